@@ -29,9 +29,9 @@ from app.agent.langgraph.schemas.state import QualityGateState, create_initial_s
 
 # Import nodes - but only use them dynamically
 from app.agent.langgraph.nodes.architect import architect_node
-from app.agent.langgraph.nodes.coder import coder_node
-from app.agent.langgraph.nodes.reviewer import reviewer_node
-from app.agent.langgraph.nodes.refiner import refiner_node
+from app.agent.langgraph.nodes.coder import coder_node_async
+from app.agent.langgraph.nodes.reviewer import reviewer_node_async
+from app.agent.langgraph.nodes.refiner import refiner_node_async
 from app.agent.langgraph.nodes.security_gate import security_gate_node
 from app.agent.langgraph.nodes.qa_gate import qa_gate_node
 from app.agent.langgraph.nodes.aggregator import quality_aggregator_node
@@ -103,11 +103,11 @@ AGENT_INFO = {
 
 # Map capability names to actual node functions
 CAPABILITY_TO_NODE = {
-    AgentCapability.IMPLEMENTATION: ("coder", coder_node),
-    AgentCapability.REVIEW: ("reviewer", reviewer_node),
+    AgentCapability.IMPLEMENTATION: ("coder", coder_node_async),
+    AgentCapability.REVIEW: ("reviewer", reviewer_node_async),
     AgentCapability.SECURITY: ("security_gate", security_gate_node),
     AgentCapability.TESTING: ("qa_gate", qa_gate_node),
-    AgentCapability.REFINEMENT: ("refiner", refiner_node),
+    AgentCapability.REFINEMENT: ("refiner", refiner_node_async),
 }
 
 
@@ -204,10 +204,10 @@ class DynamicStateGraphBuilder:
         logger.info("📏 Building LINEAR workflow")
 
         if "coder" in nodes:
-            workflow.add_node("coder", coder_node)
+            workflow.add_node("coder", coder_node_async)
 
         if "reviewer" in nodes:
-            workflow.add_node("reviewer", reviewer_node)
+            workflow.add_node("reviewer", reviewer_node_async)
 
         if "persistence" in nodes:
             workflow.add_node("persistence", persistence_node)
@@ -245,7 +245,7 @@ class DynamicStateGraphBuilder:
 
         # Add only the required nodes
         if "coder" in nodes:
-            workflow.add_node("coder", coder_node)
+            workflow.add_node("coder", coder_node_async)
 
         gates = []
         if "security_gate" in nodes:
@@ -257,14 +257,14 @@ class DynamicStateGraphBuilder:
             gates.append("qa_gate")
 
         if "reviewer" in nodes:
-            workflow.add_node("reviewer", reviewer_node)
+            workflow.add_node("reviewer", reviewer_node_async)
             gates.append("reviewer")
 
         if "aggregator" in nodes:
             workflow.add_node("aggregator", quality_aggregator_node)
 
         if "refiner" in nodes:
-            workflow.add_node("refiner", refiner_node)
+            workflow.add_node("refiner", refiner_node_async)
 
         if "persistence" in nodes:
             workflow.add_node("persistence", persistence_node)
@@ -319,10 +319,10 @@ class DynamicStateGraphBuilder:
 
         # Add nodes
         if "coder" in nodes:
-            workflow.add_node("coder", coder_node)
+            workflow.add_node("coder", coder_node_async)
 
         if "reviewer" in nodes:
-            workflow.add_node("reviewer", reviewer_node)
+            workflow.add_node("reviewer", reviewer_node_async)
 
         if "security_gate" in nodes:
             workflow.add_node("security_gate", security_gate_node)
@@ -334,7 +334,7 @@ class DynamicStateGraphBuilder:
             workflow.add_node("aggregator", quality_aggregator_node)
 
         if "refiner" in nodes:
-            workflow.add_node("refiner", refiner_node)
+            workflow.add_node("refiner", refiner_node_async)
 
         if "persistence" in nodes:
             workflow.add_node("persistence", persistence_node)
@@ -767,7 +767,7 @@ class DynamicWorkflow:
                         "streaming_content": f"$ generating code...\n> workspace: {project_dir}\n> files: {len(files_to_create)} planned",
                     })
 
-                    coder_result = coder_node(state)
+                    coder_result = await coder_node_async(state)
                     agent_times["coder"] = time.time() - coder_start
                     completed_agents.append("coder")
                     state.update(coder_result)
@@ -784,7 +784,7 @@ class DynamicWorkflow:
                 # QUALITY GATES (only if required)
                 gates_to_run = []
                 if AgentCapability.REVIEW in required_agents:
-                    gates_to_run.append(("reviewer", reviewer_node))
+                    gates_to_run.append(("reviewer", reviewer_node_async))
                 if AgentCapability.SECURITY in required_agents:
                     gates_to_run.append(("security_gate", security_gate_node))
                 if AgentCapability.TESTING in required_agents:
@@ -801,7 +801,10 @@ class DynamicWorkflow:
 
                     async def run_gate(gate_name: str, gate_func) -> tuple:
                         gate_start = time.time()
-                        result = await asyncio.to_thread(gate_func, state)
+                        if asyncio.iscoroutinefunction(gate_func):
+                            result = await gate_func(state)
+                        else:
+                            result = await asyncio.to_thread(gate_func, state)
                         return gate_name, result, time.time() - gate_start
 
                     gate_tasks = [run_gate(name, func) for name, func in gates_to_run]
@@ -856,7 +859,7 @@ class DynamicWorkflow:
 
                             state["refinement_iteration"] = iteration
                             refiner_start = time.time()
-                            refiner_result = refiner_node(state)
+                            refiner_result = await refiner_node_async(state)
                             agent_times["refiner"] = agent_times.get("refiner", 0) + (time.time() - refiner_start)
                             state.update(refiner_result)
 
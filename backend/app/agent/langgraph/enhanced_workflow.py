@@ -23,9 +23,9 @@ from app.agent.langgraph.schemas.state import QualityGateState, create_initial_s
 
 # Import nodes
 from app.agent.langgraph.nodes.architect import architect_node
-from app.agent.langgraph.nodes.coder import coder_node
-from app.agent.langgraph.nodes.reviewer import reviewer_node
-from app.agent.langgraph.nodes.refiner import refiner_node
+from app.agent.langgraph.nodes.coder import coder_node_async
+from app.agent.langgraph.nodes.reviewer import reviewer_node_async
+from app.agent.langgraph.nodes.refiner import refiner_node_async
 from app.agent.langgraph.nodes.security_gate import security_gate_node
 from app.agent.langgraph.nodes.qa_gate import qa_gate_node
 from app.agent.langgraph.nodes.aggregator import quality_aggregator_node
@@ -390,7 +390,7 @@ class EnhancedWorkflow:
             })
             await asyncio.sleep(0.3)
 
-            coder_result = coder_node(state)
+            coder_result = await coder_node_async(state)
             agent_times["coder"] = time.time() - coder_start
             completed_agents.append("coder")
             state.update(coder_result)
@@ -448,7 +448,7 @@ class EnhancedWorkflow:
                 # Run all quality gates IN PARALLEL for faster execution
                 gate_results = {}
                 gates_to_run = [
-                    ("reviewer", reviewer_node),
+                    ("reviewer", reviewer_node_async),
                     ("qa_gate", qa_gate_node),
                     ("security_gate", security_gate_node),
                 ]
@@ -461,11 +461,14 @@ class EnhancedWorkflow:
                         "parallel": True,
                     })
 
-                # Helper to run a single gate in thread pool (sync functions)
+                # Helper to run a single gate (async nodes are awaited directly,
+                # sync ones run in the thread pool to not block)
                 async def run_gate(gate_name: str, gate_func) -> tuple:
                     gate_start = time.time()
-                    # Run sync function in thread pool to not block
-                    result = await asyncio.to_thread(gate_func, state)
+                    if asyncio.iscoroutinefunction(gate_func):
+                        result = await gate_func(state)
+                    else:
+                        result = await asyncio.to_thread(gate_func, state)
                     gate_time = time.time() - gate_start
                     return gate_name, result, gate_time
 
@@ -542,7 +545,7 @@ class EnhancedWorkflow:
 
                     # Run refiner
                     refiner_start = time.time()
-                    refiner_result = refiner_node(state)
+                    refiner_result = await refiner_node_async(state)
                     refiner_time = time.time() - refiner_start
 
                     if refinement_iteration == 1:
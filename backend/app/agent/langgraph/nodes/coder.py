@@ -6,13 +6,13 @@ Supports multiple model types via prompt adaptation.
 
 import logging
 import json
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from app.core.config import settings
 from app.agent.langgraph.schemas.state import QualityGateState, DebugLog
 from app.agent.langgraph.tools.filesystem_tools import write_file_tool
-from app.services.http_client import LLMHttpClient
+from app.services.http_client import LLMHttpClient, AsyncLLMHttpClient
 
 # Import prompts for different model types
 try:
@@ -188,12 +188,54 @@ def coder_node(state: QualityGateState) -> Dict:
     """
     logger.info("💻 Coder Node: Starting code generation...")
 
-    user_request = state["user_request"]
-    workspace_root = state["workspace_root"]
-    task_type = state.get("task_type", "general")
+    debug_logs = _coder_thinking_logs(state)
+
+    try:
+        # Generate code using vLLM (returns tuple of files, deleted_files, and token_usage)
+        generated_files, deleted_files, token_usage = _generate_code_with_vllm(
+            user_request=state["user_request"],
+            task_type=state.get("task_type", "general"),
+            workspace_root=state["workspace_root"],
+            conversation_history=state.get("conversation_history", [])  # Phase 2: Pass context
+        )
+        return _write_generated_code(state, generated_files, deleted_files, token_usage, debug_logs)
+
+    except Exception as e:
+        return _coder_error_result(state, e, debug_logs)
+
 
+async def coder_node_async(state: QualityGateState) -> Dict:
+    """Async Coder Node: same as coder_node, but awaits the LLM call
+
+    Uses AsyncLLMHttpClient so the event loop is free while the model
+    generates code (no worker thread is held for the duration of the call).
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        State updates with generated code and artifacts
+    """
+    logger.info("💻 Coder Node: Starting code generation...")
+
+    debug_logs = _coder_thinking_logs(state)
+
+    try:
+        generated_files, deleted_files, token_usage = await _generate_code_with_vllm_async(
+            user_request=state["user_request"],
+            task_type=state.get("task_type", "general"),
+            workspace_root=state["workspace_root"],
+            conversation_history=state.get("conversation_history", [])
+        )
+        return _write_generated_code(state, generated_files, deleted_files, token_usage, debug_logs)
+
+    except Exception as e:
+        return _coder_error_result(state, e, debug_logs)
+
+
+def _coder_thinking_logs(state: QualityGateState) -> List[DebugLog]:
+    """Create the initial debug logs for a coder run"""
     debug_logs = []
-    artifacts = []
 
     # Add thinking debug log
     if state.get("enable_debug"):
@@ -202,168 +244,183 @@ def coder_node(state: QualityGateState) -> Dict:
             node="coder",
             agent="QwenCoder",
             event_type="thinking",
-            content=f"Analyzing request: {user_request[:200]}...",
-            metadata={"task_type": task_type},
+            content=f"Analyzing request: {state['user_request'][:200]}...",
+            metadata={"task_type": state.get("task_type", "general")},
             token_usage=None
         ))
 
-    try:
-        # Get conversation history from state (Phase 2 Context Improvement)
-        conversation_history = state.get("conversation_history", [])
+    return debug_logs
 
-        # Generate code using vLLM (returns tuple of files, deleted_files, and token_usage)
-        generated_files, deleted_files, token_usage = _generate_code_with_vllm(
-            user_request=user_request,
-            task_type=task_type,
-            workspace_root=workspace_root,
-            conversation_history=conversation_history  # Phase 2: Pass context
-        )
 
-        # Write files and create artifacts
-        # FIXED: Prevent duplicate artifacts by tracking unique normalized paths
-        import os
-        from pathlib import Path
+def _write_generated_code(
+    state: QualityGateState,
+    generated_files: List[Dict],
+    deleted_files: List[str],
+    token_usage: Dict,
+    debug_logs: List[DebugLog]
+) -> Dict:
+    """Write generated files to the workspace and build the coder state update
 
-        seen_paths = set()  # Track normalized absolute paths to prevent duplicates
+    Args:
+        state: Current workflow state
+        generated_files: Files returned by the LLM (filename, content, language, description)
+        deleted_files: File paths the LLM asked to delete
+        token_usage: Token usage of the generation call
+        debug_logs: Debug logs collected so far
 
-        for file_info in generated_files:
-            filename = file_info["filename"]
-            content = file_info["content"]
-            language = file_info.get("language", "python")
-            description = file_info.get("description", "")
+    Returns:
+        State updates with generated code and artifacts
+    """
+    workspace_root = state["workspace_root"]
+    artifacts = []
 
-            # Normalize path to prevent duplicates
-            normalized_path = os.path.normpath(os.path.join(workspace_root, filename))
+    # Write files and create artifacts
+    # FIXED: Prevent duplicate artifacts by tracking unique normalized paths
+    import os
+    from pathlib import Path
 
-            # Skip if already processed (duplicate in generated_files)
-            if normalized_path in seen_paths:
-                logger.warning(f"⚠️  Skipping duplicate file in generated_files: {filename}")
-                continue
+    seen_paths = set()  # Track normalized absolute paths to prevent duplicates
+
+    for file_info in generated_files:
+        filename = file_info["filename"]
+        content = file_info["content"]
+        language = file_info.get("language", "python")
+        description = file_info.get("description", "")
+
+        # Normalize path to prevent duplicates
+        normalized_path = os.path.normpath(os.path.join(workspace_root, filename))
+
+        # Skip if already processed (duplicate in generated_files)
+        if normalized_path in seen_paths:
+            logger.warning(f"⚠️  Skipping duplicate file in generated_files: {filename}")
+            continue
+
+        seen_paths.add(normalized_path)
 
-            seen_paths.add(normalized_path)
+        # Check if file already exists to determine action
+        full_path = os.path.join(workspace_root, filename)
+        file_existed = os.path.exists(full_path)
+        action = "modified" if file_existed else "created"
 
-            # Check if file already exists to determine action
+        # Write file to workspace
+        result = write_file_tool(
+            file_path=filename,
+            content=content,
+            workspace_root=workspace_root
+        )
+
+        if result["success"]:
+            action_emoji = "📝" if action == "modified" else "✨"
+            logger.info(f"{action_emoji} {action.capitalize()}: {filename}")
+
+            # Calculate relative path from workspace root
+            saved_path = result["file_path"]
+            relative_path = os.path.relpath(saved_path, workspace_root) if saved_path.startswith(workspace_root) else filename
+
+            # Create artifact with enhanced metadata
+            artifacts.append({
+                "filename": filename,
+                "file_path": saved_path,
+                "relative_path": relative_path,
+                "project_root": workspace_root,
+                "language": language,
+                "content": content,
+                "description": description,
+                "size_bytes": len(content),
+                "checksum": f"sha256_{hash(content) % (10 ** 8):08x}",
+                "saved": True,
+                "saved_path": saved_path,
+                "action": action,  # "created" or "modified"
+            })
+        else:
+            logger.error(f"❌ Failed to write {filename}: {result['error']}")
+
+    # Process deleted files (FILE DELETION FEATURE)
+    if deleted_files:
+        logger.info(f"🗑️  Processing {len(deleted_files)} file(s) for deletion...")
+
+        for filename in deleted_files:
+            # Normalize path
+            normalized_path = os.path.normpath(os.path.join(workspace_root, filename))
             full_path = os.path.join(workspace_root, filename)
-            file_existed = os.path.exists(full_path)
-            action = "modified" if file_existed else "created"
-
-            # Write file to workspace
-            result = write_file_tool(
-                file_path=filename,
-                content=content,
-                workspace_root=workspace_root
-            )
 
-            if result["success"]:
-                action_emoji = "📝" if action == "modified" else "✨"
-                logger.info(f"{action_emoji} {action.capitalize()}: {filename}")
-
-                # Calculate relative path from workspace root
-                saved_path = result["file_path"]
-                relative_path = os.path.relpath(saved_path, workspace_root) if saved_path.startswith(workspace_root) else filename
-
-                # Create artifact with enhanced metadata
-                artifacts.append({
-                    "filename": filename,
-                    "file_path": saved_path,
-                    "relative_path": relative_path,
-                    "project_root": workspace_root,
-                    "language": language,
-                    "content": content,
-                    "description": description,
-                    "size_bytes": len(content),
-                    "checksum": f"sha256_{hash(content) % (10 ** 8):08x}",
-                    "saved": True,
-                    "saved_path": saved_path,
-                    "action": action,  # "created" or "modified"
-                })
+            # Check if file exists before trying to delete
+            if os.path.exists(full_path):
+                try:
+                    os.remove(full_path)
+                    logger.info(f"🗑️  Deleted: {filename}")
+
+                    # Create artifact for deleted file
+                    artifacts.append({
+                        "filename": filename,
+                        "file_path": full_path,
+                        "relative_path": filename,
+                        "project_root": workspace_root,
+                        "language": "text",  # Unknown language for deleted files
+                        "content": "",  # No content for deleted files
+                        "description": "File deleted",
+                        "size_bytes": 0,
+                        "checksum": "",
+                        "saved": True,
+                        "saved_path": full_path,
+                        "action": "deleted",  # Mark as deleted
+                    })
+                except Exception as e:
+                    logger.error(f"❌ Failed to delete {filename}: {e}")
             else:
-                logger.error(f"❌ Failed to write {filename}: {result['error']}")
-
-        # Process deleted files (FILE DELETION FEATURE)
-        if deleted_files:
-            logger.info(f"🗑️  Processing {len(deleted_files)} file(s) for deletion...")
-
-            for filename in deleted_files:
-                # Normalize path
-                normalized_path = os.path.normpath(os.path.join(workspace_root, filename))
-                full_path = os.path.join(workspace_root, filename)
-
-                # Check if file exists before trying to delete
-                if os.path.exists(full_path):
-                    try:
-                        os.remove(full_path)
-                        logger.info(f"🗑️  Deleted: {filename}")
-
-                        # Create artifact for deleted file
-                        artifacts.append({
-                            "filename": filename,
-                            "file_path": full_path,
-                            "relative_path": filename,
-                            "project_root": workspace_root,
-                            "language": "text",  # Unknown language for deleted files
-                            "content": "",  # No content for deleted files
-                            "description": "File deleted",
-                            "size_bytes": 0,
-                            "checksum": "",
-                            "saved": True,
-                            "saved_path": full_path,
-                            "action": "deleted",  # Mark as deleted
-                        })
-                    except Exception as e:
-                        logger.error(f"❌ Failed to delete {filename}: {e}")
-                else:
-                    logger.warning(f"⚠️  Cannot delete {filename}: File does not exist")
-
-        # Add result debug log with actual token usage
-        if state.get("enable_debug"):
-            debug_logs.append(DebugLog(
-                timestamp=datetime.utcnow().isoformat(),
-                node="coder",
-                agent="QwenCoder",
-                event_type="result",
-                content=f"Generated {len(artifacts)} files successfully",
-                metadata={
-                    "files": [a["filename"] for a in artifacts],
-                    "total_bytes": sum(a["size_bytes"] for a in artifacts)
-                },
-                token_usage=token_usage  # Use actual token_usage from vLLM
-            ))
-
-        return {
-            "coder_output": {
-                "artifacts": artifacts,
-                "status": "completed" if artifacts else "failed",
-                "files_generated": len(artifacts),
-                "token_usage": token_usage  # Include token usage in output
-            },
-            "artifacts": artifacts,  # Top-level for frontend
-            "debug_logs": debug_logs,
-            "token_usage": token_usage  # Top-level for SSE events
-        }
+                logger.warning(f"⚠️  Cannot delete {filename}: File does not exist")
 
-    except Exception as e:
-        logger.error(f"❌ Coder Node failed: {e}", exc_info=True)
-
-        if state.get("enable_debug"):
-            debug_logs.append(DebugLog(
-                timestamp=datetime.utcnow().isoformat(),
-                node="coder",
-                agent="QwenCoder",
-                event_type="error",
-                content=f"Code generation failed: {str(e)}",
-                metadata={"error_type": type(e).__name__},
-                token_usage=None
-            ))
-
-        return {
-            "coder_output": {
-                "artifacts": [],
-                "status": "error",
-                "error": str(e)
+    # Add result debug log with actual token usage
+    if state.get("enable_debug"):
+        debug_logs.append(DebugLog(
+            timestamp=datetime.utcnow().isoformat(),
+            node="coder",
+            agent="QwenCoder",
+            event_type="result",
+            content=f"Generated {len(artifacts)} files successfully",
+            metadata={
+                "files": [a["filename"] for a in artifacts],
+                "total_bytes": sum(a["size_bytes"] for a in artifacts)
             },
-            "debug_logs": debug_logs,
-        }
+            token_usage=token_usage  # Use actual token_usage from vLLM
+        ))
+
+    return {
+        "coder_output": {
+            "artifacts": artifacts,
+            "status": "completed" if artifacts else "failed",
+            "files_generated": len(artifacts),
+            "token_usage": token_usage  # Include token usage in output
+        },
+        "artifacts": artifacts,  # Top-level for frontend
+        "debug_logs": debug_logs,
+        "token_usage": token_usage  # Top-level for SSE events
+    }
+
+
+def _coder_error_result(state: QualityGateState, e: Exception, debug_logs: List[DebugLog]) -> Dict:
+    """Build the coder state update for a failed run"""
+    logger.error(f"❌ Coder Node failed: {e}", exc_info=True)
+
+    if state.get("enable_debug"):
+        debug_logs.append(DebugLog(
+            timestamp=datetime.utcnow().isoformat(),
+            node="coder",
+            agent="QwenCoder",
+            event_type="error",
+            content=f"Code generation failed: {str(e)}",
+            metadata={"error_type": type(e).__name__},
+            token_usage=None
+        ))
+
+    return {
+        "coder_output": {
+            "artifacts": [],
+            "status": "error",
+            "error": str(e)
+        },
+        "debug_logs": debug_logs,
+    }
 
 
 def _generate_code_with_vllm(
@@ -386,29 +443,13 @@ def _generate_code_with_vllm(
         - deleted_files_list: List of file paths to delete
         - token_usage_dict: Dictionary with prompt_tokens, completion_tokens, total_tokens
     """
-    # Get endpoint and model from settings (supports both unified and split configs)
-    coding_endpoint = settings.get_coding_endpoint
-    coding_model = settings.get_coding_model
-
     # Default token usage (will be updated on successful LLM call)
     token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
 
-    # Check if endpoint is configured
-    if not coding_endpoint:
-        logger.warning("⚠️  LLM coding endpoint not configured, using fallback generator")
-        return _fallback_code_generator(user_request, task_type), [], token_usage
-
     try:
-        # Get model-appropriate prompt and config (Phase 2: Pass conversation context)
-        prompt, model_config = _get_code_generation_prompt(
-            user_request,
-            task_type,
-            conversation_history=conversation_history
-        )
-
-        # Log model info (model type auto-detected from model name)
-        logger.info(f"🤖 Using model: {coding_model} (type: {settings.get_coding_model_type})")
-        logger.info(f"📡 Endpoint: {coding_endpoint}")
+        request = _build_code_generation_request(user_request, task_type, conversation_history)
+        if request is None:
+            return _fallback_code_generator(user_request, task_type), [], token_usage
 
         # Use HTTP client with built-in retry logic for ConnectError and TimeoutException
         http_client = LLMHttpClient(
@@ -418,57 +459,134 @@ def _generate_code_with_vllm(
         )
 
         # Make request with automatic retry on connection/timeout errors
-        result, error = http_client.post(
-            url=f"{coding_endpoint}/chat/completions",
-            json={
-                "model": coding_model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert software engineer. Generate production-ready code."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": model_config.get("max_tokens", 4096),
-                "temperature": model_config.get("temperature", 0.2),
-                "stop": model_config.get("stop", ["</s>", "Human:", "User:"])
-            }
-        )
+        # (served from the shared request cache when "coding" is opted in)
+        result, error = http_client.post(**request, cache_task_type="coding")
+        return _parse_code_generation_result(result, error, user_request, task_type)
 
-        if error:
-            logger.error(f"vLLM request failed after retries: {error}")
-            return _fallback_code_generator(user_request, task_type), [], token_usage
+    except Exception as e:
+        logger.error(f"vLLM call failed: {e}", exc_info=True)
+        return _fallback_code_generator(user_request, task_type), [], token_usage
 
-        # Chat completions returns content in message
-        generated_text = result["choices"][0]["message"]["content"]
 
-        # Extract token usage from vLLM response
-        usage = result.get("usage", {})
-        token_usage = {
-            "prompt_tokens": usage.get("prompt_tokens", 0),
-            "completion_tokens": usage.get("completion_tokens", 0),
-            "total_tokens": usage.get("total_tokens", 0)
-        }
-        logger.info(f"📊 Token usage: {token_usage}")
+async def _generate_code_with_vllm_async(
+    user_request: str,
+    task_type: str,
+    workspace_root: str,
+    conversation_history: List[Dict[str, str]] = None
+) -> tuple:
+    """Async variant of _generate_code_with_vllm (non-blocking HTTP and backoff)
 
-        # Parse JSON response
-        try:
-            # Extract JSON from response
-            json_start = generated_text.find("{")
-            json_end = generated_text.rfind("}") + 1
-            if json_start != -1 and json_end > json_start:
-                json_str = generated_text[json_start:json_end]
-                parsed = json.loads(json_str)
-                files = parsed.get("files", [])
-                deleted_files = parsed.get("deleted_files", [])  # FILE DELETION FEATURE
-                logger.info(f"📝 Parsed {len(files)} files, {len(deleted_files)} files to delete")
-                return files, deleted_files, token_usage
-        except json.JSONDecodeError:
-            logger.warning("Failed to parse vLLM JSON response, using fallback")
+    Returns:
+        Tuple of (files_list, deleted_files_list, token_usage_dict)
+    """
+    token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+    try:
+        request = _build_code_generation_request(user_request, task_type, conversation_history)
+        if request is None:
             return _fallback_code_generator(user_request, task_type), [], token_usage
 
+        http_client = AsyncLLMHttpClient(
+            timeout=120,
+            max_retries=3,
+            base_delay=2
+        )
+
+        result, error = await http_client.post(**request, cache_task_type="coding")
+        return _parse_code_generation_result(result, error, user_request, task_type)
+
     except Exception as e:
         logger.error(f"vLLM call failed: {e}", exc_info=True)
         return _fallback_code_generator(user_request, task_type), [], token_usage
 
-    # Fallback if we exit without returning (should not happen)
+
+def _build_code_generation_request(
+    user_request: str,
+    task_type: str,
+    conversation_history: List[Dict[str, str]] = None
+) -> Optional[Dict]:
+    """Build the chat/completions request for code generation
+
+    Returns:
+        Dict with url and json payload, or None if no endpoint is configured
+    """
+    # Get endpoint and model from settings (supports both unified and split configs)
+    coding_endpoint = settings.get_coding_endpoint
+    coding_model = settings.get_coding_model
+
+    # Check if endpoint is configured
+    if not coding_endpoint:
+        logger.warning("⚠️  LLM coding endpoint not configured, using fallback generator")
+        return None
+
+    # Get model-appropriate prompt and config (Phase 2: Pass conversation context)
+    prompt, model_config = _get_code_generation_prompt(
+        user_request,
+        task_type,
+        conversation_history=conversation_history
+    )
+
+    # Log model info (model type auto-detected from model name)
+    logger.info(f"🤖 Using model: {coding_model} (type: {settings.get_coding_model_type})")
+    logger.info(f"📡 Endpoint: {coding_endpoint}")
+
+    return {
+        "url": f"{coding_endpoint}/chat/completions",
+        "json": {
+            "model": coding_model,
+            "messages": [
+                {"role": "system", "content": "You are an expert software engineer. Generate production-ready code."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": model_config.get("max_tokens", 4096),
+            "temperature": model_config.get("temperature", 0.2),
+            "stop": model_config.get("stop", ["</s>", "Human:", "User:"])
+        },
+    }
+
+
+def _parse_code_generation_result(
+    result: Optional[Dict],
+    error: Optional[str],
+    user_request: str,
+    task_type: str
+) -> tuple:
+    """Parse a code generation response into (files, deleted_files, token_usage)"""
+    token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+    if error:
+        logger.error(f"vLLM request failed after retries: {error}")
+        return _fallback_code_generator(user_request, task_type), [], token_usage
+
+    # Chat completions returns content in message
+    generated_text = result["choices"][0]["message"]["content"]
+
+    # Extract token usage from vLLM response
+    usage = result.get("usage", {})
+    token_usage = {
+        "prompt_tokens": usage.get("prompt_tokens", 0),
+        "completion_tokens": usage.get("completion_tokens", 0),
+        "total_tokens": usage.get("total_tokens", 0)
+    }
+    logger.info(f"📊 Token usage: {token_usage}")
+
+    # Parse JSON response
+    try:
+        # Extract JSON from response
+        json_start = generated_text.find("{")
+        json_end = generated_text.rfind("}") + 1
+        if json_start != -1 and json_end > json_start:
+            json_str = generated_text[json_start:json_end]
+            parsed = json.loads(json_str)
+            files = parsed.get("files", [])
+            deleted_files = parsed.get("deleted_files", [])  # FILE DELETION FEATURE
+            logger.info(f"📝 Parsed {len(files)} files, {len(deleted_files)} files to delete")
+            return files, deleted_files, token_usage
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse vLLM JSON response, using fallback")
+        return _fallback_code_generator(user_request, task_type), [], token_usage
+
+    # Fallback if we exit without returning (no JSON object in response)
     return _fallback_code_generator(user_request, task_type), [], token_usage
 
 
@@ -3,11 +3,15 @@
 Quality assurance gate for generated code.
 """
 
+import os
 import logging
-from typing import Dict, List
+import subprocess
+import tempfile
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from app.agent.langgraph.schemas.state import QualityGateState, DebugLog
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +24,7 @@ def qa_gate_node(state: QualityGateState) -> Dict:
     2. Security checks
     3. Best practices verification
     4. Performance checks
-    5. Test coverage (if tests exist)
+    5. Tests affected by the changed files (per-test results from pytest)
 
     Args:
         state: Current workflow state
@@ -61,7 +65,8 @@ def qa_gate_node(state: QualityGateState) -> Dict:
 
     # Run QA checks
     try:
-        qa_results = _run_qa_checks(artifacts)
+        test_run = _run_affected_tests(state, artifacts)
+        qa_results = _run_qa_checks(artifacts, test_run)
 
         passed = qa_results["passed"]
         logger.info(f"🔍 QA Gate {'✅ PASSED' if passed else '❌ FAILED'}")
@@ -83,11 +88,15 @@ def qa_gate_node(state: QualityGateState) -> Dict:
                 token_usage=None
             ))
 
-        return {
+        updates = {
             "qa_results": qa_results,
             "qa_passed": passed,
             "debug_logs": debug_logs,
         }
+        if test_run is not None:
+            updates["qa_test_results"] = test_run["tests"]
+            updates["tests_passed"] = test_run["check"]["passed"]
+        return updates
 
     except Exception as e:
         logger.error(f"❌ QA Gate failed: {e}", exc_info=True)
@@ -114,11 +123,105 @@ def qa_gate_node(state: QualityGateState) -> Dict:
         }
 
 
-def _run_qa_checks(artifacts: List[Dict]) -> Dict:
+def _run_affected_tests(state: QualityGateState, artifacts: List[Dict]) -> Optional[Dict]:
+    """Run the workspace tests affected by this iteration's changes
+
+    Changed files are the refiner's applied fixes, or the saved artifacts on
+    the first pass. Tests that failed in the previous iteration are re-run
+    as well, so a fix that changed nothing they import cannot hide them.
+
+    Args:
+        state: Current workflow state
+        artifacts: List of code artifacts
+
+    Returns:
+        {"check": check result, "tests": per-test results, "summary": counts},
+        or None if tests are disabled or could not be run
+    """
+    workspace = state.get("workspace_root")
+    if not settings.qa_run_tests or not workspace or not os.path.isdir(workspace):
+        return None
+
+    from app.services.test_selection import select_affected_tests
+    from app.tools.pytest_results import build_pytest_command, failed_tests, parse_junit_xml
+
+    refiner_output = state.get("refiner_output") or {}
+    if "changed_files" in refiner_output:
+        changed = refiner_output["changed_files"]
+    else:
+        changed = [a.get("file_path") or a["filename"] for a in artifacts if a.get("saved")]
+
+    selected = select_affected_tests(workspace, changed)
+    if selected is None:
+        targets = [workspace]
+    else:
+        previous = (state.get("qa_results") or {}).get("tests") or {}
+        selected_files = {os.path.relpath(path, workspace) for path in selected}
+        targets = selected + [
+            node_id for node_id in previous.get("failed_tests", [])
+            if node_id.split("::")[0] not in selected_files
+        ]
+
+    if not targets:
+        return {
+            "check": {"passed": True, "message": "No tests affected by the changed files"},
+            "tests": [],
+            "summary": {"total": 0, "failed_tests": [], "selected": 0},
+        }
+
+    with tempfile.NamedTemporaryFile(suffix=".xml", prefix="qa-pytest-", delete=False) as f:
+        report_path = f.name
+    cmd = build_pytest_command(
+        targets, report_path, verbose=False, fail_fast=settings.qa_test_fail_fast,
+        workers=settings.qa_test_workers, color=False
+    )
+
+    try:
+        process = subprocess.run(
+            cmd, cwd=workspace, capture_output=True, text=True, timeout=settings.qa_test_timeout
+        )
+        report = parse_junit_xml(report_path)
+    except FileNotFoundError:
+        logger.warning("pytest not found - skipping QA test run")
+        return None
+    except subprocess.TimeoutExpired:
+        return {
+            "check": {"passed": False, "message": f"Tests timed out after {settings.qa_test_timeout}s"},
+            "tests": [],
+            "summary": {"total": 0, "failed_tests": [], "selected": len(targets)},
+        }
+    except Exception as e:
+        # No report: pytest stopped before running tests (e.g. usage error)
+        logger.warning(f"QA test run produced no results: {e}")
+        return None
+    finally:
+        if os.path.exists(report_path):
+            os.remove(report_path)
+
+    summary = report["summary"]
+    failed = failed_tests(report["tests"])
+    if process.returncode == 5 or summary["total"] == 0:
+        message = "No tests collected"
+    elif failed:
+        message = f"{len(failed)}/{summary['total']} tests failed: {', '.join(failed[:3])}"
+    else:
+        message = f"{summary['passed']} tests passed" + (
+            f", {summary['skipped']} skipped" if summary["skipped"] else ""
+        )
+
+    return {
+        "check": {"passed": not failed, "message": message},
+        "tests": report["tests"],
+        "summary": {**summary, "failed_tests": failed, "selected": len(targets)},
+    }
+
+
+def _run_qa_checks(artifacts: List[Dict], test_run: Optional[Dict] = None) -> Dict:
     """Run QA checks on artifacts
 
     Args:
         artifacts: List of code artifacts
+        test_run: Result of _run_affected_tests (adds the critical "tests" check)
 
     Returns:
         QA results with passed flag and check details
@@ -188,12 +291,19 @@ def _run_qa_checks(artifacts: List[Dict]) -> Dict:
         "message": "Documentation found" if (has_readme or has_docs) else "No documentation"
     }
 
+    # Check 5: Tests affected by the changes (structured per-test results)
+    if test_run is not None:
+        checks["tests"] = test_run["check"]
+
     # Overall pass/fail (security is handled by Security Gate)
-    critical_checks = ["file_count", "no_empty_files", "syntax_valid"]
+    critical_checks = ["file_count", "no_empty_files", "syntax_valid", "tests"]
     passed = all(checks[name]["passed"] for name in critical_checks if name in checks)
 
-    return {
+    results = {
         "passed": passed,
         "checks": checks,
         "message": "All QA checks passed" if passed else "Some QA checks failed"
     }
+    if test_run is not None:
+        results["tests"] = test_run["summary"]
+    return results
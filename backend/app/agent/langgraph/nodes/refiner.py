@@ -4,12 +4,14 @@ Implements diff-based code updates instead of full regeneration for efficiency.
 Uses LLM provider abstraction for flexible model switching.
 """
 
+import asyncio
 import logging
 import difflib
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime
 from app.agent.langgraph.schemas.state import QualityGateState, CodeDiff, DebugLog
 from app.core.config import settings
+from app.services.http_client import LLMHttpClient, AsyncLLMHttpClient
 
 # Import LLM provider for model-agnostic calls
 try:
@@ -221,7 +223,61 @@ def refiner_node(state: QualityGateState) -> Dict:
     """
     logger.info("🔧 Refiner Node: Analyzing review feedback and generating fixes...")
 
-    # Extract review feedback
+    early_result = _check_refinement_needed(state)
+    if early_result is not None:
+        return early_result
+
+    review_feedback = state["review_feedback"]
+    issues = review_feedback.get("issues", [])
+    suggestions = review_feedback.get("suggestions", [])
+    artifacts = state["coder_output"]["artifacts"]
+    model_type = _log_refinement_start(state)
+
+    # Apply one fix per issue to the matching artifact using the LLM
+    fix_plan = _plan_fixes(issues, suggestions, artifacts)
+    modified_contents = [
+        _apply_fix_with_llm(fix["original_content"], fix["issue"], fix["suggestion"])
+        for fix in fix_plan
+    ]
+
+    return _finish_refinement(state, fix_plan, modified_contents, model_type)
+
+
+async def refiner_node_async(state: QualityGateState) -> Dict:
+    """Async Refiner node: same as refiner_node, but awaits the LLM calls
+
+    The per-issue fixes touch different artifacts, so they are requested
+    concurrently instead of one after another.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        State updates with refined code and diffs
+    """
+    logger.info("🔧 Refiner Node: Analyzing review feedback and generating fixes...")
+
+    early_result = _check_refinement_needed(state)
+    if early_result is not None:
+        return early_result
+
+    review_feedback = state["review_feedback"]
+    issues = review_feedback.get("issues", [])
+    suggestions = review_feedback.get("suggestions", [])
+    artifacts = state["coder_output"]["artifacts"]
+    model_type = _log_refinement_start(state)
+
+    fix_plan = _plan_fixes(issues, suggestions, artifacts)
+    modified_contents = await asyncio.gather(*[
+        _apply_fix_with_llm_async(fix["original_content"], fix["issue"], fix["suggestion"])
+        for fix in fix_plan
+    ])
+
+    return _finish_refinement(state, fix_plan, list(modified_contents), model_type)
+
+
+def _check_refinement_needed(state: QualityGateState) -> Optional[Dict]:
+    """Return the state update for runs that need no refinement, else None"""
     review_feedback = state.get("review_feedback")
     if not review_feedback:
         logger.warning("⚠️  No review feedback available - skipping refinement")
@@ -231,11 +287,7 @@ def refiner_node(state: QualityGateState) -> Dict:
             "refiner_output": {"status": "skipped", "reason": "no_feedback"},
         }
 
-    issues = review_feedback.get("issues", [])
-    suggestions = review_feedback.get("suggestions", [])
-    approved = review_feedback.get("approved", False)
-
-    if approved:
+    if review_feedback.get("approved", False):
         logger.info("✅ Code already approved - no refinement needed")
         return {
             "current_node": "refiner",
@@ -243,7 +295,6 @@ def refiner_node(state: QualityGateState) -> Dict:
             "refiner_output": {"status": "approved", "reason": "no_issues"},
         }
 
-    # Get artifacts to refine
     coder_output = state.get("coder_output")
     if not coder_output or "artifacts" not in coder_output:
         logger.error("❌ No artifacts to refine")
@@ -254,12 +305,16 @@ def refiner_node(state: QualityGateState) -> Dict:
             "error_log": ["Refiner: No artifacts found to refine"],
         }
 
-    artifacts = coder_output["artifacts"]
+    return None
 
-    # Generate diffs for each fix
-    code_diffs: List[CodeDiff] = []
-    refinement_iteration = state.get("refinement_iteration", 0) + 1
+
+def _log_refinement_start(state: QualityGateState) -> str:
+    """Log the refinement inputs and return the coding model type"""
+    review_feedback = state["review_feedback"]
+    issues = review_feedback.get("issues", [])
+    suggestions = review_feedback.get("suggestions", [])
     quality_score = review_feedback.get("quality_score", 0.0)
+    refinement_iteration = state.get("refinement_iteration", 0) + 1
 
     logger.info(f"📝 Processing {len(issues)} issues and {len(suggestions)} suggestions")
     logger.info(f"   Quality Score: {quality_score:.0%} (target: 70%+)")
@@ -272,21 +327,57 @@ def refiner_node(state: QualityGateState) -> Dict:
     analysis_prompt = get_refiner_analysis_prompt(model_type, issues, suggestions, quality_score)
     logger.debug(f"🤔 Refiner Analysis Prompt (model: {model_type}):\n{analysis_prompt[:500]}...")
 
-    # Simulate code refinement (in production, this would call LLM)
-    # For now, we'll create example diffs
+    return model_type
+
+
+def _plan_fixes(issues: List[str], suggestions: List[str], artifacts: List[Dict]) -> List[Dict]:
+    """Pair each issue with its artifact (by index) and optional suggestion"""
+    fix_plan = []
     for idx, issue in enumerate(issues):
         if idx >= len(artifacts):
             break
 
         artifact = artifacts[idx]
-        file_path = artifact.get("file_path", "unknown")
-        original_content = artifact.get("content", "")
+        fix_plan.append({
+            "file_path": artifact.get("file_path", "unknown"),
+            "original_content": artifact.get("content", ""),
+            "issue": issue,
+            # Get corresponding suggestion if available
+            "suggestion": suggestions[idx] if idx < len(suggestions) else "",
+        })
+    return fix_plan
+
+
+def _finish_refinement(
+    state: QualityGateState,
+    fix_plan: List[Dict],
+    modified_contents: List[str],
+    model_type: str
+) -> Dict:
+    """Turn fixed contents into diffs, write them and build the state update
 
-        # Get corresponding suggestion if available
-        suggestion = suggestions[idx] if idx < len(suggestions) else ""
+    Args:
+        state: Current workflow state
+        fix_plan: Planned fixes from _plan_fixes
+        modified_contents: Fixed content for each planned fix (same order)
+        model_type: Coding model type (for debug logs)
 
-        # Apply fix using LLM
-        modified_content = _apply_fix_with_llm(original_content, issue, suggestion)
+    Returns:
+        State updates with refined code and diffs
+    """
+    review_feedback = state["review_feedback"]
+    issues = review_feedback.get("issues", [])
+    suggestions = review_feedback.get("suggestions", [])
+    quality_score = review_feedback.get("quality_score", 0.0)
+    refinement_iteration = state.get("refinement_iteration", 0) + 1
+
+    # Generate diffs for each fix
+    code_diffs: List[CodeDiff] = []
+
+    for fix, modified_content in zip(fix_plan, modified_contents):
+        file_path = fix["file_path"]
+        original_content = fix["original_content"]
+        issue = fix["issue"]
 
         # Generate unified diff
         diff_hunks = list(difflib.unified_diff(
@@ -517,7 +608,8 @@ Applied {len(updated_artifacts)} fixes using {model_type} model."""
             "status": "completed",
             "diffs_generated": len(code_diffs),
             "diffs_applied": len(updated_artifacts),
-            "iteration": refinement_iteration
+            "iteration": refinement_iteration,
+            "changed_files": [a["file_path"] for a in updated_artifacts],
         },
         "code_diffs": code_diffs,
         "coder_output": updated_coder_output,  # Update artifacts with fixed code
@@ -631,8 +723,91 @@ def _apply_fix_with_llm(original_content: str, issue: str, suggestion: str = "")
     refine_endpoint = settings.get_coding_endpoint
     refine_model = settings.get_coding_model
 
-    # Build the fix prompt
-    fix_prompt = f"""Fix the following issue in the code:
+    fix_prompt = _build_fix_prompt(original_content, issue, suggestion)
+
+    # Try LLM provider adapter first
+    if LLM_PROVIDER_AVAILABLE and refine_endpoint:
+        try:
+            provider = LLMProviderFactory.create(
+                model_type=settings.get_coding_model_type,
+                endpoint=refine_endpoint,
+                model=refine_model
+            )
+
+            response = provider.generate_sync(fix_prompt, TaskType.REFINE)
+
+            fixed_code = _extract_provider_fix(response.content, original_content)
+            if fixed_code:
+                return fixed_code
+
+        except Exception as e:
+            logger.warning(f"LLM provider failed for fix: {e}, using fallback")
+
+    # Fallback to direct HTTP call (single attempt)
+    if refine_endpoint:
+        try:
+            result, error = LLMHttpClient(timeout=90, max_retries=1).post(
+                **_build_direct_fix_request(refine_endpoint, refine_model, fix_prompt)
+            )
+
+            fixed_code = _extract_direct_fix(result, error, original_content)
+            if fixed_code:
+                return fixed_code
+
+        except Exception as e:
+            logger.warning(f"Direct LLM call failed: {e}, using heuristic fallback")
+
+    # Final fallback: heuristic fixes
+    return _apply_fix_heuristic(original_content, issue)
+
+
+async def _apply_fix_with_llm_async(original_content: str, issue: str, suggestion: str = "") -> str:
+    """Async variant of _apply_fix_with_llm (awaits the provider / HTTP call)
+
+    Returns:
+        Modified code with the issue fixed
+    """
+    refine_endpoint = settings.get_coding_endpoint
+    refine_model = settings.get_coding_model
+
+    fix_prompt = _build_fix_prompt(original_content, issue, suggestion)
+
+    if LLM_PROVIDER_AVAILABLE and refine_endpoint:
+        try:
+            provider = LLMProviderFactory.create(
+                model_type=settings.get_coding_model_type,
+                endpoint=refine_endpoint,
+                model=refine_model
+            )
+
+            response = await provider.generate(fix_prompt, TaskType.REFINE)
+
+            fixed_code = _extract_provider_fix(response.content, original_content)
+            if fixed_code:
+                return fixed_code
+
+        except Exception as e:
+            logger.warning(f"LLM provider failed for fix: {e}, using fallback")
+
+    if refine_endpoint:
+        try:
+            result, error = await AsyncLLMHttpClient(timeout=90, max_retries=1).post(
+                **_build_direct_fix_request(refine_endpoint, refine_model, fix_prompt)
+            )
+
+            fixed_code = _extract_direct_fix(result, error, original_content)
+            if fixed_code:
+                return fixed_code
+
+        except Exception as e:
+            logger.warning(f"Direct LLM call failed: {e}, using heuristic fallback")
+
+    return _apply_fix_heuristic(original_content, issue)
+
+
+def _build_fix_prompt(original_content: str, issue: str, suggestion: str = "") -> str:
+    """Build the fix prompt for a single issue"""
+    return f"""Fix the following issue in the code:
 
 ISSUE: {issue}
 {f'SUGGESTION: {suggestion}' if suggestion else ''}
@@ -651,72 +826,60 @@ REQUIREMENTS:
 
 Return the fixed code directly:"""
 
-    # Try LLM provider adapter first
-    if LLM_PROVIDER_AVAILABLE and refine_endpoint:
-        try:
-            provider = LLMProviderFactory.create(
-                model_type=settings.get_coding_model_type,
-                endpoint=refine_endpoint,
-                model=refine_model
-            )
 
-            response = provider.generate_sync(fix_prompt, TaskType.REFINE)
+def _build_direct_fix_request(refine_endpoint: str, refine_model: str, fix_prompt: str) -> Dict:
+    """Build the direct /completions request used when the adapter fails"""
+    prompt = f"""You are a code fixing expert. Fix the following issue:
 
-            if response.content:
-                # Extract code from response (handles markdown, explanations, etc.)
-                fixed_code = _extract_code_from_response(response.content, original_content)
+{fix_prompt}
 
-                # Final validation: ensure we got actual code, not prose
-                if fixed_code and len(fixed_code) > 20:
-                    logger.info(f"🤖 Fix applied via {settings.get_coding_model_type} adapter")
-                    return fixed_code
-                else:
-                    logger.warning("⚠️ Extracted code too short - using fallback")
+Fixed code:"""
 
-        except Exception as e:
-            logger.warning(f"LLM provider failed for fix: {e}, using fallback")
+    return {
+        "url": f"{refine_endpoint}/completions",
+        "json": {
+            "model": refine_model,
+            "prompt": prompt,
+            "max_tokens": 2048,
+            "temperature": 0.2,
+            "stop": ["```\n\n", "ISSUE:", "ORIGINAL CODE:"]
+        },
+    }
 
-    # Fallback to direct HTTP call
-    if refine_endpoint:
-        try:
-            import httpx
 
-            prompt = f"""You are a code fixing expert. Fix the following issue:
+def _extract_provider_fix(content: str, original_content: str) -> Optional[str]:
+    """Extract fixed code from an adapter response, or None if unusable"""
+    if not content:
+        return None
 
-{fix_prompt}
+    # Extract code from response (handles markdown, explanations, etc.)
+    fixed_code = _extract_code_from_response(content, original_content)
 
-Fixed code:"""
+    # Final validation: ensure we got actual code, not prose
+    if fixed_code and len(fixed_code) > 20:
+        logger.info(f"🤖 Fix applied via {settings.get_coding_model_type} adapter")
+        return fixed_code
 
-            with httpx.Client(timeout=90.0) as client:
-                response = client.post(
-                    f"{refine_endpoint}/completions",
-                    json={
-                        "model": refine_model,
-                        "prompt": prompt,
-                        "max_tokens": 2048,
-                        "temperature": 0.2,
-                        "stop": ["```\n\n", "ISSUE:", "ORIGINAL CODE:"]
-                    }
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    raw_response = result["choices"][0]["text"].strip()
-
-                    # Use the same extraction logic as LLM provider
-                    fixed_code = _extract_code_from_response(raw_response, original_content)
-
-                    if fixed_code and len(fixed_code) > 20:
-                        logger.info(f"🔧 Fix applied via direct LLM call")
-                        return fixed_code
-                    else:
-                        logger.warning("⚠️ Direct LLM response extraction failed")
+    logger.warning("⚠️ Extracted code too short - using fallback")
+    return None
 
-        except Exception as e:
-            logger.warning(f"Direct LLM call failed: {e}, using heuristic fallback")
 
-    # Final fallback: heuristic fixes
-    return _apply_fix_heuristic(original_content, issue)
+def _extract_direct_fix(result: Optional[Dict], error: Optional[str], original_content: str) -> Optional[str]:
+    """Extract fixed code from a direct /completions response, or None"""
+    if error:
+        return None
+
+    raw_response = result["choices"][0]["text"].strip()
+
+    # Use the same extraction logic as LLM provider
+    fixed_code = _extract_code_from_response(raw_response, original_content)
+
+    if fixed_code and len(fixed_code) > 20:
+        logger.info(f"🔧 Fix applied via direct LLM call")
+        return fixed_code
+
+    logger.warning("⚠️ Direct LLM response extraction failed")
+    return None
 
 
 def _apply_fix_heuristic(original_content: str, issue: str) -> str:
@@ -4,13 +4,14 @@ Reviews generated code using LLM via vLLM/OpenAI-compatible endpoint.
 Uses model adapters for flexible model switching.
 """
 
+import json
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from app.core.config import settings
 from app.agent.langgraph.schemas.state import QualityGateState, DebugLog
-from app.services.http_client import LLMHttpClient
+from app.services.http_client import LLMHttpClient, AsyncLLMHttpClient
 
 # Import LLM provider for model-agnostic calls
 try:
@@ -39,12 +40,55 @@ def reviewer_node(state: QualityGateState) -> Dict:
     """
     logger.info("👔 Reviewer Node: Starting code review...")
 
+    artifacts, debug_logs, early_result = _start_review(state)
+    if early_result is not None:
+        return early_result
+
+    # Perform review
+    try:
+        review_result = _review_code_with_vllm(artifacts, state.get("user_request", ""))
+        return _finish_review(state, review_result, debug_logs)
+
+    except Exception as e:
+        return _review_error_result(state, e, debug_logs)
+
+
+async def reviewer_node_async(state: QualityGateState) -> Dict:
+    """Async Reviewer Node: same as reviewer_node, but awaits the LLM call
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        State updates with review feedback and approval status
+    """
+    logger.info("👔 Reviewer Node: Starting code review...")
+
+    artifacts, debug_logs, early_result = _start_review(state)
+    if early_result is not None:
+        return early_result
+
+    try:
+        review_result = await _review_code_with_vllm_async(artifacts, state.get("user_request", ""))
+        return _finish_review(state, review_result, debug_logs)
+
+    except Exception as e:
+        return _review_error_result(state, e, debug_logs)
+
+
+def _start_review(state: QualityGateState) -> Tuple[List[Dict], List[DebugLog], Optional[Dict]]:
+    """Collect artifacts and initial debug logs for a review
+
+    Returns:
+        Tuple of (artifacts, debug_logs, early_result); early_result is the
+        state update to return immediately when there is nothing to review
+    """
     coder_output = state.get("coder_output")
     debug_logs = []
 
     if not coder_output or not coder_output.get("artifacts"):
         logger.warning("⚠️  No code to review")
-        return {
+        return [], debug_logs, {
             "review_feedback": {
                 "approved": False,
                 "issues": ["No code artifacts found to review"],
@@ -70,82 +114,85 @@ def reviewer_node(state: QualityGateState) -> Dict:
             token_usage=None
         ))
 
-    # Perform review
-    try:
-        review_result = _review_code_with_vllm(artifacts, state.get("user_request", ""))
+    return artifacts, debug_logs, None
 
-        approved = review_result["approved"]
-
-        # FIXED: Force approval after max refinement iterations to prevent infinite loop
-        refinement_iteration = state.get("refinement_iteration", 0)
-        max_iterations = state.get("max_iterations", 5)
-
-        if refinement_iteration >= max_iterations - 1 and not approved:
-            # Force approve on last iteration (max_iterations - 1)
-            logger.warning(f"⚠️ Refinement iteration {refinement_iteration}/{max_iterations} - forcing approval to prevent loop")
-            approved = True
-            review_result["approved"] = True
-            review_result["critique"] += f" [Auto-approved after {max_iterations} iterations]"
-
-        logger.info(f"📋 Review {'✅ APPROVED' if approved else '❌ REJECTED'}")
-        logger.info(f"   Quality Score: {review_result['quality_score']:.2f}")
-        logger.info(f"   Issues: {len(review_result['issues'])}")
-        logger.info(f"   Suggestions: {len(review_result['suggestions'])}")
-        logger.info(f"   Refinement Iteration: {refinement_iteration}/{max_iterations}")
-
-        # Add result debug log
-        if state.get("enable_debug"):
-            debug_logs.append(DebugLog(
-                timestamp=datetime.utcnow().isoformat(),
-                node="reviewer",
-                agent="ReviewerAgent",
-                event_type="result",
-                content=f"Review {'approved' if approved else 'rejected'}: "
-                       f"{len(review_result['issues'])} issues, "
-                       f"score {review_result['quality_score']:.2f}",
-                metadata={
-                    "approved": approved,
-                    "quality_score": review_result["quality_score"],
-                    "issues_count": len(review_result["issues"]),
-                },
-                token_usage={
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "total_tokens": 0
-                }
-            ))
-
-        return {
-            "review_feedback": review_result,
-            "review_approved": approved,
-            "debug_logs": debug_logs,
-        }
 
-    except Exception as e:
-        logger.error(f"❌ Review failed: {e}", exc_info=True)
-
-        if state.get("enable_debug"):
-            debug_logs.append(DebugLog(
-                timestamp=datetime.utcnow().isoformat(),
-                node="reviewer",
-                agent="ReviewerAgent",
-                event_type="error",
-                content=f"Review failed: {str(e)}",
-                metadata={"error_type": type(e).__name__},
-                token_usage=None
-            ))
-
-        return {
-            "review_feedback": {
-                "approved": False,
-                "issues": [f"Review error: {str(e)}"],
-                "suggestions": [],
-                "quality_score": 0.0,
-                "critique": "Review failed due to error"
+def _finish_review(state: QualityGateState, review_result: Dict, debug_logs: List[DebugLog]) -> Dict:
+    """Apply approval rules to a review result and build the state update"""
+    approved = review_result["approved"]
+
+    # FIXED: Force approval after max refinement iterations to prevent infinite loop
+    refinement_iteration = state.get("refinement_iteration", 0)
+    max_iterations = state.get("max_iterations", 5)
+
+    if refinement_iteration >= max_iterations - 1 and not approved:
+        # Force approve on last iteration (max_iterations - 1)
+        logger.warning(f"⚠️ Refinement iteration {refinement_iteration}/{max_iterations} - forcing approval to prevent loop")
+        approved = True
+        review_result["approved"] = True
+        review_result["critique"] += f" [Auto-approved after {max_iterations} iterations]"
+
+    logger.info(f"📋 Review {'✅ APPROVED' if approved else '❌ REJECTED'}")
+    logger.info(f"   Quality Score: {review_result['quality_score']:.2f}")
+    logger.info(f"   Issues: {len(review_result['issues'])}")
+    logger.info(f"   Suggestions: {len(review_result['suggestions'])}")
+    logger.info(f"   Refinement Iteration: {refinement_iteration}/{max_iterations}")
+
+    # Add result debug log
+    if state.get("enable_debug"):
+        debug_logs.append(DebugLog(
+            timestamp=datetime.utcnow().isoformat(),
+            node="reviewer",
+            agent="ReviewerAgent",
+            event_type="result",
+            content=f"Review {'approved' if approved else 'rejected'}: "
+                   f"{len(review_result['issues'])} issues, "
+                   f"score {review_result['quality_score']:.2f}",
+            metadata={
+                "approved": approved,
+                "quality_score": review_result["quality_score"],
+                "issues_count": len(review_result["issues"]),
             },
-            "review_approved": False,
-            "debug_logs": debug_logs,
-        }
+            token_usage={
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "total_tokens": 0
+            }
+        ))
+
+    return {
+        "review_feedback": review_result,
+        "review_approved": approved,
+        "debug_logs": debug_logs,
+    }
+
+
+def _review_error_result(state: QualityGateState, e: Exception, debug_logs: List[DebugLog]) -> Dict:
+    """Build the reviewer state update for a failed review"""
+    logger.error(f"❌ Review failed: {e}", exc_info=True)
+
+    if state.get("enable_debug"):
+        debug_logs.append(DebugLog(
+            timestamp=datetime.utcnow().isoformat(),
+            node="reviewer",
+            agent="ReviewerAgent",
+            event_type="error",
+            content=f"Review failed: {str(e)}",
+            metadata={"error_type": type(e).__name__},
+            token_usage=None
+        ))
+
+    return {
+        "review_feedback": {
+            "approved": False,
+            "issues": [f"Review error: {str(e)}"],
+            "suggestions": [],
+            "quality_score": 0.0,
+            "critique": "Review failed due to error"
+        },
+        "review_approved": False,
+        "debug_logs": debug_logs,
+    }
 
 
 def _review_code_with_vllm(artifacts: List[Dict], user_request: str) -> Dict:
@@ -167,22 +214,7 @@ def _review_code_with_vllm(artifacts: List[Dict], user_request: str) -> Dict:
         logger.warning("⚠️  LLM endpoint not configured, using fallback reviewer")
         return _fallback_code_reviewer(artifacts, user_request)
 
-    # Build review prompt
-    code_summary = "\n\n".join([
-        f"File: {a['filename']}\n```{a.get('language', 'text')}\n{a['content'][:500]}...\n```"
-        for a in artifacts[:3]  # Review first 3 files
-    ])
-
-    review_prompt = f"""Original Request: {user_request}
-
-Generated Code:
-{code_summary}
-
-Review this code for:
-1. Correctness - Does it fulfill the requirements?
-2. Security - Any vulnerabilities?
-3. Performance - Any inefficiencies?
-4. Best Practices - Does it follow conventions?"""
+    review_prompt = _build_review_prompt(artifacts, user_request)
 
     # Try LLM provider adapter first
     if LLM_PROVIDER_AVAILABLE:
@@ -205,13 +237,6 @@ Review this code for:
 
     # Fallback to direct HTTP call with retry logic
     try:
-        # Get model-specific prompt
-        model_type = settings.get_reasoning_model_type
-        prompt = _get_review_prompt(model_type, review_prompt)
-
-        # Log model info (model type auto-detected from model name)
-        logger.info(f"🤖 Reviewing with model: {review_model} (type: {model_type})")
-
         # Use HTTP client with built-in retry logic
         http_client = LLMHttpClient(
             timeout=90,
@@ -220,41 +245,133 @@ Review this code for:
         )
 
         result, error = http_client.post(
-            url=f"{review_endpoint}/completions",
-            json={
-                "model": review_model,
-                "prompt": prompt,
-                "max_tokens": 1024,
-                "temperature": 0.1,
-                "stop": ["</s>", "Human:", "User:"]
-            }
+            **_build_review_request(review_endpoint, review_model, review_prompt),
+            cache_task_type="review"
         )
+        return _parse_review_result(result, error, artifacts, user_request)
 
-        if error:
-            logger.warning(f"LLM review failed after retries: {error}, using fallback")
-            return _fallback_code_reviewer(artifacts, user_request)
+    except Exception as e:
+        logger.error(f"LLM review failed: {e}")
+        return _fallback_code_reviewer(artifacts, user_request)
 
-        generated_text = result["choices"][0]["text"]
 
-        # Parse JSON
-        import json
-        try:
-            json_start = generated_text.find("{")
-            json_end = generated_text.rfind("}") + 1
-            if json_start != -1 and json_end > json_start:
-                json_str = generated_text[json_start:json_end]
-                return json.loads(json_str)
-        except json.JSONDecodeError:
-            pass
-
-        logger.warning("Failed to parse LLM review JSON, using fallback")
+async def _review_code_with_vllm_async(artifacts: List[Dict], user_request: str) -> Dict:
+    """Async variant of _review_code_with_vllm (awaits the provider / HTTP call)
+
+    Returns:
+        Review result with approved, issues, suggestions, quality_score, critique
+    """
+    review_endpoint = settings.get_coding_endpoint
+    review_model = settings.get_coding_model
+
+    if not review_endpoint:
+        logger.warning("⚠️  LLM endpoint not configured, using fallback reviewer")
         return _fallback_code_reviewer(artifacts, user_request)
 
+    review_prompt = _build_review_prompt(artifacts, user_request)
+
+    if LLM_PROVIDER_AVAILABLE:
+        try:
+            provider = LLMProviderFactory.create(
+                model_type=settings.get_reasoning_model_type,
+                endpoint=review_endpoint,
+                model=review_model
+            )
+
+            response = await provider.generate(review_prompt, TaskType.REVIEW)
+
+            if response.parsed_json:
+                logger.info(f"🤖 Review via {settings.get_reasoning_model_type} adapter")
+                return response.parsed_json
+
+        except Exception as e:
+            logger.warning(f"LLM provider failed: {e}, falling back to direct call")
+
+    try:
+        http_client = AsyncLLMHttpClient(
+            timeout=90,
+            max_retries=3,
+            base_delay=2
+        )
+
+        result, error = await http_client.post(
+            **_build_review_request(review_endpoint, review_model, review_prompt),
+            cache_task_type="review"
+        )
+        return _parse_review_result(result, error, artifacts, user_request)
+
     except Exception as e:
         logger.error(f"LLM review failed: {e}")
         return _fallback_code_reviewer(artifacts, user_request)
 
 
+def _build_review_prompt(artifacts: List[Dict], user_request: str) -> str:
+    """Build the review prompt from the first few artifacts"""
+    code_summary = "\n\n".join([
+        f"File: {a['filename']}\n```{a.get('language', 'text')}\n{a['content'][:500]}...\n```"
+        for a in artifacts[:3]  # Review first 3 files
+    ])
+
+    return f"""Original Request: {user_request}
+
+Generated Code:
+{code_summary}
+
+Review this code for:
+1. Correctness - Does it fulfill the requirements?
+2. Security - Any vulnerabilities?
+3. Performance - Any inefficiencies?
+4. Best Practices - Does it follow conventions?"""
+
+
+def _build_review_request(review_endpoint: str, review_model: str, review_prompt: str) -> Dict:
+    """Build the direct /completions request used when the adapter fails"""
+    # Get model-specific prompt
+    model_type = settings.get_reasoning_model_type
+    prompt = _get_review_prompt(model_type, review_prompt)
+
+    # Log model info (model type auto-detected from model name)
+    logger.info(f"🤖 Reviewing with model: {review_model} (type: {model_type})")
+
+    return {
+        "url": f"{review_endpoint}/completions",
+        "json": {
+            "model": review_model,
+            "prompt": prompt,
+            "max_tokens": 1024,
+            "temperature": 0.1,
+            "stop": ["</s>", "Human:", "User:"]
+        },
+    }
+
+
+def _parse_review_result(
+    result: Optional[Dict],
+    error: Optional[str],
+    artifacts: List[Dict],
+    user_request: str
+) -> Dict:
+    """Parse a /completions review response, falling back to heuristics"""
+    if error:
+        logger.warning(f"LLM review failed after retries: {error}, using fallback")
+        return _fallback_code_reviewer(artifacts, user_request)
+
+    generated_text = result["choices"][0]["text"]
+
+    # Parse JSON
+    try:
+        json_start = generated_text.find("{")
+        json_end = generated_text.rfind("}") + 1
+        if json_start != -1 and json_end > json_start:
+            json_str = generated_text[json_start:json_end]
+            return json.loads(json_str)
+    except json.JSONDecodeError:
+        pass
+
+    logger.warning("Failed to parse LLM review JSON, using fallback")
+    return _fallback_code_reviewer(artifacts, user_request)
+
+
 def _get_review_prompt(model_type: str, review_context: str) -> str:
     """Generate model-specific review prompt
 
@@ -10,8 +10,14 @@ logger = logging.getLogger(__name__)
 class CodingAgent(BaseAgent):
     """Coding agent that uses vLLM models for code generation and reasoning."""
 
-    def __init__(self):
-        """Initialize coding agent."""
+    def __init__(self, session_id: Optional[str] = None):
+        """Initialize coding agent.
+
+        Args:
+            session_id: Session identifier (keeps the session on one vLLM
+                replica with the prefix_affinity load balancing strategy)
+        """
+        self.session_id = session_id
         self.conversation_history: List[Dict[str, str]] = []
         logger.info("CodingAgent (Microsoft) initialized")
 
@@ -32,7 +38,7 @@ class CodingAgent(BaseAgent):
             Agent's response
         """
         # Get appropriate client
-        client = vllm_router.get_client(task_type)
+        client = vllm_router.get_client(task_type, affinity_key=self.session_id or system_prompt)
 
         # Build messages
         messages = []
@@ -86,7 +92,7 @@ class CodingAgent(BaseAgent):
             Chunks of the agent's response
         """
         # Get appropriate client
-        client = vllm_router.get_client(task_type)
+        client = vllm_router.get_client(task_type, affinity_key=self.session_id or system_prompt)
 
         # Build messages
         messages = []
@@ -155,7 +161,7 @@ class AgentManager(BaseAgentManager):
             CodingAgent instance
         """
         if session_id not in self.agents:
-            self.agents[session_id] = CodingAgent()
+            self.agents[session_id] = CodingAgent(session_id)
             logger.info(f"Created new agent for session {session_id}")
         return self.agents[session_id]
 
@@ -411,7 +411,8 @@ class VLLMChatClient(BaseChatClient):
             messages=vllm_messages,
             temperature=kwargs.get("temperature", 0.7),
             max_tokens=kwargs.get("max_tokens", 4096),
-            stream=False
+            stream=False,
+            cache_task_type=self.model_type
         )
 
         response_message = ChatMessage(role="assistant", text=vllm_response.choices[0].message.content)
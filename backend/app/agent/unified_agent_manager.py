@@ -203,6 +203,8 @@ class UnifiedAgentManager:
         """RAG 컨텍스트로 사용자 메시지 보강
 
         벡터 검색을 통해 관련 코드를 찾고 메시지에 추가합니다.
+        코드/대화 검색은 이벤트 루프 밖에서 동시에 실행되며, 지연 시간 예산을
+        넘긴 검색은 빼고 나머지 결과만 사용합니다.
 
         Args:
             user_message: 원본 사용자 메시지
@@ -213,7 +215,7 @@ class UnifiedAgentManager:
         """
         try:
             rag_builder = get_rag_builder(session_id)
-            enriched_message, rag_context = rag_builder.enrich_query(
+            enriched_message, rag_context = await rag_builder.enrich_query_async(
                 user_message,
                 n_results=5,
                 min_relevance=0.5
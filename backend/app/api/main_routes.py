@@ -29,6 +29,7 @@ from app.db import get_db, ConversationRepository
 from app.utils.security import sanitize_path, SecurityError
 from app.services import WorkflowService
 from app.services.code_indexer import get_code_indexer
+from app.services.workspace_watcher import start_workspace_watcher
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -253,7 +254,7 @@ async def get_unified_context(session_id: str):
 
         return {
             "session_id": session_id,
-            "message_count": len(context.messages),
+            "message_count": context.message_count,
             "artifact_count": len(context.artifacts),
             "workspace": context.workspace,
             "last_analysis": context.last_analysis,
@@ -1111,7 +1112,9 @@ async def delete_vector_session(session_id: str):
     """Delete all indexed code for a session."""
     try:
         from app.services.vector_db import vector_db
+        from app.services.lexical_index import reset_lexical_index
         vector_db.delete_by_session(session_id)
+        reset_lexical_index(session_id)
         return {"message": f"Deleted vectors for session {session_id}"}
 
     except Exception as e:
@@ -1127,7 +1130,10 @@ async def get_cache_stats():
     """Get LM cache statistics."""
     try:
         from app.services.lm_cache import lm_cache
-        return lm_cache.get_stats()
+        from app.services.llm_request_cache import get_llm_request_cache
+        stats = lm_cache.get_stats()
+        stats["request_cache"] = get_llm_request_cache().get_stats()
+        return stats
 
     except Exception as e:
         logger.error(f"Error getting cache stats: {e}")
@@ -1322,9 +1328,15 @@ async def get_tool_stats():
     """
     try:
         from app.tools.registry import get_registry
+        from app.tools.python_pool import get_python_worker_pool
+        from app.tools.performance import get_cache
 
         registry = get_registry()
-        return registry.get_statistics()
+        stats = registry.get_statistics()
+        pool = get_python_worker_pool()
+        stats["python_worker_pool"] = pool.get_stats() if pool else None
+        stats["result_cache"] = get_cache().get_stats()
+        return stats
 
     except Exception as e:
         logger.error(f"Error getting tool stats: {e}")
@@ -1464,7 +1476,20 @@ async def set_workspace(request: dict):
         )
         logger.info(f"Started background indexing for workspace: {validated_path}")
 
-        return {"success": True, "workspace": str(validated_path), "indexing": "started"}
+        # Keep the index live while the agent edits files
+        watching = False
+        if settings.workspace_watch_enabled:
+            await start_workspace_watcher(
+                str(validated_path),
+                session_id,
+                debounce_seconds=settings.workspace_watch_debounce,
+                max_delay_seconds=settings.workspace_watch_max_delay,
+                max_pending=settings.workspace_watch_max_pending,
+                poll_interval=settings.workspace_watch_poll_interval,
+            )
+            watching = True
+
+        return {"success": True, "workspace": str(validated_path), "indexing": "started", "watching": watching}
 
     except SecurityError as e:
         logger.warning(f"Security violation in set_workspace: {e}")
@@ -1516,10 +1541,15 @@ async def index_workspace(request: dict):
             "stats": {
                 "indexed": stats.indexed,
                 "skipped": stats.skipped,
+                "removed": stats.removed,
                 "errors": stats.errors,
                 "total_chunks": stats.total_chunks,
                 "files_processed": stats.files_processed[:20],  # Limit response size
-                "error_files": stats.error_files
+                "error_files": stats.error_files,
+                "batches": stats.batches,
+                "duration_seconds": round(stats.duration_seconds, 2),
+                "files_per_second": round(stats.files_per_second, 1),
+                "chunks_per_second": round(stats.chunks_per_second, 1)
             }
         }
     except Exception as e:
@@ -1782,18 +1812,21 @@ async def execute_shell_command(request: dict):
     """Execute a shell command in the workspace directory.
 
     Args:
-        request: Contains session_id, command, and optional timeout
+        request: Contains session_id, command, optional timeout and
+            stream (send output as NDJSON events while the command runs)
 
     Returns:
-        Command output (stdout, stderr, return code)
+        Command output (stdout, stderr, return code). With stream=true,
+        {"type": "output", "stream", "data"} lines followed by a
+        {"type": "result", ...} line with the same fields.
     """
-    import asyncio
-    import subprocess
     import os
+    from app.tools.streaming import OutputBuffer, stream_output_events
 
     session_id = request.get("session_id", "default")
     command = request.get("command", "")
     timeout = request.get("timeout", 30)  # Default 30 seconds
+    stream = bool(request.get("stream", False))
 
     if not command:
         return {"success": False, "error": "No command provided"}
@@ -1816,42 +1849,60 @@ async def execute_shell_command(request: dict):
                 "error": f"Blocked: potentially dangerous command pattern '{pattern}'"
             }
 
-    try:
-        # Run command in workspace directory
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=workspace,
-            env={**os.environ, "HOME": workspace}
-        )
-
+    async def run():
+        """Yield output events, then the result event"""
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout
+            # Run command in workspace directory
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=workspace,
+                env={**os.environ, "HOME": workspace}
             )
-        except asyncio.TimeoutError:
-            process.kill()
-            return {
-                "success": False,
-                "error": f"Command timed out after {timeout} seconds",
-                "stdout": "",
-                "stderr": "",
-                "return_code": -1
+
+            stdout, stderr = OutputBuffer(), OutputBuffer()
+            try:
+                async for event in stream_output_events(process, timeout, stdout, stderr):
+                    yield event
+            except asyncio.TimeoutError:
+                yield {
+                    "type": "result",
+                    "success": False,
+                    "error": f"Command timed out after {timeout} seconds",
+                    "stdout": stdout.getvalue(),
+                    "stderr": stderr.getvalue(),
+                    "return_code": -1
+                }
+                return
+
+            yield {
+                "type": "result",
+                "success": process.returncode == 0,
+                "stdout": stdout.getvalue(),
+                "stderr": stderr.getvalue(),
+                "return_code": process.returncode,
+                "cwd": workspace,
+                "output_truncated": stdout.truncated or stderr.truncated
             }
 
-        return {
-            "success": process.returncode == 0,
-            "stdout": stdout.decode('utf-8', errors='replace'),
-            "stderr": stderr.decode('utf-8', errors='replace'),
-            "return_code": process.returncode,
-            "cwd": workspace
-        }
+        except Exception as e:
+            logger.error(f"Error executing shell command: {e}")
+            yield {"type": "result", "success": False, "error": str(e)}
 
-    except Exception as e:
-        logger.error(f"Error executing shell command: {e}")
-        return {"success": False, "error": str(e)}
+    if stream:
+        async def generate():
+            async for event in run():
+                yield json.dumps(event) + "\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    result = {}
+    async for event in run():
+        if event["type"] == "result":
+            result = event
+    result.pop("type", None)
+    return result
 
 
 @router.get("/shell/history")
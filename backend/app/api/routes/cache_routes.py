@@ -5,7 +5,7 @@ Provides functionality to clear LLM cache, session context, and workspace contex
 """
 
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 
@@ -28,6 +28,14 @@ class CacheStatsResponse(BaseModel):
     ttl_hours: int
     used_memory: Optional[str] = None
     cache_dir: Optional[str] = None
+    semantic_enabled: bool = False
+    lookups: int = 0
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+    exact_hit_rate: float = 0.0
+    semantic_hit_rate: float = 0.0
+    request_cache: Optional[Dict[str, Any]] = None
 
 
 class ClearContextRequest(BaseModel):
@@ -44,10 +52,12 @@ async def get_cache_stats() -> CacheStatsResponse:
     """Get LLM cache statistics
 
     Returns:
-        Cache statistics including entry count and memory usage
+        Cache statistics including entry count, memory usage and
+        exact vs semantic hit rates
     """
     try:
         from app.services.lm_cache import lm_cache
+        from app.services.llm_request_cache import get_llm_request_cache
 
         stats = lm_cache.get_stats()
         return CacheStatsResponse(
@@ -56,6 +66,14 @@ async def get_cache_stats() -> CacheStatsResponse:
             ttl_hours=stats.get("ttl_hours", 24),
             used_memory=stats.get("used_memory"),
             cache_dir=stats.get("cache_dir"),
+            semantic_enabled=stats.get("semantic_enabled", False),
+            lookups=stats.get("lookups", 0),
+            exact_hits=stats.get("exact_hits", 0),
+            semantic_hits=stats.get("semantic_hits", 0),
+            misses=stats.get("misses", 0),
+            exact_hit_rate=stats.get("exact_hit_rate", 0.0),
+            semantic_hit_rate=stats.get("semantic_hit_rate", 0.0),
+            request_cache=get_llm_request_cache().get_stats(),
         )
     except Exception as e:
         logger.error(f"Error getting cache stats: {e}")
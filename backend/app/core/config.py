@@ -75,6 +75,10 @@ class Settings(BaseSettings):
     llm_endpoint: str = "http://localhost:8001/v1"
     llm_model: str = "deepseek-ai/DeepSeek-R1"
 
+    # Optional tokenizer.json for exact token counting (falls back to a local
+    # Hugging Face cache copy for llm_model, then to estimation)
+    tokenizer_path: Optional[str] = None
+
     # Model type override (optional - auto-detected from model name if not set)
     # Options: "deepseek", "qwen", "gpt-oss", "gpt", "claude", "generic"
     model_type: Optional[str] = None
@@ -85,9 +89,16 @@ class Settings(BaseSettings):
 
     # Optional: Multiple endpoints for load balancing (comma-separated)
     # Example: "http://localhost:8001/v1,http://localhost:8002/v1"
-    # If set, load balances across all endpoints using round-robin
+    # If set, load balances across all endpoints (see vllm_lb_strategy)
     vllm_endpoints: Optional[str] = None
 
+    # Load balancing strategy for vllm_endpoints:
+    # "round_robin", "least_outstanding", "latency_ewma", "prefix_affinity"
+    vllm_lb_strategy: str = "least_outstanding"
+    # Passive health checks: eject an endpoint after N consecutive failures
+    vllm_lb_eject_after_failures: int = 3
+    vllm_lb_eject_cooldown: float = 30.0  # seconds before an ejected endpoint is retried
+
     # Optional: Task-specific models (override llm_model if set)
     reasoning_model: Optional[str] = None
     coding_model: Optional[str] = None
@@ -96,6 +107,11 @@ class Settings(BaseSettings):
     reasoning_model_type: Optional[str] = None
     coding_model_type: Optional[str] = None
 
+    # HTTP connection pool shared by the LLM adapters (per endpoint)
+    llm_http_max_connections: int = 100
+    llm_http_max_keepalive_connections: int = 20
+    llm_http2: bool = True  # Used only when the 'h2' package is installed
+
     # GPT-OSS specific settings
     gpt_oss_reasoning_effort: str = "low"  # low, medium, high - default is low per official docs
 
@@ -173,12 +189,53 @@ class Settings(BaseSettings):
     # Enable parallel coding (set to False for sequential processing)
     enable_parallel_coding: bool = True
 
+    # QA gate: run the workspace tests affected by the files changed in each
+    # iteration and gate on the per-test results
+    qa_run_tests: bool = True
+    qa_test_timeout: int = 300  # seconds
+    qa_test_workers: int = 0  # pytest-xdist workers (0 = single process)
+    qa_test_fail_fast: bool = False  # stop at the first failing test (pytest -x)
+
+    # =========================
+    # LLM Response Cache
+    # =========================
+    # Semantic tier: reuse responses of embedding-similar prompts
+    # (same model/temperature) when the exact prompt is not cached
+    lm_cache_semantic_enabled: bool = False
+    lm_cache_semantic_threshold: float = 0.95  # Minimum cosine similarity
+
+    # Request cache on the LLM call paths (nodes, adapters, vLLM client)
+    # Comma-separated task types to cache: reasoning, coding, review, refine, general
+    # Empty = disabled. Identical concurrent requests are coalesced into one call.
+    llm_cache_task_types: str = ""
+    llm_cache_max_temperature: float = 0.2  # Only cache (near-)deterministic calls
+
+    @property
+    def llm_cache_task_types_list(self) -> List[str]:
+        """Get list of task types that use the LLM request cache."""
+        return [t.strip().lower() for t in self.llm_cache_task_types.split(",") if t.strip()]
+
     # =========================
     # Workspace Configuration
     # =========================
     # Default workspace path (auto-detected based on OS if not set)
     default_workspace: str = DEFAULT_WORKSPACE
 
+    # Background watcher that keeps the code index and knowledge graph live
+    # Uses watchdog (inotify/FSEvents) when installed, otherwise polls
+    workspace_watch_enabled: bool = False
+    workspace_watch_debounce: float = 0.5  # seconds of quiet before re-indexing
+    workspace_watch_max_delay: float = 5.0  # re-index at least this often during bursts
+    workspace_watch_max_pending: int = 2000  # above this, one incremental full re-index
+    workspace_watch_poll_interval: float = 2.0  # polling fallback interval (seconds)
+
+    # Knowledge graphs: one per workspace (shared by its sessions), saved as
+    # snapshots under data/knowledge_graphs and loaded lazily after a restart.
+    # Least recently used graphs are saved and dropped from memory above these limits.
+    knowledge_graph_persist: bool = True
+    knowledge_graph_max_loaded: int = 8  # graphs kept in memory
+    knowledge_graph_max_nodes: int = 2000000  # total nodes kept in memory
+
     # =========================
     # API Configuration
     # =========================
@@ -219,6 +276,24 @@ class Settings(BaseSettings):
     sandbox_memory: str = "1g"
     sandbox_cpu: float = 2.0
 
+    # Warm Python worker pool for the execute_python tool (POSIX only)
+    # Each run is forked from a warm worker with its own timeout and memory limit.
+    # 0 = disabled (a new python3 process per run)
+    python_worker_pool_size: int = 2
+    python_worker_max_executions: int = 100  # runs before a worker is replaced
+    python_worker_memory_mb: int = 1024  # address-space limit per run (0 = unlimited)
+    python_worker_preload: str = ""  # comma-separated modules imported once per worker
+
+    @property
+    def python_worker_preload_list(self) -> List[str]:
+        """Get list of modules preloaded by Python workers."""
+        return [m.strip() for m in self.python_worker_preload.split(",") if m.strip()]
+
+    # Parallel tool execution (Supervisor tool-use loop, ToolExecutor.execute_batch)
+    # Independent calls from one model turn run concurrently; calls that change
+    # files run after the calls before them that touch the same paths.
+    tool_max_parallel: int = 4  # 1 = run tool calls one by one
+
     @property
     def cors_origins_list(self) -> List[str]:
         """Convert comma-separated CORS origins to list."""
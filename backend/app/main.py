@@ -1,4 +1,5 @@
 """FastAPI application entry point."""
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -65,9 +66,54 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("Database initialization skipped (not available)")
 
+    # Shared keep-alive HTTP pool for LLM adapters
+    try:
+        from shared.llm.http_pool import configure_llm_client_pool
+        configure_llm_client_pool(
+            max_connections=settings.llm_http_max_connections,
+            max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+            http2=settings.llm_http2,
+        )
+    except ImportError as e:
+        logger.warning(f"LLM HTTP client pool not available: {e}")
+
+    # Exact token counting when a local tokenizer for the model is available
+    from shared.utils.token_utils import configure_tokenizer
+    await asyncio.to_thread(configure_tokenizer, settings.llm_model, settings.tokenizer_path)
+
+    # Warm Python workers for execute_python (started in the background)
+    from app.tools.python_pool import get_python_worker_pool, close_python_worker_pool
+    python_pool = get_python_worker_pool()
+    python_pool_start = asyncio.create_task(python_pool.start()) if python_pool else None
+
     yield
     logger.info("Shutting down Coding Agent API...")
 
+    from app.services.workspace_watcher import stop_all_watchers
+    await stop_all_watchers()
+
+    try:
+        from core.context_store import get_context_store
+        await get_context_store().close()
+    except ImportError:
+        pass
+
+    from app.memory.graph_store import get_graph_store
+    saved = await asyncio.to_thread(get_graph_store().save_all)
+    logger.info(f"Saved {saved} knowledge graph snapshots")
+
+    try:
+        from shared.llm.http_pool import close_llm_client_pool
+        await close_llm_client_pool()
+    except ImportError:
+        pass
+
+    if python_pool_start and not python_pool_start.done():
+        python_pool_start.cancel()
+    if python_pool_start:
+        await asyncio.gather(python_pool_start, return_exceptions=True)
+    await close_python_worker_pool()
+
 
 # Create FastAPI app
 app = FastAPI(
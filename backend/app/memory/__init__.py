@@ -3,13 +3,16 @@ Memory and Knowledge Management System for DeepAgent Phase 1
 
 This module provides:
 - Knowledge Graph: Concept relationships and code structure
+- Knowledge Graph Store: Persisted, memory-bounded graphs shared per workspace
 - Context Manager: Enhanced context with graph integration
 """
 
 from .knowledge_graph import KnowledgeGraph, Concept, Relationship
+from .graph_store import KnowledgeGraphStore
 
 __all__ = [
     "KnowledgeGraph",
     "Concept",
     "Relationship",
+    "KnowledgeGraphStore",
 ]
@@ -0,0 +1,301 @@
+"""
+Knowledge Graph Store - persisted, memory-bounded knowledge graphs
+
+Graphs are keyed by workspace (sessions on the same workspace share one graph)
+or by session when no workspace is known. Each graph is written to a gzipped
+JSON snapshot (export_to_dict format) and loaded lazily on first access, so a
+restart does not require rebuilding the graph from source files. Only the most
+recently used graphs are kept in memory; idle ones are saved and dropped.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from .knowledge_graph import KnowledgeGraph
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
+GRAPH_DIR = os.path.join(DATA_DIR, "knowledge_graphs")
+
+
+class KnowledgeGraphStore:
+    """
+    LRU cache of KnowledgeGraphs backed by on-disk snapshots.
+
+    A graph is evicted (saved if dirty, then dropped) when more than
+    `max_loaded` graphs or more than `max_nodes` nodes in total are in memory.
+    The graph just requested is never evicted. An evicted graph that is still
+    referenced elsewhere is reused on the next access instead of being reloaded,
+    so there is never more than one live instance per key. Snapshots are read
+    and written outside the store lock, and a graph is loaded once however
+    many callers ask for it concurrently.
+    """
+
+    SNAPSHOT_VERSION = 1
+
+    def __init__(
+        self,
+        directory: Optional[str] = GRAPH_DIR,
+        max_loaded: int = 8,
+        max_nodes: int = 2_000_000
+    ):
+        """
+        Initialize graph store.
+
+        Args:
+            directory: Snapshot directory (None disables persistence)
+            max_loaded: Maximum number of graphs kept in memory
+            max_nodes: Maximum total nodes across graphs kept in memory
+        """
+        self.directory = Path(directory) if directory else None
+        self.max_loaded = max(1, max_loaded)
+        self.max_nodes = max_nodes
+        self._graphs: "OrderedDict[str, KnowledgeGraph]" = OrderedDict()
+        self._evicted: "weakref.WeakValueDictionary[str, KnowledgeGraph]" = weakref.WeakValueDictionary()
+        self._session_keys: Dict[str, str] = {}
+        self._loading: Dict[str, Future] = {}
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self.stats = {"loads": 0, "evictions": 0, "saves": 0}
+
+    @staticmethod
+    def graph_key(session_id: str, workspace: Optional[str] = None) -> str:
+        """
+        Key of the graph for a session/workspace.
+
+        Args:
+            session_id: Session identifier
+            workspace: Optional workspace path
+
+        Returns:
+            Graph key
+        """
+        if workspace:
+            return f"workspace:{Path(workspace).resolve()}"
+        return f"session:{session_id}"
+
+    def get(self, session_id: str, workspace: Optional[str] = None) -> KnowledgeGraph:
+        """
+        Get (loading if needed) the graph for a session.
+
+        Args:
+            session_id: Session identifier
+            workspace: Optional workspace path (binds the session to it)
+
+        Returns:
+            KnowledgeGraph instance
+        """
+        with self._lock:
+            if workspace:
+                key = self.graph_key(session_id, workspace)
+                self._session_keys[session_id] = key
+            else:
+                key = self._session_keys.get(session_id) or self.graph_key(session_id)
+
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._graphs.move_to_end(key)
+                return graph
+
+            graph = self._evicted.pop(key, None)
+            if graph is not None:
+                victims = self._admit(key, graph)
+            else:
+                loading = self._loading.get(key)
+                owner = loading is None
+                if owner:
+                    loading = self._loading[key] = Future()
+
+        if graph is None:
+            if not owner:
+                return loading.result()
+
+            # Snapshot reads run outside the store lock; other callers for
+            # this key wait on the loading future instead of loading again
+            try:
+                graph = self._load(key, session_id)
+            except BaseException as e:
+                with self._lock:
+                    del self._loading[key]
+                loading.set_exception(e)
+                raise
+            with self._lock:
+                del self._loading[key]
+                victims = self._admit(key, graph)
+            loading.set_result(graph)
+
+        for victim_key, victim in victims:
+            self._save(victim_key, victim)
+        return graph
+
+    def save(self, session_id: str, workspace: Optional[str] = None) -> bool:
+        """
+        Write the session's graph snapshot if it changed since the last save.
+
+        Returns immediately if another snapshot is being written; the graph
+        stays dirty and is written by the next save.
+
+        Args:
+            session_id: Session identifier
+            workspace: Optional workspace path
+
+        Returns:
+            True if a snapshot was written
+        """
+        with self._lock:
+            key = self.graph_key(session_id, workspace) if workspace else (
+                self._session_keys.get(session_id) or self.graph_key(session_id)
+            )
+            graph = self._graphs.get(key) or self._evicted.get(key)
+        if graph is None or not self._save_lock.acquire(blocking=False):
+            return False
+        try:
+            return self._write_snapshot(key, graph)
+        finally:
+            self._save_lock.release()
+
+    def save_all(self) -> int:
+        """
+        Write snapshots of every changed graph in memory (e.g. on shutdown).
+
+        Returns:
+            Number of snapshots written
+        """
+        with self._lock:
+            graphs = list(self._graphs.items()) + list(self._evicted.items())
+        return sum(self._save(key, graph) for key, graph in graphs)
+
+    def clear(self):
+        """Drop every graph from memory without saving"""
+        with self._lock:
+            self._graphs.clear()
+            self._evicted.clear()
+            self._session_keys.clear()
+
+    def get_statistics(self) -> Dict:
+        """
+        Get store statistics.
+
+        Returns:
+            Statistics dictionary
+        """
+        with self._lock:
+            return {
+                "loaded_graphs": len(self._graphs),
+                "loaded_nodes": sum(g.graph.number_of_nodes() for g in self._graphs.values()),
+                "max_loaded": self.max_loaded,
+                "max_nodes": self.max_nodes,
+                **self.stats
+            }
+
+    def _admit(self, key: str, graph: KnowledgeGraph) -> List[Tuple[str, KnowledgeGraph]]:
+        """
+        Put a graph in memory and drop least recently used graphs over the limits.
+
+        Called with the store lock held. Dropped graphs stay reachable through
+        `_evicted` while the caller saves them after releasing the lock.
+
+        Returns:
+            (key, graph) pairs to save
+        """
+        self._graphs[key] = graph
+        total_nodes = sum(g.graph.number_of_nodes() for g in self._graphs.values())
+        victims = []
+
+        while len(self._graphs) > 1 and (
+            len(self._graphs) > self.max_loaded or total_nodes > self.max_nodes
+        ):
+            victim_key, victim = self._graphs.popitem(last=False)
+            total_nodes -= victim.graph.number_of_nodes()
+            self._evicted[victim_key] = victim
+            victims.append((victim_key, victim))
+            self.stats["evictions"] += 1
+            logger.info(f"Evicted knowledge graph from memory: {victim_key}")
+
+        return victims
+
+    def _snapshot_path(self, key: str) -> Optional[Path]:
+        """Snapshot file of a graph key"""
+        if self.directory is None:
+            return None
+        return self.directory / f"{hashlib.md5(key.encode()).hexdigest()}.json.gz"
+
+    def _load(self, key: str, session_id: str) -> KnowledgeGraph:
+        """Load a graph from its snapshot (empty graph if missing or unreadable)"""
+        graph = KnowledgeGraph(session_id)
+        path = self._snapshot_path(key)
+        if path is None or not path.exists():
+            return graph
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.SNAPSHOT_VERSION and data.get("key") == key:
+                graph.import_from_dict(data["graph"])
+                graph.dirty = False
+                self.stats["loads"] += 1
+        except Exception as e:
+            logger.warning(f"Failed to load knowledge graph snapshot {path}: {e}")
+            graph.clear()
+            graph.dirty = False
+
+        return graph
+
+    def _save(self, key: str, graph: KnowledgeGraph) -> bool:
+        """Write a graph snapshot, waiting for any snapshot in progress"""
+        with self._save_lock:
+            return self._write_snapshot(key, graph)
+
+    def _write_snapshot(self, key: str, graph: KnowledgeGraph) -> bool:
+        """Write a graph snapshot atomically if the graph is dirty"""
+        path = self._snapshot_path(key)
+        if path is None or not graph.dirty:
+            return False
+
+        data = {"version": self.SNAPSHOT_VERSION, "key": key, "graph": graph.snapshot()}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=3) as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            graph.dirty = True
+            logger.warning(f"Failed to save knowledge graph snapshot {path}: {e}")
+            return False
+
+        self.stats["saves"] += 1
+        return True
+
+
+_graph_store: Optional[KnowledgeGraphStore] = None
+_graph_store_lock = threading.Lock()
+
+
+def get_graph_store() -> KnowledgeGraphStore:
+    """
+    Get the global graph store (configured from settings).
+
+    Returns:
+        KnowledgeGraphStore instance
+    """
+    global _graph_store
+    with _graph_store_lock:
+        if _graph_store is None:
+            _graph_store = KnowledgeGraphStore(
+                directory=GRAPH_DIR if settings.knowledge_graph_persist else None,
+                max_loaded=settings.knowledge_graph_max_loaded,
+                max_nodes=settings.knowledge_graph_max_nodes
+            )
+        return _graph_store
@@ -2,7 +2,9 @@
 Knowledge Graph - Graph-based knowledge representation for code concepts
 """
 
-from typing import List, Dict, Optional
+import threading
+from collections import deque
+from typing import Any, Iterable, List, Dict, Optional, Tuple
 import networkx as nx
 from dataclasses import dataclass
 import logging
@@ -50,19 +52,57 @@ class KnowledgeGraph:
 
     Stores concepts (nodes) and relationships (edges) about code,
     patterns, and development knowledge.
+
+    Secondary indexes (attribute -> value -> node IDs) are kept for the
+    concept type, name and DEFAULT_INDEXED_PROPERTIES, so search_concepts
+    only looks at matching nodes instead of scanning the whole graph.
+    Concepts must therefore be changed through add_concept/remove_concept,
+    not by editing self.graph node data directly.
+
+    Mutations, searches and exports are serialized with a lock so a graph can
+    be read from worker threads and snapshotted while it is being updated.
+    `dirty` is set by every mutation and cleared when a snapshot is taken.
     """
 
-    def __init__(self, session_id: str):
+    # Node properties indexed in addition to type and name
+    DEFAULT_INDEXED_PROPERTIES: Tuple[str, ...] = ("path", "file")
+
+    def __init__(self, session_id: str, indexed_properties: Optional[Iterable[str]] = None):
         """
         Initialize knowledge graph.
 
         Args:
             session_id: Session identifier
+            indexed_properties: Node properties to index besides type and name
+                (defaults to DEFAULT_INDEXED_PROPERTIES)
         """
         self.session_id = session_id
         self.graph = nx.DiGraph()
+        self.dirty = False
+        self._lock = threading.RLock()
+        if indexed_properties is None:
+            indexed_properties = self.DEFAULT_INDEXED_PROPERTIES
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {
+            attribute: {} for attribute in ("type", "name", *indexed_properties)
+        }
         logger.info(f"Knowledge graph initialized for session {session_id}")
 
+    def add_index(self, attribute: str):
+        """
+        Index another node property (built from the existing nodes).
+
+        Args:
+            attribute: Node property name
+        """
+        with self._lock:
+            if attribute in self._indexes:
+                return
+
+            index: Dict[Any, Dict[str, None]] = {}
+            self._indexes[attribute] = index
+            for node_id, value in self.graph.nodes(data=attribute):
+                self._index_value(index, value, node_id)
+
     def add_concept(self, concept: Concept):
         """
         Add a concept to the graph.
@@ -70,14 +110,30 @@ class KnowledgeGraph:
         Args:
             concept: Concept to add
         """
-        self.graph.add_node(
-            concept.id,
-            type=concept.type,
-            name=concept.name,
-            **concept.properties
-        )
+        with self._lock:
+            self._add_concept(concept)
+            self.dirty = True
         logger.debug(f"Added concept: {concept.id} ({concept.type})")
 
+    def add_concepts(self, concepts: Iterable[Concept]) -> int:
+        """
+        Add many concepts at once (one lock acquisition, no per-concept logging).
+
+        Args:
+            concepts: Concepts to add
+
+        Returns:
+            Number of concepts added or updated
+        """
+        count = 0
+        with self._lock:
+            for concept in concepts:
+                self._add_concept(concept)
+                count += 1
+            if count:
+                self.dirty = True
+        return count
+
     def add_relationship(self, rel: Relationship):
         """
         Add a relationship between concepts.
@@ -85,16 +141,95 @@ class KnowledgeGraph:
         Args:
             rel: Relationship to add
         """
-        self.graph.add_edge(
-            rel.source_id,
-            rel.target_id,
-            type=rel.relationship_type,
-            **rel.properties
-        )
+        with self._lock:
+            self.graph.add_edge(
+                rel.source_id,
+                rel.target_id,
+                type=rel.relationship_type,
+                **rel.properties
+            )
+            self.dirty = True
         logger.debug(
             f"Added relationship: {rel.source_id} -[{rel.relationship_type}]-> {rel.target_id}"
         )
 
+    def add_relationships(self, relationships: Iterable[Relationship]) -> int:
+        """
+        Add many relationships at once (one lock acquisition, no per-edge logging).
+
+        Args:
+            relationships: Relationships to add
+
+        Returns:
+            Number of relationships added or updated
+        """
+        edges = [
+            (rel.source_id, rel.target_id, {"type": rel.relationship_type, **rel.properties})
+            for rel in relationships
+        ]
+        if edges:
+            with self._lock:
+                self.graph.add_edges_from(edges)
+                self.dirty = True
+        return len(edges)
+
+    def remove_concept(self, concept_id: str) -> bool:
+        """
+        Remove a concept and all of its relationships.
+
+        Args:
+            concept_id: Concept identifier
+
+        Returns:
+            True if the concept existed
+        """
+        with self._lock:
+            if concept_id not in self.graph:
+                return False
+
+            self._unindex_node(concept_id, self.graph.nodes[concept_id])
+            self.graph.remove_node(concept_id)
+            self.dirty = True
+        logger.debug(f"Removed concept: {concept_id}")
+        return True
+
+    def remove_relationships(self, source_id: str, relationship_type: Optional[str] = None) -> int:
+        """
+        Remove outgoing relationships of a concept.
+
+        Args:
+            source_id: Source concept ID
+            relationship_type: Optional filter by relationship type
+
+        Returns:
+            Number of relationships removed
+        """
+        with self._lock:
+            if source_id not in self.graph:
+                return 0
+
+            edges = [
+                (source_id, target)
+                for target, edge_data in self.graph.succ[source_id].items()
+                if relationship_type is None or edge_data.get("type") == relationship_type
+            ]
+            if edges:
+                self.graph.remove_edges_from(edges)
+                self.dirty = True
+            return len(edges)
+
+    def has_concept(self, concept_id: str) -> bool:
+        """
+        Check whether a concept exists (without materializing it).
+
+        Args:
+            concept_id: Concept identifier
+
+        Returns:
+            True if the concept exists
+        """
+        return concept_id in self.graph
+
     def get_concept(self, concept_id: str) -> Optional[Concept]:
         """
         Get a concept by ID.
@@ -105,22 +240,19 @@ class KnowledgeGraph:
         Returns:
             Concept if found, None otherwise
         """
-        if concept_id not in self.graph:
-            return None
+        with self._lock:
+            if concept_id not in self.graph:
+                return None
 
-        node_data = self.graph.nodes[concept_id]
-        return Concept(
-            id=concept_id,
-            type=node_data.get("type"),
-            name=node_data.get("name"),
-            properties={k: v for k, v in node_data.items() if k not in ["type", "name"]}
-        )
+            return self._make_concept(concept_id, self.graph.nodes[concept_id])
 
     def get_related_concepts(
         self,
         concept_id: str,
         relationship_type: Optional[str] = None,
-        depth: int = 1
+        depth: int = 1,
+        max_results: Optional[int] = None,
+        reverse: bool = False
     ) -> List[Concept]:
         """
         Get concepts related to a given concept.
@@ -129,48 +261,80 @@ class KnowledgeGraph:
             concept_id: Starting concept ID
             relationship_type: Optional filter by relationship type
             depth: Maximum traversal depth
+            max_results: Optional maximum number of concepts
+            reverse: Follow incoming relationships instead (e.g. files that import a file)
 
         Returns:
-            List of related concepts
+            List of related concepts (each concept once, nearest first)
         """
-        if concept_id not in self.graph:
-            return []
+        return [
+            concept
+            for concept, _, _ in self.traverse(concept_id, relationship_type, depth, max_results, reverse)
+        ]
 
-        related = []
-        visited = set()
-        queue = [(concept_id, 0)]
+    def traverse(
+        self,
+        concept_id: str,
+        relationship_type: Optional[str] = None,
+        depth: int = 1,
+        max_results: Optional[int] = None,
+        reverse: bool = False
+    ) -> List[Tuple[Concept, Optional[str], int]]:
+        """
+        Breadth-first traversal along outgoing (or, with reverse, incoming) relationships.
 
-        while queue:
-            current_id, current_depth = queue.pop(0)
+        Edge data is read once from the adjacency while iterating neighbors,
+        and each reachable concept is materialized once, at its shallowest depth.
 
-            if current_id in visited or current_depth > depth:
-                continue
+        Args:
+            concept_id: Starting concept ID
+            relationship_type: Optional filter by relationship type (edges of
+                other types are neither returned nor followed)
+            depth: Maximum traversal depth
+            max_results: Optional maximum number of concepts (stops early)
+            reverse: Follow relationships from target to source
 
-            visited.add(current_id)
+        Returns:
+            List of (concept, type of the relationship it was reached by, depth)
+        """
+        with self._lock:
+            if concept_id not in self.graph or depth < 1:
+                return []
 
-            # Get neighbors
-            for neighbor in self.graph.neighbors(current_id):
-                edge_data = self.graph.get_edge_data(current_id, neighbor)
+            results: List[Tuple[Concept, Optional[str], int]] = []
+            visited = {concept_id}
+            queue = deque([(concept_id, 0)])
+            successors = self.graph.pred if reverse else self.graph.succ
+            nodes = self.graph.nodes
 
-                # Filter by relationship type if specified
-                if relationship_type and edge_data.get("type") != relationship_type:
-                    continue
+            while queue:
+                current_id, current_depth = queue.popleft()
+                next_depth = current_depth + 1
+
+                for neighbor, edge_data in successors[current_id].items():
+                    edge_type = edge_data.get("type")
+                    if relationship_type and edge_type != relationship_type:
+                        continue
+                    if neighbor in visited:
+                        continue
+                    visited.add(neighbor)
 
-                # Get concept
-                concept = self.get_concept(neighbor)
-                if concept:
-                    related.append(concept)
+                    results.append((self._make_concept(neighbor, nodes[neighbor]), edge_type, next_depth))
+                    if max_results is not None and len(results) >= max_results:
+                        return results
 
-                # Add to queue for further exploration
-                if current_depth < depth:
-                    queue.append((neighbor, current_depth + 1))
+                    if next_depth < depth:
+                        queue.append((neighbor, next_depth))
 
-        return related
+            return results
 
     def search_concepts(self, concept_type: str, properties: Dict = None) -> List[Concept]:
         """
         Search for concepts by type and properties.
 
+        Starts from the smallest matching secondary index and checks the
+        remaining filters on those nodes only.
+
         Args:
             concept_type: Type of concept to find
             properties: Optional property filters
@@ -178,28 +342,29 @@ class KnowledgeGraph:
         Returns:
             List of matching concepts
         """
-        results = []
-
-        for node_id, node_data in self.graph.nodes(data=True):
-            # Check type
-            if node_data.get("type") != concept_type:
-                continue
+        filters = {"type": concept_type, **(properties or {})}
 
-            # Check properties if specified
-            if properties:
-                match = all(
-                    node_data.get(k) == v
-                    for k, v in properties.items()
-                )
-                if not match:
+        with self._lock:
+            candidates: Optional[Dict[str, None]] = None
+            for attribute, value in filters.items():
+                index = self._indexes.get(attribute)
+                if index is None:
                     continue
-
-            # Add to results
-            concept = self.get_concept(node_id)
-            if concept:
-                results.append(concept)
-
-        return results
+                try:
+                    matches = index.get(value, {})
+                except TypeError:  # unhashable filter value
+                    continue
+                if candidates is None or len(matches) < len(candidates):
+                    candidates = matches
+                if not candidates:
+                    return []
+
+            nodes = self.graph.nodes
+            return [
+                self._make_concept(node_id, nodes[node_id])
+                for node_id in list(candidates or {})
+                if all(nodes[node_id].get(k) == v for k, v in filters.items())
+            ]
 
     def get_statistics(self) -> Dict:
         """
@@ -216,9 +381,11 @@ class KnowledgeGraph:
         }
 
         # Count by concept type
-        for node_id, node_data in self.graph.nodes(data=True):
-            concept_type = node_data.get("type", "unknown")
-            stats["by_type"][concept_type] = stats["by_type"].get(concept_type, 0) + 1
+        for concept_type, node_ids in self._indexes["type"].items():
+            stats["by_type"][concept_type] = len(node_ids)
+        untyped = stats["nodes"] - sum(stats["by_type"].values())
+        if untyped:
+            stats["by_type"]["unknown"] = untyped
 
         return stats
 
@@ -229,17 +396,32 @@ class KnowledgeGraph:
         Returns:
             Graph data as dictionary
         """
-        return {
-            "session_id": self.session_id,
-            "nodes": [
-                {"id": node_id, **data}
-                for node_id, data in self.graph.nodes(data=True)
-            ],
-            "edges": [
-                {"source": u, "target": v, **data}
-                for u, v, data in self.graph.edges(data=True)
-            ]
-        }
+        with self._lock:
+            return {
+                "session_id": self.session_id,
+                "nodes": [
+                    {"id": node_id, **data}
+                    for node_id, data in self.graph.nodes(data=True)
+                ],
+                "edges": [
+                    {"source": u, "target": v, **data}
+                    for u, v, data in self.graph.edges(data=True)
+                ]
+            }
+
+    def snapshot(self) -> Dict:
+        """
+        Export the graph and mark it clean in one step.
+
+        Changes made after the snapshot set `dirty` again.
+
+        Returns:
+            Graph data as dictionary (see export_to_dict)
+        """
+        with self._lock:
+            data = self.export_to_dict()
+            self.dirty = False
+            return data
 
     def import_from_dict(self, data: Dict):
         """
@@ -248,19 +430,25 @@ class KnowledgeGraph:
         Args:
             data: Graph data dictionary
         """
-        # Clear existing graph
-        self.graph.clear()
-
-        # Import nodes
-        for node in data.get("nodes", []):
-            node_id = node.pop("id")
-            self.graph.add_node(node_id, **node)
-
-        # Import edges
-        for edge in data.get("edges", []):
-            source = edge.pop("source")
-            target = edge.pop("target")
-            self.graph.add_edge(source, target, **edge)
+        with self._lock:
+            # Clear existing graph
+            self.clear_indexes()
+            self.graph.clear()
+
+            # Import nodes
+            for node in data.get("nodes", []):
+                node_id = node.pop("id")
+                self.graph.add_node(node_id, **node)
+
+            # Import edges
+            for edge in data.get("edges", []):
+                source = edge.pop("source")
+                target = edge.pop("target")
+                self.graph.add_edge(source, target, **edge)
+
+            for node_id, node_data in self.graph.nodes(data=True):
+                self._index_node(node_id, node_data)
+            self.dirty = True
 
         logger.info(
             f"Imported graph: {self.graph.number_of_nodes()} nodes, "
@@ -269,24 +457,84 @@ class KnowledgeGraph:
 
     def clear(self):
         """Clear all data from the graph"""
-        self.graph.clear()
+        with self._lock:
+            self.clear_indexes()
+            self.graph.clear()
+            self.dirty = True
         logger.info(f"Cleared knowledge graph for session {self.session_id}")
 
+    def clear_indexes(self):
+        """Empty the secondary indexes (keeps the indexed attribute list)"""
+        for index in self._indexes.values():
+            index.clear()
 
-# Global graphs per session
-_session_graphs: Dict[str, KnowledgeGraph] = {}
+    def _add_concept(self, concept: Concept):
+        """Add or replace a node and keep the indexes in sync (lock held)"""
+        if concept.id in self.graph:
+            self._unindex_node(concept.id, self.graph.nodes[concept.id])
+        self.graph.add_node(
+            concept.id,
+            type=concept.type,
+            name=concept.name,
+            **concept.properties
+        )
+        self._index_node(concept.id, self.graph.nodes[concept.id])
+
+    def _index_node(self, node_id: str, node_data: Dict):
+        """Add a node to every secondary index"""
+        for attribute, index in self._indexes.items():
+            self._index_value(index, node_data.get(attribute), node_id)
+
+    def _unindex_node(self, node_id: str, node_data: Dict):
+        """Remove a node from every secondary index"""
+        for attribute, index in self._indexes.items():
+            value = node_data.get(attribute)
+            try:
+                node_ids = index.get(value)
+            except TypeError:
+                continue
+            if node_ids is not None:
+                node_ids.pop(node_id, None)
+                if not node_ids:
+                    del index[value]
+
+    @staticmethod
+    def _index_value(index: Dict[Any, Dict[str, None]], value: Any, node_id: str):
+        """Add node_id under value (missing and unhashable values are not indexed)"""
+        if value is None:
+            return
+        try:
+            index.setdefault(value, {})[node_id] = None
+        except TypeError:
+            pass
+
+    @staticmethod
+    def _make_concept(node_id: str, node_data: Dict) -> Concept:
+        """Build a Concept from node attributes"""
+        return Concept(
+            id=node_id,
+            type=node_data.get("type"),
+            name=node_data.get("name"),
+            properties={k: v for k, v in node_data.items() if k not in ("type", "name")}
+        )
 
 
-def get_knowledge_graph(session_id: str) -> KnowledgeGraph:
+def get_knowledge_graph(session_id: str, workspace: Optional[str] = None) -> KnowledgeGraph:
     """
     Get knowledge graph for a session.
 
+    Sessions that use the same workspace share one graph. A session bound to
+    a workspace once keeps resolving to that graph when called without one.
+    Graphs are loaded from their snapshot on first access and may be evicted
+    from memory when idle (see KnowledgeGraphStore).
+
     Args:
         session_id: Session identifier
+        workspace: Optional workspace path the graph describes
 
     Returns:
         KnowledgeGraph instance for the session
     """
-    if session_id not in _session_graphs:
-        _session_graphs[session_id] = KnowledgeGraph(session_id)
-    return _session_graphs[session_id]
+    from .graph_store import get_graph_store
+
+    return get_graph_store().get(session_id, workspace)
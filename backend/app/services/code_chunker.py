@@ -0,0 +1,484 @@
+"""Code Chunker - 구조 기반 코드 청킹.
+
+Python은 ast로, JavaScript/TypeScript는 괄호 깊이를 추적하는 경량 스캐너로
+클래스/메서드/함수 단위를 찾아 청크로 나눕니다.
+
+- 청크는 원본의 정확한 줄 범위(start_line, end_line)를 가집니다.
+- 큰 클래스는 헤더(시그니처, docstring, 클래스 속성)와 멤버별 청크로 나누고,
+  멤버 청크 앞에는 부모 컨텍스트 주석(예: ``# class UserService:``)을 붙입니다.
+- 같은 부모의 인접 단위는 MAX_CHUNK_SIZE 안에서 한 청크로 묶어 청크(임베딩) 수를 줄이고,
+  작은 단위도 버리지 않습니다.
+"""
+import ast
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class CodeUnit:
+    """청크 후보가 되는 코드 단위 (줄 번호는 1부터, 끝 포함)"""
+    name: str
+    kind: str
+    start_line: int
+    end_line: int
+    context: List[str] = field(default_factory=list)
+    doc: str = ""
+    is_header: bool = False
+    part: int = 0  # 너무 커서 줄 기준으로 나눈 조각 번호 (0이면 나누지 않음)
+
+
+class StructuralChunker:
+    """클래스/함수 경계를 따라 코드를 청크로 나누는 청커"""
+
+    # 최상위 선언 시작 (JS/TS)
+    JS_DECL_RE = re.compile(
+        r'^(?:export\s+)?(?:default\s+)?(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?'
+        r'(class|function\*?|const|let|var|interface|type|enum|namespace)\s+([\w$]+)'
+    )
+    JS_START_RE = re.compile(
+        r'^(?:export|import|class|function|async|const|let|var|interface|type|enum|'
+        r'namespace|declare|abstract|module\.exports|exports\.|@)\b|^@'
+    )
+    # 클래스 멤버 시작 (메서드, 필드, 생성자, 접근자)
+    JS_MEMBER_RE = re.compile(
+        r'^(?:(?:public|private|protected|static|readonly|async|abstract|override|declare|'
+        r'get|set|accessor)\s+)*\*?\s*([#\w$]+)\s*[?!]?\s*(?:<[^>]*>)?\s*[(=:;]'
+    )
+    # 앞 줄이 이 문자로 끝나면 다음 줄은 같은 문장의 연속
+    JS_OPEN_ENDINGS = ('=', ',', '(', '[', '{', '.', '+', '-', '*', '/', '?', ':', '&', '|', '=>')
+    JS_CONTINUATION_STARTS = ('.', ')', ']', '}', '?', ':', '+', '-', '*', '/', '&', '|', ',')
+    # 정의가 아닌 문장 묶음 단위의 종류
+    GAP_KINDS = ("module", "attributes", "members")
+
+    def __init__(self, max_chunk_size: int = 2000):
+        """StructuralChunker 초기화
+
+        Args:
+            max_chunk_size: 최대 청크 크기 (문자)
+        """
+        self.max_chunk_size = max_chunk_size
+
+    # ==================== Python ====================
+
+    def chunk_python(self, content: str, filename: str, language: str) -> Optional[List[Dict]]:
+        """Python 코드를 ast로 클래스/메서드/함수 단위 청크로 분할
+
+        Args:
+            content: 파일 내용
+            filename: 파일 이름
+            language: 언어
+
+        Returns:
+            Optional[List[Dict]]: 청크 목록 (구문 오류로 파싱할 수 없으면 None)
+        """
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return None
+
+        lines = content.split('\n')
+        units = self._python_units(tree.body, lines, 1, len(lines), [], "")
+        return self._emit(units, lines, filename, language, comment="#")
+
+    def _python_units(self,
+                      body: List[ast.stmt],
+                      lines: List[str],
+                      start_line: int,
+                      end_line: int,
+                      context: List[str],
+                      prefix: str) -> List[CodeUnit]:
+        """문장 목록을 코드 단위로 변환 (너무 큰 클래스/함수는 재귀 분할)
+
+        각 단위는 앞 단위가 끝난 다음 줄부터 시작하므로 정의 위의
+        주석과 데코레이터가 그 정의에 포함됩니다.
+        """
+        units: List[CodeUnit] = []
+        gap: Optional[CodeUnit] = None
+        cursor = start_line
+
+        for node in body:
+            node_end = node.end_lineno
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                if gap is None:
+                    gap = CodeUnit(name=f"{prefix}module" if not context else f"{prefix}attributes",
+                                   kind="module" if not context else "attributes",
+                                   start_line=cursor, end_line=node_end, context=context)
+                    units.append(gap)
+                gap.end_line = node_end
+                cursor = node_end + 1
+                continue
+
+            gap = None
+            qualname = f"{prefix}{node.name}"
+            if isinstance(node, ast.ClassDef):
+                kind = "class"
+            else:
+                kind = "method" if context and context[-1].startswith("class ") else "function"
+            unit = CodeUnit(name=qualname, kind=kind, start_line=cursor, end_line=node_end,
+                            context=context, doc=(ast.get_docstring(node) or "").split('\n')[0])
+            cursor = node_end + 1
+
+            if self._size(lines, unit) <= self.max_chunk_size:
+                units.append(unit)
+            elif isinstance(node, ast.ClassDef) and node.body:
+                units.extend(self._python_class_units(node, unit, lines, context, qualname))
+            else:
+                units.extend(self._split_unit(unit, lines, lines[node.lineno - 1].strip()))
+
+        # 마지막 정의 뒤의 주석 등
+        if units and end_line > units[-1].end_line:
+            units[-1].end_line = end_line
+
+        # 정의가 아닌 문장 묶음(모듈 코드, 클래스 속성)도 너무 크면 줄 기준으로 분할
+        sized: List[CodeUnit] = []
+        for unit in units:
+            if unit.kind in self.GAP_KINDS and self._size(lines, unit) > self.max_chunk_size:
+                sized.extend(self._split_unit(unit, lines, ""))
+            else:
+                sized.append(unit)
+        return sized
+
+    def _python_class_units(self,
+                            node: ast.ClassDef,
+                            unit: CodeUnit,
+                            lines: List[str],
+                            context: List[str],
+                            qualname: str) -> List[CodeUnit]:
+        """큰 클래스를 헤더와 멤버 단위로 분할"""
+        signature = lines[node.lineno - 1].strip()
+        member_context = context + [signature]
+
+        # 헤더: 데코레이터/시그니처부터 첫 메서드 전까지 (docstring, 클래스 속성 포함)
+        first_def = next(
+            (i for i, child in enumerate(node.body)
+             if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))),
+            len(node.body)
+        )
+        if first_def:
+            header_end = node.body[first_def - 1].end_lineno
+        else:
+            first = node.body[0]
+            header_end = min([first.lineno] + [d.lineno for d in first.decorator_list]) - 1
+        header_end = max(header_end, node.lineno)
+        header = CodeUnit(name=qualname, kind="class", start_line=unit.start_line, end_line=header_end,
+                          context=member_context, doc=unit.doc, is_header=True)
+
+        members = self._python_units(node.body[first_def:], lines, header_end + 1, unit.end_line,
+                                     member_context, f"{qualname}.")
+        if self._size(lines, header) > self.max_chunk_size:
+            # 헤더 컨텍스트에 이미 시그니처가 있음
+            return self._split_unit(header, lines, "") + members
+        return [header] + members
+
+    # ==================== JavaScript / TypeScript ====================
+
+    def chunk_javascript(self, content: str, filename: str, language: str) -> List[Dict]:
+        """JavaScript/TypeScript 코드를 선언/클래스 멤버 단위 청크로 분할
+
+        문자열, 템플릿 리터럴, 주석을 건너뛰며 각 줄 시작의 중괄호 깊이를 계산하고,
+        깊이 0의 선언 경계(클래스는 깊이 1의 멤버 경계)를 따라 나눕니다.
+
+        Args:
+            content: 파일 내용
+            filename: 파일 이름
+            language: 언어
+
+        Returns:
+            List[Dict]: 청크 목록
+        """
+        lines = content.split('\n')
+        info = self._scan_js(lines)
+        units = self._js_units(lines, info, 0, len(lines), 0, [], "")
+        return self._emit(units, lines, filename, language, comment="//")
+
+    def _scan_js(self, lines: List[str]) -> List[Tuple[int, bool]]:
+        """각 줄 시작의 (중괄호 깊이, 주석/문자열 내부 여부) 계산"""
+        info: List[Tuple[int, bool]] = []
+        depth = 0
+        state = None  # None, 'block', 또는 열린 따옴표/백틱 문자
+
+        for line in lines:
+            info.append((depth, state is not None))
+            i, n = 0, len(line)
+            while i < n:
+                ch = line[i]
+                if state == 'block':
+                    if line.startswith('*/', i):
+                        state = None
+                        i += 1
+                elif state is not None:
+                    if ch == '\\':
+                        i += 1
+                    elif ch == state:
+                        state = None
+                elif line.startswith('//', i):
+                    break
+                elif line.startswith('/*', i):
+                    state = 'block'
+                    i += 1
+                elif ch in ('"', "'", '`'):
+                    state = ch
+                elif ch == '{':
+                    depth += 1
+                elif ch == '}':
+                    depth = max(0, depth - 1)
+                i += 1
+
+            # 일반 문자열은 줄을 넘지 않음 (템플릿 리터럴과 블록 주석만 이어짐)
+            if state in ('"', "'"):
+                state = None
+
+        return info
+
+    def _js_boundaries(self,
+                       lines: List[str],
+                       info: List[Tuple[int, bool]],
+                       lo: int,
+                       hi: int,
+                       depth: int,
+                       start_re: "re.Pattern") -> List[int]:
+        """[lo, hi) 범위에서 주어진 깊이의 문장 시작 줄 인덱스 (앞 주석/데코레이터 포함)"""
+        starts: List[int] = []
+        prev_code = ""
+        decorator_only = False
+
+        for i in range(lo, hi):
+            line_depth, inside = info[i]
+            stripped = lines[i].strip()
+            if inside or not stripped or line_depth != depth or self._is_js_comment(stripped):
+                if stripped and not inside and not self._is_js_comment(stripped):
+                    prev_code = stripped
+                continue
+
+            open_prev = prev_code.endswith(self.JS_OPEN_ENDINGS)
+            complete_prev = prev_code == "" or prev_code.endswith((';', '}', ')'))
+            is_decl = bool(start_re.match(stripped))
+            starts_new = (is_decl and not open_prev) or (
+                complete_prev and not stripped.startswith(self.JS_CONTINUATION_STARTS)
+            )
+
+            # 데코레이터 바로 뒤의 선언은 데코레이터와 같은 단위
+            if starts_new and not (decorator_only and not stripped.startswith('@')):
+                starts.append(i)
+                decorator_only = stripped.startswith('@')
+            elif decorator_only and is_decl and not stripped.startswith('@'):
+                decorator_only = False
+            prev_code = stripped
+
+        # 바로 위의 주석을 선언에 붙이기
+        attached = []
+        floor = lo
+        for start in starts:
+            j = start
+            while j - 1 >= floor and lines[j - 1].strip() and (
+                    info[j - 1][1] or self._is_js_comment(lines[j - 1].strip())):
+                j -= 1
+            attached.append(j)
+            floor = start + 1
+        if attached:
+            attached[0] = lo
+        return attached
+
+    def _js_units(self,
+                  lines: List[str],
+                  info: List[Tuple[int, bool]],
+                  lo: int,
+                  hi: int,
+                  depth: int,
+                  context: List[str],
+                  prefix: str) -> List[CodeUnit]:
+        """[lo, hi) 범위를 주어진 깊이의 선언 단위로 분할"""
+        start_re = self.JS_START_RE if depth == 0 else self.JS_MEMBER_RE
+        starts = self._js_boundaries(lines, info, lo, hi, depth, start_re)
+        if not starts:
+            starts = [lo]
+
+        units: List[CodeUnit] = []
+        for index, start in enumerate(starts):
+            end = (starts[index + 1] if index + 1 < len(starts) else hi) - 1
+            decl_line, name, kind = self._js_declaration(lines, info, start, end, depth)
+            unit = CodeUnit(name=f"{prefix}{name}", kind=kind, start_line=start + 1, end_line=end + 1,
+                            context=context)
+
+            if self._size(lines, unit) <= self.max_chunk_size:
+                units.append(unit)
+            elif kind == "class":
+                units.extend(self._js_class_units(lines, info, unit, decl_line, depth, context))
+            else:
+                signature = lines[decl_line].strip() if decl_line is not None else ""
+                units.extend(self._split_unit(unit, lines, signature))
+
+        return units
+
+    def _js_declaration(self,
+                        lines: List[str],
+                        info: List[Tuple[int, bool]],
+                        start: int,
+                        end: int,
+                        depth: int) -> Tuple[Optional[int], str, str]:
+        """단위의 선언 줄 인덱스, 이름, 종류"""
+        for i in range(start, end + 1):
+            stripped = lines[i].strip()
+            if info[i][1] or not stripped or self._is_js_comment(stripped) or stripped.startswith('@'):
+                continue
+            if depth == 0:
+                match = self.JS_DECL_RE.match(stripped)
+                if match:
+                    kind = match.group(1).rstrip('*')
+                    return i, match.group(2), kind
+                return i, "module", "module"
+
+            match = self.JS_MEMBER_RE.match(stripped)
+            if match:
+                name = match.group(1)
+                kind = "method" if '(' in stripped.split('=')[0] else "field"
+                return i, name, kind
+            return i, "members", "members"
+
+        return None, "module" if depth == 0 else "members", "module"
+
+    def _js_class_units(self,
+                        lines: List[str],
+                        info: List[Tuple[int, bool]],
+                        unit: CodeUnit,
+                        decl_line: int,
+                        depth: int,
+                        context: List[str]) -> List[CodeUnit]:
+        """큰 클래스를 헤더와 멤버 단위로 분할 (닫는 중괄호 줄은 헤더 쪽 컨텍스트로 대체)"""
+        signature = lines[decl_line].strip()
+        member_context = context + [signature]
+
+        # 본문 범위: 여는 중괄호 다음 줄 ~ 닫는 중괄호 전 줄
+        body_start = next((i + 1 for i in range(decl_line, unit.end_line)
+                           if i + 1 < len(info) and info[i + 1][0] > depth), None)
+        body_end = unit.end_line - 1
+        while body_end > decl_line and not lines[body_end].strip():
+            body_end -= 1
+        if body_start is None or body_start > body_end:
+            return self._split_unit(unit, lines, signature)
+
+        members = self._js_units(lines, info, body_start, body_end, depth + 1,
+                                 member_context, f"{unit.name}.")
+        first_member = members[0].start_line if members else body_start + 1
+        header = CodeUnit(name=unit.name, kind="class", start_line=unit.start_line,
+                          end_line=max(first_member - 1, decl_line + 1), context=member_context, is_header=True)
+        if members and members[0].start_line <= header.end_line:
+            members[0].start_line = header.end_line + 1
+        return [header] + [m for m in members if m.start_line <= m.end_line]
+
+    @staticmethod
+    def _is_js_comment(stripped: str) -> bool:
+        return stripped.startswith(('//', '/*', '*'))
+
+    # ==================== 공통 ====================
+
+    def _split_unit(self, unit: CodeUnit, lines: List[str], signature: str) -> List[CodeUnit]:
+        """너무 큰 단위를 줄 기준으로 분할 (두 번째 조각부터는 시그니처를 컨텍스트로)"""
+        budget = self.max_chunk_size - self._context_length(unit.context + [signature])
+        total = self._span_size(lines, unit.start_line, unit.end_line)
+        # 마지막 조각만 작게 남지 않도록 조각 크기를 고르게
+        target = min(budget, -(-total // -(-total // max(budget, 1))))
+        parts: List[Tuple[int, int]] = []
+        part_start = unit.start_line
+        size = 0
+
+        for line_no in range(unit.start_line, unit.end_line + 1):
+            line_size = len(lines[line_no - 1]) + 1
+            if size + line_size > target and line_no > part_start:
+                parts.append((part_start, line_no - 1))
+                part_start, size = line_no, 0
+            size += line_size
+        parts.append((part_start, unit.end_line))
+
+        return [
+            CodeUnit(
+                name=unit.name if n == 1 else f"{unit.name}::part{n}",
+                kind=unit.kind,
+                start_line=start,
+                end_line=end,
+                context=unit.context if n == 1 or not signature else unit.context + [signature],
+                doc=unit.doc if n == 1 else "",
+                is_header=unit.is_header and n == 1,
+                part=n,
+            )
+            for n, (start, end) in enumerate(parts, 1)
+        ]
+
+    def _emit(self,
+              units: List[CodeUnit],
+              lines: List[str],
+              filename: str,
+              language: str,
+              comment: str) -> List[Dict]:
+        """코드 단위를 청크 dict로 변환 (같은 부모의 인접 단위는 크기 제한 안에서 합침)"""
+        groups: List[List[CodeUnit]] = []
+        for unit in units:
+            unit.start_line, unit.end_line = self._trim(lines, unit.start_line, unit.end_line)
+            if unit.start_line > unit.end_line:
+                continue
+
+            if groups and self._can_merge(groups[-1], unit, lines):
+                groups[-1].append(unit)
+            else:
+                groups.append([unit])
+
+        chunks = []
+        for group in groups:
+            first, last = group[0], group[-1]
+            code = '\n'.join(lines[first.start_line - 1:last.end_line])
+            if first.context and not first.is_header:
+                code = f"{comment} {' > '.join(first.context)}\n{code}"
+            elif first.is_header and len(first.context) > 1:
+                code = f"{comment} {' > '.join(first.context[:-1])}\n{code}"
+
+            chunks.append({
+                'code': code,
+                'filename': f"{filename}::{first.name}",
+                'language': language,
+                'description': self._describe(group, filename),
+                'start_line': first.start_line,
+                'end_line': last.end_line,
+            })
+        return chunks
+
+    def _can_merge(self, group: List[CodeUnit], unit: CodeUnit, lines: List[str]) -> bool:
+        """단위를 앞 그룹과 합칠 수 있는지 (같은 부모 컨텍스트, 크기 제한 안)"""
+        first = group[0]
+        if unit.context != first.context or unit.is_header or unit.part or group[-1].part:
+            return False
+
+        group_size = self._span_size(lines, first.start_line, group[-1].end_line)
+        unit_size = self._span_size(lines, unit.start_line, unit.end_line)
+        return group_size + unit_size + self._context_length(unit.context) <= self.max_chunk_size
+
+    @classmethod
+    def _describe(cls, group: List[CodeUnit], filename: str) -> str:
+        if len(group) == 1:
+            unit = group[0]
+            if unit.kind in cls.GAP_KINDS:
+                parent = unit.name[:-len(unit.kind)].rstrip('.')
+                return f"{unit.kind} of {parent} in {filename}" if parent else f"Module-level code in {filename}"
+            description = f"{unit.kind} {unit.name} in {filename}"
+            return f"{description}: {unit.doc}" if unit.doc else description
+        return f"{', '.join(unit.name for unit in group)} in {filename}"
+
+    @staticmethod
+    def _trim(lines: List[str], start: int, end: int) -> Tuple[int, int]:
+        """앞뒤 빈 줄 제외"""
+        while start <= end and not lines[start - 1].strip():
+            start += 1
+        while end >= start and not lines[end - 1].strip():
+            end -= 1
+        return start, end
+
+    @staticmethod
+    def _span_size(lines: List[str], start: int, end: int) -> int:
+        return sum(len(line) + 1 for line in lines[start - 1:end])
+
+    def _size(self, lines: List[str], unit: CodeUnit) -> int:
+        return self._span_size(lines, unit.start_line, unit.end_line) + self._context_length(unit.context)
+
+    @staticmethod
+    def _context_length(context: List[str]) -> int:
+        return len(' > '.join(context)) + 4 if context else 0
@@ -0,0 +1,113 @@
+"""Code Graph Extractor - Knowledge Graph용 단일 패스 심볼 추출.
+
+파일마다 언어별로 미리 컴파일한 정규식 하나를 내용 전체에 한 번만 적용해
+import 대상과 최상위 클래스/함수 정의를 함께 뽑습니다. 구문 오류가 있는
+파일도 처리할 수 있고, 이 모듈은 표준 라이브러리만 쓰므로 프로세스 풀
+워커에서 가볍게 실행됩니다.
+"""
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 그래프를 구축하는 언어 (확장자 -> 언어)
+LANGUAGE_MAP: Dict[str, str] = {
+    '.py': 'python',
+    '.js': 'javascript',
+    '.ts': 'typescript',
+    '.jsx': 'javascript',
+    '.tsx': 'typescript',
+}
+
+# 최대 분석 크기 (CodeIndexer.MAX_FILE_SIZE와 동일)
+MAX_FILE_SIZE: int = 100000
+
+# Python: import / from ... import / 최상위 class, (async) def
+PYTHON_SYMBOL_RE = re.compile(
+    r'^(?:class[ \t]+(?P<class>\w+)'
+    r'|(?:async[ \t]+)?def[ \t]+(?P<function>\w+)'
+    r'|[ \t]*import[ \t]+(?P<imports>[\w.]+(?:[ \t]+as[ \t]+\w+)?'
+    r'(?:[ \t]*,[ \t]*[\w.]+(?:[ \t]+as[ \t]+\w+)?)*)'
+    r'|[ \t]*from[ \t]+(?P<from>\.*[\w.]*)[ \t]+import\b)',
+    re.MULTILINE
+)
+
+# JavaScript/TypeScript: 최상위 class, function / import, export ... from, require
+JS_SYMBOL_RE = re.compile(
+    r'^(?:(?:export[ \t]+)?(?:default[ \t]+)?(?:abstract[ \t]+)?class[ \t]+(?P<class>[\w$]+)'
+    r'|(?:export[ \t]+)?(?:default[ \t]+)?(?:async[ \t]+)?function\*?[ \t]*(?P<function>[\w$]+)'
+    r'|[ \t]*import[ \t]+(?:[\w$*{},\s]*?\sfrom[ \t]*)?[\'"](?P<import>[^\'"\n]+)[\'"]'
+    r'|[ \t]*export[ \t]+[\w$*{},\s]*?\sfrom[ \t]*[\'"](?P<reexport>[^\'"\n]+)[\'"]'
+    r'|[ \t]*(?:const|let|var)[ \t]+[^=;\n]+=[ \t]*require\([ \t]*[\'"](?P<require>[^\'"\n]+)[\'"][ \t]*\))',
+    re.MULTILINE
+)
+
+
+@dataclass
+class FileSymbols:
+    """파일 하나에서 추출한 그래프 심볼"""
+    path: str
+    language: str
+    imports: List[str] = field(default_factory=list)
+    definitions: List[Tuple[str, str]] = field(default_factory=list)  # (class|function, 이름)
+
+
+def detect_language(file_path: str) -> str:
+    """확장자로 언어 감지 (그래프를 구축하지 않는 언어는 'unknown')"""
+    return LANGUAGE_MAP.get(Path(file_path).suffix.lower(), 'unknown')
+
+
+def extract_symbols(file_path: str, content: Optional[str] = None, language: Optional[str] = None) -> FileSymbols:
+    """파일의 import 대상과 클래스/함수 정의를 한 번의 스캔으로 추출
+
+    Args:
+        file_path: 파일 경로
+        content: 이미 읽은 파일 내용 (None이면 파일에서 읽음)
+        language: 언어 (None이면 확장자로 감지)
+
+    Returns:
+        FileSymbols: 추출 결과 (import는 등장 순서, 중복 제거)
+    """
+    language = language or detect_language(file_path)
+    symbols = FileSymbols(path=str(file_path), language=language)
+
+    if language == 'python':
+        pattern = PYTHON_SYMBOL_RE
+    elif language in ('javascript', 'typescript'):
+        pattern = JS_SYMBOL_RE
+    else:
+        return symbols
+
+    if content is None:
+        content = Path(file_path).read_text(encoding='utf-8', errors='ignore')[:MAX_FILE_SIZE]
+
+    imports: Dict[str, None] = {}
+    for match in pattern.finditer(content):
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ('class', 'function'):
+            symbols.definitions.append((kind, value))
+        elif kind == 'imports':
+            # import a.b as c, d
+            for name in value.split(','):
+                imports[name.split()[0]] = None
+        else:
+            imports[value] = None
+
+    symbols.imports = list(imports)
+    return symbols
+
+
+def extract_file_symbols(file_path: str) -> Optional[FileSymbols]:
+    """파일을 읽어 심볼 추출 (프로세스 풀 워커용, 읽을 수 없으면 None)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        Optional[FileSymbols]: 추출 결과
+    """
+    try:
+        return extract_symbols(file_path)
+    except OSError:
+        return None
@@ -3,15 +3,20 @@
 워크스페이스의 코드 파일들을 자동으로 벡터DB에 색인합니다.
 """
 import os
-import re
+import json
+import time
 import logging
 import hashlib
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Callable, Iterable, List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass, field
 
-from app.services.vector_db import vector_db
+from app.services.code_chunker import StructuralChunker
+from app.services.code_graph_extractor import FileSymbols, extract_symbols
+from app.services.lexical_index import get_lexical_index
+from app.services.vector_db import DATA_DIR, vector_db
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +30,81 @@ class IndexingStats:
     total_chunks: int = 0
     files_processed: List[str] = field(default_factory=list)
     error_files: List[str] = field(default_factory=list)
+    removed: int = 0
+    deleted_chunks: int = 0
+    batches: int = 0
+    duration_seconds: float = 0.0
+    files_per_second: float = 0.0
+    chunks_per_second: float = 0.0
+
+
+MANIFEST_DIR = os.path.join(DATA_DIR, "index_manifests")
+
+
+@dataclass
+class ManifestEntry:
+    """색인된 파일 하나의 매니페스트 항목"""
+    mtime_ns: int
+    size: int
+    content_hash: str
+    chunk_ids: List[str] = field(default_factory=list)
+
+
+class IndexManifest:
+    """워크스페이스별 색인 매니페스트 (상대 경로 -> ManifestEntry)
+
+    증분 색인에서 변경되지 않은 파일을 건너뛰고,
+    수정/삭제된 파일의 기존 청크를 벡터DB에서 지우는 데 사용합니다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        """IndexManifest 초기화
+
+        Args:
+            path: 매니페스트 JSON 파일 경로
+        """
+        self.path = Path(path)
+        self.entries: Dict[str, ManifestEntry] = {}
+        self.chunker_version = 0
+
+    def load(self) -> "IndexManifest":
+        """디스크에서 매니페스트 읽기 (없거나 손상되면 빈 매니페스트)"""
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get("version") == self.VERSION:
+                self.chunker_version = data.get("chunker_version", 0)
+                self.entries = {
+                    rel_path: ManifestEntry(**entry)
+                    for rel_path, entry in data.get("files", {}).items()
+                }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable index manifest {self.path}: {e}")
+            self.entries = {}
+        return self
+
+    def save(self) -> None:
+        """매니페스트를 원자적으로 저장 (임시 파일 작성 후 교체)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": self.VERSION,
+            "chunker_version": self.chunker_version,
+            "files": {
+                rel_path: {
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "content_hash": entry.content_hash,
+                    "chunk_ids": entry.chunk_ids,
+                }
+                for rel_path, entry in self.entries.items()
+            },
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding='utf-8')
+        os.replace(tmp_path, self.path)
 
 
 class CodeIndexer:
@@ -90,86 +170,531 @@ class CodeIndexer:
     # 청크 설정
     MAX_CHUNK_SIZE: int = 2000  # 최대 청크 크기 (문자)
     MIN_CHUNK_SIZE: int = 100   # 최소 청크 크기
+    CHUNKER_VERSION: int = 3  # 청킹 방식이 바뀌면 증가 (기존 색인을 한 번 다시 청킹)
     MAX_FILE_SIZE: int = 100000  # 최대 파일 크기 (100KB)
 
-    def __init__(self, workspace: str, session_id: str):
+    # 파이프라인 설정
+    INDEX_WORKERS: int = min(8, (os.cpu_count() or 2))  # 파일 읽기/청킹 워커 수
+    EMBED_BATCH_SIZE: int = 256  # 벡터DB upsert(임베딩) 1회당 청크 수
+    PIPELINE_QUEUE_SIZE: int = 32  # 청킹 완료 후 대기 가능한 파일 수 (메모리 상한)
+
+    def __init__(self, workspace: str, session_id: str, manifest_path: Optional[str] = None):
         """CodeIndexer 초기화
 
         Args:
             workspace: 워크스페이스 경로
             session_id: 세션 ID (색인 그룹화용)
+            manifest_path: 색인 매니페스트 경로 (None이면 data/index_manifests 아래)
         """
         self.workspace = Path(workspace)
         self.session_id = session_id
         self.logger = logging.getLogger(f"{__name__}.{session_id[:8]}")
 
+        if manifest_path is None:
+            key = hashlib.md5(f"{self.workspace.resolve()}:{session_id}".encode()).hexdigest()
+            manifest_path = os.path.join(MANIFEST_DIR, f"{key}.json")
+        self.manifest = IndexManifest(Path(manifest_path)).load()
+        self.chunker = StructuralChunker(self.MAX_CHUNK_SIZE)
+        # 하이브리드 검색용 BM25 색인 (벡터DB와 같은 청크/ID로 갱신)
+        self.lexical_index = get_lexical_index(session_id)
+        # 색인 작업 직렬화 (초기 색인과 파일 감시기 갱신이 겹치지 않도록)
+        self._lock = asyncio.Lock()
+
     async def index_project(self,
                            incremental: bool = True,
-                           max_files: Optional[int] = None) -> IndexingStats:
+                           max_files: Optional[int] = None,
+                           progress_callback: Optional[Callable[[int, int], None]] = None) -> IndexingStats:
         """전체 프로젝트 색인
 
+        파이프라인 구조:
+        1. 매니페스트와 비교해 변경/추가/삭제된 파일 찾기
+        2. 워커 풀에서 파일 읽기 + 청킹 (병렬)
+        3. 청크를 EMBED_BATCH_SIZE 단위로 모음
+        4. 배치마다 벡터DB upsert 1회 (임베딩도 배치당 1회) 후
+           수정된 파일의 이전 청크 삭제
+
+        대기열 크기가 제한되어 있어 대형 저장소에서도 메모리 사용량이 일정합니다.
+        삭제된 파일의 청크는 incremental 여부와 관계없이 항상 제거됩니다.
+
         Args:
-            incremental: True면 변경된 파일만 색인 (현재는 전체 색인)
+            incremental: True면 변경된 파일만 색인 (mtime/크기가 같으면 건너뛰고,
+                다르면 내용 해시로 한 번 더 확인), False면 전체 재색인
             max_files: 최대 색인할 파일 수 (None이면 무제한)
+            progress_callback: 진행률 콜백 (완료 파일 수, 전체 파일 수)
+
+        Returns:
+            IndexingStats: 색인 통계
+        """
+        async with self._lock:
+            stats = IndexingStats()
+            start_time = time.monotonic()
+            self.logger.info(f"Starting project indexing: {self.workspace}")
+
+            code_files = list(self._get_code_files())
+            total_files = len(code_files)
+
+            # 매니페스트에는 있지만 워크스페이스에서 사라진 파일
+            current_files = {self._relative_path(path) for path in code_files}
+            removed_files = [rel_path for rel_path in self.manifest.entries if rel_path not in current_files]
+
+            if max_files:
+                code_files = code_files[:max_files]
+
+            # 청킹 방식이 바뀌었으면 내용이 그대로인 파일도 다시 청킹
+            rechunk = self.manifest.chunker_version != self.CHUNKER_VERSION
+            if rechunk and not max_files:
+                self.manifest.chunker_version = self.CHUNKER_VERSION
+
+            unchanged_files: List[Path] = []
+            if incremental and not rechunk:
+                code_files, unchanged_files = await asyncio.to_thread(self._split_unchanged, code_files)
+                stats.skipped = len(unchanged_files)
+
+            self.logger.info(
+                f"Found {total_files} code files, indexing {len(code_files)} "
+                f"({stats.skipped} unchanged, {len(removed_files)} removed)"
+            )
+
+            await self._apply_changes(stats, code_files, removed_files, unchanged_files,
+                                      force=not incremental or rechunk, progress_callback=progress_callback)
+            stats.duration_seconds = time.monotonic() - start_time
+            self._log_completion(stats)
+            return stats
+
+    async def index_paths(self, paths: Iterable[str]) -> IndexingStats:
+        """변경된 경로만 증분 색인 (파일 감시기용)
+
+        존재하는 코드 파일은 내용 해시를 확인해 바뀐 경우에만 다시 색인하고,
+        사라진 경로(파일 또는 디렉토리)는 그 아래 색인된 파일의 청크를 삭제합니다.
+        워크스페이스 밖이거나 제외 대상인 경로는 무시합니다.
+
+        Args:
+            paths: 변경된 파일/디렉토리 경로 목록
 
         Returns:
             IndexingStats: 색인 통계
         """
-        stats = IndexingStats()
-        self.logger.info(f"Starting project indexing: {self.workspace}")
+        async with self._lock:
+            stats = IndexingStats()
+            start_time = time.monotonic()
 
-        code_files = list(self._get_code_files())
-        total_files = len(code_files)
+            code_files, removed_files = await asyncio.to_thread(self._resolve_changed_paths, paths)
+            self.logger.info(f"Re-indexing {len(code_files)} changed files, {len(removed_files)} removed")
 
-        if max_files:
-            code_files = code_files[:max_files]
+            await self._apply_changes(stats, code_files, removed_files, [])
+            stats.duration_seconds = time.monotonic() - start_time
+            self._log_completion(stats)
+            return stats
 
-        self.logger.info(f"Found {total_files} code files, indexing {len(code_files)}")
+    def is_watched_path(self, path: Path) -> bool:
+        """워크스페이스 안에 있고 제외 디렉토리(숨김 포함) 밖의 경로인지 확인
 
-        for i, file_path in enumerate(code_files):
-            try:
-                # 진행률 로깅 (10% 단위)
-                if total_files > 10 and i % (total_files // 10) == 0:
-                    self.logger.info(f"Indexing progress: {i}/{len(code_files)} ({i*100//len(code_files)}%)")
+        Args:
+            path: 파일/디렉토리 경로
+
+        Returns:
+            bool: 색인 대상 범위면 True
+        """
+        try:
+            rel_path = Path(path).relative_to(self.workspace)
+        except ValueError:
+            return False
+
+        return not any(
+            part in self.EXCLUDED_DIRS or part.startswith('.')
+            for part in rel_path.parts[:-1]
+        )
+
+    def _is_code_file(self, file_path: Path) -> bool:
+        """색인 대상 확장자이고 제외 패턴이 아닌 파일인지 확인"""
+        return (file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
+                and not self._should_exclude(file_path.name))
+
+    def _resolve_changed_paths(self, paths: Iterable[str]) -> Tuple[List[Path], List[str]]:
+        """변경된 경로를 (다시 색인할 파일, 삭제된 파일의 상대 경로)로 분류
+
+        Args:
+            paths: 변경된 파일/디렉토리 경로 목록
 
-                chunk_count = await self._index_file(file_path)
-                stats.indexed += 1
-                stats.total_chunks += chunk_count
-                stats.files_processed.append(str(file_path))
+        Returns:
+            Tuple[List[Path], List[str]]: (색인할 파일, 매니페스트에서 제거할 상대 경로)
+        """
+        code_files: Dict[Path, None] = {}
+        removed: Dict[str, None] = {}
+
+        for path in map(Path, paths):
+            if not self.is_watched_path(path):
+                continue
+
+            if path.is_dir():
+                if path.name not in self.EXCLUDED_DIRS and not path.name.startswith('.'):
+                    code_files.update(dict.fromkeys(self._get_code_files(path)))
+            elif path.is_file():
+                if self._is_code_file(path):
+                    code_files[path] = None
+            else:
+                # 삭제된 파일이거나 디렉토리 (디렉토리면 그 아래 모든 파일)
+                rel_path = self._relative_path(path)
+                prefix = rel_path + os.sep
+                removed.update(dict.fromkeys(
+                    entry for entry in self.manifest.entries
+                    if entry == rel_path or entry.startswith(prefix)
+                ))
+
+        return list(code_files), list(removed)
+
+    async def _apply_changes(self,
+                             stats: IndexingStats,
+                             code_files: List[Path],
+                             removed_files: List[str],
+                             unchanged_files: List[Path],
+                             force: bool = False,
+                             progress_callback: Optional[Callable[[int, int], None]] = None) -> None:
+        """삭제된 파일 정리, 변경된 파일 색인, 매니페스트 저장, Knowledge Graph 갱신
 
+        Args:
+            stats: 갱신할 색인 통계
+            code_files: 색인할 파일 목록
+            removed_files: 삭제된 파일의 상대 경로 목록
+            unchanged_files: 변경 없는 파일 목록 (그래프에 없으면 추가)
+            force: True면 내용 해시가 같아도 다시 청킹
+            progress_callback: 진행률 콜백
+        """
+        await self._remove_files(removed_files, stats)
+
+        # 파이프라인에서 추출한 그래프 심볼 (그래프 갱신 시 파일을 다시 읽지 않음)
+        graph_symbols: List[FileSymbols] = []
+        if code_files:
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+            with ThreadPoolExecutor(max_workers=self.INDEX_WORKERS,
+                                    thread_name_prefix="code-indexer") as pool:
+                producer = asyncio.create_task(self._produce_chunks(code_files, pool, queue, force=force))
+                try:
+                    await self._consume_chunks(queue, stats, len(code_files), progress_callback, graph_symbols)
+                finally:
+                    producer.cancel()
+                    await asyncio.gather(producer, return_exceptions=True)
+
+        if code_files or removed_files:
+            try:
+                await asyncio.to_thread(self.manifest.save)
             except Exception as e:
-                self.logger.warning(f"Failed to index {file_path}: {e}")
-                stats.errors += 1
-                stats.error_files.append(str(file_path))
+                self.logger.warning(f"Failed to save index manifest: {e}")
+
+        # Knowledge Graph 갱신 (Phase 3-E) - 같은 변경분으로 증분 갱신
+        await self._build_knowledge_graph(
+            stats.files_processed,
+            removed_paths=[str(self.workspace / rel_path) for rel_path in removed_files],
+            unchanged_paths=[str(path) for path in unchanged_files],
+            symbols=graph_symbols,
+        )
+
+    def _log_completion(self, stats: IndexingStats) -> None:
+        """처리량 계산 및 완료 로그"""
+        if stats.duration_seconds > 0:
+            stats.files_per_second = stats.indexed / stats.duration_seconds
+            stats.chunks_per_second = stats.total_chunks / stats.duration_seconds
 
         self.logger.info(
             f"Indexing complete: {stats.indexed} files, "
-            f"{stats.total_chunks} chunks, {stats.errors} errors"
+            f"{stats.total_chunks} chunks, {stats.errors} errors, "
+            f"{stats.skipped} skipped, {stats.removed} removed "
+            f"in {stats.duration_seconds:.1f}s "
+            f"({stats.files_per_second:.1f} files/s, {stats.chunks_per_second:.1f} chunks/s)"
         )
 
-        # Knowledge Graph 구축 (Phase 3-E)
-        await self._build_knowledge_graph(stats.files_processed)
+    def _split_unchanged(self, code_files: List[Path]) -> Tuple[List[Path], List[Path]]:
+        """mtime/크기가 매니페스트와 같은 파일을 분리 (파일 내용은 읽지 않음)
+
+        Args:
+            code_files: 색인 대상 파일 목록
+
+        Returns:
+            Tuple[List[Path], List[Path]]: (다시 확인할 파일, 변경 없는 파일)
+        """
+        candidates: List[Path] = []
+        unchanged: List[Path] = []
 
-        return stats
+        for file_path in code_files:
+            entry = self.manifest.entries.get(self._relative_path(file_path))
+            try:
+                stat = file_path.stat()
+            except OSError:
+                candidates.append(file_path)
+                continue
 
-    async def _build_knowledge_graph(self, file_paths: List[str]):
-        """Knowledge Graph 구축
+            if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                unchanged.append(file_path)
+            else:
+                candidates.append(file_path)
 
-        색인된 파일들을 분석하여 Knowledge Graph를 구축합니다.
+        return candidates, unchanged
+
+    async def _remove_files(self, rel_paths: List[str], stats: IndexingStats) -> None:
+        """삭제된 파일의 청크를 벡터DB와 매니페스트에서 제거
 
         Args:
-            file_paths: 분석할 파일 경로 목록
+            rel_paths: 삭제된 파일의 상대 경로 목록
+            stats: 갱신할 색인 통계
+        """
+        if not rel_paths:
+            return
+
+        chunk_ids = [
+            chunk_id
+            for rel_path in rel_paths
+            for chunk_id in self.manifest.entries[rel_path].chunk_ids
+        ]
+        if await self._delete_chunks(chunk_ids, stats):
+            for rel_path in rel_paths:
+                del self.manifest.entries[rel_path]
+            stats.removed += len(rel_paths)
+
+    async def _delete_chunks(self, chunk_ids: List[str], stats: Optional[IndexingStats] = None) -> bool:
+        """벡터DB에서 청크 삭제
+
+        Args:
+            chunk_ids: 삭제할 문서 ID 목록
+            stats: 갱신할 색인 통계 (선택)
+
+        Returns:
+            bool: 성공하면 True
         """
+        if not chunk_ids:
+            return True
+
         try:
-            from app.services.hybrid_rag import CodeGraphBuilder
+            await asyncio.to_thread(vector_db.delete_documents, chunk_ids, self.session_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to delete {len(chunk_ids)} stale chunks: {e}")
+            return False
+        self.lexical_index.remove(chunk_ids)
+
+        if stats:
+            stats.deleted_chunks += len(chunk_ids)
+        return True
+
+    async def _produce_chunks(self,
+                              code_files: List[Path],
+                              pool: ThreadPoolExecutor,
+                              queue: asyncio.Queue,
+                              force: bool = False) -> None:
+        """워커 풀에서 파일을 청킹해 대기열에 넣기 (파일 순서 유지)
+
+        Args:
+            code_files: 색인할 파일 목록
+            pool: 파일 읽기/청킹용 스레드 풀
+            queue: (파일 경로, _scan_file 결과 또는 예외) 대기열, 끝은 None
+            force: True면 내용 해시가 같아도 다시 청킹
+        """
+        loop = asyncio.get_running_loop()
+        window = self.INDEX_WORKERS * 2
+        pending: List[Tuple[Path, asyncio.Future]] = []
+        files = iter(code_files)
+
+        def submit_next() -> None:
+            file_path = next(files, None)
+            if file_path is not None:
+                pending.append((file_path, loop.run_in_executor(pool, self._scan_file, file_path, force)))
+
+        for _ in range(window):
+            submit_next()
+
+        while pending:
+            file_path, future = pending.pop(0)
+            try:
+                result = await future
+            except Exception as e:
+                result = e
+            submit_next()
+            await queue.put((file_path, result))
+
+        await queue.put(None)
 
-            builder = CodeGraphBuilder(self.session_id, str(self.workspace))
-            nodes_added = builder.build_from_files(file_paths)
-            self.logger.info(f"Knowledge Graph built: {nodes_added} nodes")
+    def _scan_file(self,
+                   file_path: Path,
+                   force: bool = False) -> Tuple[ManifestEntry, Optional[List[Dict]], Optional[FileSymbols]]:
+        """파일의 매니페스트 항목을 만들고, 내용이 바뀌었으면 청킹과 그래프 심볼 추출 (워커 스레드에서 실행)
+
+        Args:
+            file_path: 파일 경로
+            force: True면 내용 해시가 같아도 청킹
+
+        Returns:
+            Tuple[ManifestEntry, Optional[List[Dict]], Optional[FileSymbols]]: (새 매니페스트 항목,
+                청크 목록, Knowledge Graph 심볼 - 내용이 그대로면 둘 다 None)
+        """
+        stat = file_path.stat()
+        content = self._read_file(file_path)
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        entry = ManifestEntry(mtime_ns=stat.st_mtime_ns, size=stat.st_size, content_hash=content_hash)
+
+        previous = self.manifest.entries.get(self._relative_path(file_path))
+        if not force and previous and previous.content_hash == content_hash:
+            # 내용은 그대로 (touch 등) - 기존 청크 유지
+            entry.chunk_ids = previous.chunk_ids
+            return entry, None, None
+
+        return entry, self._prepare_file(file_path, content), extract_symbols(str(file_path), content)
+
+    async def _consume_chunks(self,
+                              queue: asyncio.Queue,
+                              stats: IndexingStats,
+                              file_count: int,
+                              progress_callback: Optional[Callable[[int, int], None]],
+                              graph_symbols: Optional[List[FileSymbols]] = None) -> None:
+        """대기열의 청크를 배치로 모아 벡터DB에 upsert
+
+        upsert가 끝난 파일은 매니페스트에 새 청크 ID를 기록하고,
+        더 이상 쓰이지 않는 이전 청크는 삭제합니다.
+
+        Args:
+            queue: _produce_chunks가 채우는 대기열
+            stats: 갱신할 색인 통계
+            file_count: 전체 색인 대상 파일 수
+            progress_callback: 진행률 콜백
+            graph_symbols: 색인된 파일의 그래프 심볼을 모을 목록 (선택)
+        """
+        batch: List[Dict] = []
+        batch_files: List[Tuple[Path, ManifestEntry, int, Optional[FileSymbols]]] = []
+        done = 0
+        log_every = max(1, file_count // 10)
+
+        def report(count: int) -> None:
+            nonlocal done
+            previous = done
+            done += count
+
+            # 진행률 로깅 (10% 단위)
+            if done // log_every != previous // log_every:
+                self.logger.info(f"Indexing progress: {done}/{file_count} ({done * 100 // file_count}%)")
+            if progress_callback:
+                progress_callback(done, file_count)
+
+        async def flush() -> None:
+            if not batch_files:
+                return
+            try:
+                doc_ids: List[str] = []
+                if batch:
+                    doc_ids = await asyncio.to_thread(vector_db.upsert_code_snippets, list(batch), self.session_id)
+                    await asyncio.to_thread(self.lexical_index.add_chunks, doc_ids, list(batch))
+                    stats.batches += 1
+
+                stale_ids: List[str] = []
+                offset = 0
+                for file_path, entry, chunk_count, symbols in batch_files:
+                    entry.chunk_ids = list(doc_ids[offset:offset + chunk_count])
+                    offset += chunk_count
+
+                    rel_path = self._relative_path(file_path)
+                    previous = self.manifest.entries.get(rel_path)
+                    if previous:
+                        stale_ids.extend(set(previous.chunk_ids) - set(entry.chunk_ids))
+                    self.manifest.entries[rel_path] = entry
+
+                    stats.indexed += 1
+                    stats.total_chunks += chunk_count
+                    stats.files_processed.append(str(file_path))
+                    if graph_symbols is not None and symbols is not None:
+                        graph_symbols.append(symbols)
+
+                await self._delete_chunks(stale_ids, stats)
+            except Exception as e:
+                self.logger.warning(f"Failed to index batch of {len(batch_files)} files: {e}")
+                for file_path, *_ in batch_files:
+                    stats.errors += 1
+                    stats.error_files.append(str(file_path))
+
+            count = len(batch_files)
+            batch.clear()
+            batch_files.clear()
+            report(count)
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+
+            file_path, result = item
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to index {file_path}: {result}")
+                stats.errors += 1
+                stats.error_files.append(str(file_path))
+                continue
+
+            entry, chunks, symbols = result
+            if chunks is None:
+                # 내용이 그대로인 파일은 mtime만 갱신
+                self.manifest.entries[self._relative_path(file_path)] = entry
+                stats.skipped += 1
+                report(1)
+                continue
+
+            batch.extend(chunks)
+            batch_files.append((file_path, entry, len(chunks), symbols))
+            if len(batch) >= self.EMBED_BATCH_SIZE:
+                await flush()
+
+        await flush()
+
+    async def _build_knowledge_graph(self,
+                                     file_paths: List[str],
+                                     removed_paths: Optional[List[str]] = None,
+                                     unchanged_paths: Optional[List[str]] = None,
+                                     symbols: Optional[List[FileSymbols]] = None):
+        """Knowledge Graph 증분 갱신
+
+        색인된(추가/수정) 파일은 다시 분석하고, 삭제된 파일의 노드는 제거합니다.
+        변경 없는 파일은 그래프에 아직 없을 때만 (예: 스냅샷이 없을 때) 추가하고,
+        그래프가 바뀌었으면 스냅샷을 저장합니다.
+
+        Args:
+            file_paths: 다시 분석할 파일 경로 목록
+            removed_paths: 그래프에서 제거할 파일 경로 목록
+            unchanged_paths: 변경 없는 파일 경로 목록
+            symbols: 색인 파이프라인에서 이미 추출한 심볼 (해당 파일은 다시 읽지 않음)
+        """
+        try:
+            from app.memory.graph_store import get_graph_store
+
+            # 그래프 로드/퇴출(스냅샷 읽기·쓰기)까지 이벤트 루프 밖에서 수행
+            nodes_added = await asyncio.to_thread(
+                self._update_knowledge_graph, file_paths, removed_paths or [], unchanged_paths or [], symbols
+            )
+            self.logger.info(f"Knowledge Graph updated: {nodes_added} nodes")
+
+            # 변경된 그래프 스냅샷 저장 (재시작 시 전체 재구축 방지)
+            await asyncio.to_thread(get_graph_store().save, self.session_id, str(self.workspace))
         except Exception as e:
             # 그래프 구축 실패해도 색인은 완료된 것으로 처리
             self.logger.warning(f"Knowledge Graph build failed: {e}")
 
+    def _update_knowledge_graph(self,
+                                file_paths: List[str],
+                                removed_paths: List[str],
+                                unchanged_paths: List[str],
+                                symbols: Optional[List[FileSymbols]]) -> int:
+        """Knowledge Graph 갱신 (동기, 워커 스레드에서 실행)
+
+        그래프를 가져올 때 스냅샷 로드나 다른 그래프의 퇴출 저장이 일어날 수 있어
+        빌더 생성과 누락 파일 확인도 여기서 함께 수행합니다.
+
+        Args:
+            file_paths: 다시 분석할 파일 경로 목록
+            removed_paths: 그래프에서 제거할 파일 경로 목록
+            unchanged_paths: 변경 없는 파일 경로 목록 (그래프에 없으면 추가)
+            symbols: 이미 추출한 심볼
+
+        Returns:
+            int: 추가된 노드 수
+        """
+        from app.services.hybrid_rag import CodeGraphBuilder
+
+        builder = CodeGraphBuilder(self.session_id, str(self.workspace))
+        missing = [path for path in unchanged_paths if not builder.has_file(path)]
+        return builder.update_files(list(file_paths) + missing, removed_paths, symbols)
+
     async def index_file(self, file_path: str) -> List[str]:
         """단일 파일 색인
 
@@ -179,7 +704,8 @@ class CodeIndexer:
         Returns:
             List[str]: 생성된 문서 ID 목록
         """
-        return await self._index_file(Path(file_path))
+        async with self._lock:
+            return await self._index_file(Path(file_path))
 
     async def _index_file(self, file_path: Path) -> int:
         """파일 색인 내부 구현
@@ -190,7 +716,33 @@ class CodeIndexer:
         Returns:
             int: 생성된 청크 수
         """
-        # 파일 읽기
+        entry, chunks, _ = await asyncio.to_thread(self._scan_file, file_path, True)
+
+        # 파일의 모든 청크를 한 번에 색인
+        doc_ids = await asyncio.to_thread(vector_db.upsert_code_snippets, chunks, self.session_id)
+        await asyncio.to_thread(self.lexical_index.add_chunks, doc_ids, chunks)
+        self.logger.debug(f"Indexed {len(chunks)} chunks: {file_path}")
+
+        # 이전 청크 정리 후 매니페스트 갱신
+        entry.chunk_ids = list(doc_ids)
+        rel_path = self._relative_path(file_path)
+        previous = self.manifest.entries.get(rel_path)
+        if previous:
+            await self._delete_chunks(list(set(previous.chunk_ids) - set(entry.chunk_ids)))
+        self.manifest.entries[rel_path] = entry
+        await asyncio.to_thread(self.manifest.save)
+
+        return len(chunks)
+
+    def _read_file(self, file_path: Path) -> str:
+        """파일 읽기 (MAX_FILE_SIZE 초과분은 잘라냄)
+
+        Args:
+            file_path: 파일 경로
+
+        Returns:
+            str: 파일 내용
+        """
         try:
             content = file_path.read_text(encoding='utf-8', errors='ignore')
         except Exception as e:
@@ -202,40 +754,53 @@ class CodeIndexer:
             self.logger.debug(f"File too large, truncating: {file_path}")
             content = content[:self.MAX_FILE_SIZE]
 
-        # 상대 경로 계산
-        try:
-            rel_path = file_path.relative_to(self.workspace)
-        except ValueError:
-            rel_path = file_path
+        return content
+
+    def _prepare_file(self, file_path: Path, content: Optional[str] = None) -> List[Dict]:
+        """파일을 읽어 청크 목록으로 변환 (워커 스레드에서 실행)
+
+        Args:
+            file_path: 파일 경로
+            content: 이미 읽은 파일 내용 (None이면 파일에서 읽음)
+
+        Returns:
+            List[Dict]: 청크 목록
+        """
+        if content is None:
+            content = self._read_file(file_path)
 
         # 언어 감지
         language = self._detect_language(file_path)
 
         # 코드 청킹
-        chunks = self._chunk_code(content, str(rel_path), language)
-
-        # 각 청크 색인
-        for chunk in chunks:
-            doc_id = vector_db.add_code_snippet(
-                code=chunk['code'],
-                filename=chunk['filename'],
-                language=chunk['language'],
-                session_id=self.session_id,
-                description=chunk['description']
-            )
-            self.logger.debug(f"Indexed chunk: {chunk['filename']} ({len(chunk['code'])} chars)")
+        return self._chunk_code(content, self._relative_path(file_path), language)
 
-        return len(chunks)
+    def _relative_path(self, file_path: Path) -> str:
+        """워크스페이스 기준 상대 경로 (워크스페이스 밖이면 그대로)
+
+        Args:
+            file_path: 파일 경로
 
-    def _get_code_files(self) -> List[Path]:
+        Returns:
+            str: 상대 경로
+        """
+        try:
+            return str(file_path.relative_to(self.workspace))
+        except ValueError:
+            return str(file_path)
+
+    def _get_code_files(self, root_dir: Optional[Path] = None) -> List[Path]:
         """워크스페이스에서 코드 파일 목록 가져오기
 
+        Args:
+            root_dir: 탐색할 하위 디렉토리 (None이면 워크스페이스 전체)
+
         Returns:
             List[Path]: 코드 파일 경로 목록
         """
         code_files = []
 
-        for root, dirs, files in os.walk(self.workspace):
+        for root, dirs, files in os.walk(root_dir or self.workspace):
             # 제외 디렉토리 필터링
             dirs[:] = [d for d in dirs if d not in self.EXCLUDED_DIRS
                       and not d.startswith('.')]
@@ -287,8 +852,8 @@ class CodeIndexer:
     def _chunk_code(self, content: str, filename: str, language: str) -> List[Dict]:
         """코드를 의미 있는 청크로 분할
 
-        현재 구현: 파일 단위 + 크기 기반 분할
-        TODO: AST 기반 함수/클래스 단위 분할
+        작은 파일은 파일 전체를 하나의 청크로, 큰 파일은 Python/JS/TS면
+        클래스/메서드/함수 단위로, 그 밖의 언어는 라인 기반으로 분할합니다.
 
         Args:
             content: 파일 내용
@@ -296,7 +861,8 @@ class CodeIndexer:
             language: 프로그래밍 언어
 
         Returns:
-            List[Dict]: 청크 목록
+            List[Dict]: 청크 목록 (code, filename, language, description,
+                start_line, end_line)
         """
         chunks = []
 
@@ -307,7 +873,9 @@ class CodeIndexer:
                 'code': content,
                 'filename': filename,
                 'language': language,
-                'description': description
+                'description': description,
+                'start_line': 1,
+                'end_line': content.count('\n') + 1
             })
             return chunks
 
@@ -320,15 +888,20 @@ class CodeIndexer:
             # 기본: 라인 기반 분할
             chunks = self._chunk_by_lines(content, filename, language)
 
+        partial = content[:self.MAX_CHUNK_SIZE]
         return chunks if chunks else [{
-            'code': content[:self.MAX_CHUNK_SIZE],
+            'code': partial,
             'filename': filename,
             'language': language,
-            'description': f"Partial content of {filename}"
+            'description': f"Partial content of {filename}",
+            'start_line': 1,
+            'end_line': partial.count('\n') + 1
         }]
 
     def _chunk_python(self, content: str, filename: str, language: str) -> List[Dict]:
-        """Python 코드를 함수/클래스 단위로 분할
+        """Python 코드를 ast로 클래스/메서드/함수 단위로 분할
+
+        구문 오류로 파싱할 수 없는 파일은 라인 기반으로 분할합니다.
 
         Args:
             content: 파일 내용
@@ -338,70 +911,13 @@ class CodeIndexer:
         Returns:
             List[Dict]: 청크 목록
         """
-        chunks = []
-
-        # 정규식으로 함수와 클래스 찾기
-        # class/def 시작점 찾기
-        pattern = r'^(class\s+\w+|def\s+\w+|async\s+def\s+\w+)'
-
-        lines = content.split('\n')
-        current_chunk_start = 0
-        current_chunk_lines = []
-        current_name = "module_header"
-
-        for i, line in enumerate(lines):
-            match = re.match(pattern, line.lstrip())
-            if match and len(line) - len(line.lstrip()) == 0:  # 탑레벨만
-                # 이전 청크 저장
-                if current_chunk_lines:
-                    chunk_content = '\n'.join(current_chunk_lines)
-                    if len(chunk_content) >= self.MIN_CHUNK_SIZE:
-                        chunks.append({
-                            'code': chunk_content,
-                            'filename': f"{filename}::{current_name}",
-                            'language': language,
-                            'description': f"{current_name} in {filename}"
-                        })
-
-                # 새 청크 시작
-                current_name = match.group(1).split()[1] if len(match.group(1).split()) > 1 else match.group(1)
-                current_chunk_lines = [line]
-                current_chunk_start = i
-            else:
-                current_chunk_lines.append(line)
-
-        # 마지막 청크
-        if current_chunk_lines:
-            chunk_content = '\n'.join(current_chunk_lines)
-            if len(chunk_content) >= self.MIN_CHUNK_SIZE:
-                chunks.append({
-                    'code': chunk_content,
-                    'filename': f"{filename}::{current_name}",
-                    'language': language,
-                    'description': f"{current_name} in {filename}"
-                })
-
-        # 청크가 없거나 너무 크면 라인 기반으로
-        if not chunks:
+        chunks = self.chunker.chunk_python(content, filename, language)
+        if chunks is None:
             return self._chunk_by_lines(content, filename, language)
-
-        # 너무 큰 청크는 추가 분할
-        final_chunks = []
-        for chunk in chunks:
-            if len(chunk['code']) > self.MAX_CHUNK_SIZE:
-                sub_chunks = self._chunk_by_lines(
-                    chunk['code'],
-                    chunk['filename'],
-                    language
-                )
-                final_chunks.extend(sub_chunks)
-            else:
-                final_chunks.append(chunk)
-
-        return final_chunks
+        return chunks
 
     def _chunk_javascript(self, content: str, filename: str, language: str) -> List[Dict]:
-        """JavaScript/TypeScript 코드를 함수/클래스 단위로 분할
+        """JavaScript/TypeScript 코드를 선언/클래스 멤버 단위로 분할
 
         Args:
             content: 파일 내용
@@ -411,50 +927,8 @@ class CodeIndexer:
         Returns:
             List[Dict]: 청크 목록
         """
-        chunks = []
-
-        # export, function, class, const 패턴
-        pattern = r'^(export\s+)?(class\s+\w+|function\s+\w+|const\s+\w+\s*=|let\s+\w+\s*=|async\s+function\s+\w+)'
-
-        lines = content.split('\n')
-        current_chunk_lines = []
-        current_name = "module"
-
-        for line in lines:
-            match = re.match(pattern, line.lstrip())
-            if match:
-                # 이전 청크 저장
-                if current_chunk_lines and len('\n'.join(current_chunk_lines)) >= self.MIN_CHUNK_SIZE:
-                    chunk_content = '\n'.join(current_chunk_lines)
-                    chunks.append({
-                        'code': chunk_content,
-                        'filename': f"{filename}::{current_name}",
-                        'language': language,
-                        'description': f"{current_name} in {filename}"
-                    })
-
-                # 새 청크 시작
-                parts = match.group(0).replace('export ', '').split()
-                current_name = parts[1] if len(parts) > 1 else parts[0]
-                current_name = current_name.split('=')[0].strip()
-                current_chunk_lines = [line]
-            else:
-                current_chunk_lines.append(line)
-
-        # 마지막 청크
-        if current_chunk_lines and len('\n'.join(current_chunk_lines)) >= self.MIN_CHUNK_SIZE:
-            chunk_content = '\n'.join(current_chunk_lines)
-            chunks.append({
-                'code': chunk_content,
-                'filename': f"{filename}::{current_name}",
-                'language': language,
-                'description': f"{current_name} in {filename}"
-            })
-
-        if not chunks:
-            return self._chunk_by_lines(content, filename, language)
-
-        return chunks
+        chunks = self.chunker.chunk_javascript(content, filename, language)
+        return chunks if chunks else self._chunk_by_lines(content, filename, language)
 
     def _chunk_by_lines(self, content: str, filename: str, language: str) -> List[Dict]:
         """라인 기반으로 청크 분할
@@ -472,8 +946,9 @@ class CodeIndexer:
         current_chunk = []
         current_size = 0
         chunk_num = 1
+        chunk_start = 1
 
-        for line in lines:
+        for line_no, line in enumerate(lines, 1):
             line_size = len(line) + 1  # +1 for newline
 
             if current_size + line_size > self.MAX_CHUNK_SIZE and current_chunk:
@@ -483,9 +958,12 @@ class CodeIndexer:
                     'code': chunk_content,
                     'filename': f"{filename}::part{chunk_num}",
                     'language': language,
-                    'description': f"Part {chunk_num} of {filename}"
+                    'description': f"Part {chunk_num} of {filename}",
+                    'start_line': chunk_start,
+                    'end_line': line_no - 1
                 })
                 chunk_num += 1
+                chunk_start = line_no
                 current_chunk = [line]
                 current_size = line_size
             else:
@@ -500,7 +978,9 @@ class CodeIndexer:
                     'code': chunk_content,
                     'filename': f"{filename}::part{chunk_num}" if chunk_num > 1 else filename,
                     'language': language,
-                    'description': f"Part {chunk_num} of {filename}" if chunk_num > 1 else f"Content of {filename}"
+                    'description': f"Part {chunk_num} of {filename}" if chunk_num > 1 else f"Content of {filename}",
+                    'start_line': chunk_start,
+                    'end_line': len(lines)
                 })
 
         return chunks
@@ -4,8 +4,12 @@ Provides robust HTTP client with exponential backoff retry for:
 - httpx.ConnectError (connection failures)
 - httpx.TimeoutException (request timeouts)
 - HTTP 5xx errors (server errors)
+
+Connections are borrowed from the shared keep-alive pool in
+``shared.llm.http_pool`` instead of opening a new client per attempt.
 """
 
+import asyncio
 import logging
 import time
 import httpx
@@ -20,6 +24,23 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_BASE_DELAY = 2  # seconds
 
 
+def _encode_post_result(value: Tuple[Optional[Dict[str, Any]], Optional[str]]) -> Optional[Dict[str, Any]]:
+    """Cache only successful (response_json, None) results."""
+    result, error = value
+    return None if error else result
+
+
+def _decode_post_result(result: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    return result, None
+
+
+def _pool_endpoint(url: str) -> str:
+    """Pool key for a URL (scheme + host + port)."""
+    parsed = httpx.URL(url)
+    port = f":{parsed.port}" if parsed.port else ""
+    return f"{parsed.scheme}://{parsed.host}{port}"
+
+
 class LLMHttpClient:
     """HTTP client optimized for LLM endpoint calls with retry logic.
 
@@ -50,7 +71,8 @@ class LLMHttpClient:
         self,
         url: str,
         json: Dict[str, Any],
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        cache_task_type: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """Make POST request with retry logic.
 
@@ -58,17 +80,42 @@ class LLMHttpClient:
             url: Target URL
             json: JSON payload
             headers: Optional headers
+            cache_task_type: Task type for the shared LLM request cache
+                (None = always call the endpoint)
 
         Returns:
             Tuple of (response_json, error_message)
             - On success: (dict, None)
             - On failure: (None, error_string)
         """
+        if cache_task_type is None:
+            return self._post(url, json, headers)
+
+        from app.services.llm_request_cache import get_llm_request_cache
+
+        # Errors are shared with coalesced callers but never cached
+        return get_llm_request_cache().call_sync(
+            cache_task_type,
+            json,
+            lambda: self._post(url, json, headers),
+            encode=_encode_post_result,
+            decode=_decode_post_result,
+        )
+
+    def _post(
+        self,
+        url: str,
+        json: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Make POST request with retry logic (uncached)."""
+        from shared.llm.http_pool import pooled_sync_client
+
         last_error = None
 
         for attempt in range(self.max_retries):
             try:
-                with httpx.Client(timeout=self.timeout) as client:
+                with pooled_sync_client(_pool_endpoint(url), self.timeout) as client:
                     response = client.post(url, json=json, headers=headers)
 
                     if response.status_code == 200:
@@ -139,7 +186,7 @@ class AsyncLLMHttpClient:
 
     Features:
     - Exponential backoff retry for connection and timeout errors
-    - Async/await support
+    - Async/await support (non-blocking backoff, pooled connections)
     - Configurable timeout and retry settings
     """
 
@@ -164,7 +211,8 @@ class AsyncLLMHttpClient:
         self,
         url: str,
         json: Dict[str, Any],
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        cache_task_type: Optional[str] = None
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """Make async POST request with retry logic.
 
@@ -172,16 +220,39 @@ class AsyncLLMHttpClient:
             url: Target URL
             json: JSON payload
             headers: Optional headers
+            cache_task_type: Task type for the shared LLM request cache
+                (None = always call the endpoint)
 
         Returns:
             Tuple of (response_json, error_message)
         """
-        import asyncio
+        if cache_task_type is None:
+            return await self._post(url, json, headers)
+
+        from app.services.llm_request_cache import get_llm_request_cache
+
+        return await get_llm_request_cache().call(
+            cache_task_type,
+            json,
+            lambda: self._post(url, json, headers),
+            encode=_encode_post_result,
+            decode=_decode_post_result,
+        )
+
+    async def _post(
+        self,
+        url: str,
+        json: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Make async POST request with retry logic (uncached)."""
+        from shared.llm.http_pool import pooled_async_client
+
         last_error = None
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                async with pooled_async_client(_pool_endpoint(url), self.timeout) as client:
                     response = await client.post(url, json=json, headers=headers)
 
                     if response.status_code == 200:
@@ -237,7 +308,6 @@ class AsyncLLMHttpClient:
         Args:
             attempt: Current attempt number (0-indexed)
         """
-        import asyncio
         wait_time = self.base_delay * (2 ** attempt)
         logger.info(f"[HTTP] Retrying in {wait_time}s...")
         await asyncio.sleep(wait_time)
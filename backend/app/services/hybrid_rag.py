@@ -1,16 +1,24 @@
 """Hybrid RAG - 벡터 검색과 Knowledge Graph 통합
 
 벡터 검색(시맨틱)과 그래프 탐색(관계)을 결합하여
-더 풍부한 컨텍스트를 제공합니다.
+더 풍부한 컨텍스트를 제공합니다. 코드 검색은 벡터 검색과 BM25 어휘 검색
+결과를 Reciprocal Rank Fusion으로 합쳐 정확한 식별자도 잘 찾습니다.
 """
-import re
+import os
+import asyncio
 import logging
-from typing import List, Dict, Optional, Tuple, Set
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from app.services.vector_db import vector_db, SearchResult
-from app.services.rag_context import RAGContextBuilder, RAGContext
+from app.services.rag_context import RAGContextBuilder, RAGContext, gather_with_budget
+from app.services.lexical_index import get_lexical_index, reciprocal_rank_fusion
+from app.services.code_graph_extractor import (
+    FileSymbols, detect_language, extract_file_symbols, extract_symbols
+)
 from app.memory.knowledge_graph import (
     KnowledgeGraph, Concept, Relationship, get_knowledge_graph
 )
@@ -49,6 +57,8 @@ class HybridRAGContext:
     # 메타데이터
     search_query: str
     avg_relevance: float
+    # 지연 시간 예산 안에 끝나지 않은 소스 (code, graph, conversation)
+    timed_out_sources: List[str] = field(default_factory=list)
 
 
 class CodeGraphBuilder:
@@ -56,18 +66,19 @@ class CodeGraphBuilder:
 
     파일 간의 관계, import 구문, 클래스/함수 참조 등을
     분석하여 그래프를 구축합니다.
-    """
 
-    # 지원하는 import 패턴
-    PYTHON_IMPORT_PATTERNS = [
-        r'^import\s+([\w.]+)',
-        r'^from\s+([\w.]+)\s+import',
-    ]
+    파일마다 한 번의 스캔으로 심볼을 추출하고(색인 파이프라인이 이미 추출한
+    심볼이 있으면 파일을 다시 읽지 않음), 디스크에서 읽을 파일이 많으면
+    프로세스 풀에서 병렬로 추출한 뒤 노드/관계를 한 번에 추가합니다.
+    워크스페이스의 파일로 해석되는 import는 파일 간 `imports` 관계로,
+    나머지는 `dep:` 의존성 노드로 연결합니다.
+    """
 
-    JS_IMPORT_PATTERNS = [
-        r'^import\s+.*?\s+from\s+[\'"]([^"\']+)[\'"]',
-        r'^const\s+\w+\s*=\s*require\([\'"]([^"\']+)[\'"]\)',
-    ]
+    # 디스크에서 읽어 분석할 파일이 이 수 이상이면 프로세스 풀 사용
+    PROCESS_POOL_MIN_FILES: int = 256
+    GRAPH_WORKERS: int = min(8, (os.cpu_count() or 2))
+    # 상대 경로 import에 붙여 볼 확장자 (JS/TS)
+    JS_RESOLVE_EXTENSIONS: Tuple[str, ...] = ('.ts', '.tsx', '.js', '.jsx')
 
     def __init__(self, session_id: str, workspace: str):
         """CodeGraphBuilder 초기화
@@ -78,80 +89,290 @@ class CodeGraphBuilder:
         """
         self.session_id = session_id
         self.workspace = Path(workspace)
-        self.graph = get_knowledge_graph(session_id)
+        self.graph = get_knowledge_graph(session_id, workspace)
         self.logger = logging.getLogger(f"{__name__}.{session_id[:8]}")
 
-    def build_from_files(self, file_paths: List[str]) -> int:
+    def build_from_files(self,
+                         file_paths: List[str],
+                         symbols: Optional[List[FileSymbols]] = None) -> int:
         """파일 목록에서 그래프 구축
 
         Args:
             file_paths: 분석할 파일 경로 목록
+            symbols: 이미 추출한 파일 심볼 (해당 파일은 다시 읽지 않음)
 
         Returns:
             int: 추가된 노드 수
         """
-        nodes_added = 0
+        extracted = {item.path: item for item in symbols or []}
+        pending = [path for path in dict.fromkeys(file_paths) if path not in extracted]
+        for item in self._extract_all(pending):
+            extracted[item.path] = item
+
+        nodes_added = self._add_symbols(list(extracted.values()))
+        self.logger.info(f"Built graph: {nodes_added} nodes from {len(extracted)} files")
+        return nodes_added
+
+    def update_files(self,
+                     changed_paths: List[str],
+                     removed_paths: List[str],
+                     symbols: Optional[List[FileSymbols]] = None) -> int:
+        """변경분만으로 그래프 증분 갱신
+
+        삭제된 파일의 노드와 수정된 파일의 정의/import를 지운 뒤 수정/추가된
+        파일만 다시 분석합니다. 수정된 파일 노드는 유지하므로 다른 파일에서
+        그 파일로 오는 import 관계도 유지됩니다.
+
+        Args:
+            changed_paths: 추가/수정된 파일 경로 목록
+            removed_paths: 삭제된 파일 경로 목록
+            symbols: changed_paths 중 이미 추출한 파일 심볼
+
+        Returns:
+            int: 추가된 노드 수
+        """
+        self.remove_files(removed_paths)
+        for file_path in changed_paths:
+            self._remove_file(file_path, keep_file=True)
+        if not changed_paths and not symbols:
+            return 0
+        return self.build_from_files(changed_paths, symbols)
+
+    def remove_files(self, file_paths: List[str]) -> int:
+        """파일 노드와 그 파일에 정의된 클래스/함수 노드 제거
+
+        더 이상 어떤 파일도 import하지 않는 의존성 노드도 함께 제거합니다.
+
+        Args:
+            file_paths: 제거할 파일 경로 목록
+
+        Returns:
+            int: 제거된 노드 수
+        """
+        return sum(self._remove_file(file_path) for file_path in file_paths)
+
+    def has_file(self, file_path: str) -> bool:
+        """파일 노드가 그래프에 있는지 확인"""
+        return self.graph.has_concept(self._file_concept_id(file_path))
+
+    def get_dependent_files(self, file_path: str, depth: int = 32) -> List[str]:
+        """파일을 (직접 또는 간접적으로) import하는 워크스페이스 파일
 
-        for file_path in file_paths:
+        Args:
+            file_path: 파일 경로
+            depth: 따라갈 최대 import 단계
+
+        Returns:
+            List[str]: import하는 파일의 워크스페이스 기준 상대 경로 (가까운 순)
+        """
+        return [
+            concept.properties["path"]
+            for concept in self.graph.get_related_concepts(
+                self._file_concept_id(file_path), relationship_type="imports",
+                depth=depth, reverse=True
+            )
+            if concept.type == "file" and "path" in concept.properties
+        ]
+
+    def _remove_file(self, file_path: str, keep_file: bool = False) -> int:
+        """파일의 정의 노드와 import 관계 제거 (keep_file이 False면 파일 노드도 제거)
+
+        Args:
+            file_path: 파일 경로
+            keep_file: True면 파일 노드와 들어오는 관계는 유지
+
+        Returns:
+            int: 제거된 노드 수
+        """
+        file_id = self._file_concept_id(file_path)
+        if not self.graph.has_concept(file_id):
+            return 0
+
+        definitions = self.graph.get_related_concepts(file_id, relationship_type="contains")
+        imported = self.graph.get_related_concepts(file_id, relationship_type="imports")
+        removed = 0
+
+        for concept in definitions:
+            removed += self.graph.remove_concept(concept.id)
+        if keep_file:
+            self.graph.remove_relationships(file_id, relationship_type="imports")
+        else:
+            removed += self.graph.remove_concept(file_id)
+
+        for concept in imported:
+            if concept.type == "dependency" and self.graph.graph.in_degree(concept.id) == 0:
+                removed += self.graph.remove_concept(concept.id)
+
+        return removed
+
+    def _extract_all(self, file_paths: List[str]) -> List[FileSymbols]:
+        """디스크에서 파일을 읽어 심볼 추출 (파일이 많으면 프로세스 풀에서 병렬)
+
+        Args:
+            file_paths: 분석할 파일 경로 목록
+
+        Returns:
+            List[FileSymbols]: 읽을 수 있었던 파일의 심볼
+        """
+        results: List[Optional[FileSymbols]] = []
+        if len(file_paths) >= self.PROCESS_POOL_MIN_FILES and self.GRAPH_WORKERS > 1:
             try:
-                # 파일 노드 추가
-                file_concept = self._create_file_concept(file_path)
-                self.graph.add_concept(file_concept)
-                nodes_added += 1
+                with ProcessPoolExecutor(max_workers=self.GRAPH_WORKERS) as pool:
+                    chunksize = max(1, len(file_paths) // (self.GRAPH_WORKERS * 4))
+                    results = list(pool.map(extract_file_symbols, file_paths, chunksize=chunksize))
+            except (OSError, BrokenProcessPool) as e:
+                self.logger.warning(f"Process pool unavailable, analyzing files serially: {e}")
+                results = []
 
-                # 파일 내용 분석
-                content = Path(file_path).read_text(encoding='utf-8', errors='ignore')
-                language = self._detect_language(file_path)
+        if not results:
+            results = [extract_file_symbols(file_path) for file_path in file_paths]
+
+        failed = results.count(None)
+        if failed:
+            self.logger.warning(f"Failed to analyze {failed} unreadable files")
+        return [item for item in results if item is not None]
+
+    def _add_symbols(self, symbols: List[FileSymbols]) -> int:
+        """추출한 심볼로 노드/관계를 만들어 그래프에 한 번에 추가
+
+        Args:
+            symbols: 파일 심볼 목록
+
+        Returns:
+            int: 추가된 노드 수 (파일 + 정의 + import)
+        """
+        batch_files = {self._file_concept_id(item.path) for item in symbols}
+        concepts: List[Concept] = []
+        relationships: List[Relationship] = []
+        nodes_added = 0
+
+        for item in symbols:
+            file_concept = self._create_file_concept(item.path)
+            concepts.append(file_concept)
+            nodes_added += 1
+
+            # 클래스/함수 정의
+            for kind, name in item.definitions:
+                definition = self._definition_concept(kind, name, item.path)
+                concepts.append(definition)
+                relationships.append(Relationship(
+                    source_id=file_concept.id,
+                    target_id=definition.id,
+                    relationship_type="contains",
+                    properties={}
+                ))
+                nodes_added += 1
 
-                # Import/의존성 분석
-                imports = self._extract_imports(content, language)
-                for imp in imports:
-                    # 의존성 노드 추가
-                    dep_concept = Concept(
-                        id=f"dep:{imp}",
+            # Import/의존성 (워크스페이스 파일이면 파일로 연결)
+            for imp in item.imports:
+                target_id = self._resolve_import(imp, item, batch_files)
+                if target_id is None:
+                    target_id = f"dep:{imp}"
+                    concepts.append(Concept(
+                        id=target_id,
                         type="dependency",
                         name=imp,
-                        properties={"source": file_path}
-                    )
-                    self.graph.add_concept(dep_concept)
-
-                    # 관계 추가
-                    rel = Relationship(
-                        source_id=file_concept.id,
-                        target_id=dep_concept.id,
-                        relationship_type="imports",
-                        properties={}
-                    )
-                    self.graph.add_relationship(rel)
-                    nodes_added += 1
-
-                # 클래스/함수 분석
-                definitions = self._extract_definitions(content, language, file_path)
-                for defn in definitions:
-                    self.graph.add_concept(defn)
-                    # 파일과의 관계
-                    rel = Relationship(
-                        source_id=file_concept.id,
-                        target_id=defn.id,
-                        relationship_type="contains",
-                        properties={}
-                    )
-                    self.graph.add_relationship(rel)
-                    nodes_added += 1
-
-            except Exception as e:
-                self.logger.warning(f"Failed to analyze {file_path}: {e}")
-
-        self.logger.info(f"Built graph: {nodes_added} nodes from {len(file_paths)} files")
+                        properties={"source": item.path}
+                    ))
+                elif target_id == file_concept.id:
+                    continue
+
+                relationships.append(Relationship(
+                    source_id=file_concept.id,
+                    target_id=target_id,
+                    relationship_type="imports",
+                    properties={}
+                ))
+                nodes_added += 1
+
+        self.graph.add_concepts(concepts)
+        self.graph.add_relationships(relationships)
         return nodes_added
 
-    def _create_file_concept(self, file_path: str) -> Concept:
-        """파일 Concept 생성"""
+    def _resolve_import(self, module: str, symbols: FileSymbols, batch_files: Set[str]) -> Optional[str]:
+        """import 대상을 워크스페이스 파일 Concept ID로 해석
+
+        Args:
+            module: import 대상 (Python 모듈 경로 또는 JS/TS 모듈 지정자)
+            symbols: import하는 파일의 심볼
+            batch_files: 이번에 함께 추가되는 파일 Concept ID
+
+        Returns:
+            Optional[str]: 파일 Concept ID (워크스페이스 파일이 아니면 None)
+        """
+        def exists(path: Path) -> bool:
+            concept_id = f"file:{path}"
+            return concept_id in batch_files or self.graph.has_concept(concept_id)
+
+        directory = self._relative_path(symbols.path).parent
+        if symbols.language == 'python':
+            candidates = self._python_import_candidates(module, directory, exists)
+        else:
+            candidates = self._js_import_candidates(module, directory)
+
+        for candidate in candidates:
+            if exists(candidate):
+                return f"file:{candidate}"
+        return None
+
+    def _python_import_candidates(self, module: str, directory: Path, exists) -> Iterator[Path]:
+        """Python import가 가리킬 수 있는 파일 경로 (가까운 후보부터)
+
+        상대 import는 패키지 기준으로 찾습니다. 절대 import는 import하는 파일의
+        상위 디렉토리들을 가까운 순서로 소스 루트 후보로 보되, 파일이 속한
+        디렉토리가 패키지(__init__.py)면 그 디렉토리는 제외합니다 (Python 3에는
+        암묵적 상대 import가 없으므로 `import logging`이 옆의 logging.py가 아님).
+        """
+        level = len(module) - len(module.lstrip('.'))
+        parts = [part for part in module[level:].split('.') if part]
+
+        if level:
+            base = directory
+            for _ in range(level - 1):
+                base = base.parent
+            roots = [base]
+        else:
+            roots = [*directory.parents]
+            if not exists(directory / '__init__.py'):
+                roots.insert(0, directory)
+
+        for root in roots:
+            if parts:
+                yield root.joinpath(*parts[:-1], f"{parts[-1]}.py")
+            yield root.joinpath(*parts, '__init__.py')
+
+    def _js_import_candidates(self, module: str, directory: Path) -> Iterator[Path]:
+        """JS/TS 상대 경로 import가 가리킬 수 있는 파일 경로 (패키지 import는 없음)"""
+        if not module.startswith('.'):
+            return
+
+        target = Path(os.path.normpath(directory / module))
+        if target.parts and target.parts[0] == '..':
+            return
+
+        if target.suffix in self.JS_RESOLVE_EXTENSIONS:
+            yield target
+        for ext in self.JS_RESOLVE_EXTENSIONS:
+            yield target.with_name(target.name + ext)
+        for ext in self.JS_RESOLVE_EXTENSIONS:
+            yield target / f"index{ext}"
+
+    def _relative_path(self, file_path: str) -> Path:
+        """워크스페이스 기준 상대 경로"""
         path = Path(file_path)
         try:
-            rel_path = path.relative_to(self.workspace)
+            return path.relative_to(self.workspace)
         except ValueError:
-            rel_path = path
+            return path
+
+    def _file_concept_id(self, file_path: str) -> str:
+        """파일 Concept ID"""
+        return f"file:{self._relative_path(file_path)}"
+
+    def _create_file_concept(self, file_path: str) -> Concept:
+        """파일 Concept 생성"""
+        path = Path(file_path)
+        rel_path = self._relative_path(file_path)
 
         return Concept(
             id=f"file:{rel_path}",
@@ -164,82 +385,32 @@ class CodeGraphBuilder:
             }
         )
 
+    @staticmethod
+    def _definition_concept(kind: str, name: str, file_path: str) -> Concept:
+        """클래스/함수 정의 Concept 생성"""
+        return Concept(
+            id=f"{kind}:{file_path}::{name}",
+            type=kind,
+            name=name,
+            properties={"file": file_path}
+        )
+
     def _detect_language(self, file_path: str) -> str:
         """파일 언어 감지"""
-        ext = Path(file_path).suffix.lower()
-        lang_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'javascript',
-            '.tsx': 'typescript',
-        }
-        return lang_map.get(ext, 'unknown')
+        return detect_language(file_path)
 
     def _extract_imports(self, content: str, language: str) -> List[str]:
         """Import 구문 추출"""
-        imports = []
-
-        if language == 'python':
-            patterns = self.PYTHON_IMPORT_PATTERNS
-        elif language in ('javascript', 'typescript'):
-            patterns = self.JS_IMPORT_PATTERNS
-        else:
-            return imports
-
-        for line in content.split('\n'):
-            for pattern in patterns:
-                match = re.match(pattern, line.strip())
-                if match:
-                    imports.append(match.group(1))
-
-        return imports
+        return extract_symbols("", content, language).imports
 
     def _extract_definitions(
         self, content: str, language: str, file_path: str
     ) -> List[Concept]:
         """클래스/함수 정의 추출"""
-        definitions = []
-
-        if language == 'python':
-            # 클래스 추출
-            for match in re.finditer(r'^class\s+(\w+)', content, re.MULTILINE):
-                definitions.append(Concept(
-                    id=f"class:{file_path}::{match.group(1)}",
-                    type="class",
-                    name=match.group(1),
-                    properties={"file": file_path}
-                ))
-
-            # 함수 추출
-            for match in re.finditer(r'^def\s+(\w+)', content, re.MULTILINE):
-                definitions.append(Concept(
-                    id=f"function:{file_path}::{match.group(1)}",
-                    type="function",
-                    name=match.group(1),
-                    properties={"file": file_path}
-                ))
-
-        elif language in ('javascript', 'typescript'):
-            # 클래스 추출
-            for match in re.finditer(r'^(?:export\s+)?class\s+(\w+)', content, re.MULTILINE):
-                definitions.append(Concept(
-                    id=f"class:{file_path}::{match.group(1)}",
-                    type="class",
-                    name=match.group(1),
-                    properties={"file": file_path}
-                ))
-
-            # 함수 추출
-            for match in re.finditer(r'^(?:export\s+)?(?:async\s+)?function\s+(\w+)', content, re.MULTILINE):
-                definitions.append(Concept(
-                    id=f"function:{file_path}::{match.group(1)}",
-                    type="function",
-                    name=match.group(1),
-                    properties={"file": file_path}
-                ))
-
-        return definitions
+        return [
+            self._definition_concept(kind, name, file_path)
+            for kind, name in extract_symbols(file_path, content, language).definitions
+        ]
 
 
 class HybridRAGBuilder:
@@ -249,6 +420,9 @@ class HybridRAGBuilder:
     더 풍부한 컨텍스트를 제공합니다.
     """
 
+    # Reciprocal Rank Fusion 순위 완화 상수 (벡터 + BM25)
+    RRF_K: int = 60
+
     def __init__(self, session_id: str, workspace: Optional[str] = None):
         """HybridRAGBuilder 초기화
 
@@ -259,9 +433,14 @@ class HybridRAGBuilder:
         self.session_id = session_id
         self.workspace = workspace
         self.rag_builder = RAGContextBuilder(session_id)
-        self.graph = get_knowledge_graph(session_id)
+        self.lexical_index = get_lexical_index(session_id)
         self.logger = logging.getLogger(f"{__name__}.{session_id[:8]}")
 
+    @property
+    def graph(self) -> KnowledgeGraph:
+        """세션의 Knowledge Graph (캐시된 빌더가 메모리에서 내보낸 그래프를 붙잡지 않도록 매번 조회)"""
+        return get_knowledge_graph(self.session_id, self.workspace)
+
     def build_context(
         self,
         query: str,
@@ -284,13 +463,12 @@ class HybridRAGBuilder:
         Returns:
             HybridRAGContext: 하이브리드 컨텍스트
         """
-        # 1. 벡터 검색 (코드 + 대화)
-        _, rag_context = self.rag_builder.enrich_query(
-            query,
-            n_results=n_vector_results,
-            min_relevance=min_relevance,
-            include_conversation=include_conversation
-        )
+        # 1. 코드 검색 (벡터 + BM25) + 대화 검색
+        rag_context = self._search_code(query, n_vector_results, min_relevance)
+        if include_conversation:
+            conv_context, conv_search_results = self.rag_builder.search_conversation(query)
+            rag_context.conversation_results = len(conv_search_results)
+            rag_context.conversation_context = conv_context
 
         # 2. 그래프 탐색 (벡터 검색 결과에서 시작)
         graph_results = self._traverse_graph(
@@ -321,6 +499,114 @@ class HybridRAGBuilder:
             avg_relevance=rag_context.avg_relevance
         )
 
+    async def build_context_async(
+        self,
+        query: str,
+        n_vector_results: int = 5,
+        n_graph_results: int = 3,
+        graph_depth: int = 2,
+        min_relevance: float = 0.5,
+        include_conversation: bool = True,
+        timeout: Optional[float] = RAGContextBuilder.DEFAULT_LATENCY_BUDGET
+    ) -> HybridRAGContext:
+        """build_context의 비동기 버전 - 코드/대화 검색과 그래프 탐색을 동시에 실행
+
+        그래프 탐색은 코드 검색 결과 파일에서 시작하므로 코드 검색이 끝나는 즉시
+        시작되고, 대화 검색은 처음부터 함께 실행됩니다. timeout 안에 끝나지 않은
+        소스는 빼고 나머지 결과로 컨텍스트를 구성합니다.
+
+        Args:
+            query: 검색 쿼리
+            n_vector_results: 벡터 검색 결과 수
+            n_graph_results: 그래프 탐색 결과 수
+            graph_depth: 그래프 탐색 깊이
+            min_relevance: 최소 관련성
+            include_conversation: 대화 검색 포함 여부
+            timeout: 지연 시간 예산 (초, None이면 무제한)
+
+        Returns:
+            HybridRAGContext: 하이브리드 컨텍스트
+        """
+        code_task = asyncio.ensure_future(
+            asyncio.to_thread(self._search_code, query, n_vector_results, min_relevance)
+        )
+
+        async def traverse_after_code() -> List[GraphSearchResult]:
+            rag_context = await asyncio.shield(code_task)
+            return await asyncio.to_thread(
+                self._traverse_graph, rag_context.files_referenced, graph_depth, n_graph_results
+            )
+
+        sources = {"code": code_task, "graph": traverse_after_code()}
+        if include_conversation:
+            sources["conversation"] = self.rag_builder.search_conversation_async(query)
+
+        results, timed_out = await gather_with_budget(sources, timeout, self.logger)
+
+        rag_context: Optional[RAGContext] = results.get("code")
+        graph_results: List[GraphSearchResult] = results.get("graph", [])
+        conv_context, conv_search_results = results.get("conversation", ("", []))
+        graph_context, related_concepts = self._format_graph_results(graph_results)
+
+        self.logger.info(
+            f"Hybrid RAG: {rag_context.results_count if rag_context else 0} vector, "
+            f"{len(graph_results)} graph, "
+            f"{len(conv_search_results)} conversation"
+        )
+
+        return HybridRAGContext(
+            vector_context=rag_context.formatted_context if rag_context else "",
+            vector_results_count=rag_context.results_count if rag_context else 0,
+            files_from_vector=rag_context.files_referenced if rag_context else [],
+            graph_context=graph_context,
+            graph_results_count=len(graph_results),
+            related_concepts=related_concepts,
+            conversation_context=conv_context,
+            conversation_results=len(conv_search_results),
+            search_query=query,
+            avg_relevance=rag_context.avg_relevance if rag_context else 0.0,
+            timed_out_sources=timed_out
+        )
+
+    def _search_code(self, query: str, n_results: int, min_relevance: float) -> RAGContext:
+        """벡터 검색과 BM25 검색 결과를 RRF로 합쳐 코드 컨텍스트 생성
+
+        두 검색 모두 n_results개만 가져옵니다. 벡터 결과는 관련성 임계값으로 거르고,
+        BM25로만 찾은 청크는 벡터DB에서 내용을 가져와 임계값 거리로 표시합니다.
+
+        Args:
+            query: 검색 쿼리
+            n_results: 최대 결과 수
+            min_relevance: 벡터 결과의 최소 관련성
+
+        Returns:
+            RAGContext: 코드 컨텍스트
+        """
+        max_distance = 1 - min_relevance
+
+        try:
+            vector_results = vector_db.search_code(query=query, session_id=self.session_id, n_results=n_results)
+        except Exception as e:
+            self.logger.warning(f"Vector search failed: {e}")
+            vector_results = []
+        try:
+            lexical_hits = self.lexical_index.search(query, n_results)
+        except Exception as e:
+            self.logger.warning(f"Lexical search failed: {e}")
+            lexical_hits = []
+
+        by_id = {r.id: r for r in vector_results if r.distance <= max_distance}
+        ranked = reciprocal_rank_fusion(
+            [list(by_id), [hit.doc_id for hit in lexical_hits]], self.RRF_K
+        )[:n_results]
+
+        for result in vector_db.get_documents([doc_id for doc_id in ranked if doc_id not in by_id]):
+            result.distance = max_distance
+            by_id[result.id] = result
+
+        results = [by_id[doc_id] for doc_id in ranked if doc_id in by_id]
+        return self.rag_builder.build_context_from_results(query, results)
+
     def _traverse_graph(
         self,
         starting_files: List[str],
@@ -344,38 +630,37 @@ class HybridRAGBuilder:
         visited: Set[str] = set()
 
         for file_ref in starting_files[:3]:  # 상위 3개 파일만
-            # 파일명에서 concept ID 추론
-            file_name = Path(file_ref).name if '::' not in file_ref else file_ref.split('::')[0]
-
-            # 그래프에서 관련 파일 노드 찾기
-            file_nodes = self.graph.search_concepts("file", {"name": file_name})
+            # 청크 이름(path::Class.method)에서 파일 경로 추출 후 ID로 바로 조회,
+            # 없으면 파일명 인덱스로 검색
+            file_path = file_ref.split('::')[0]
+            file_node = self.graph.get_concept(f"file:{file_path}")
+            file_nodes = [file_node] if file_node else self.graph.search_concepts(
+                "file", {"name": Path(file_path).name}
+            )
 
             for file_node in file_nodes:
                 if file_node.id in visited:
                     continue
                 visited.add(file_node.id)
 
-                # 관련 개념 탐색
-                related = self.graph.get_related_concepts(
+                # 관련 개념 탐색 (이미 본 개념이 섞여도 충분하도록 여유분 포함)
+                related = self.graph.traverse(
                     file_node.id,
-                    depth=depth
+                    depth=depth,
+                    max_results=max_results - len(results) + len(visited)
                 )
 
-                for concept in related:
+                for concept, rel_type, concept_depth in related:
                     if concept.id in visited:
                         continue
                     visited.add(concept.id)
 
-                    # 관계 타입 추출
-                    edge_data = self.graph.graph.get_edge_data(file_node.id, concept.id)
-                    rel_type = edge_data.get("type", "related") if edge_data else "related"
-
                     results.append(GraphSearchResult(
                         concept_id=concept.id,
                         concept_type=concept.type,
                         name=concept.name,
-                        relationship=rel_type,
-                        depth=1,
+                        relationship=rel_type or "related",
+                        depth=concept_depth,
                         properties=concept.properties
                     ))
 
@@ -446,8 +731,43 @@ class HybridRAGBuilder:
             n_graph_results=n_graph_results,
             include_conversation=include_conversation
         )
+        return self._combine_context(user_request, context)
 
-        # 컨텍스트 결합
+    async def enrich_query_async(
+        self,
+        user_request: str,
+        n_vector_results: int = 5,
+        n_graph_results: int = 3,
+        include_conversation: bool = True,
+        timeout: Optional[float] = RAGContextBuilder.DEFAULT_LATENCY_BUDGET
+    ) -> Tuple[str, HybridRAGContext]:
+        """enrich_query의 비동기 버전 (소스 동시 실행, 지연 시간 예산 적용)
+
+        Args:
+            user_request: 원본 사용자 요청
+            n_vector_results: 벡터 검색 결과 수
+            n_graph_results: 그래프 탐색 결과 수
+            include_conversation: 대화 검색 포함 여부
+            timeout: 지연 시간 예산 (초, None이면 무제한)
+
+        Returns:
+            Tuple[str, HybridRAGContext]: (보강된 요청, 하이브리드 컨텍스트)
+        """
+        context = await self.build_context_async(
+            query=user_request,
+            n_vector_results=n_vector_results,
+            n_graph_results=n_graph_results,
+            include_conversation=include_conversation,
+            timeout=timeout
+        )
+        return self._combine_context(user_request, context)
+
+    def _combine_context(
+        self,
+        user_request: str,
+        context: HybridRAGContext
+    ) -> Tuple[str, HybridRAGContext]:
+        """벡터/그래프/대화 컨텍스트를 요청에 결합"""
         context_parts = []
 
         if context.vector_context:
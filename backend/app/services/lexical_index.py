@@ -0,0 +1,335 @@
+"""Lexical Index - 식별자 인식 BM25 역색인
+
+벡터 검색은 정확한 식별자(함수명, 에러 문자열, 설정 키)에 약하므로
+CodeIndexer가 만든 청크를 BM25로도 색인해 하이브리드 검색에 사용합니다.
+
+- 토큰화: 식별자 전체(소문자, '_' 제거)와 camelCase/snake_case 조각을 함께 색인
+  (getUserById -> getuserbyid, get, user, id)
+- 저장: 세션별 메모리 역색인. 서버 재시작 후 첫 사용 시 벡터DB의 코드 문서로 다시 구축하고,
+  이후에는 CodeIndexer의 upsert/삭제와 함께 갱신됩니다.
+"""
+import re
+import math
+import logging
+import threading
+from array import array
+from collections import Counter
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.vector_db import vector_db
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[A-Za-z0-9_]+")
+_PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+# 검색에 도움이 되지 않는 흔한 단어와 언어 키워드
+STOPWORDS = frozenset("""
+a an and are as at be by do does for from has have how if in into is it its no not of on or
+that the this to was what when where which who why will with
+filename language
+self cls def return import class none true false pass
+const let var function new null undefined export default
+""".split())
+
+
+@lru_cache(maxsize=65536)
+def _identifier_terms(word: str) -> Tuple[str, ...]:
+    """식별자 하나를 검색어로 분해 (전체 + camelCase/snake_case 조각)"""
+    full = word.replace("_", "").lower()
+    parts = [part.lower() for part in _PART_RE.findall(word)]
+    terms = [full] if len(parts) != 1 or parts[0] != full else []
+    terms.extend(parts)
+    return tuple(term for term in terms if len(term) > 1 and term not in STOPWORDS)
+
+
+def tokenize(text: str) -> List[str]:
+    """식별자 인식 토큰화
+
+    Args:
+        text: 코드 또는 검색 쿼리
+
+    Returns:
+        List[str]: 토큰 목록 (중복 포함)
+    """
+    tokens: List[str] = []
+    for word in _WORD_RE.findall(text):
+        tokens.extend(_identifier_terms(word))
+    return tokens
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[str]:
+    """여러 순위 목록을 Reciprocal Rank Fusion으로 합치기
+
+    각 문서의 점수는 목록마다 1 / (k + 순위)의 합입니다.
+
+    Args:
+        rankings: 문서 ID 순위 목록들 (앞쪽이 상위)
+        k: 순위 완화 상수
+
+    Returns:
+        List[str]: 합친 점수 순 문서 ID (동점이면 먼저 나온 순서)
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, 1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(scores, key=scores.__getitem__, reverse=True)
+
+
+@dataclass
+class LexicalHit:
+    """BM25 검색 결과"""
+    doc_id: str
+    score: float
+    language: str
+
+
+class LexicalIndex:
+    """세션 하나의 코드 청크 BM25 역색인 (스레드 안전)
+
+    posting은 (문서 슬롯 array, 빈도 array)로 저장하고 검색 시 numpy 뷰로 한 번에
+    점수를 계산하므로, 청크 10만 개 규모에서도 메모리가 작고 검색이 수 ms 안에 끝납니다.
+    제거된 문서는 슬롯만 비활성화하고, 비활성 슬롯이 많아지면 posting을 한 번에 압축합니다.
+    """
+
+    K1: float = 1.2
+    B: float = 0.75
+    COMPACT_MIN_DEAD: int = 1024  # 압축을 시작할 최소 비활성 슬롯 수
+    COMPACT_RATIO: float = 0.25   # 전체 슬롯 중 비활성 슬롯 비율이 이보다 크면 압축
+
+    def __init__(self, session_id: str):
+        """LexicalIndex 초기화
+
+        Args:
+            session_id: 세션 ID
+        """
+        self.session_id = session_id
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        """빈 색인 상태로 초기화"""
+        self.loaded = False
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._slots: Dict[str, int] = {}
+        self._doc_ids: List[Optional[str]] = []
+        self._lengths = array("I")
+        self._alive = array("B")
+        self._language_codes = array("H")
+        self._languages: Dict[str, int] = {}
+        self._total_length = 0
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def ensure_loaded(self) -> None:
+        """아직 구축되지 않았으면 벡터DB에 저장된 코드 청크로 구축
+
+        로드 중에 들어온 add/remove는 로드가 끝날 때까지 기다린 뒤 적용됩니다.
+        """
+        with self._lock:
+            if self.loaded:
+                return
+            try:
+                documents = vector_db.get_code_documents(self.session_id)
+            except Exception as e:
+                logger.warning(f"Failed to load lexical index for {self.session_id}: {e}")
+                return
+            self.loaded = True
+            for doc_id, text, metadata in documents:
+                self._add(doc_id, text, metadata.get("language", "text"))
+            logger.info(f"Lexical index loaded: {len(self)} chunks ({self.session_id})")
+
+    def add_chunks(self, doc_ids: Sequence[str], chunks: Sequence[Dict]) -> None:
+        """CodeIndexer 청크를 색인 (같은 ID가 있으면 교체)
+
+        아직 로드되지 않은 색인은 건너뜁니다 (나중에 로드할 때 벡터DB에서 읽음).
+
+        Args:
+            doc_ids: upsert_code_snippets가 반환한 문서 ID (chunks와 같은 순서)
+            chunks: 청크 목록 (code, filename, language, description)
+        """
+        with self._lock:
+            if not self.loaded:
+                return
+            for doc_id, chunk in zip(doc_ids, chunks):
+                text = f"{chunk.get('description') or ''}\n{chunk['filename']}\n{chunk['code']}"
+                self._add(doc_id, text, chunk.get("language", "text"))
+
+    def remove(self, doc_ids: Iterable[str]) -> None:
+        """문서 제거 (없는 ID는 무시)
+
+        Args:
+            doc_ids: 제거할 문서 ID 목록
+        """
+        with self._lock:
+            for doc_id in doc_ids:
+                self._remove(doc_id)
+            if self._dead >= self.COMPACT_MIN_DEAD and self._dead > len(self._doc_ids) * self.COMPACT_RATIO:
+                self._compact()
+
+    def search(self, query: str, n_results: int = 5, language: Optional[str] = None) -> List[LexicalHit]:
+        """BM25 검색
+
+        Args:
+            query: 검색 쿼리
+            n_results: 최대 결과 수
+            language: 언어 필터 (선택적)
+
+        Returns:
+            List[LexicalHit]: 점수 순 결과
+        """
+        self.ensure_loaded()
+        terms = set(tokenize(query))
+
+        with self._lock:
+            doc_count = len(self._slots)
+            if not terms or not doc_count or n_results <= 0:
+                return []
+            if language and language not in self._languages:
+                return []
+
+            alive = np.frombuffer(self._alive, dtype=np.bool_)
+            lengths = np.frombuffer(self._lengths, dtype=np.uint32)
+            k1, b = self.K1, self.B
+            norm = k1 * (1 - b)
+            scale = k1 * b * doc_count / self._total_length if self._total_length else 0.0
+            scores = np.zeros(len(self._doc_ids), dtype=np.float64)
+
+            for term in terms:
+                posting = self._postings.get(term)
+                if posting is None:
+                    continue
+                docs = np.frombuffer(posting[0], dtype=np.uint32)
+                df = int(np.count_nonzero(alive[docs])) if self._dead else len(docs)
+                if not df:
+                    continue
+                freqs = np.frombuffer(posting[1], dtype=np.uint32).astype(np.float64)
+                weight = math.log(1 + (doc_count - df + 0.5) / (df + 0.5)) * (k1 + 1)
+                scores[docs] += weight * freqs / (freqs + norm + scale * lengths[docs])
+
+            if self._dead:
+                scores[~alive] = 0.0
+            if language:
+                codes = np.frombuffer(self._language_codes, dtype=np.uint16)
+                scores[codes != self._languages[language]] = 0.0
+
+            candidates = np.flatnonzero(scores)
+            if len(candidates) > n_results:
+                candidates = candidates[np.argpartition(-scores[candidates], n_results - 1)[:n_results]]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            names = {code: name for name, code in self._languages.items()}
+            return [
+                LexicalHit(self._doc_ids[slot], float(scores[slot]), names[self._language_codes[slot]])
+                for slot in candidates.tolist()
+            ]
+
+    def clear(self) -> None:
+        """색인 비우기 (다음 사용 시 벡터DB에서 다시 구축)"""
+        with self._lock:
+            self._reset()
+
+    def _add(self, doc_id: str, text: str, language: str) -> None:
+        """문서 하나 색인 (락을 잡은 상태에서 호출)"""
+        self._remove(doc_id)
+
+        counts: Counter = Counter()
+        for word, count in Counter(_WORD_RE.findall(text)).items():
+            for term in _identifier_terms(word):
+                counts[term] += count
+        length = sum(counts.values())
+
+        slot = len(self._doc_ids)
+        self._doc_ids.append(doc_id)
+        self._lengths.append(length)
+        self._alive.append(1)
+        self._language_codes.append(self._languages.setdefault(language, len(self._languages)))
+        self._slots[doc_id] = slot
+        self._total_length += length
+
+        for term, tf in counts.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array("I"), array("I"))
+            posting[0].append(slot)
+            posting[1].append(tf)
+
+    def _remove(self, doc_id: str) -> None:
+        """문서 하나 비활성화 (락을 잡은 상태에서 호출)"""
+        slot = self._slots.pop(doc_id, None)
+        if slot is None:
+            return
+
+        self._alive[slot] = 0
+        self._doc_ids[slot] = None
+        self._total_length -= self._lengths[slot]
+        self._dead += 1
+
+    def _compact(self) -> None:
+        """비활성 슬롯을 posting에서 지우고 슬롯 번호를 다시 매김 (락을 잡은 상태에서 호출)"""
+        alive = np.frombuffer(self._alive, dtype=np.bool_).copy()
+        new_slots = (np.cumsum(alive) - 1).astype(np.uint32)
+
+        for term in list(self._postings):
+            docs_buffer, freqs_buffer = self._postings[term]
+            docs = np.frombuffer(docs_buffer, dtype=np.uint32)
+            keep = alive[docs]
+            if not keep.any():
+                del self._postings[term]
+                continue
+            freqs = np.frombuffer(freqs_buffer, dtype=np.uint32)
+            self._postings[term] = (_to_array(new_slots[docs[keep]], "I"), _to_array(freqs[keep], "I"))
+            del docs, freqs
+
+        self._lengths = _to_array(np.frombuffer(self._lengths, dtype=np.uint32)[alive], "I")
+        self._language_codes = _to_array(np.frombuffer(self._language_codes, dtype=np.uint16)[alive], "H")
+        self._doc_ids = [doc_id for doc_id in self._doc_ids if doc_id is not None]
+        self._alive = array("B", [1]) * len(self._doc_ids)
+        self._slots = {doc_id: slot for slot, doc_id in enumerate(self._doc_ids)}
+        self._dead = 0
+
+
+def _to_array(values: "np.ndarray", typecode: str) -> array:
+    """numpy 배열을 (크기를 바꿀 수 있는) array.array로 복사"""
+    result = array(typecode)
+    result.frombytes(values.astype(typecode).tobytes())
+    return result
+
+
+# 세션별 색인 인스턴스
+_indexes: Dict[str, LexicalIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_lexical_index(session_id: str) -> LexicalIndex:
+    """LexicalIndex 인스턴스 가져오기 (캐시됨)
+
+    Args:
+        session_id: 세션 ID
+
+    Returns:
+        LexicalIndex: 세션의 색인
+    """
+    with _indexes_lock:
+        if session_id not in _indexes:
+            _indexes[session_id] = LexicalIndex(session_id)
+        return _indexes[session_id]
+
+
+def reset_lexical_index(session_id: str) -> None:
+    """세션 색인 버리기 (벡터DB에서 세션 문서를 지운 뒤 호출)
+
+    Args:
+        session_id: 세션 ID
+    """
+    with _indexes_lock:
+        index = _indexes.get(session_id)
+    if index is not None:
+        index.clear()
@@ -0,0 +1,254 @@
+"""Shared LLM request cache with single-flight coalescing.
+
+Sits between the LLM call sites (LangGraph nodes, shared/llm adapters,
+VLLMClient, LLMHttpClient) and the endpoint:
+
+- Opt-in per task type (LLM_CACHE_TASK_TYPES) and only for low-temperature
+  (deterministic) requests, backed by LMCacheService.
+- Single-flight: N concurrent identical requests produce one upstream call;
+  the other callers wait for and share the leader's result.
+"""
+import asyncio
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Resolves followers when their leader was cancelled: one of them retries as leader
+_RETRY = object()
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class LLMRequestCache:
+    """Response cache + request coalescing shared by all LLM call paths."""
+
+    def __init__(
+        self,
+        cache=None,
+        task_types: Optional[Iterable[str]] = None,
+        max_temperature: float = 0.2,
+    ):
+        """Initialize request cache.
+
+        Args:
+            cache: LMCacheService instance (defaults to the global lm_cache)
+            task_types: Task types allowed to use the cache (e.g. "review")
+            max_temperature: Highest temperature considered deterministic
+        """
+        self._cache = cache
+        self.task_types = {t.strip().lower() for t in (task_types or []) if t.strip()}
+        self.max_temperature = max_temperature
+
+        self._lock = threading.Lock()
+        self._inflight_sync: Dict[str, Future] = {}
+        self._inflight_async: Dict[Tuple[int, str], asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+
+    @property
+    def cache(self):
+        """Get LMCacheService (lazy to avoid import cycles)."""
+        if self._cache is None:
+            from app.services.lm_cache import lm_cache
+            self._cache = lm_cache
+        return self._cache
+
+    def is_cacheable(self, task_type: Optional[str], request: Dict[str, Any]) -> bool:
+        """Check whether a request may be cached and coalesced.
+
+        Args:
+            task_type: Task type of the call site ("coding", "review", ...)
+            request: Request payload (must carry "temperature")
+        """
+        if not task_type or task_type.lower() not in self.task_types:
+            return False
+        if request.get("stream"):
+            return False
+        temperature = request.get("temperature")
+        return temperature is not None and temperature <= self.max_temperature
+
+    @staticmethod
+    def _request_key(task_type: str, request: Dict[str, Any]) -> str:
+        return json.dumps({"task_type": task_type, "request": request}, sort_keys=True, default=str)
+
+    def _cache_params(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "temperature": request.get("temperature"),
+            "max_tokens": request.get("max_tokens"),
+        }
+
+    def _lookup(self, key: str, request: Dict[str, Any], decode: Callable[[Dict], Any]) -> Tuple[bool, Any]:
+        # Exact tier only: the key is a JSON request blob, not a natural prompt
+        cached = self.cache.get(
+            key, str(request.get("model", "")), semantic=False, **self._cache_params(request)
+        )
+        if cached is None:
+            return False, None
+        try:
+            return True, decode(json.loads(cached))
+        except Exception as e:
+            logger.warning(f"Discarding undecodable cached LLM response: {e}")
+            return False, None
+
+    def _store(self, key: str, request: Dict[str, Any], value: Any, encode: Callable[[Any], Optional[Dict]]) -> None:
+        try:
+            payload = encode(value)
+            if payload is None:
+                return
+            self.cache.set(
+                key,
+                json.dumps(payload),
+                str(request.get("model", "")),
+                metadata={"source": "llm_request_cache"},
+                semantic=False,
+                **self._cache_params(request),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache LLM response: {e}")
+
+    async def call(
+        self,
+        task_type: Optional[str],
+        request: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+        encode: Callable[[Any], Optional[Dict]] = _identity,
+        decode: Callable[[Dict], Any] = _identity,
+    ) -> Any:
+        """Serve a request from cache, an in-flight twin, or the endpoint.
+
+        Args:
+            task_type: Task type of the call site
+            request: Request payload used as cache key
+            fetch: Coroutine factory performing the real upstream call
+            encode: Converts the result to a JSON dict (None = don't cache)
+            decode: Rebuilds a result from its cached JSON dict
+
+        Returns:
+            Result of ``fetch`` (or an equivalent cached/shared result)
+        """
+        if not self.is_cacheable(task_type, request):
+            return await fetch()
+
+        key = self._request_key(task_type, request)
+        hit, value = await asyncio.to_thread(self._lookup, key, request, decode)
+        if hit:
+            self.hits += 1
+            return value
+
+        loop = asyncio.get_running_loop()
+        inflight_key = (id(loop), key)
+        leader = self._inflight_async.get(inflight_key)
+        while leader is not None:
+            self.coalesced += 1
+            value = await asyncio.shield(leader)
+            if value is not _RETRY:
+                return value
+            # The leader was cancelled; the first follower here becomes the new leader
+            self.coalesced -= 1
+            leader = self._inflight_async.get(inflight_key)
+
+        future = loop.create_future()
+        self._inflight_async[inflight_key] = future
+        self.misses += 1
+        try:
+            self.upstream_calls += 1
+            value = await fetch()
+            # Store before leaving the in-flight table so late arrivals hit the cache
+            await asyncio.to_thread(self._store, key, request, value, encode)
+            future.set_result(value)
+        except asyncio.CancelledError:
+            # Followers were not cancelled themselves: let them retry
+            future.set_result(_RETRY)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve so an exception without followers is not reported as unhandled
+            future.exception()
+            raise
+        finally:
+            self._inflight_async.pop(inflight_key, None)
+
+        return value
+
+    def call_sync(
+        self,
+        task_type: Optional[str],
+        request: Dict[str, Any],
+        fetch: Callable[[], Any],
+        encode: Callable[[Any], Optional[Dict]] = _identity,
+        decode: Callable[[Dict], Any] = _identity,
+    ) -> Any:
+        """Synchronous variant of ``call`` for thread-based call sites."""
+        if not self.is_cacheable(task_type, request):
+            return fetch()
+
+        key = self._request_key(task_type, request)
+        hit, value = self._lookup(key, request, decode)
+        if hit:
+            self.hits += 1
+            return value
+
+        with self._lock:
+            leader = self._inflight_sync.get(key)
+            if leader is None:
+                future = self._inflight_sync[key] = Future()
+                self.misses += 1
+        if leader is not None:
+            self.coalesced += 1
+            return leader.result()
+
+        try:
+            self.upstream_calls += 1
+            value = fetch()
+            self._store(key, request, value, encode)
+            future.set_result(value)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight_sync.pop(key, None)
+
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, coalescing and upstream counters
+        """
+        return {
+            "task_types": sorted(self.task_types),
+            "max_temperature": self.max_temperature,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "upstream_calls": self.upstream_calls,
+            "inflight": len(self._inflight_sync) + len(self._inflight_async),
+        }
+
+
+_llm_request_cache: Optional[LLMRequestCache] = None
+
+
+def get_llm_request_cache() -> LLMRequestCache:
+    """Get or create singleton LLM request cache."""
+    global _llm_request_cache
+    if _llm_request_cache is None:
+        _llm_request_cache = LLMRequestCache(
+            task_types=settings.llm_cache_task_types_list,
+            max_temperature=settings.llm_cache_max_temperature,
+        )
+    return _llm_request_cache
@@ -1,13 +1,25 @@
 """LM Cache service for caching LLM responses."""
 import os
 import json
+import heapq
+import atexit
 import hashlib
 import logging
+import re
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 # Data directory for file-based cache
@@ -29,18 +41,523 @@ class CacheEntry:
     metadata: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class _IndexRecord:
+    """In-memory index record pointing at a live entry in a segment file."""
+    segment: int
+    offset: int
+    length: int
+    expires_at: datetime
+    hit_count: int = 0
+
+
+class SegmentLogStore:
+    """Append-only segment log with an in-memory key index.
+
+    Entries are appended as JSON lines to numbered segment files instead of
+    one file per entry. The key -> (segment, offset, length) index is rebuilt
+    by replaying the segments on startup, so lookups cost a single seek/read.
+
+    - Hit counts are kept in memory and flushed as one batched record
+      every ``hit_flush_threshold`` hits or ``hit_flush_interval`` seconds.
+    - A min-heap on ``expires_at`` makes expiry cleanup O(expired).
+    - Overwritten/deleted/expired records are reclaimed by ``compact()``.
+    - Appends hold an ``fcntl`` lock on the segment and take the offset after
+      seeking to its end, so several worker processes sharing the directory
+      never record wrong offsets for each other's writes.
+    """
+
+    SEGMENT_SUFFIX = ".seg"
+
+    def __init__(
+        self,
+        directory: str,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        hit_flush_threshold: int = 100,
+        hit_flush_interval: float = 30.0,
+    ):
+        """Initialize segment store.
+
+        Args:
+            directory: Directory holding the segment files
+            max_segment_bytes: Size after which a new segment is started
+            hit_flush_threshold: Pending hit updates that trigger a flush
+            hit_flush_interval: Seconds after which pending hits are flushed
+        """
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.hit_flush_threshold = hit_flush_threshold
+        self.hit_flush_interval = hit_flush_interval
+
+        self._lock = threading.RLock()
+        self._index: Dict[str, _IndexRecord] = {}
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        self._dirty_hits: Dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._live_bytes = 0
+        self._dead_bytes = 0
+        self._active_segment = 0
+        self._active_file = None
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load()
+
+    # ---------- Segment files ----------
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{segment:08d}{self.SEGMENT_SUFFIX}")
+
+    def _list_segments(self) -> List[int]:
+        segments = []
+        for filename in os.listdir(self.directory):
+            if filename.endswith(self.SEGMENT_SUFFIX):
+                try:
+                    segments.append(int(filename[:-len(self.SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(segments)
+
+    def _open_active(self, segment: int) -> None:
+        if self._active_file:
+            self._active_file.close()
+        self._active_segment = segment
+        self._active_file = open(self._segment_path(segment), "ab")
+
+    def _append(self, record: Dict[str, Any]) -> Tuple[int, int, int]:
+        """Append a record to the active segment.
+
+        Returns:
+            (segment, offset, length) of the written line
+        """
+        data = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        while True:
+            f = self._active_file
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                # Other processes may have appended since our last write
+                offset = f.seek(0, os.SEEK_END)
+                if offset + len(data) > self.max_segment_bytes and offset > 0:
+                    rotate = True
+                else:
+                    rotate = False
+                    f.write(data)
+                    f.flush()
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+            if not rotate:
+                return self._active_segment, offset, len(data)
+            self._open_active(self._active_segment + 1)
+
+    def _read(self, record: _IndexRecord) -> Optional[Dict[str, Any]]:
+        with open(self._segment_path(record.segment), "rb") as f:
+            f.seek(record.offset)
+            line = f.read(record.length)
+        return json.loads(line)["entry"]
+
+    # ---------- Index maintenance ----------
+
+    def _load(self) -> None:
+        """Rebuild the index by replaying all segments in order."""
+        segments = self._list_segments()
+        now = datetime.utcnow()
+
+        for segment in segments:
+            offset = 0
+            with open(self._segment_path(segment), "rb") as f:
+                for line in f:
+                    length = len(line)
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn write at the tail of a segment
+                        self._dead_bytes += length
+                        offset += length
+                        continue
+
+                    op = record.get("op")
+                    if op == "set":
+                        entry = record["entry"]
+                        self._drop(entry["key"])
+                        self._live_bytes += length
+                        self._index[entry["key"]] = _IndexRecord(
+                            segment=segment,
+                            offset=offset,
+                            length=length,
+                            expires_at=datetime.fromisoformat(entry["expires_at"]),
+                            hit_count=entry.get("hit_count", 0),
+                        )
+                    elif op == "hits":
+                        for key, count in record.get("hits", {}).items():
+                            if key in self._index:
+                                self._index[key].hit_count = count
+                        self._dead_bytes += length
+                    elif op == "del":
+                        self._drop(record.get("key"))
+                        self._dead_bytes += length
+                    offset += length
+
+        for key, rec in list(self._index.items()):
+            if rec.expires_at < now:
+                self._drop(key)
+            else:
+                self._expiry_heap.append((rec.expires_at, key))
+        heapq.heapify(self._expiry_heap)
+
+        self._open_active(segments[-1] if segments else 1)
+        if self._index:
+            logger.info(f"Loaded {len(self._index)} LM cache entries from {len(segments)} segments")
+
+    def _drop(self, key: Optional[str]) -> Optional[_IndexRecord]:
+        """Remove a key from the index, accounting its bytes as dead."""
+        rec = self._index.pop(key, None)
+        if rec:
+            self._live_bytes -= rec.length
+            self._dead_bytes += rec.length
+            self._dirty_hits.pop(key, None)
+        return rec
+
+    # ---------- Public API ----------
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a live entry and bump its hit count."""
+        with self._lock:
+            rec = self._index.get(key)
+            if rec is None:
+                return None
+            if datetime.utcnow() > rec.expires_at:
+                self._drop(key)
+                return None
+
+            try:
+                entry = self._read(rec)
+            except (OSError, ValueError, KeyError):
+                # Segment compacted or cleared by another process
+                self._drop(key)
+                return None
+            rec.hit_count += 1
+            entry["hit_count"] = rec.hit_count
+            self._dirty_hits[key] = rec.hit_count
+            self._maybe_flush_hits()
+            return entry
+
+    def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """Append an entry, superseding any previous value for the key."""
+        with self._lock:
+            self._drop(key)
+            segment, offset, length = self._append({"op": "set", "entry": entry})
+            self._live_bytes += length
+            expires_at = datetime.fromisoformat(entry["expires_at"])
+            self._index[key] = _IndexRecord(
+                segment=segment,
+                offset=offset,
+                length=length,
+                expires_at=expires_at,
+                hit_count=entry.get("hit_count", 0),
+            )
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+
+    def delete(self, key: str) -> bool:
+        """Delete an entry by appending a tombstone."""
+        with self._lock:
+            if self._drop(key) is None:
+                return False
+            self._append({"op": "del", "key": key})
+            return True
+
+    def clear(self) -> int:
+        """Remove all entries and segment files."""
+        with self._lock:
+            count = len(self._index)
+            self._active_file.close()
+            for segment in self._list_segments():
+                os.remove(self._segment_path(segment))
+            self._index.clear()
+            self._expiry_heap.clear()
+            self._dirty_hits.clear()
+            self._live_bytes = 0
+            self._dead_bytes = 0
+            self._open_active(1)
+            return count
+
+    def cleanup_expired(self) -> int:
+        """Drop expired entries by popping the expiry heap.
+
+        Heap items whose key was since overwritten or deleted are skipped,
+        so the cost is proportional to the number of expired entries.
+        """
+        now = datetime.utcnow()
+        count = 0
+        with self._lock:
+            while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                expires_at, key = heapq.heappop(self._expiry_heap)
+                rec = self._index.get(key)
+                if rec is not None and rec.expires_at == expires_at:
+                    self._drop(key)
+                    count += 1
+            if self._dead_bytes > self._live_bytes:
+                self.compact()
+        return count
+
+    def flush_hits(self) -> None:
+        """Persist pending hit counts as one batched record."""
+        with self._lock:
+            if self._dirty_hits:
+                self._append({"op": "hits", "hits": self._dirty_hits})
+                self._dirty_hits = {}
+            self._last_flush = time.monotonic()
+
+    def _maybe_flush_hits(self) -> None:
+        if (
+            len(self._dirty_hits) >= self.hit_flush_threshold
+            or time.monotonic() - self._last_flush >= self.hit_flush_interval
+        ):
+            self.flush_hits()
+
+    def compact(self) -> None:
+        """Rewrite live entries into a fresh segment and drop the old ones."""
+        with self._lock:
+            old_segments = self._list_segments()
+            entries = []
+            for key, rec in self._index.items():
+                entry = self._read(rec)
+                entry["hit_count"] = rec.hit_count
+                entries.append(entry)
+
+            self._open_active((old_segments[-1] if old_segments else 0) + 1)
+            self._index.clear()
+            self._expiry_heap.clear()
+            self._dirty_hits.clear()
+            self._live_bytes = 0
+            for entry in entries:
+                self.set(entry["key"], entry)
+
+            for segment in old_segments:
+                os.remove(self._segment_path(segment))
+            self._dead_bytes = 0
+            logger.info(f"Compacted LM cache: {len(entries)} live entries kept")
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics without touching entry contents."""
+        with self._lock:
+            segments = self._list_segments()
+            return {
+                "entry_count": len(self._index),
+                "segment_count": len(segments),
+                "total_size_bytes": sum(
+                    os.path.getsize(self._segment_path(s)) for s in segments
+                ),
+                "live_bytes": self._live_bytes,
+                "dead_bytes": self._dead_bytes,
+                "pending_hit_updates": len(self._dirty_hits),
+            }
+
+    def close(self) -> None:
+        """Flush pending hit counts and close the active segment."""
+        with self._lock:
+            if self._active_file and not self._active_file.closed:
+                self.flush_hits()
+                self._active_file.close()
+
+
+class _SemanticPartition:
+    """Row-normalized embedding matrix for one (model, temperature) scope."""
+
+    def __init__(self, dim: int):
+        import numpy as np
+
+        self._np = np
+        self.matrix = np.zeros((16, dim), dtype=np.float32)
+        self.rows: "OrderedDict[str, int]" = OrderedDict()  # key -> row, insertion order
+        self.row_keys: List[str] = []  # row -> key
+
+    def __len__(self) -> int:
+        return len(self.row_keys)
+
+    def add(self, key: str, vector) -> None:
+        if key in self.rows:
+            self.matrix[self.rows[key]] = vector
+            self.rows.move_to_end(key)
+            return
+        size = len(self.row_keys)
+        if size == self.matrix.shape[0]:
+            grown = self._np.zeros((size * 2, self.matrix.shape[1]), dtype=self.matrix.dtype)
+            grown[:size] = self.matrix
+            self.matrix = grown
+        self.matrix[size] = vector
+        self.rows[key] = size
+        self.row_keys.append(key)
+
+    def remove(self, key: str) -> None:
+        """Swap-remove a row so the matrix stays dense."""
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        last_key = self.row_keys.pop()
+        if last_key != key:
+            self.matrix[row] = self.matrix[len(self.row_keys)]
+            self.row_keys[row] = last_key
+            self.rows[last_key] = row
+
+    def oldest(self) -> Optional[str]:
+        return next(iter(self.rows), None)
+
+    def nearest(self, vector) -> Tuple[Optional[str], float]:
+        size = len(self.row_keys)
+        if size == 0:
+            return None, 0.0
+        scores = self.matrix[:size] @ vector
+        row = int(scores.argmax())
+        return self.row_keys[row], float(scores[row])
+
+
+class SemanticCacheIndex:
+    """Embedding-similarity index over cached prompts.
+
+    Prompts are whitespace-normalized, embedded and kept in a local numpy
+    matrix per (model, temperature), so a lookup is one matrix-vector product.
+    Uses ChromaDB's default embedding function (same model as vector_db)
+    unless an ``embedding_fn`` is supplied.
+
+    Prompts longer than the embedder's input window are neither indexed nor
+    looked up: the model truncates them, so prompts that share a long prefix
+    (e.g. the same system prompt) would embed almost identically.
+    """
+
+    _WHITESPACE = re.compile(r"\s+")
+
+    # all-MiniLM-L6-v2 truncates input at 256 word pieces; at roughly three
+    # characters per word piece this keeps prompts inside that window
+    DEFAULT_MAX_PROMPT_CHARS = 768
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries_per_scope: int = 10000,
+        embedding_fn: Optional[Callable[[List[str]], List[List[float]]]] = None,
+        max_prompt_chars: int = DEFAULT_MAX_PROMPT_CHARS,
+    ):
+        """Initialize semantic index.
+
+        Args:
+            threshold: Minimum cosine similarity for a semantic hit
+            max_entries_per_scope: Oldest prompts are evicted past this size
+            embedding_fn: Callable mapping a list of texts to embeddings
+            max_prompt_chars: Longest (normalized) prompt the embedder sees in full
+        """
+        import numpy  # noqa: F401 - fail early if numpy is unavailable
+
+        self.threshold = threshold
+        self.max_entries_per_scope = max_entries_per_scope
+        self.max_prompt_chars = max_prompt_chars
+        self._embedding_fn = embedding_fn
+        self._partitions: Dict[Tuple[str, float, Optional[int]], _SemanticPartition] = {}
+        self._key_scopes: Dict[str, Tuple[str, float, Optional[int]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def normalize_prompt(cls, prompt: str) -> str:
+        return cls._WHITESPACE.sub(" ", prompt).strip()
+
+    def _embed(self, text: str):
+        import numpy as np
+
+        if self._embedding_fn is None:
+            from chromadb.utils import embedding_functions
+            self._embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+
+        vector = np.asarray(self._embedding_fn([text])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def _scope(model: str, temperature: float, max_tokens: Optional[int]) -> Tuple[str, float, Optional[int]]:
+        return (model, float(temperature), max_tokens)
+
+    def add(
+        self, key: str, prompt: str, model: str, temperature: float, max_tokens: Optional[int] = None
+    ) -> None:
+        """Index a cached prompt under its exact cache key (skipped if too long)."""
+        text = self.normalize_prompt(prompt)
+        if len(text) > self.max_prompt_chars:
+            return
+        vector = self._embed(text)
+        scope = self._scope(model, temperature, max_tokens)
+        with self._lock:
+            partition = self._partitions.get(scope)
+            if partition is None:
+                partition = self._partitions[scope] = _SemanticPartition(vector.shape[0])
+            partition.add(key, vector)
+            self._key_scopes[key] = scope
+            while len(partition) > self.max_entries_per_scope:
+                oldest = partition.oldest()
+                partition.remove(oldest)
+                self._key_scopes.pop(oldest, None)
+
+    def lookup(
+        self, prompt: str, model: str, temperature: float, max_tokens: Optional[int] = None
+    ) -> Tuple[Optional[str], float]:
+        """Find the cache key of the most similar prompt above threshold.
+
+        Returns:
+            (key, similarity); key is None when nothing clears the threshold
+            or the prompt is longer than the embedder's window
+        """
+        text = self.normalize_prompt(prompt)
+        if len(text) > self.max_prompt_chars:
+            return None, 0.0
+        with self._lock:
+            partition = self._partitions.get(self._scope(model, temperature, max_tokens))
+            if not partition:
+                return None, 0.0
+        vector = self._embed(text)
+        with self._lock:
+            key, similarity = partition.nearest(vector)
+        if similarity < self.threshold:
+            return None, similarity
+        return key, similarity
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            scope = self._key_scopes.pop(key, None)
+            if scope and scope in self._partitions:
+                self._partitions[scope].remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+            self._key_scopes.clear()
+
+    def __len__(self) -> int:
+        return len(self._key_scopes)
+
+
 class LMCacheService:
     """Cache service for LLM responses.
 
     Supports both Redis (if available) and file-based caching.
-    Uses semantic similarity for cache matching when vector_db is enabled.
+    With ``semantic_cache`` enabled, exact-key misses fall back to a
+    second tier that matches embedding-similar prompts (SemanticCacheIndex).
+
+    File backends:
+    - "segment": append-only segment log with in-memory index (default)
+    - "json": legacy one JSON file per entry
     """
 
     def __init__(
         self,
         ttl_hours: int = 24,
         use_redis: bool = True,
-        redis_url: str = "redis://localhost:6379"
+        redis_url: str = "redis://localhost:6379",
+        file_backend: str = "segment",
+        cache_dir: str = CACHE_DIR,
+        semantic_cache: bool = False,
+        semantic_threshold: float = 0.95,
+        embedding_fn: Optional[Callable[[List[str]], List[List[float]]]] = None,
     ):
         """Initialize LM Cache service.
 
@@ -48,16 +565,44 @@ class LMCacheService:
             ttl_hours: Time-to-live for cache entries in hours
             use_redis: Whether to try using Redis
             redis_url: Redis connection URL
+            file_backend: File backend used when Redis is unavailable ("segment" or "json")
+            cache_dir: Directory for file-based cache data
+            semantic_cache: Enable the embedding-similarity tier
+            semantic_threshold: Minimum cosine similarity for a semantic hit
+            embedding_fn: Optional embedding function for the semantic tier
         """
+        if file_backend not in ("segment", "json"):
+            raise ValueError(f"Invalid file_backend: {file_backend}")
+
         self.ttl_hours = ttl_hours
         self.redis_url = redis_url
+        self.file_backend = file_backend
+        self.cache_dir = cache_dir
         self._redis_client = None
         self._use_redis = use_redis
         self._redis_available = False
+        self._store: Optional[SegmentLogStore] = None
+        self._semantic: Optional[SemanticCacheIndex] = None
+        self._exact_hits = 0
+        self._semantic_hits = 0
+        self._misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
 
         if use_redis:
             self._init_redis()
 
+        if not self._redis_available and file_backend == "segment":
+            self._init_segment_store()
+
+        if semantic_cache:
+            try:
+                self._semantic = SemanticCacheIndex(
+                    threshold=semantic_threshold,
+                    embedding_fn=embedding_fn,
+                )
+            except ImportError:
+                logger.warning("numpy not installed, semantic LM cache disabled")
+
     def _init_redis(self):
         """Initialize Redis connection."""
         try:
@@ -77,6 +622,30 @@ class LMCacheService:
             logger.warning(f"Redis not available: {e}. Using file-based cache")
             self._redis_available = False
 
+    def _init_segment_store(self):
+        """Initialize segment log store and migrate legacy JSON entries."""
+        self._store = SegmentLogStore(os.path.join(self.cache_dir, "segments"))
+        atexit.register(self._store.close)
+
+        legacy_files = [f for f in os.listdir(self.cache_dir) if f.endswith(".json")]
+        if not legacy_files:
+            return
+
+        migrated = 0
+        now = datetime.utcnow()
+        for filename in legacy_files:
+            file_path = os.path.join(self.cache_dir, filename)
+            try:
+                with open(file_path, "r") as f:
+                    entry = json.load(f)
+                if datetime.fromisoformat(entry["expires_at"]) > now:
+                    self._store.set(entry["key"], entry)
+                    migrated += 1
+                os.remove(file_path)
+            except Exception as e:
+                logger.warning(f"Skipping legacy cache file {filename}: {e}")
+        logger.info(f"Migrated {migrated} legacy LM cache entries to segment store")
+
     def _generate_key(self, prompt: str, model: str, **kwargs) -> str:
         """Generate cache key from prompt and parameters.
 
@@ -100,14 +669,15 @@ class LMCacheService:
 
     def _get_file_path(self, key: str) -> str:
         """Get file path for cache entry."""
-        return os.path.join(CACHE_DIR, f"{key}.json")
+        return os.path.join(self.cache_dir, f"{key}.json")
 
-    def get(self, prompt: str, model: str, **kwargs) -> Optional[str]:
+    def get(self, prompt: str, model: str, semantic: bool = True, **kwargs) -> Optional[str]:
         """Get cached response for prompt.
 
         Args:
             prompt: The LLM prompt
             model: Model name
+            semantic: Fall back to the semantic tier on an exact miss
             **kwargs: Additional parameters
 
         Returns:
@@ -115,11 +685,52 @@ class LMCacheService:
         """
         key = self._generate_key(prompt, model, **kwargs)
 
+        response = self._get_by_key(key)
+        if response is not None:
+            self._exact_hits += 1
+            return response
+
+        if self._semantic is not None and semantic:
+            response = self._get_semantic(
+                prompt, model, kwargs.get("temperature", 0.7), kwargs.get("max_tokens")
+            )
+            if response is not None:
+                self._semantic_hits += 1
+                return response
+
+        self._misses += 1
+        return None
+
+    def _get_by_key(self, key: str) -> Optional[str]:
+        """Get from the configured backend by exact cache key."""
         if self._redis_available:
             return self._get_redis(key)
+        elif self._store is not None:
+            return self._get_segment(key)
         else:
             return self._get_file(key)
 
+    def _get_semantic(
+        self, prompt: str, model: str, temperature: float, max_tokens: Optional[int] = None
+    ) -> Optional[str]:
+        """Get the response of the most similar cached prompt, if close enough."""
+        try:
+            key, similarity = self._semantic.lookup(prompt, model, temperature, max_tokens)
+            if key is None:
+                return None
+
+            response = self._get_by_key(key)
+            if response is None:
+                # Entry expired or was removed from the backend
+                self._semantic.remove(key)
+                return None
+
+            logger.debug(f"Cache hit (semantic, {similarity:.3f}): {key[:16]}...")
+            return response
+        except Exception as e:
+            logger.error(f"Semantic cache lookup error: {e}")
+            return None
+
     def _get_redis(self, key: str) -> Optional[str]:
         """Get from Redis cache."""
         try:
@@ -139,6 +750,17 @@ class LMCacheService:
             logger.error(f"Redis get error: {e}")
         return None
 
+    def _get_segment(self, key: str) -> Optional[str]:
+        """Get from segment log cache."""
+        try:
+            entry = self._store.get(key)
+            if entry:
+                logger.debug(f"Cache hit (segment): {key[:16]}...")
+                return entry["response"]
+        except Exception as e:
+            logger.error(f"Segment cache get error: {e}")
+        return None
+
     def _get_file(self, key: str) -> Optional[str]:
         """Get from file cache."""
         file_path = self._get_file_path(key)
@@ -170,6 +792,7 @@ class LMCacheService:
         response: str,
         model: str,
         metadata: Optional[Dict[str, Any]] = None,
+        semantic: bool = True,
         **kwargs
     ) -> str:
         """Cache LLM response.
@@ -179,6 +802,7 @@ class LMCacheService:
             response: The LLM response
             model: Model name
             metadata: Optional metadata
+            semantic: Index the prompt in the semantic tier
             **kwargs: Additional parameters
 
         Returns:
@@ -199,9 +823,19 @@ class LMCacheService:
 
         if self._redis_available:
             self._set_redis(key, entry)
+        elif self._store is not None:
+            self._set_segment(key, entry)
         else:
             self._set_file(key, entry)
 
+        if self._semantic is not None and semantic:
+            try:
+                self._semantic.add(
+                    key, prompt, model, kwargs.get("temperature", 0.7), kwargs.get("max_tokens")
+                )
+            except Exception as e:
+                logger.error(f"Semantic cache index error: {e}")
+
         return key
 
     def _set_redis(self, key: str, entry: CacheEntry) -> None:
@@ -216,6 +850,14 @@ class LMCacheService:
         except Exception as e:
             logger.error(f"Redis set error: {e}")
 
+    def _set_segment(self, key: str, entry: CacheEntry) -> None:
+        """Set in segment log cache."""
+        try:
+            self._store.set(key, asdict(entry))
+            logger.debug(f"Cached (segment): {key[:16]}...")
+        except Exception as e:
+            logger.error(f"Segment cache set error: {e}")
+
     def _set_file(self, key: str, entry: CacheEntry) -> None:
         """Set in file cache."""
         file_path = self._get_file_path(key)
@@ -239,12 +881,21 @@ class LMCacheService:
         """
         key = self._generate_key(prompt, model, **kwargs)
 
+        if self._semantic is not None:
+            self._semantic.remove(key)
+
         if self._redis_available:
             try:
                 return bool(self._redis_client.delete(f"lm_cache:{key}"))
             except Exception as e:
                 logger.error(f"Redis delete error: {e}")
                 return False
+        elif self._store is not None:
+            try:
+                return self._store.delete(key)
+            except Exception as e:
+                logger.error(f"Segment cache delete error: {e}")
+                return False
         else:
             file_path = self._get_file_path(key)
             try:
@@ -263,6 +914,9 @@ class LMCacheService:
         """
         count = 0
 
+        if self._semantic is not None:
+            self._semantic.clear()
+
         if self._redis_available:
             try:
                 keys = self._redis_client.keys("lm_cache:*")
@@ -271,11 +925,17 @@ class LMCacheService:
                 logger.info(f"Cleared {count} Redis cache entries")
             except Exception as e:
                 logger.error(f"Redis clear error: {e}")
+        elif self._store is not None:
+            try:
+                count = self._store.clear()
+                logger.info(f"Cleared {count} segment cache entries")
+            except Exception as e:
+                logger.error(f"Segment cache clear error: {e}")
         else:
             try:
-                for filename in os.listdir(CACHE_DIR):
+                for filename in os.listdir(self.cache_dir):
                     if filename.endswith(".json"):
-                        os.remove(os.path.join(CACHE_DIR, filename))
+                        os.remove(os.path.join(self.cache_dir, filename))
                         count += 1
                 logger.info(f"Cleared {count} file cache entries")
             except Exception as e:
@@ -292,8 +952,11 @@ class LMCacheService:
         stats = {
             "backend": "redis" if self._redis_available else "file",
             "ttl_hours": self.ttl_hours,
-            "cache_dir": CACHE_DIR,
+            "cache_dir": self.cache_dir,
         }
+        if not self._redis_available:
+            stats["file_backend"] = self.file_backend
+        stats.update(self.get_hit_stats())
 
         if self._redis_available:
             try:
@@ -305,14 +968,19 @@ class LMCacheService:
                 stats["used_memory"] = info.get("used_memory_human", "unknown")
             except Exception as e:
                 stats["error"] = str(e)
+        elif self._store is not None:
+            try:
+                stats.update(self._store.get_stats())
+            except Exception as e:
+                stats["error"] = str(e)
         else:
             try:
-                files = [f for f in os.listdir(CACHE_DIR) if f.endswith(".json")]
+                files = [f for f in os.listdir(self.cache_dir) if f.endswith(".json")]
                 stats["entry_count"] = len(files)
 
                 # Get total size
                 total_size = sum(
-                    os.path.getsize(os.path.join(CACHE_DIR, f))
+                    os.path.getsize(os.path.join(self.cache_dir, f))
                     for f in files
                 )
                 stats["total_size_bytes"] = total_size
@@ -321,6 +989,29 @@ class LMCacheService:
 
         return stats
 
+    def get_hit_stats(self) -> Dict[str, Any]:
+        """Get exact vs semantic hit counters since startup.
+
+        Returns:
+            Dictionary with hit/miss counts and rates
+        """
+        lookups = self._exact_hits + self._semantic_hits + self._misses
+        return {
+            "semantic_enabled": self._semantic is not None,
+            "semantic_entries": len(self._semantic) if self._semantic is not None else 0,
+            "lookups": lookups,
+            "exact_hits": self._exact_hits,
+            "semantic_hits": self._semantic_hits,
+            "misses": self._misses,
+            "exact_hit_rate": self._exact_hits / lookups if lookups else 0.0,
+            "semantic_hit_rate": self._semantic_hits / lookups if lookups else 0.0,
+        }
+
+    def flush(self) -> None:
+        """Persist pending hit-count updates (segment backend only)."""
+        if self._store is not None:
+            self._store.flush_hits()
+
     def cleanup_expired(self) -> int:
         """Remove expired cache entries (file-based only).
 
@@ -331,13 +1022,22 @@ class LMCacheService:
             # Redis handles expiration automatically
             return 0
 
+        if self._store is not None:
+            try:
+                count = self._store.cleanup_expired()
+                logger.info(f"Cleaned up {count} expired cache entries")
+                return count
+            except Exception as e:
+                logger.error(f"Cleanup error: {e}")
+                return 0
+
         count = 0
         try:
-            for filename in os.listdir(CACHE_DIR):
+            for filename in os.listdir(self.cache_dir):
                 if not filename.endswith(".json"):
                     continue
 
-                file_path = os.path.join(CACHE_DIR, filename)
+                file_path = os.path.join(self.cache_dir, filename)
                 try:
                     with open(file_path, "r") as f:
                         entry = json.load(f)
@@ -357,4 +1057,7 @@ class LMCacheService:
 
 
 # Global instance
-lm_cache = LMCacheService()
+lm_cache = LMCacheService(
+    semantic_cache=settings.lm_cache_semantic_enabled,
+    semantic_threshold=settings.lm_cache_semantic_threshold,
+)
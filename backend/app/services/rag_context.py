@@ -8,9 +8,11 @@ Phase 6 Enhancements:
 - 압축된 히스토리 통합
 - 토큰 버짓 인식
 - MAX_CONTEXT_LENGTH 증가
+- 코드/대화 검색 동시 실행 (enrich_query_async, 지연 시간 예산)
 """
+import asyncio
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Awaitable, List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 
 from app.services.vector_db import vector_db, SearchResult
@@ -33,6 +35,50 @@ class RAGContext:
     # Phase 6: 토큰 정보
     estimated_tokens: int = 0
     compressed_history: Optional[str] = None
+    # 지연 시간 예산 안에 끝나지 않아 결과에서 빠진 소스 (code, conversation)
+    timed_out_sources: List[str] = field(default_factory=list)
+
+
+async def gather_with_budget(
+    sources: Dict[str, Awaitable],
+    timeout: Optional[float],
+    source_logger: logging.Logger = logger
+) -> Tuple[Dict[str, Any], List[str]]:
+    """여러 검색을 동시에 실행하고 예산 안에 끝난 결과만 반환
+
+    예산을 넘긴 검색은 기다리지 않고 취소합니다 (스레드에서 실행 중인 작업은
+    백그라운드에서 마저 끝나지만 결과는 버려집니다). 실패한 검색도 결과에서 빠집니다.
+
+    Args:
+        sources: 소스 이름 -> 검색 awaitable
+        timeout: 전체 지연 시간 예산 (초, None이면 무제한)
+        source_logger: 경고를 남길 로거
+
+    Returns:
+        Tuple[Dict[str, Any], List[str]]: (끝난 소스의 결과, 시간 초과된 소스 이름)
+    """
+    tasks = {name: asyncio.ensure_future(aw) for name, aw in sources.items()}
+    if not tasks:
+        return {}, []
+
+    _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+
+    results: Dict[str, Any] = {}
+    timed_out: List[str] = []
+    for name, task in tasks.items():
+        if task in pending:
+            timed_out.append(name)
+        elif task.exception() is not None:
+            source_logger.warning(f"{name} search failed: {task.exception()}")
+        else:
+            results[name] = task.result()
+
+    for task in pending:
+        task.cancel()
+    if timed_out:
+        source_logger.warning(f"RAG sources exceeded {timeout}s budget, using partial results: {timed_out}")
+
+    return results, timed_out
 
 
 class RAGContextBuilder:
@@ -52,6 +98,7 @@ class RAGContextBuilder:
     DEFAULT_CONVERSATION_RESULTS: int = 5   # Phase 6: 3 → 5
     DEFAULT_MIN_RELEVANCE: float = 0.5      # 최소 관련성 (cosine distance 기준)
     MAX_CONTEXT_LENGTH: int = 12000         # Phase 6: 8000 → 12000 (토큰 절약)
+    DEFAULT_LATENCY_BUDGET: float = 2.0     # enrich_query_async 지연 시간 예산 (초)
 
     def __init__(self, session_id: str):
         """RAGContextBuilder 초기화
@@ -117,29 +164,38 @@ class RAGContextBuilder:
 
         if not relevant:
             self.logger.debug(f"No results above relevance threshold {min_relevance}")
-            return RAGContext(
-                formatted_context="",
-                results_count=0,
-                files_referenced=[],
-                avg_relevance=0.0,
-                search_query=query
-            )
+            return self._empty_context(query)
+
+        return self.build_context_from_results(query, relevant)
+
+    def build_context_from_results(self, query: str, results: List[SearchResult]) -> RAGContext:
+        """이미 골라낸 검색 결과(순위 순)로 RAG 컨텍스트 생성
+
+        Args:
+            query: 검색 쿼리
+            results: 컨텍스트에 넣을 검색 결과
+
+        Returns:
+            RAGContext: 포맷된 컨텍스트 정보
+        """
+        if not results:
+            return self._empty_context(query)
 
         # 컨텍스트 포맷팅
-        formatted_context, files = self._format_results(relevant)
+        formatted_context, files = self._format_results(results)
 
         # 평균 관련성 계산
-        avg_relevance = 1 - (sum(r.distance for r in relevant) / len(relevant))
+        avg_relevance = 1 - (sum(r.distance for r in results) / len(results))
 
         self.logger.info(
-            f"RAG context built: {len(relevant)} results, "
+            f"RAG context built: {len(results)} results, "
             f"avg relevance: {avg_relevance:.2%}, "
             f"files: {files[:3]}..."
         )
 
         return RAGContext(
             formatted_context=formatted_context,
-            results_count=len(relevant),
+            results_count=len(results),
             files_referenced=files,
             avg_relevance=avg_relevance,
             search_query=query
@@ -162,6 +218,9 @@ class RAGContextBuilder:
             filename = result.metadata.get('filename', 'unknown')
             language = result.metadata.get('language', 'text')
             description = result.metadata.get('description', '')
+            start_line = result.metadata.get('start_line')
+            end_line = result.metadata.get('end_line')
+            location = f" (lines {start_line}-{end_line})" if start_line and end_line else ""
             relevance = round((1 - result.distance) * 100, 1)
 
             # 코드 내용 추출 (document에서 코드 부분만)
@@ -174,7 +233,7 @@ class RAGContextBuilder:
                 break
 
             context_parts.append(f"""
-### [{i}] {filename} (Relevance: {relevance}%)
+### [{i}] {filename}{location} (Relevance: {relevance}%)
 {f"> {description}" if description else ""}
 
 ```{language}
@@ -286,21 +345,110 @@ class RAGContextBuilder:
         )
 
         # 2. 대화 검색 (선택적) - Phase 6: 확장된 결과 수 (3 → 5)
-        conv_context = ""
-        conv_results = 0
         if include_conversation:
             conv_context, conv_search_results = self.search_conversation(
                 query=user_request,
                 n_results=self.DEFAULT_CONVERSATION_RESULTS,  # Phase 6: 5개
                 min_relevance=0.4
             )
-            conv_results = len(conv_search_results)
 
             # RAGContext에 대화 정보 추가
-            rag_context.conversation_results = conv_results
+            rag_context.conversation_results = len(conv_search_results)
             rag_context.conversation_context = conv_context
 
         # 3. 컨텍스트 결합
+        return self._combine_context(user_request, rag_context, compressed_history)
+
+    async def enrich_query_async(
+        self,
+        user_request: str,
+        n_results: int = None,
+        min_relevance: float = None,
+        include_conversation: bool = True,
+        compressed_history: Optional[List[Dict]] = None,
+        timeout: Optional[float] = DEFAULT_LATENCY_BUDGET
+    ) -> Tuple[str, RAGContext]:
+        """enrich_query의 비동기 버전 - 코드 검색과 대화 검색을 동시에 실행
+
+        두 검색을 이벤트 루프 밖(스레드)에서 동시에 실행하고, timeout 안에
+        끝나지 않은 검색은 빼고 나머지 결과로 보강합니다.
+
+        Args:
+            user_request: 원본 사용자 요청
+            n_results: 최대 결과 수 (기본: 7)
+            min_relevance: 최소 관련성 (기본: 0.5)
+            include_conversation: 대화 검색 포함 여부
+            compressed_history: 압축된 대화 히스토리
+            timeout: 지연 시간 예산 (초, None이면 무제한)
+
+        Returns:
+            Tuple[str, RAGContext]: (보강된 요청, RAG 컨텍스트)
+        """
+        if n_results is None:
+            n_results = self.DEFAULT_N_RESULTS
+        if min_relevance is None:
+            min_relevance = self.DEFAULT_MIN_RELEVANCE
+
+        sources = {"code": self.build_context_async(user_request, n_results, min_relevance)}
+        if include_conversation:
+            sources["conversation"] = self.search_conversation_async(user_request)
+
+        results, timed_out = await gather_with_budget(sources, timeout, self.logger)
+
+        rag_context = results.get("code") or self._empty_context(user_request)
+        rag_context.timed_out_sources = timed_out
+        if "conversation" in results:
+            conv_context, conv_search_results = results["conversation"]
+            rag_context.conversation_results = len(conv_search_results)
+            rag_context.conversation_context = conv_context
+
+        return self._combine_context(user_request, rag_context, compressed_history)
+
+    async def build_context_async(
+        self,
+        query: str,
+        n_results: int = DEFAULT_N_RESULTS,
+        min_relevance: float = DEFAULT_MIN_RELEVANCE,
+        language: Optional[str] = None
+    ) -> RAGContext:
+        """build_context를 스레드에서 실행 (이벤트 루프 차단 방지)"""
+        return await asyncio.to_thread(self.build_context, query, n_results, min_relevance, language)
+
+    async def search_conversation_async(
+        self,
+        query: str,
+        n_results: int = None,
+        min_relevance: float = 0.4
+    ) -> Tuple[str, List[ConversationSearchResult]]:
+        """search_conversation을 스레드에서 실행 (이벤트 루프 차단 방지)"""
+        return await asyncio.to_thread(self.search_conversation, query, n_results, min_relevance)
+
+    def _empty_context(self, query: str) -> RAGContext:
+        """결과 없는 RAGContext"""
+        return RAGContext(
+            formatted_context="",
+            results_count=0,
+            files_referenced=[],
+            avg_relevance=0.0,
+            search_query=query
+        )
+
+    def _combine_context(
+        self,
+        user_request: str,
+        rag_context: RAGContext,
+        compressed_history: Optional[List[Dict]] = None
+    ) -> Tuple[str, RAGContext]:
+        """압축 히스토리, 코드 컨텍스트, 대화 컨텍스트를 요청에 결합
+
+        Args:
+            user_request: 원본 사용자 요청
+            rag_context: 코드/대화 검색 결과가 담긴 컨텍스트
+            compressed_history: 압축된 대화 히스토리
+
+        Returns:
+            Tuple[str, RAGContext]: (보강된 요청, RAG 컨텍스트)
+        """
         context_parts = []
 
         # Phase 6: 압축된 히스토리 추가
@@ -313,8 +461,8 @@ class RAGContextBuilder:
         if rag_context.formatted_context:
             context_parts.append(rag_context.formatted_context)
 
-        if conv_context:
-            context_parts.append(conv_context)
+        if rag_context.conversation_context:
+            context_parts.append(rag_context.conversation_context)
 
         if context_parts:
             combined_context = "\n\n".join(context_parts)
@@ -325,7 +473,7 @@ class RAGContextBuilder:
 
             self.logger.info(
                 f"Query enriched: {rag_context.results_count} code results, "
-                f"{conv_results} conversation results, "
+                f"{rag_context.conversation_results} conversation results, "
                 f"~{rag_context.estimated_tokens} tokens"
             )
             return enriched_request, rag_context
@@ -0,0 +1,127 @@
+"""Affected Test Selection - 변경된 파일에 영향을 받는 테스트만 선택
+
+Knowledge Graph의 파일 간 `imports` 관계를 거꾸로 따라가, 변경된 파일을
+직접 또는 간접적으로 import하는 테스트 파일만 고릅니다. 리파인 루프처럼
+몇 개 파일만 바뀌는 반복에서 전체 테스트 스위트를 다시 돌리지 않기 위함입니다.
+
+그래프에 아직 없는 Python 파일과 변경된 파일은 선택 전에 CodeGraphBuilder로
+증분 반영하므로, 색인되지 않은 워크스페이스에서도 동작합니다.
+"""
+import fnmatch
+import os
+import logging
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# pytest 기본 테스트 파일 이름 패턴
+TEST_FILE_PATTERNS = ("test_*.py", "*_test.py")
+
+# 바뀌면 모든 테스트에 영향을 줄 수 있는 파일 (전체 실행)
+GLOBAL_TEST_FILES = {"conftest.py", "pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini"}
+
+# 테스트 결과에 영향을 주지 않는 것이 분명한 Python 외 파일 (문서, 이미지).
+# 그 밖의 Python 외 파일(데이터, 설정, 템플릿 등)은 import로 추적할 수 없으므로 전체 실행
+IRRELEVANT_SUFFIXES = {".md", ".rst", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico"}
+IRRELEVANT_FILES = {"LICENSE", "AUTHORS", "CHANGELOG", ".gitignore", ".gitattributes"}
+
+# 그래프를 쓰는 세션 ID (워크스페이스 그래프는 세션과 무관하게 공유됨)
+SELECTION_SESSION_ID = "test_selection"
+
+
+def is_test_file(path: str) -> bool:
+    """pytest가 수집하는 테스트 파일 이름인지 확인"""
+    name = os.path.basename(path)
+    return any(fnmatch.fnmatch(name, pattern) for pattern in TEST_FILE_PATTERNS)
+
+
+def select_affected_tests(
+    workspace: str,
+    changed_files: Iterable[str],
+    test_root: Optional[str] = None
+) -> Optional[List[str]]:
+    """변경된 파일에 영향을 받는 테스트 파일 선택
+
+    변경된 테스트 파일 자체와, 변경된 파일을 import 관계로 (간접 포함)
+    참조하는 테스트 파일을 반환합니다. 영향받는 파일 중 conftest.py가 있으면
+    그 디렉토리 아래의 테스트를 모두 선택합니다. Python이 아닌 파일은 import로
+    추적할 수 없으므로, 문서/이미지처럼 무관한 것이 분명한 파일이 아니면
+    전체 실행(None)으로 처리합니다.
+
+    Args:
+        workspace: 워크스페이스 경로
+        changed_files: 변경/삭제된 파일 경로 (절대 경로 또는 워크스페이스 기준 상대 경로)
+        test_root: 이 경로 아래의 테스트만 선택 (기본값: 워크스페이스 전체)
+
+    Returns:
+        Optional[List[str]]: 선택된 테스트 파일의 절대 경로 (정렬됨).
+            conftest.py나 pytest 설정, 추적할 수 없는 Python 외 파일이 바뀌어
+            전체 실행이 필요하면 None
+    """
+    from app.services.code_indexer import CodeIndexer
+    from app.services.hybrid_rag import CodeGraphBuilder
+
+    root = Path(workspace).resolve()
+    scope = Path(test_root).resolve() if test_root else root
+    changed = []
+    for file_path in changed_files:
+        path = Path(file_path)
+        path = (path if path.is_absolute() else root / path).resolve()
+        if path.name in GLOBAL_TEST_FILES:
+            logger.info(f"{path.name} changed - selecting all tests")
+            return None
+        if not path.is_relative_to(root):
+            continue
+        if path.suffix == ".py":
+            changed.append(path)
+        elif path.suffix.lower() not in IRRELEVANT_SUFFIXES and path.name not in IRRELEVANT_FILES:
+            logger.info(f"{path.name} changed (not traceable by imports) - selecting all tests")
+            return None
+
+    builder = CodeGraphBuilder(SELECTION_SESSION_ID, str(root))
+    removed = [str(path) for path in changed if not path.exists()]
+    affected = {str(path.relative_to(root)) for path in changed}
+
+    # 삭제된 파일은 노드가 지워지기 전에 의존 파일을 찾음
+    for file_path in removed:
+        affected.update(builder.get_dependent_files(file_path))
+
+    refresh = {str(path) for path in changed if path.exists()}
+    refresh.update(
+        file_path for file_path in _python_files(root, CodeIndexer.EXCLUDED_DIRS)
+        if not builder.has_file(file_path)
+    )
+    if refresh or removed:
+        builder.update_files(sorted(refresh), removed)
+
+    for file_path in refresh & {str(path) for path in changed}:
+        affected.update(builder.get_dependent_files(file_path))
+
+    # conftest.py의 fixture/hook은 import 없이 그 디렉토리 아래 테스트 전체에 적용됨
+    for relative_path in list(affected):
+        if os.path.basename(relative_path) == "conftest.py":
+            conftest_dir = (root / relative_path).parent
+            affected.update(
+                os.path.relpath(file_path, root)
+                for file_path in _python_files(conftest_dir, CodeIndexer.EXCLUDED_DIRS)
+            )
+
+    selected = []
+    for relative_path in affected:
+        path = root / relative_path
+        if is_test_file(relative_path) and path.exists() and path.is_relative_to(scope):
+            selected.append(str(path))
+
+    logger.info(f"Selected {len(selected)} affected test files for {len(changed)} changed files")
+    return sorted(selected)
+
+
+def _python_files(root: Path, excluded_dirs: Iterable[str]) -> List[str]:
+    """워크스페이스의 Python 파일 (제외 디렉토리 건너뜀)"""
+    excluded = set(excluded_dirs)
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in excluded and not d.startswith('.')]
+        files.extend(os.path.join(dirpath, name) for name in filenames if name.endswith('.py'))
+    return files
@@ -1,7 +1,10 @@
 """Vector database service using ChromaDB for semantic search."""
 import os
+import json
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -22,18 +25,43 @@ class SearchResult:
 
 
 class VectorDBService:
-    """Vector database service for semantic search using ChromaDB."""
+    """Vector database service for semantic search using ChromaDB.
 
-    def __init__(self, collection_name: str = "code_snippets"):
+    Query embeddings and search results are kept in in-process LRU caches.
+    Each cached search remembers the index generation of the session it was
+    filtered by; any add/upsert/delete through this service bumps that
+    generation, so stale results are never served.
+    """
+
+    QUERY_CACHE_SIZE = 256
+    EMBEDDING_CACHE_SIZE = 1024
+
+    def __init__(
+        self,
+        collection_name: str = "code_snippets",
+        embedding_fn: Optional[Callable[[List[str]], List[List[float]]]] = None
+    ):
         """Initialize ChromaDB client and collection.
 
         Args:
             collection_name: Name of the collection to use
+            embedding_fn: Query embedding function (defaults to ChromaDB's
+                default embedding function, which the collection also uses)
         """
         self.collection_name = collection_name
         self._client = None
         self._collection = None
         self._initialized = False
+        self._embedding_fn = embedding_fn
+
+        # Query caches (searches may run concurrently in worker threads)
+        self._cache_lock = threading.Lock()
+        self._result_cache: "OrderedDict[tuple, Tuple[tuple, List[SearchResult]]]" = OrderedDict()
+        self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._session_generations: Dict[str, int] = {}
+        self._unscoped_generation = 0  # writes whose session is unknown
+        self._write_generation = 0  # every write
+        self._cache_stats = {"hits": 0, "misses": 0, "embedding_hits": 0, "embedding_misses": 0}
 
     def _init_client(self):
         """Lazy initialization of ChromaDB client."""
@@ -101,6 +129,9 @@ class VectorDBService:
         except Exception as e:
             logger.error(f"Failed to add documents: {e}")
             raise
+        finally:
+            sessions = {(metadata or {}).get("session_id") for metadata in metadatas or [None]}
+            self._invalidate(None if None in sessions else sessions)
 
     def add_code_snippet(
         self,
@@ -122,6 +153,76 @@ class VectorDBService:
         Returns:
             Document ID
         """
+        doc_id, doc_text, metadata = self._code_snippet_record(
+            code, filename, language, session_id, description
+        )
+
+        self.add_documents(
+            documents=[doc_text],
+            ids=[doc_id],
+            metadatas=[metadata]
+        )
+
+        return doc_id
+
+    def upsert_code_snippets(self, snippets: List[Dict[str, Any]], session_id: str) -> List[str]:
+        """Add or replace many code snippets in one collection call.
+
+        All documents are embedded in a single batched embedding call, so
+        this is much cheaper than calling add_code_snippet per chunk.
+
+        Args:
+            snippets: Dicts with code, filename, language and optional description
+            session_id: Associated session ID
+
+        Returns:
+            Document IDs (same order as snippets)
+        """
+        records: Dict[str, tuple] = {}
+        doc_ids = []
+        for snippet in snippets:
+            doc_id, doc_text, metadata = self._code_snippet_record(
+                snippet["code"],
+                snippet["filename"],
+                snippet["language"],
+                session_id,
+                snippet.get("description"),
+                snippet.get("start_line"),
+                snippet.get("end_line")
+            )
+            # Identical chunks share an ID; the collection rejects duplicate IDs
+            records[doc_id] = (doc_text, metadata)
+            doc_ids.append(doc_id)
+
+        if not records:
+            return doc_ids
+
+        try:
+            self.collection.upsert(
+                ids=list(records),
+                documents=[doc_text for doc_text, _ in records.values()],
+                metadatas=[metadata for _, metadata in records.values()]
+            )
+            logger.debug(f"Upserted {len(records)} code snippets to vector DB")
+        except Exception as e:
+            logger.error(f"Failed to upsert code snippets: {e}")
+            raise
+        finally:
+            self._invalidate([session_id])
+
+        return doc_ids
+
+    @staticmethod
+    def _code_snippet_record(
+        code: str,
+        filename: str,
+        language: str,
+        session_id: str,
+        description: Optional[str] = None,
+        start_line: Optional[int] = None,
+        end_line: Optional[int] = None
+    ) -> tuple:
+        """Build (doc_id, doc_text, metadata) for a code snippet."""
         import hashlib
 
         # Create unique ID from content hash
@@ -138,14 +239,11 @@ class VectorDBService:
         }
         if description:
             metadata["description"] = description
+        if start_line is not None and end_line is not None:
+            metadata["start_line"] = start_line
+            metadata["end_line"] = end_line
 
-        self.add_documents(
-            documents=[doc_text],
-            ids=[doc_id],
-            metadatas=[metadata]
-        )
-
-        return doc_id
+        return doc_id, doc_text, metadata
 
     def search(
         self,
@@ -163,9 +261,19 @@ class VectorDBService:
         Returns:
             List of search results
         """
+        key = (self.collection_name, json.dumps(filter_metadata, sort_keys=True, default=str), query, n_results)
+        generation = self._generation(filter_metadata)
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None and cached[0] == generation:
+                self._result_cache.move_to_end(key)
+                self._cache_stats["hits"] += 1
+                return list(cached[1])
+            self._cache_stats["misses"] += 1
+
         try:
             results = self.collection.query(
-                query_texts=[query],
+                query_embeddings=[self._embed_query(query)],
                 n_results=n_results,
                 where=filter_metadata
             )
@@ -180,7 +288,13 @@ class VectorDBService:
                         distance=results['distances'][0][i] if results['distances'] else 0.0
                     ))
 
-            return search_results
+            with self._cache_lock:
+                self._result_cache[key] = (generation, search_results)
+                self._result_cache.move_to_end(key)
+                while len(self._result_cache) > self.QUERY_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+            return list(search_results)
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
@@ -212,6 +326,70 @@ class VectorDBService:
 
         return self.search(query, n_results, filter_metadata)
 
+    def get_documents(self, doc_ids: List[str]) -> List[SearchResult]:
+        """Fetch documents by ID (without a similarity score).
+
+        Args:
+            doc_ids: Document IDs (unknown IDs are skipped)
+
+        Returns:
+            Found documents in the order of doc_ids, with distance 0.0
+        """
+        if not doc_ids:
+            return []
+
+        try:
+            results = self.collection.get(ids=list(doc_ids), include=["documents", "metadatas"])
+        except Exception as e:
+            logger.error(f"Failed to get documents: {e}")
+            return []
+
+        found = {
+            doc_id: SearchResult(
+                id=doc_id,
+                content=results["documents"][i] if results.get("documents") else "",
+                metadata=results["metadatas"][i] if results.get("metadatas") else {},
+                distance=0.0
+            )
+            for i, doc_id in enumerate(results.get("ids") or [])
+        }
+        return [found[doc_id] for doc_id in doc_ids if doc_id in found]
+
+    def get_code_documents(self, session_id: str) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Fetch every code snippet of a session (used to rebuild the lexical index).
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            (doc_id, document, metadata) tuples
+        """
+        results = self.collection.get(
+            where={"$and": [{"type": "code_snippet"}, {"session_id": session_id}]},
+            include=["documents", "metadatas"]
+        )
+        return list(zip(results["ids"], results["documents"], results["metadatas"]))
+
+    def delete_documents(self, doc_ids: List[str], session_id: Optional[str] = None) -> None:
+        """Delete documents by ID.
+
+        Args:
+            doc_ids: Document IDs to delete (unknown IDs are ignored)
+            session_id: Session owning the documents; if omitted, cached
+                searches of every session are invalidated
+        """
+        if not doc_ids:
+            return
+
+        try:
+            self.collection.delete(ids=list(dict.fromkeys(doc_ids)))
+            logger.debug(f"Deleted {len(doc_ids)} documents from vector DB")
+        except Exception as e:
+            logger.error(f"Failed to delete documents: {e}")
+            raise
+        finally:
+            self._invalidate([session_id] if session_id else None)
+
     def delete_by_session(self, session_id: str) -> None:
         """Delete all documents for a session.
 
@@ -225,6 +403,8 @@ class VectorDBService:
             logger.info(f"Deleted documents for session: {session_id}")
         except Exception as e:
             logger.error(f"Failed to delete documents: {e}")
+        finally:
+            self._invalidate([session_id])
 
     def get_stats(self) -> Dict[str, Any]:
         """Get vector database statistics.
@@ -237,11 +417,80 @@ class VectorDBService:
             return {
                 "collection_name": self.collection_name,
                 "document_count": count,
-                "storage_path": CHROMA_DIR
+                "storage_path": CHROMA_DIR,
+                "query_cache": self.get_cache_stats()
             }
         except Exception as e:
             logger.error(f"Failed to get stats: {e}")
-            return {"error": str(e)}
+            return {"error": str(e), "query_cache": self.get_cache_stats()}
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get query cache hit/miss counters.
+
+        Returns:
+            Dictionary with result and embedding cache counters and sizes
+        """
+        with self._cache_lock:
+            stats = dict(self._cache_stats)
+            stats["size"] = len(self._result_cache)
+            stats["embedding_size"] = len(self._embedding_cache)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def clear_cache(self) -> None:
+        """Drop all cached query embeddings and search results."""
+        with self._cache_lock:
+            self._result_cache.clear()
+            self._embedding_cache.clear()
+
+    def _embed_query(self, query: str) -> List[float]:
+        """Embed a query text, reusing the cached embedding if present."""
+        with self._cache_lock:
+            embedding = self._embedding_cache.get(query)
+            if embedding is not None:
+                self._embedding_cache.move_to_end(query)
+                self._cache_stats["embedding_hits"] += 1
+                return embedding
+            self._cache_stats["embedding_misses"] += 1
+
+        if self._embedding_fn is None:
+            from chromadb.utils import embedding_functions
+            self._embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+        embedding = [float(x) for x in self._embedding_fn([query])[0]]
+
+        with self._cache_lock:
+            self._embedding_cache[query] = embedding
+            while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+        return embedding
+
+    def _generation(self, filter_metadata: Optional[Dict[str, Any]]) -> tuple:
+        """Index generation that a search with this filter depends on.
+
+        Searches scoped to one session only depend on that session's writes
+        (and on deletes whose session is unknown); unscoped searches depend
+        on every write.
+        """
+        session_id = (filter_metadata or {}).get("session_id")
+        with self._cache_lock:
+            if isinstance(session_id, str):
+                return (self._session_generations.get(session_id, 0), self._unscoped_generation)
+            return (self._write_generation,)
+
+    def _invalidate(self, session_ids: Optional[Iterable[str]] = None) -> None:
+        """Bump the index generation after a write.
+
+        Args:
+            session_ids: Sessions whose documents changed (None if unknown)
+        """
+        with self._cache_lock:
+            self._write_generation += 1
+            if session_ids is None:
+                self._unscoped_generation += 1
+                return
+            for session_id in session_ids:
+                self._session_generations[session_id] = self._session_generations.get(session_id, 0) + 1
 
 
 # Global instance
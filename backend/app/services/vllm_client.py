@@ -1,29 +1,200 @@
 """vLLM client for interacting with OpenAI-compatible endpoints."""
+import asyncio
+import hashlib
 import logging
 import threading
-from typing import AsyncGenerator, Optional, Dict, Any, List
-from openai import AsyncOpenAI
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import AsyncGenerator, Iterator, Optional, Dict, Any, List
+from openai import APIStatusError, AsyncOpenAI
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+LOAD_BALANCING_STRATEGIES = ("round_robin", "least_outstanding", "latency_ewma", "prefix_affinity")
+
+
+def _is_endpoint_failure(error: BaseException) -> bool:
+    """Whether an error counts against the endpoint's health.
+
+    Client errors (4xx) are caused by the request, and cancellation or an
+    early close of a stream (GeneratorExit) by the caller, so none of them
+    says anything about the endpoint.
+    """
+    if isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+        return False
+    if isinstance(error, APIStatusError) and error.status_code < 500:
+        return False
+    return True
+
+
+class EndpointStats:
+    """Passive health and load tracking for a single vLLM endpoint.
+
+    Updated by VLLMClient around every upstream call; read by VLLMRouter
+    to pick endpoints and to report load balancing statistics.
+
+    After the ejection cool-down the endpoint is half-open: the router lets
+    a single probe request through (claim()). A successful probe readmits
+    the endpoint, a failed one ejects it again; until the probe finishes
+    (or eject_cooldown passes without an answer) the endpoint stays skipped.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        eject_after_failures: int = 3,
+        eject_cooldown: float = 30.0,
+        ewma_alpha: float = 0.3,
+        latency_window: int = 256,
+    ):
+        """Initialize endpoint stats.
+
+        Args:
+            endpoint: Endpoint base URL
+            eject_after_failures: Consecutive failures before ejection
+            eject_cooldown: Seconds an ejected endpoint is skipped
+            ewma_alpha: Weight of the newest sample in the latency EWMA
+            latency_window: Number of recent latencies kept for percentiles
+        """
+        self.endpoint = endpoint
+        self.eject_after_failures = eject_after_failures
+        self.eject_cooldown = eject_cooldown
+        self.ewma_alpha = ewma_alpha
+
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=latency_window)
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self._probe_deadline = 0.0
+        self.ewma_latency: Optional[float] = None
+
+    def _half_open(self, now: float) -> bool:
+        return self.consecutive_failures >= self.eject_after_failures and now >= self.ejected_until
+
+    def is_available(self, now: Optional[float] = None) -> bool:
+        """Whether the endpoint is not ejected and no half-open probe is pending."""
+        now = now if now is not None else time.monotonic()
+        if now < self.ejected_until:
+            return False
+        return not (self._half_open(now) and now < self._probe_deadline)
+
+    def claim(self, now: Optional[float] = None) -> None:
+        """Record that a request was routed here (the probe, when half-open)."""
+        now = now if now is not None else time.monotonic()
+        with self._lock:
+            if self._half_open(now) and now >= self._probe_deadline:
+                # A probe that never finishes frees the slot after another cool-down
+                self._probe_deadline = now + self.eject_cooldown
+                logger.info(f"🩺 Probing ejected vLLM endpoint {self.endpoint}")
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Track one upstream call (in-flight count, latency, errors)."""
+        with self._lock:
+            self.in_flight += 1
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self._finish(time.monotonic() - start, error=e)
+            raise
+        else:
+            self._finish(time.monotonic() - start)
+
+    def _finish(self, latency: float, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+                # Says nothing about the endpoint; let another probe through
+                self._probe_deadline = 0.0
+                return
+
+            self.requests += 1
+            if error is not None and _is_endpoint_failure(error):
+                self.errors += 1
+                self.consecutive_failures += 1
+                # A failed half-open probe ejects again for another cool-down
+                if self.consecutive_failures >= self.eject_after_failures:
+                    self._probe_deadline = 0.0
+                    self.ejected_until = time.monotonic() + self.eject_cooldown
+                    self.ejections += 1
+                    logger.warning(
+                        f"⛔ Ejecting vLLM endpoint {self.endpoint} for {self.eject_cooldown:.0f}s "
+                        f"after {self.consecutive_failures} consecutive failures"
+                    )
+                return
+
+            self.consecutive_failures = 0
+            self._probe_deadline = 0.0
+            self._latencies.append(latency)
+            if self.ewma_latency is None:
+                self.ewma_latency = latency
+            else:
+                self.ewma_latency += self.ewma_alpha * (latency - self.ewma_latency)
+
+    def _percentile(self, ordered: List[float], pct: float) -> Optional[float]:
+        if not ordered:
+            return None
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get a snapshot of this endpoint's statistics."""
+        with self._lock:
+            ordered = sorted(self._latencies)
+            now = time.monotonic()
+            return {
+                "endpoint": self.endpoint,
+                "healthy": now >= self.ejected_until,
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "errors": self.errors,
+                "error_rate": self.errors / self.requests if self.requests else 0.0,
+                "consecutive_failures": self.consecutive_failures,
+                "ejections": self.ejections,
+                "ejected_for_seconds": max(0.0, self.ejected_until - now),
+                "latency_ewma_ms": self.ewma_latency * 1000 if self.ewma_latency is not None else None,
+                "latency_p50_ms": self._ms(self._percentile(ordered, 50)),
+                "latency_p95_ms": self._ms(self._percentile(ordered, 95)),
+            }
+
+    @staticmethod
+    def _ms(seconds: Optional[float]) -> Optional[float]:
+        return seconds * 1000 if seconds is not None else None
+
 
 class VLLMClient:
     """Client for vLLM OpenAI-compatible API."""
 
-    def __init__(self, base_url: str, model_name: str):
+    def __init__(
+        self,
+        base_url: str,
+        model_name: str,
+        stats: Optional[EndpointStats] = None,
+        max_retries: int = 2
+    ):
         """Initialize vLLM client.
 
         Args:
             base_url: Base URL for vLLM endpoint (e.g., http://localhost:8001/v1)
             model_name: Name of the model to use
+            stats: Health/load tracker for this endpoint (created if omitted)
+            max_retries: Retries done by the OpenAI client per call
         """
         self.base_url = base_url
         self.model_name = model_name
+        self.stats = stats or EndpointStats(base_url)
         self.client = AsyncOpenAI(
             base_url=base_url,
-            api_key="dummy-key"  # vLLM doesn't require real API key
+            api_key="dummy-key",  # vLLM doesn't require real API key
+            max_retries=max_retries
         )
         logger.info(f"Initialized vLLM client for {model_name} at {base_url}")
 
@@ -33,6 +204,7 @@ class VLLMClient:
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         stream: bool = False,
+        cache_task_type: Optional[str] = None,
         **kwargs
     ) -> Any:
         """Create a chat completion.
@@ -41,22 +213,54 @@ class VLLMClient:
             messages: List of message dictionaries with 'role' and 'content'
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
-            stream: Whether to stream the response
+            stream: Not supported; use stream_chat_completion, which keeps the
+                endpoint tracked until the stream is consumed
+            cache_task_type: Task type for the shared LLM request cache
+                (None = always call the endpoint)
             **kwargs: Additional arguments to pass to the API
 
         Returns:
-            Chat completion response or async generator if streaming
+            Chat completion response
+
+        Raises:
+            ValueError: If stream is True
         """
+        if stream:
+            raise ValueError("chat_completion does not stream; use stream_chat_completion")
+
+        async def fetch():
+            with self.stats.track():
+                return await self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=False,
+                    **kwargs
+                )
+
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=stream,
-                **kwargs
+            if cache_task_type is None:
+                return await fetch()
+
+            from openai.types.chat import ChatCompletion
+            from app.services.llm_request_cache import get_llm_request_cache
+
+            request = {
+                "model": self.model_name,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": False,
+                **kwargs,
+            }
+            return await get_llm_request_cache().call(
+                cache_task_type,
+                request,
+                fetch,
+                encode=lambda response: response.model_dump(),
+                decode=ChatCompletion.model_validate,
             )
-            return response
         except Exception as e:
             logger.error(f"Error calling vLLM API: {e}")
             raise
@@ -84,16 +288,17 @@ class VLLMClient:
             Chat completion response with tool_calls if LLM wants to call tools
         """
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                tools=tools,
-                tool_choice=tool_choice,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=False,  # Tool calling doesn't support streaming
-                **kwargs
-            )
+            with self.stats.track():
+                response = await self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=False,  # Tool calling doesn't support streaming
+                    **kwargs
+                )
             return response
         except Exception as e:
             logger.error(f"Error calling vLLM API with tools: {e}")
@@ -118,18 +323,20 @@ class VLLMClient:
             Chunks of generated text
         """
         try:
-            stream = await self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                stream=True,
-                **kwargs
-            )
+            # The endpoint stays "in flight" until the stream is fully consumed
+            with self.stats.track():
+                stream = await self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    **kwargs
+                )
 
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
 
         except Exception as e:
             logger.error(f"Error streaming from vLLM API: {e}")
@@ -140,17 +347,45 @@ class VLLMRouter:
     """Router for vLLM clients with load balancing support.
 
     Supports two modes:
-    1. Load Balancing Mode: Multiple endpoints for the same model (round-robin)
+    1. Load Balancing Mode: Multiple endpoints for the same model
     2. Task-Based Mode: Different endpoints for reasoning vs coding tasks
+
+    Load balancing strategies (VLLM_LB_STRATEGY):
+    - round_robin: Rotate through healthy endpoints
+    - least_outstanding: Fewest in-flight requests (ties rotate)
+    - latency_ewma: Lowest latency EWMA weighted by in-flight requests
+    - prefix_affinity: Same affinity key (session / system prompt) goes to the
+      same endpoint to reuse its prefix KV cache (rendezvous hashing, so an
+      ejected endpoint only moves its own keys); least_outstanding without a key
+
+    Endpoints that fail repeatedly are ejected for a cool-down period
+    (passive health checks), then get a single probe request before they
+    are readmitted; if all are ejected, the one that comes back first is used.
     """
 
-    def __init__(self):
-        """Initialize vLLM router with load balancing or task-based routing."""
+    # prefix_affinity falls back to the next endpoint when the preferred one
+    # has this many more in-flight requests than the least loaded one
+    affinity_max_extra_in_flight = 8
+
+    def __init__(self, endpoints: Optional[List[str]] = None, strategy: Optional[str] = None):
+        """Initialize vLLM router with load balancing or task-based routing.
+
+        Args:
+            endpoints: Load balanced endpoints (defaults to VLLM_ENDPOINTS)
+            strategy: Load balancing strategy (defaults to VLLM_LB_STRATEGY)
+        """
         self._lock = threading.Lock()
         self._round_robin_index = 0
+        self.strategy = (strategy or settings.vllm_lb_strategy).lower()
+        if self.strategy not in LOAD_BALANCING_STRATEGIES:
+            raise ValueError(
+                f"Unknown load balancing strategy: {self.strategy} "
+                f"(expected one of {', '.join(LOAD_BALANCING_STRATEGIES)})"
+            )
 
         # Check if load balancing mode is enabled (multiple endpoints configured)
-        endpoints = settings.get_vllm_endpoints_list
+        if endpoints is None:
+            endpoints = settings.get_vllm_endpoints_list
 
         if len(endpoints) > 1:
             # Load Balancing Mode: Multiple endpoints for same model
@@ -160,7 +395,8 @@ class VLLMRouter:
             for i, endpoint in enumerate(endpoints):
                 client = VLLMClient(
                     base_url=endpoint,
-                    model_name=settings.llm_model
+                    model_name=settings.llm_model,
+                    stats=self._new_stats(endpoint)
                 )
                 self.clients.append(client)
 
@@ -168,18 +404,20 @@ class VLLMRouter:
             logger.info(f"   📊 {len(self.clients)} endpoints configured:")
             for i, endpoint in enumerate(endpoints):
                 logger.info(f"      [{i+1}] {endpoint}")
-            logger.info(f"   🔄 Strategy: Round-robin across all endpoints")
+            logger.info(f"   🔄 Strategy: {self.strategy}")
 
         elif settings.vllm_reasoning_endpoint and settings.vllm_coding_endpoint:
             # Task-Based Mode: Separate endpoints for reasoning and coding
             self.mode = "task_based"
             self.reasoning_client = VLLMClient(
                 base_url=settings.vllm_reasoning_endpoint,
-                model_name=settings.reasoning_model or settings.llm_model
+                model_name=settings.reasoning_model or settings.llm_model,
+                stats=self._new_stats(settings.vllm_reasoning_endpoint)
             )
             self.coding_client = VLLMClient(
                 base_url=settings.vllm_coding_endpoint,
-                model_name=settings.coding_model or settings.llm_model
+                model_name=settings.coding_model or settings.llm_model,
+                stats=self._new_stats(settings.vllm_coding_endpoint)
             )
             logger.info(f"🎯 VLLMRouter initialized in TASK-BASED mode")
             logger.info(f"   🧠 Reasoning: {settings.vllm_reasoning_endpoint}")
@@ -190,26 +428,33 @@ class VLLMRouter:
             self.mode = "single"
             self.primary_client = VLLMClient(
                 base_url=settings.llm_endpoint,
-                model_name=settings.llm_model
+                model_name=settings.llm_model,
+                stats=self._new_stats(settings.llm_endpoint)
             )
             logger.info(f"📍 VLLMRouter initialized in SINGLE ENDPOINT mode")
             logger.info(f"   🔗 Endpoint: {settings.llm_endpoint}")
 
-    def get_client(self, task_type: str = "coding") -> VLLMClient:
+    @staticmethod
+    def _new_stats(endpoint: str) -> EndpointStats:
+        return EndpointStats(
+            endpoint,
+            eject_after_failures=settings.vllm_lb_eject_after_failures,
+            eject_cooldown=settings.vllm_lb_eject_cooldown,
+        )
+
+    def get_client(self, task_type: str = "coding", affinity_key: Optional[str] = None) -> VLLMClient:
         """Get appropriate vLLM client based on routing mode.
 
         Args:
             task_type: Type of task ('reasoning' or 'coding') - only used in task-based mode
+            affinity_key: Session ID or system prompt - only used by the
+                prefix_affinity strategy
 
         Returns:
             VLLMClient instance (load balanced or task-specific)
         """
         if self.mode == "load_balancing":
-            # Round-robin load balancing across all clients
-            with self._lock:
-                client = self.clients[self._round_robin_index]
-                self._round_robin_index = (self._round_robin_index + 1) % len(self.clients)
-                return client
+            return self._select_client(affinity_key)
 
         elif self.mode == "task_based":
             # Task-specific routing
@@ -221,14 +466,68 @@ class VLLMRouter:
             # Single endpoint
             return self.primary_client
 
+    def _select_client(self, affinity_key: Optional[str]) -> VLLMClient:
+        """Pick a load balanced client according to the strategy."""
+        client = self._pick_client(affinity_key, time.monotonic())
+        client.stats.claim()
+        return client
+
+    def _pick_client(self, affinity_key: Optional[str], now: float) -> VLLMClient:
+        candidates = [c for c in self.clients if c.stats.is_available(now)]
+        if not candidates:
+            # Everything is ejected: fail open to the endpoint that returns first
+            return min(self.clients, key=lambda c: c.stats.ejected_until)
+
+        if self.strategy == "prefix_affinity" and affinity_key:
+            # Bounded load: skip preferred endpoints that are far busier than the rest
+            limit = min(c.stats.in_flight for c in candidates) + self.affinity_max_extra_in_flight
+            ranked = sorted(candidates, key=lambda c: self._affinity_score(affinity_key, c.base_url), reverse=True)
+            return next(c for c in ranked if c.stats.in_flight <= limit)
+
+        # Rotating start position breaks ties (and is plain round-robin)
+        with self._lock:
+            start = self._round_robin_index % len(candidates)
+            self._round_robin_index = (self._round_robin_index + 1) % len(self.clients)
+        rotated = candidates[start:] + candidates[:start]
+
+        if self.strategy == "round_robin":
+            return rotated[0]
+
+        if self.strategy == "latency_ewma":
+            known = [c.stats.ewma_latency for c in candidates if c.stats.ewma_latency is not None]
+            # Endpoints without samples are assumed to be average
+            default = sum(known) / len(known) if known else 0.0
+            return min(
+                rotated,
+                key=lambda c: (c.stats.ewma_latency if c.stats.ewma_latency is not None else default)
+                * (c.stats.in_flight + 1)
+            )
+
+        return min(rotated, key=lambda c: c.stats.in_flight)
+
+    @staticmethod
+    def _affinity_score(affinity_key: str, endpoint: str) -> int:
+        digest = hashlib.blake2b(f"{affinity_key}|{endpoint}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+    def _all_clients(self) -> List[VLLMClient]:
+        if self.mode == "load_balancing":
+            return self.clients
+        if self.mode == "task_based":
+            return [self.reasoning_client, self.coding_client]
+        return [self.primary_client]
+
     def get_load_balancing_stats(self) -> Dict[str, Any]:
         """Get load balancing statistics.
 
         Returns:
-            Dictionary with routing mode, endpoint count, and current index
+            Dictionary with routing mode, strategy, endpoint count, current
+            index and per-endpoint health/load ("endpoint_stats": in-flight
+            requests, p50/p95 latency, error rate, ejection state)
         """
         stats = {
             "mode": self.mode,
+            "strategy": self.strategy,
             "endpoint_count": 1,
             "current_index": 0
         }
@@ -237,6 +536,7 @@ class VLLMRouter:
             stats["endpoint_count"] = len(self.clients)
             stats["current_index"] = self._round_robin_index
             stats["endpoints"] = [client.base_url for client in self.clients]
+            stats["healthy_endpoints"] = sum(1 for c in self.clients if c.stats.is_available())
 
         elif self.mode == "task_based":
             stats["endpoint_count"] = 2
@@ -246,6 +546,7 @@ class VLLMRouter:
         else:
             stats["endpoint"] = self.primary_client.base_url
 
+        stats["endpoint_stats"] = [client.stats.get_stats() for client in self._all_clients()]
         return stats
 
 
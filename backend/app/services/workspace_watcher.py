@@ -0,0 +1,290 @@
+"""Workspace Watcher - 워크스페이스 변경 감시 및 실시간 재색인.
+
+활성 세션의 워크스페이스를 감시하다가 파일이 바뀌면 변경분만
+CodeIndexer(벡터DB)와 CodeGraphBuilder(Knowledge Graph)에 반영합니다.
+
+- watchdog(inotify 등)이 설치되어 있으면 OS 이벤트를 사용하고,
+  없으면 주기적으로 mtime/크기를 비교하는 폴링으로 동작합니다.
+- 이벤트는 디바운스되어 한 번에 처리되고, 갱신이 진행 중인 동안 들어온
+  이벤트는 다음 배치로 합쳐집니다 (갱신은 항상 하나만 실행).
+- 대기 경로가 너무 많으면 (예: 수천 개 파일을 바꾸는 git checkout)
+  개별 경로 대신 증분 전체 색인 한 번으로 처리합니다.
+"""
+import os
+import time
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from app.services.code_indexer import CodeIndexer, get_code_indexer
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """watchdog 이벤트를 이벤트 루프의 WorkspaceWatcher로 전달"""
+
+    def __init__(self, watcher: "WorkspaceWatcher", loop: asyncio.AbstractEventLoop):
+        super().__init__()
+        self.watcher = watcher
+        self.loop = loop
+
+    def on_any_event(self, event) -> None:
+        # 디렉토리 수정 이벤트는 하위 파일 이벤트와 중복
+        if event.is_directory and event.event_type == "modified":
+            return
+
+        paths = [event.src_path]
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            paths.append(dest_path)
+
+        try:
+            self.loop.call_soon_threadsafe(self.watcher.notify, paths)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (종료 중)
+            pass
+
+
+class WorkspaceWatcher:
+    """워크스페이스 하나를 감시하며 변경분을 디바운스해 재색인"""
+
+    def __init__(self,
+                 indexer: CodeIndexer,
+                 debounce_seconds: float = 0.5,
+                 max_delay_seconds: float = 5.0,
+                 max_pending: int = 2000,
+                 poll_interval: float = 2.0,
+                 use_watchdog: Optional[bool] = None):
+        """WorkspaceWatcher 초기화
+
+        Args:
+            indexer: 변경분을 반영할 CodeIndexer
+            debounce_seconds: 마지막 이벤트 후 이만큼 조용하면 배치 처리
+            max_delay_seconds: 이벤트가 계속 들어와도 첫 이벤트 후 이 시간이 지나면 처리
+            max_pending: 대기 경로가 이보다 많으면 증분 전체 색인으로 대체
+            poll_interval: 폴링 모드의 검사 주기 (초)
+            use_watchdog: None이면 watchdog 설치 여부로 결정
+        """
+        self.indexer = indexer
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.max_pending = max_pending
+        self.poll_interval = poll_interval
+        self.use_watchdog = WATCHDOG_AVAILABLE if use_watchdog is None else use_watchdog
+        self.logger = logging.getLogger(f"{__name__}.{indexer.session_id[:8]}")
+
+        self._pending: Set[str] = set()
+        self._overflow = False
+        self._first_event_at: Optional[float] = None
+        self._last_event_at = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: list = []
+        self._observer = None
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+
+        # 통계
+        self.batches = 0
+        self.full_reindexes = 0
+
+    @property
+    def workspace(self) -> Path:
+        """감시 중인 워크스페이스 경로"""
+        return self.indexer.workspace
+
+    @property
+    def running(self) -> bool:
+        """감시 중이면 True"""
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        """감시 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return
+
+        self._wakeup = asyncio.Event()
+        self._tasks.append(asyncio.create_task(self._process_loop(), name=f"watch_{self.indexer.session_id}"))
+
+        if self.use_watchdog:
+            handler = _ChangeHandler(self, asyncio.get_running_loop())
+            self._observer = Observer()
+            self._observer.schedule(handler, str(self.workspace), recursive=True)
+            self._observer.daemon = True
+            self._observer.start()
+            mode = "watchdog"
+        else:
+            self._snapshot = await asyncio.to_thread(self._take_snapshot)
+            self._tasks.append(asyncio.create_task(self._poll_loop(), name=f"poll_{self.indexer.session_id}"))
+            mode = f"polling every {self.poll_interval}s"
+
+        self.logger.info(f"Watching workspace {self.workspace} ({mode})")
+
+    async def stop(self) -> None:
+        """감시 중지 (진행 중인 재색인은 취소)"""
+        if self._observer is not None:
+            observer, self._observer = self._observer, None
+            observer.stop()
+            await asyncio.to_thread(observer.join, 5.0)
+
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._pending.clear()
+        self._overflow = False
+        self._first_event_at = None
+        self.logger.info(f"Stopped watching workspace {self.workspace}")
+
+    def notify(self, paths: Iterable[str]) -> None:
+        """변경된 경로를 대기열에 추가 (이벤트 루프 스레드에서 호출)
+
+        Args:
+            paths: 변경된 파일/디렉토리 경로 목록
+        """
+        added = False
+        for path in paths:
+            if not self.indexer.is_watched_path(Path(path)):
+                continue
+            added = True
+            if not self._overflow:
+                self._pending.add(str(path))
+
+        if not added:
+            return
+
+        if len(self._pending) > self.max_pending:
+            # 백프레셔: 경로 목록 대신 증분 전체 색인 한 번으로 처리
+            self._overflow = True
+            self._pending.clear()
+
+        now = time.monotonic()
+        self._last_event_at = now
+        if self._first_event_at is None:
+            self._first_event_at = now
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _process_loop(self) -> None:
+        """대기 중인 변경분을 디바운스해 한 번에 하나씩 색인"""
+        while True:
+            await self._wakeup.wait()
+            await self._wait_until_quiet()
+            self._wakeup.clear()
+
+            paths, overflow = list(self._pending), self._overflow
+            self._pending = set()
+            self._overflow = False
+            self._first_event_at = None
+            if not paths and not overflow:
+                continue
+
+            try:
+                if overflow:
+                    self.logger.info("Too many pending changes, running incremental full re-index")
+                    await self.indexer.index_project(incremental=True)
+                    self.full_reindexes += 1
+                else:
+                    await self.indexer.index_paths(paths)
+                self.batches += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"Re-indexing {len(paths)} changed paths failed: {e}")
+
+    async def _wait_until_quiet(self) -> None:
+        """마지막 이벤트 후 debounce_seconds가 지나거나 max_delay_seconds에 도달할 때까지 대기"""
+        while True:
+            now = time.monotonic()
+            quiet_at = self._last_event_at + self.debounce_seconds
+            deadline = (self._first_event_at or now) + self.max_delay_seconds
+            delay = min(quiet_at, deadline) - now
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    async def _poll_loop(self) -> None:
+        """폴링 모드: 주기적으로 스냅샷을 비교해 변경된 경로를 전달"""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                snapshot = await asyncio.to_thread(self._take_snapshot)
+            except Exception as e:
+                self.logger.warning(f"Workspace poll failed: {e}")
+                continue
+
+            previous, self._snapshot = self._snapshot, snapshot
+            changed = [path for path, state in snapshot.items() if previous.get(path) != state]
+            changed.extend(path for path in previous if path not in snapshot)
+            if changed:
+                self.notify(changed)
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """색인 대상 파일의 (mtime_ns, 크기) 스냅샷"""
+        snapshot = {}
+        for file_path in self.indexer._get_code_files():
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            snapshot[str(file_path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+# 세션별 감시기
+_watchers: Dict[str, WorkspaceWatcher] = {}
+
+
+async def start_workspace_watcher(workspace: str, session_id: str, **kwargs) -> WorkspaceWatcher:
+    """세션 워크스페이스 감시 시작 (워크스페이스가 바뀌면 기존 감시기 교체)
+
+    Args:
+        workspace: 워크스페이스 경로
+        session_id: 세션 ID
+        **kwargs: WorkspaceWatcher 옵션
+
+    Returns:
+        WorkspaceWatcher: 실행 중인 감시기
+    """
+    watcher = _watchers.get(session_id)
+    if watcher is not None:
+        if watcher.workspace == Path(workspace) and watcher.running:
+            return watcher
+        await stop_workspace_watcher(session_id)
+
+    watcher = WorkspaceWatcher(get_code_indexer(workspace, session_id), **kwargs)
+    _watchers[session_id] = watcher
+    await watcher.start()
+    return watcher
+
+
+async def stop_workspace_watcher(session_id: str) -> bool:
+    """세션 워크스페이스 감시 중지
+
+    Args:
+        session_id: 세션 ID
+
+    Returns:
+        bool: 감시 중이던 세션이면 True
+    """
+    watcher = _watchers.pop(session_id, None)
+    if watcher is None:
+        return False
+    await watcher.stop()
+    return True
+
+
+async def stop_all_watchers() -> None:
+    """모든 워크스페이스 감시 중지 (서버 종료 시)"""
+    for session_id in list(_watchers):
+        await stop_workspace_watcher(session_id)
@@ -8,7 +8,7 @@ Phase 2: Network Mode Support
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from enum import Enum
 import time
 
@@ -90,6 +90,16 @@ class BaseTool(ABC):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Whether execute_stream() yields output while the tool runs
+        self.supports_streaming = False
+
+        # Result caching (ToolExecutor): read-only tools opt in with
+        # cacheable; tools that may change files set invalidates_cache
+        # (ToolScheduler also orders them after earlier calls on their paths)
+        self.cacheable = False
+        self.cache_ttl: Optional[int] = None
+        self.invalidates_cache = False
+
     @abstractmethod
     async def execute(self, **kwargs) -> ToolResult:
         """
@@ -116,6 +126,24 @@ class BaseTool(ABC):
         """
         pass
 
+    async def execute_stream(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute the tool, yielding output as it is produced.
+
+        Streaming tools yield {"type": "output", "stream": "stdout" | "stderr",
+        "data": str} events while running. Every tool ends with a
+        {"type": "result", "result": ToolResult} event; the default
+        implementation only yields that.
+
+        Args:
+            **kwargs: Tool-specific parameters
+
+        Yields:
+            Dict: Output events, then the result event
+        """
+        result = await self.execute(**kwargs)
+        yield {"type": "result", "result": result}
+
     def get_schema(self) -> Dict:
         """
         Return JSON schema for tool parameters.
@@ -130,6 +158,38 @@ class BaseTool(ABC):
             "parameters": self.parameters
         }
 
+    def cache_dependencies(self, **kwargs) -> List[str]:
+        """
+        Files a cached result depends on.
+
+        A cached result is discarded when the mtime or size of any of these
+        paths changes. Tools without file dependencies rely on the TTL and on
+        workspace invalidation.
+
+        Args:
+            **kwargs: Tool parameters (including _workspace when given)
+
+        Returns:
+            List[str]: File or directory paths
+        """
+        return []
+
+    def access_paths(self, **kwargs) -> Optional[List[str]]:
+        """
+        Local paths a call reads or writes, for scheduling parallel calls.
+
+        Calls on disjoint paths may run concurrently even if one of them
+        changes files. None means the call may touch anything in the
+        workspace; an empty list means it touches no local files.
+
+        Args:
+            **kwargs: Tool parameters (including _workspace when given)
+
+        Returns:
+            Optional[List[str]]: Absolute file or directory paths, or None
+        """
+        return None
+
     async def _execute_with_timing(self, **kwargs) -> ToolResult:
         """
         Internal method to execute with timing.
@@ -5,13 +5,19 @@ Phase 1: ExecutePythonTool, RunTestsTool, LintCodeTool
 Phase 2.5: FormatCodeTool, ShellCommandTool, DocstringGeneratorTool
 """
 
+import os
 import subprocess
 import tempfile
 import pathlib
 import asyncio
 import logging
+import xml.etree.ElementTree as ET
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from .base import BaseTool, ToolCategory, ToolResult, NetworkType
+from .streaming import OutputBuffer, collect_stream_result, stream_output_events
+from .python_pool import PythonWorkerError, get_python_worker_pool
+from .pytest_results import build_pytest_command, failed_tests, parse_junit_xml, xdist_available
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,12 @@ class ExecutePythonTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Snippets may write files; drop cached results of the workspace
+        self.invalidates_cache = True
+
+        # Output is streamed while the process runs
+        self.supports_streaming = True
+
         self.description = "Execute Python code safely with timeout - works offline"
         self.parameters = {
             "code": {
@@ -44,6 +56,58 @@ class ExecutePythonTool(BaseTool):
         return isinstance(code, str) and len(code) > 0
 
     async def execute(self, code: str, timeout: int = 30) -> ToolResult:
+        return await collect_stream_result(self.execute_stream(code=code, timeout=timeout))
+
+    async def execute_stream(self, code: str, timeout: int = 30) -> AsyncIterator[Dict[str, Any]]:
+        pool = get_python_worker_pool()
+        if pool is None:
+            async for event in self._execute_subprocess(code, timeout):
+                yield event
+            return
+
+        stdout, stderr = OutputBuffer(), OutputBuffer()
+        outcome = None
+        try:
+            async for message in pool.execute(code, timeout):
+                if message["type"] == "output":
+                    (stdout if message["stream"] == "stdout" else stderr).append(message["data"])
+                    yield {"type": "output", "stream": message["stream"], "data": message["data"]}
+                else:
+                    outcome = message
+        except PythonWorkerError as e:
+            if stdout.total_chars or stderr.total_chars:
+                yield {"type": "result", "result": ToolResult(False, None, f"Python worker failed: {e}")}
+                return
+            # Nothing ran yet: fall back to a fresh interpreter
+            logger.warning(f"Python worker unavailable, using subprocess: {e}")
+            async for event in self._execute_subprocess(code, timeout):
+                yield event
+            return
+
+        if outcome["timed_out"]:
+            yield {"type": "result", "result": ToolResult(
+                False,
+                None,
+                f"Execution timeout ({timeout}s)"
+            )}
+            return
+
+        yield {"type": "result", "result": ToolResult(
+            success=outcome["returncode"] == 0,
+            output={
+                "stdout": stdout.getvalue(),
+                "stderr": stderr.getvalue(),
+                "returncode": outcome["returncode"]
+            },
+            metadata={
+                "code_lines": len(code.splitlines()),
+                "output_truncated": stdout.truncated or stderr.truncated,
+                "worker": "pool"
+            }
+        )}
+
+    async def _execute_subprocess(self, code: str, timeout: int) -> AsyncIterator[Dict[str, Any]]:
+        """Run code in a new python3 process (no pool, or the pool failed)"""
         temp_path = None
         try:
             # Create temporary file
@@ -56,43 +120,42 @@ class ExecutePythonTool(BaseTool):
                 f.write(code)
                 temp_path = f.name
 
-            # Execute in subprocess with timeout
+            # Execute in subprocess with timeout (-u: unbuffered, so output streams)
             process = await asyncio.create_subprocess_exec(
-                'python3', temp_path,
+                'python3', '-u', temp_path,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
 
+            stdout, stderr = OutputBuffer(), OutputBuffer()
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout
-                )
-
-                return ToolResult(
-                    success=process.returncode == 0,
-                    output={
-                        "stdout": stdout.decode('utf-8'),
-                        "stderr": stderr.decode('utf-8'),
-                        "returncode": process.returncode
-                    },
-                    metadata={
-                        "code_lines": len(code.splitlines())
-                    }
-                )
-
+                async for event in stream_output_events(process, timeout, stdout, stderr):
+                    yield event
             except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                return ToolResult(
+                yield {"type": "result", "result": ToolResult(
                     False,
                     None,
                     f"Execution timeout ({timeout}s)"
-                )
+                )}
+                return
+
+            yield {"type": "result", "result": ToolResult(
+                success=process.returncode == 0,
+                output={
+                    "stdout": stdout.getvalue(),
+                    "stderr": stderr.getvalue(),
+                    "returncode": process.returncode
+                },
+                metadata={
+                    "code_lines": len(code.splitlines()),
+                    "output_truncated": stdout.truncated or stderr.truncated,
+                    "worker": "subprocess"
+                }
+            )}
 
         except Exception as e:
             logger.error(f"Error executing Python code: {str(e)}")
-            return ToolResult(False, None, str(e))
+            yield {"type": "result", "result": ToolResult(False, None, str(e))}
 
         finally:
             # Clean up temp file
@@ -110,7 +173,13 @@ class RunTestsTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
-        self.description = "Run pytest tests on specified path - works offline"
+        # Output is streamed while the process runs
+        self.supports_streaming = True
+
+        self.description = (
+            "Run pytest tests on specified path with per-test results - works offline. "
+            "Pass changed_files to run only the tests affected by those files."
+        )
         self.parameters = {
             "test_path": {
                 "type": "string",
@@ -126,6 +195,22 @@ class RunTestsTool(BaseTool):
                 "type": "boolean",
                 "default": True,
                 "description": "Verbose output"
+            },
+            "changed_files": {
+                "type": "array",
+                "items": {"type": "string"},
+                "required": False,
+                "description": "Files changed since the last run; only tests importing them (directly or indirectly) are run, all tests if a changed file cannot be traced"
+            },
+            "fail_fast": {
+                "type": "boolean",
+                "default": False,
+                "description": "Stop at the first failing test (pytest -x)"
+            },
+            "workers": {
+                "type": "number",
+                "default": 0,
+                "description": "Parallel test workers (pytest-xdist -n); 0 runs tests in one process"
             }
         }
 
@@ -136,71 +221,144 @@ class RunTestsTool(BaseTool):
         self,
         test_path: str,
         timeout: int = 300,
-        verbose: bool = True
+        verbose: bool = True,
+        changed_files: Optional[List[str]] = None,
+        fail_fast: bool = False,
+        workers: int = 0,
+        _workspace: str = None
     ) -> ToolResult:
+        return await collect_stream_result(self.execute_stream(
+            test_path=test_path, timeout=timeout, verbose=verbose, changed_files=changed_files,
+            fail_fast=fail_fast, workers=workers, _workspace=_workspace
+        ))
+
+    async def execute_stream(
+        self,
+        test_path: str,
+        timeout: int = 300,
+        verbose: bool = True,
+        changed_files: Optional[List[str]] = None,
+        fail_fast: bool = False,
+        workers: int = 0,
+        _workspace: str = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        report_path = None
         try:
             test_file = pathlib.Path(test_path)
+            if not test_file.is_absolute() and _workspace:
+                test_file = pathlib.Path(_workspace) / test_file
 
             if not test_file.exists():
-                return ToolResult(False, None, f"Test path not found: {test_path}")
+                yield {"type": "result", "result": ToolResult(False, None, f"Test path not found: {test_path}")}
+                return
+
+            metadata: Dict[str, Any] = {"test_path": str(test_file)}
+            targets = [str(test_file)]
+
+            # Affected-test selection: only tests that import the changed files
+            if changed_files is not None:
+                from app.services.test_selection import select_affected_tests
+
+                selected = await asyncio.to_thread(
+                    select_affected_tests, _workspace or os.getcwd(), changed_files, str(test_file)
+                )
+                if selected is not None:
+                    metadata["selected_tests"] = selected
+                    if not selected:
+                        yield {"type": "result", "result": ToolResult(
+                            success=True,
+                            output=self._no_tests_output("No tests affected by the changed files"),
+                            metadata=metadata
+                        )}
+                        return
+                    targets = selected
+
+            with tempfile.NamedTemporaryFile(suffix='.xml', prefix='pytest-report-', delete=False) as f:
+                report_path = f.name
 
             # Build pytest command
-            cmd = ['pytest', str(test_file)]
-            if verbose:
-                cmd.append('-v')
-            cmd.extend(['--tb=short', '--color=yes'])
+            cmd = build_pytest_command(targets, report_path, verbose, fail_fast, workers)
+            if workers and workers > 1:
+                if xdist_available():
+                    metadata["workers"] = int(workers)
+                else:
+                    metadata["workers_ignored"] = "pytest-xdist is not installed"
 
             # Run tests
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                cwd=_workspace
             )
 
+            stdout, stderr = OutputBuffer(), OutputBuffer()
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout
-                )
-
-                output_text = stdout.decode('utf-8')
-                error_text = stderr.decode('utf-8')
-
-                # Parse results (basic parsing)
-                passed = "passed" in output_text
-                failed = "failed" in output_text
-
-                return ToolResult(
-                    success=process.returncode == 0,
-                    output={
-                        "stdout": output_text,
-                        "stderr": error_text,
-                        "passed": passed and not failed,
-                        "returncode": process.returncode
-                    },
-                    metadata={
-                        "test_path": str(test_file)
-                    }
-                )
-
+                async for event in stream_output_events(process, timeout, stdout, stderr):
+                    yield event
             except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                return ToolResult(
+                yield {"type": "result", "result": ToolResult(
                     False,
                     None,
                     f"Test execution timeout ({timeout}s)"
-                )
+                )}
+                return
+
+            # Per-test outcomes from the JUnit report (missing if pytest
+            # failed before collecting, e.g. a usage error)
+            try:
+                report = parse_junit_xml(report_path)
+            except (OSError, ET.ParseError):
+                report = {"summary": None, "tests": []}
+
+            summary = report["summary"]
+            if summary is not None:
+                # Exit code 5: no tests collected
+                passed = process.returncode in (0, 5) and summary["failed"] + summary["errors"] == 0
+            else:
+                passed = process.returncode == 0
+
+            metadata["output_truncated"] = stdout.truncated or stderr.truncated
+            yield {"type": "result", "result": ToolResult(
+                success=process.returncode == 0,
+                output={
+                    "stdout": stdout.getvalue(),
+                    "stderr": stderr.getvalue(),
+                    "passed": passed,
+                    "returncode": process.returncode,
+                    "summary": summary,
+                    "tests": report["tests"],
+                    "failed_tests": failed_tests(report["tests"])
+                },
+                metadata=metadata
+            )}
 
         except FileNotFoundError:
-            return ToolResult(
+            yield {"type": "result", "result": ToolResult(
                 False,
                 None,
                 "pytest not found. Please install pytest: pip install pytest"
-            )
+            )}
         except Exception as e:
             logger.error(f"Error running tests {test_path}: {str(e)}")
-            return ToolResult(False, None, str(e))
+            yield {"type": "result", "result": ToolResult(False, None, str(e))}
+
+        finally:
+            if report_path:
+                pathlib.Path(report_path).unlink(missing_ok=True)
+
+    @staticmethod
+    def _no_tests_output(message: str) -> Dict[str, Any]:
+        """Result output when no tests needed to run"""
+        return {
+            "stdout": message,
+            "stderr": "",
+            "passed": True,
+            "returncode": None,
+            "summary": {"total": 0, "passed": 0, "failed": 0, "errors": 0, "skipped": 0, "duration_ms": 0.0},
+            "tests": [],
+            "failed_tests": []
+        }
 
 
 class LintCodeTool(BaseTool):
@@ -222,6 +380,9 @@ class LintCodeTool(BaseTool):
             }
         }
 
+    def access_paths(self, file_path: str = "", **kwargs) -> List[str]:
+        return [str(pathlib.Path(file_path).resolve())]
+
     def validate_params(self, file_path: str, **kwargs) -> bool:
         return isinstance(file_path, str)
 
@@ -287,6 +448,9 @@ class FormatCodeTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Formatting rewrites files; drop cached results of the workspace
+        self.invalidates_cache = True
+
         self.description = "Format code using black (Python) or prettier (JS/TS) - works offline"
         self.parameters = {
             "file_path": {
@@ -306,6 +470,9 @@ class FormatCodeTool(BaseTool):
             }
         }
 
+    def access_paths(self, file_path: str = "", **kwargs) -> List[str]:
+        return [str(pathlib.Path(file_path).resolve())]
+
     def validate_params(self, file_path: str = None, **kwargs) -> bool:
         if not file_path or not isinstance(file_path, str):
             return False
@@ -446,6 +613,12 @@ class ShellCommandTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Commands may change files; drop cached results of the workspace
+        self.invalidates_cache = True
+
+        # Output is streamed while the process runs
+        self.supports_streaming = True
+
         self.description = "Execute safe shell commands with security restrictions - works offline"
         self.parameters = {
             "command": {
@@ -503,26 +676,38 @@ class ShellCommandTool(BaseTool):
         working_dir: str = None,
         timeout: int = 60
     ) -> ToolResult:
+        return await collect_stream_result(
+            self.execute_stream(command=command, working_dir=working_dir, timeout=timeout)
+        )
+
+    async def execute_stream(
+        self,
+        command: str,
+        working_dir: str = None,
+        timeout: int = 60
+    ) -> AsyncIterator[Dict[str, Any]]:
         try:
             # Security check
             is_safe, reason = self._is_command_safe(command)
             if not is_safe:
-                return ToolResult(
+                yield {"type": "result", "result": ToolResult(
                     False,
                     None,
                     f"Security check failed: {reason}"
-                )
+                )}
+                return
 
             # Validate working directory
             cwd = None
             if working_dir:
                 cwd = pathlib.Path(working_dir)
                 if not cwd.exists() or not cwd.is_dir():
-                    return ToolResult(
+                    yield {"type": "result", "result": ToolResult(
                         False,
                         None,
                         f"Working directory not found: {working_dir}"
-                    )
+                    )}
+                    return
                 cwd = str(cwd)
 
             # Execute command
@@ -533,38 +718,37 @@ class ShellCommandTool(BaseTool):
                 cwd=cwd
             )
 
+            stdout, stderr = OutputBuffer(), OutputBuffer()
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=min(timeout, 300)  # Cap at 300s
-                )
-
-                return ToolResult(
-                    success=process.returncode == 0,
-                    output={
-                        "stdout": stdout.decode('utf-8'),
-                        "stderr": stderr.decode('utf-8'),
-                        "returncode": process.returncode,
-                        "command": command
-                    },
-                    metadata={
-                        "working_dir": cwd or "current",
-                        "timeout": timeout
-                    }
-                )
-
+                # Cap at 300s
+                async for event in stream_output_events(process, min(timeout, 300), stdout, stderr):
+                    yield event
             except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                return ToolResult(
+                yield {"type": "result", "result": ToolResult(
                     False,
                     None,
                     f"Command timeout ({timeout}s): {command}"
-                )
+                )}
+                return
+
+            yield {"type": "result", "result": ToolResult(
+                success=process.returncode == 0,
+                output={
+                    "stdout": stdout.getvalue(),
+                    "stderr": stderr.getvalue(),
+                    "returncode": process.returncode,
+                    "command": command
+                },
+                metadata={
+                    "working_dir": cwd or "current",
+                    "timeout": timeout,
+                    "output_truncated": stdout.truncated or stderr.truncated
+                }
+            )}
 
         except Exception as e:
             logger.error(f"Error executing command '{command}': {str(e)}")
-            return ToolResult(False, None, str(e))
+            yield {"type": "result", "result": ToolResult(False, None, str(e))}
 
 
 class DocstringGeneratorTool(BaseTool):
@@ -596,6 +780,9 @@ class DocstringGeneratorTool(BaseTool):
             }
         }
 
+    def access_paths(self, file_path: str = "", **kwargs) -> List[str]:
+        return [str(pathlib.Path(file_path).resolve())]
+
     def validate_params(self, file_path: str = None, **kwargs) -> bool:
         if not file_path or not isinstance(file_path, str):
             return False
@@ -3,11 +3,15 @@ Tool Executor - Safe execution engine for tools with timeout and safety checks
 """
 
 import asyncio
-from typing import Dict, Optional
+import dataclasses
+import os
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 from .base import BaseTool, ToolResult
+from .performance import ResultCache, file_fingerprint, get_cache
 from .registry import ToolRegistry
+from .scheduler import ToolScheduler, classify_call
 
 logger = logging.getLogger(__name__)
 
@@ -21,19 +25,38 @@ class ToolExecutor:
     - Parameter validation
     - Error handling
     - Execution logging
+    - Result caching for read-only tools (BaseTool.cacheable), keyed by
+      workspace and invalidated by file changes and mutating tools
     """
 
-    def __init__(self, timeout: int = 30, max_memory_mb: int = 512):
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_memory_mb: int = 512,
+        cache: Optional[ResultCache] = None,
+        use_cache: bool = True,
+        max_parallel: Optional[int] = None
+    ):
         """
         Initialize tool executor.
 
         Args:
             timeout: Maximum execution time in seconds (default: 30)
             max_memory_mb: Maximum memory limit in MB (default: 512)
+            cache: Result cache (default: the shared global cache)
+            use_cache: Whether to cache results of read-only tools
+            max_parallel: Maximum concurrent calls in execute_batch
+                (default: settings.tool_max_parallel)
         """
         self.timeout = timeout
         self.max_memory_mb = max_memory_mb
         self.registry = ToolRegistry()
+        self.cache = (cache or get_cache()) if use_cache else None
+
+        if max_parallel is None:
+            from app.core.config import settings
+            max_parallel = settings.tool_max_parallel
+        self.max_parallel = max_parallel
 
     async def execute(
         self,
@@ -81,7 +104,14 @@ class ToolExecutor:
                 error=f"Parameter validation error: {str(e)}"
             )
 
+        # Serve read-only calls from the cache
+        cached, fingerprint = self.get_cached(tool, params)
+        if cached is not None:
+            logger.info(f"[{session_id}] Tool '{tool_name}' served from cache")
+            return cached
+
         # Execute with timeout
+        result = None
         try:
             result = await asyncio.wait_for(
                 tool._execute_with_timing(**params),
@@ -110,6 +140,9 @@ class ToolExecutor:
                 error=f"Execution error: {str(e)}"
             )
 
+        finally:
+            self.update_cache(tool, params, result, fingerprint)
+
     async def execute_batch(
         self,
         tool_calls: list[Dict],
@@ -118,6 +151,10 @@ class ToolExecutor:
         """
         Execute multiple tools in parallel.
 
+        Independent calls run concurrently (up to max_parallel); a call that
+        may change files waits for the earlier calls on the same paths (see
+        ToolScheduler).
+
         Args:
             tool_calls: List of {tool_name, params} dictionaries
             session_id: Session identifier
@@ -125,26 +162,108 @@ class ToolExecutor:
         Returns:
             List of ToolResults in the same order
         """
-        tasks = [
-            self.execute(call["tool_name"], call["params"], session_id)
+        calls = [
+            classify_call(self.registry.get_tool(call["tool_name"]), call["tool_name"], call["params"])
             for call in tool_calls
         ]
+        results: list[Optional[ToolResult]] = [None] * len(tool_calls)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def run_call(index: int):
+            call = tool_calls[index]
+            try:
+                result = await self.execute(call["tool_name"], call["params"], session_id)
+            except Exception as e:
+                result = ToolResult(success=False, output=None, error=str(e))
+            yield {"type": "result", "result": result}
 
-        # Convert exceptions to ToolResults
-        processed_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                processed_results.append(ToolResult(
-                    success=False,
-                    output=None,
-                    error=str(result)
-                ))
+        scheduler = ToolScheduler(self.max_parallel)
+        async for index, event in scheduler.run(calls, run_call):
+            results[index] = event["result"]
+
+        return results
+
+    def get_cached(
+        self,
+        tool: BaseTool,
+        params: Dict,
+        scope: Optional[str] = None
+    ) -> Tuple[Optional[ToolResult], Optional[Dict[str, Any]]]:
+        """
+        Look up a cached result for a read-only tool call.
+
+        Args:
+            tool: Tool to be executed
+            params: Parameters for the tool
+            scope: Workspace of the caller (e.g. the session workspace), used
+                when params name none
+
+        Returns:
+            (cached result marked with metadata["cached"], or None;
+             file fingerprint to pass to update_cache() on a miss)
+        """
+        if self.cache is None or not tool.cacheable:
+            return None, None
+
+        cached = self.cache.get(tool.name, self._cache_params(params, scope))
+        if cached is not None:
+            return dataclasses.replace(cached, metadata={**cached.metadata, "cached": True}), None
+
+        # Taken before the tool runs, so changes during the run make the entry stale
+        return None, file_fingerprint(tool.cache_dependencies(**params))
+
+    def update_cache(
+        self,
+        tool: BaseTool,
+        params: Dict,
+        result: Optional[ToolResult] = None,
+        fingerprint: Optional[Dict[str, Any]] = None,
+        scope: Optional[str] = None
+    ) -> None:
+        """
+        Cache a successful read-only result, or invalidate after a mutating tool.
+
+        Mutating tools (BaseTool.invalidates_cache) drop every cached result
+        of their workspace, whether or not they succeeded. When neither the
+        params nor the caller name a workspace, a mutating tool may have
+        changed anything, so the whole cache is dropped.
+
+        Args:
+            tool: Executed tool
+            params: Parameters the tool ran with
+            result: Result of the run (None for invalidation only)
+            fingerprint: Fingerprint returned by get_cached()
+            scope: Workspace of the caller, as passed to get_cached()
+        """
+        if self.cache is None:
+            return
+
+        if tool.invalidates_cache:
+            workspace = self._cache_scope(params, scope)
+            if workspace is None:
+                self.cache.invalidate_all()
             else:
-                processed_results.append(result)
+                self.cache.invalidate_scope(workspace)
+        elif tool.cacheable and result is not None and result.success:
+            key_params = self._cache_params(params, scope)
+            self.cache.set(
+                tool.name,
+                key_params,
+                result,
+                ttl_override=tool.cache_ttl,
+                scope=key_params["_workspace"],
+                dependencies=fingerprint
+            )
+
+    @staticmethod
+    def _cache_scope(params: Dict, scope: Optional[str] = None) -> Optional[str]:
+        """Workspace of a call: _workspace, working_dir or the caller's scope (None if unknown)"""
+        workspace = params.get("_workspace") or params.get("working_dir") or scope
+        return os.path.realpath(workspace) if workspace else None
 
-        return processed_results
+    def _cache_params(self, params: Dict, scope: Optional[str] = None) -> Dict:
+        """Parameters used as cache key (always including the workspace, else the process directory)"""
+        workspace = self._cache_scope(params, scope) or os.path.realpath(os.getcwd())
+        return {**params, "_workspace": workspace}
 
     def get_available_tools(self) -> list[str]:
         """
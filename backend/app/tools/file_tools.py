@@ -12,6 +12,17 @@ from .base import BaseTool, ToolCategory, ToolResult, NetworkType
 
 logger = logging.getLogger(__name__)
 
+# Cache lifetime of directory listings and searches (changes below the top
+# level do not touch the directory's mtime)
+LISTING_CACHE_TTL = 30
+
+
+def _resolve_path(path: str, workspace: str = None) -> str:
+    """Absolute path of a tool path argument (relative paths use the workspace)"""
+    if workspace:
+        return str((pathlib.Path(workspace) / path).resolve())
+    return str(pathlib.Path(path).resolve())
+
 
 class ReadFileTool(BaseTool):
     """Read contents of a file"""
@@ -23,6 +34,9 @@ class ReadFileTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Read-only: ToolExecutor caches results until the file changes
+        self.cacheable = True
+
         self.description = "Read contents of a file with size limits - works offline"
         self.parameters = {
             "path": {
@@ -37,6 +51,12 @@ class ReadFileTool(BaseTool):
             }
         }
 
+    def access_paths(self, path: str = "", _workspace: str = None, **kwargs) -> List[str]:
+        return [_resolve_path(path, _workspace)]
+
+    def cache_dependencies(self, **kwargs) -> List[str]:
+        return self.access_paths(**kwargs)
+
     def validate_params(self, path: str, **kwargs) -> bool:
         return isinstance(path, str) and len(path) > 0
 
@@ -105,6 +125,9 @@ class WriteFileTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Writes drop cached results of the workspace
+        self.invalidates_cache = True
+
         self.description = "Write content to a file with safety checks - works offline"
         self.parameters = {
             "path": {
@@ -124,6 +147,9 @@ class WriteFileTool(BaseTool):
             }
         }
 
+    def access_paths(self, path: str = "", _workspace: str = None, **kwargs) -> List[str]:
+        return [_resolve_path(path, _workspace)]
+
     def validate_params(self, path: str, content: str, **kwargs) -> bool:
         return isinstance(path, str) and isinstance(content, str)
 
@@ -190,6 +216,10 @@ class SearchFilesTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Read-only: ToolExecutor caches results until the directory changes
+        self.cacheable = True
+        self.cache_ttl = LISTING_CACHE_TTL
+
         self.description = "Search for files matching a glob pattern - works offline"
         self.parameters = {
             "pattern": {
@@ -209,6 +239,12 @@ class SearchFilesTool(BaseTool):
             }
         }
 
+    def access_paths(self, path: str = ".", _workspace: str = None, **kwargs) -> List[str]:
+        return [_resolve_path(path, _workspace)]
+
+    def cache_dependencies(self, **kwargs) -> List[str]:
+        return self.access_paths(**kwargs)
+
     def validate_params(self, pattern: str, **kwargs) -> bool:
         return isinstance(pattern, str) and len(pattern) > 0
 
@@ -276,6 +312,10 @@ class ListDirectoryTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Read-only: ToolExecutor caches results until the directory changes
+        self.cacheable = True
+        self.cache_ttl = LISTING_CACHE_TTL
+
         self.description = "List files and directories in a path - works offline"
         self.parameters = {
             "path": {
@@ -295,6 +335,12 @@ class ListDirectoryTool(BaseTool):
             }
         }
 
+    def access_paths(self, path: str = ".", _workspace: str = None, **kwargs) -> List[str]:
+        return [_resolve_path(path, _workspace)]
+
+    def cache_dependencies(self, **kwargs) -> List[str]:
+        return self.access_paths(**kwargs)
+
     def validate_params(self, **kwargs) -> bool:
         return True
 
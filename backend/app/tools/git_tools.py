@@ -4,12 +4,29 @@ Git Tools - Version control operations
 
 import asyncio
 import logging
+import os
 from typing import Optional, List
 
 from .base import BaseTool, ToolCategory, ToolResult, NetworkType
 
 logger = logging.getLogger(__name__)
 
+# Cache lifetime of git status (edits outside the tools do not touch .git)
+STATUS_CACHE_TTL = 10
+
+
+def _git_dir(start: Optional[str] = None) -> Optional[str]:
+    """The .git directory of the repository containing start (default: cwd)"""
+    path = os.path.abspath(start or os.getcwd())
+    while True:
+        candidate = os.path.join(path, ".git")
+        if os.path.isdir(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
 
 class GitStatusTool(BaseTool):
     """Get git repository status"""
@@ -21,9 +38,17 @@ class GitStatusTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Read-only: ToolExecutor caches results until the index or HEAD changes
+        self.cacheable = True
+        self.cache_ttl = STATUS_CACHE_TTL
+
         self.description = "Get current git repository status - works offline"
         self.parameters = {}
 
+    def cache_dependencies(self, **kwargs) -> List[str]:
+        git_dir = _git_dir()
+        return [os.path.join(git_dir, "index"), os.path.join(git_dir, "HEAD")] if git_dir else []
+
     def validate_params(self, **kwargs) -> bool:
         return True
 
@@ -173,6 +198,9 @@ class GitLogTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Read-only: ToolExecutor caches results until HEAD moves
+        self.cacheable = True
+
         self.description = "View recent git commits - works offline"
         self.parameters = {
             "max_count": {
@@ -182,6 +210,10 @@ class GitLogTool(BaseTool):
             }
         }
 
+    def cache_dependencies(self, **kwargs) -> List[str]:
+        git_dir = _git_dir()
+        return [os.path.join(git_dir, "HEAD"), os.path.join(git_dir, "logs", "HEAD")] if git_dir else []
+
     def validate_params(self, **kwargs) -> bool:
         return True
 
@@ -292,6 +324,9 @@ class GitCommitTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Commits drop cached results of the workspace
+        self.invalidates_cache = True
+
         self.description = "Create a git commit with staged or specified files - works offline"
         self.parameters = {
             "message": {
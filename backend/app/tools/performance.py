@@ -13,10 +13,11 @@ import asyncio
 import hashlib
 import json
 import logging
+import os
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
@@ -316,6 +317,7 @@ class ResultCache:
     - TTL (time-to-live) support
     - Configurable max size
     - Cache key generation from params
+    - Invalidation by tool, by scope (e.g. workspace) and by file changes
 
     Usage:
         cache = ResultCache(max_size=100, ttl_seconds=300)
@@ -328,8 +330,9 @@ class ResultCache:
         # Execute tool
         result = await tool.execute(...)
 
-        # Cache result
-        cache.set("tool_name", {"param": "value"}, result)
+        # Cache result; it is dropped when one of the files changes
+        cache.set("tool_name", {"param": "value"}, result,
+                  scope="/workspace", dependencies=file_fingerprint(paths))
     """
 
     def __init__(
@@ -341,16 +344,19 @@ class ResultCache:
         self._max_size = max_size
         self._ttl_seconds = ttl_seconds
         self._enabled = enabled
-        self._cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        # key -> (result, timestamp, scope, dependency fingerprint)
+        self._cache: OrderedDict[str, Tuple[Any, float, Optional[str], Dict[str, Any]]] = OrderedDict()
         self._hits = 0
         self._misses = 0
+        self._invalidations = 0
 
     def _make_key(self, tool_name: str, params: Dict[str, Any]) -> str:
         """Generate cache key from tool name and parameters"""
         # Sort params for consistent key generation
         sorted_params = json.dumps(params, sort_keys=True, default=str)
         key_string = f"{tool_name}:{sorted_params}"
-        return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+        # Readable tool prefix so invalidate(tool_name) can match entries
+        return f"{tool_name}:{hashlib.sha256(key_string.encode()).hexdigest()[:16]}"
 
     def _is_expired(self, timestamp: float) -> bool:
         """Check if cache entry is expired"""
@@ -365,7 +371,7 @@ class ResultCache:
             params: Tool execution parameters
 
         Returns:
-            Cached result or None if not found/expired
+            Cached result or None if not found/expired/stale
         """
         if not self._enabled:
             return None
@@ -376,7 +382,7 @@ class ResultCache:
             self._misses += 1
             return None
 
-        result, timestamp = self._cache[key]
+        result, timestamp, _, dependencies = self._cache[key]
 
         # Check expiration
         if self._is_expired(timestamp):
@@ -384,6 +390,14 @@ class ResultCache:
             self._misses += 1
             return None
 
+        # Check the files the result was computed from
+        if dependencies and file_fingerprint(dependencies) != dependencies:
+            del self._cache[key]
+            self._misses += 1
+            self._invalidations += 1
+            logger.debug(f"Cache entry for {tool_name} is stale (files changed)")
+            return None
+
         # Move to end (most recently used)
         self._cache.move_to_end(key)
         self._hits += 1
@@ -396,7 +410,9 @@ class ResultCache:
         tool_name: str,
         params: Dict[str, Any],
         result: Any,
-        ttl_override: Optional[int] = None
+        ttl_override: Optional[int] = None,
+        scope: Optional[str] = None,
+        dependencies: Optional[Dict[str, Any]] = None
     ):
         """
         Cache a result.
@@ -406,6 +422,9 @@ class ResultCache:
             params: Tool execution parameters
             result: Result to cache
             ttl_override: Optional TTL override for this entry
+            scope: Optional scope (e.g. workspace path) for invalidate_scope()
+            dependencies: Optional file_fingerprint() taken before the tool ran;
+                the entry is dropped once any of these files changes
         """
         if not self._enabled:
             return
@@ -426,27 +445,71 @@ class ResultCache:
             # Adjust timestamp for custom TTL
             timestamp = time.time() - (self._ttl_seconds - ttl_override)
 
-        self._cache[key] = (result, timestamp)
+        self._cache[key] = (result, timestamp, scope, dict(dependencies or {}))
         logger.debug(f"Cached result for {tool_name}")
 
-    def invalidate(self, tool_name: str, params: Optional[Dict[str, Any]] = None):
+    def invalidate(self, tool_name: str, params: Optional[Dict[str, Any]] = None) -> int:
         """
         Invalidate cache entries.
 
         Args:
             tool_name: Name of the tool
             params: If provided, invalidate specific entry; otherwise invalidate all for tool
+
+        Returns:
+            Number of entries removed
         """
         if params:
             key = self._make_key(tool_name, params)
-            if key in self._cache:
-                del self._cache[key]
+            keys_to_remove = [key] if key in self._cache else []
         else:
             # Remove all entries for this tool
-            prefix = hashlib.sha256(f"{tool_name}:".encode()).hexdigest()[:8]
+            prefix = f"{tool_name}:"
             keys_to_remove = [k for k in self._cache if k.startswith(prefix)]
-            for key in keys_to_remove:
-                del self._cache[key]
+        return self._remove(keys_to_remove)
+
+    def invalidate_scope(self, scope: str) -> int:
+        """
+        Invalidate all entries cached under a scope.
+
+        Path scopes overlap: invalidating a directory also removes entries
+        of its subdirectories and of the directories containing it.
+
+        Args:
+            scope: Scope passed to set() (e.g. workspace path)
+
+        Returns:
+            Number of entries removed
+        """
+        keys_to_remove = [
+            k for k, entry in self._cache.items()
+            if entry[2] is not None and paths_overlap(entry[2], scope)
+        ]
+        removed = self._remove(keys_to_remove)
+        if removed:
+            logger.debug(f"Invalidated {removed} cached results for {scope}")
+        return removed
+
+    def invalidate_all(self) -> int:
+        """
+        Invalidate every entry (e.g. after a change of unknown extent).
+
+        Unlike clear(), removed entries count as invalidations.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = self._remove(list(self._cache))
+        if removed:
+            logger.debug(f"Invalidated all {removed} cached results")
+        return removed
+
+    def _remove(self, keys: List[str]) -> int:
+        """Delete entries and count them as invalidations"""
+        for key in keys:
+            del self._cache[key]
+        self._invalidations += len(keys)
+        return len(keys)
 
     def clear(self):
         """Clear all cached entries"""
@@ -465,10 +528,37 @@ class ResultCache:
             "ttl_seconds": self._ttl_seconds,
             "hits": self._hits,
             "misses": self._misses,
+            "invalidations": self._invalidations,
             "hit_rate_percent": round(hit_rate, 1)
         }
 
 
+def paths_overlap(a: str, b: str) -> bool:
+    """Whether two paths are equal or one contains the other"""
+    a, b = a.rstrip(os.sep) or os.sep, b.rstrip(os.sep) or os.sep
+    return a == b or a.startswith(b.rstrip(os.sep) + os.sep) or b.startswith(a.rstrip(os.sep) + os.sep)
+
+
+def file_fingerprint(paths: Iterable[str]) -> Dict[str, Optional[Tuple[int, int]]]:
+    """
+    Snapshot (mtime_ns, size) of files for cache validation.
+
+    Args:
+        paths: File or directory paths
+
+    Returns:
+        Dict of path -> (mtime_ns, size), or None for missing paths
+    """
+    fingerprint: Dict[str, Optional[Tuple[int, int]]] = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            fingerprint[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            fingerprint[path] = None
+    return fingerprint
+
+
 # =============================================================================
 # Global Instances
 # =============================================================================
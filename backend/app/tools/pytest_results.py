@@ -0,0 +1,140 @@
+"""
+Structured pytest results - per-test outcomes from pytest's JUnit XML report
+
+RunTestsTool and the QA gate run pytest with --junitxml (xunit1 family,
+which records the test file) and parse the report here, so pass/fail comes
+from the actual per-test outcomes rather than from matching words in the
+console output.
+Test entries use the TestResult shape of the LangGraph workflow state
+(test_name, passed, duration_ms, error_message, coverage_percent).
+"""
+
+import importlib.util
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List
+
+# pytest options that make the JUnit report include the test file
+JUNIT_OPTIONS = ["-o", "junit_family=xunit1"]
+
+# Characters of a failure's details kept per test
+MAX_ERROR_CHARS = 2000
+
+
+def xdist_available() -> bool:
+    """Whether pytest-xdist is installed (parallel workers with -n)"""
+    return importlib.util.find_spec("xdist") is not None
+
+
+def build_pytest_command(
+    targets: List[str],
+    report_path: str,
+    verbose: bool = True,
+    fail_fast: bool = False,
+    workers: int = 0,
+    color: bool = True
+) -> List[str]:
+    """
+    Build a pytest command line that writes a JUnit report.
+
+    Args:
+        targets: Test files, directories or node IDs
+        report_path: Where pytest writes the JUnit XML report
+        verbose: Add -v
+        fail_fast: Stop at the first failure (-x)
+        workers: pytest-xdist worker count; ignored unless > 1 and xdist is installed
+        color: Force colored console output
+
+    Returns:
+        Command arguments
+    """
+    # python -m puts the working directory (the project root) on sys.path
+    cmd = ['python3', '-m', 'pytest', *targets]
+    if verbose:
+        cmd.append('-v')
+    if fail_fast:
+        cmd.append('-x')
+    if workers and workers > 1 and xdist_available():
+        cmd.extend(['-n', str(int(workers))])
+    cmd.extend(['--tb=short', '--color=yes' if color else '--color=no'])
+    cmd.extend([f'--junitxml={report_path}', *JUNIT_OPTIONS])
+    return cmd
+
+
+def parse_junit_xml(path: str) -> Dict[str, Any]:
+    """
+    Parse a pytest JUnit XML report.
+
+    Args:
+        path: Report file written by pytest --junitxml
+
+    Returns:
+        {"summary": {total, passed, failed, errors, skipped, duration_ms},
+         "tests": [{"test_name", "outcome", "passed", "duration_ms",
+                    "error_message", "coverage_percent"}, ...]}
+
+    Raises:
+        ET.ParseError: If the report is not valid XML
+        OSError: If the report cannot be read
+    """
+    root = ET.parse(path).getroot()
+    tests: List[Dict[str, Any]] = []
+    summary = {"total": 0, "passed": 0, "failed": 0, "errors": 0, "skipped": 0, "duration_ms": 0.0}
+
+    for case in root.iter("testcase"):
+        outcome, error_message = "passed", None
+        for child in case:
+            if child.tag in ("failure", "error"):
+                outcome = "failed" if child.tag == "failure" else "error"
+                error_message = _error_text(child)
+                break
+            if child.tag == "skipped":
+                outcome = "skipped"
+                error_message = child.get("message")
+
+        duration_ms = round(float(case.get("time") or 0) * 1000, 3)
+        tests.append({
+            "test_name": _node_id(case),
+            "outcome": outcome,
+            "passed": outcome in ("passed", "skipped"),
+            "duration_ms": duration_ms,
+            "error_message": error_message,
+            "coverage_percent": None,
+        })
+
+        summary["total"] += 1
+        summary["errors" if outcome == "error" else outcome] += 1
+        summary["duration_ms"] += duration_ms
+
+    summary["duration_ms"] = round(summary["duration_ms"], 3)
+    return {"summary": summary, "tests": tests}
+
+
+def failed_tests(tests: List[Dict[str, Any]]) -> List[str]:
+    """Node IDs of failed or erroring tests (for re-running with pytest)"""
+    return [test["test_name"] for test in tests if not test["passed"]]
+
+
+def _node_id(case: ET.Element) -> str:
+    """pytest node ID (file::Class::test) of a testcase element"""
+    name = case.get("name", "")
+    classname = case.get("classname", "")
+    file = case.get("file")
+    if not file:
+        return f"{classname}::{name}" if classname else name
+
+    module = file[:-3].replace("/", ".").replace("\\", ".") if file.endswith(".py") else file
+    classes = classname[len(module) + 1:].split(".") if classname.startswith(module + ".") else []
+    return "::".join([file, *[c for c in classes if c], name])
+
+
+def _error_text(element: ET.Element) -> str:
+    """Failure message followed by the (truncated) details"""
+    message = element.get("message") or ""
+    details = (element.text or "").strip()
+    if details and details != message:
+        text = f"{message}\n{details}" if message else details
+    else:
+        text = message
+    if len(text) > MAX_ERROR_CHARS:
+        text = text[:MAX_ERROR_CHARS] + "\n... [truncated]"
+    return text
@@ -0,0 +1,319 @@
+"""
+Python Worker Pool - warm interpreters for ExecutePythonTool
+
+Keeps a few python_worker.py processes running with the configured modules
+already imported. Each run is forked from a warm worker (fresh state, own
+resource limits), so the agent's edit-run loop does not pay interpreter
+startup and import costs on every snippet. Workers are recycled after
+max_executions runs or when they stop responding.
+
+POSIX only (the worker forks); get_python_worker_pool() returns None
+elsewhere or when the pool is disabled.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import pathlib
+import signal
+import sys
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = str(pathlib.Path(__file__).with_name("python_worker.py"))
+
+# Extra seconds the pool waits for a worker beyond the run timeout
+WORKER_GRACE_SECONDS = 5.0
+
+# Max wait for a worker to import its preload modules
+WORKER_STARTUP_TIMEOUT = 60.0
+
+# Max size of one protocol line (an output chunk, JSON-encoded)
+PROTOCOL_LINE_LIMIT = 1024 * 1024
+
+
+class PythonWorkerError(Exception):
+    """A worker failed to start or stopped responding"""
+
+
+class _Worker:
+    """One warm worker process"""
+
+    def __init__(self, process: asyncio.subprocess.Process, preloaded: List[str]):
+        self.process = process
+        self.preloaded = preloaded
+        self.executions = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    async def stop(self) -> None:
+        """Stop the worker (it kills a running snippet first) and reap it"""
+        if self.alive:
+            try:
+                self.process.send_signal(signal.SIGTERM)
+                await asyncio.wait_for(self.process.wait(), WORKER_GRACE_SECONDS)
+            except ProcessLookupError:
+                pass
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        # Close the pipe transports while the loop is still running
+        transport = getattr(self.process, "_transport", None)
+        if transport is not None:
+            transport.close()
+
+
+class PythonWorkerPool:
+    """
+    Pool of warm, resource-limited Python worker processes.
+
+    Features:
+    - Workers started lazily (or ahead of time with start()), up to size
+    - Per-run timeout and address-space limit, enforced in the worker
+    - Recycling after max_executions runs, on crash or on abandoned runs
+    - Statistics for monitoring (get_stats)
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_executions: int = 100,
+        memory_limit_mb: int = 1024,
+        preload_modules: Optional[List[str]] = None,
+        python: str = "python3"
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Maximum number of workers (and concurrent runs)
+            max_executions: Runs after which a worker is replaced
+            memory_limit_mb: Address-space limit per run (0 = unlimited)
+            preload_modules: Modules each worker imports once at startup
+            python: Interpreter used for workers
+        """
+        self.size = size
+        self.max_executions = max_executions
+        self.memory_limit_mb = memory_limit_mb
+        self.preload_modules = list(preload_modules or [])
+        self.python = python
+
+        self._idle: List[_Worker] = []
+        self._workers = 0
+        self._busy = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+        self._stopping: Set[asyncio.Future] = set()
+
+        self.stats = {
+            "executions": 0,
+            "started": 0,
+            "recycles": 0,
+            "crashes": 0,
+            "timeouts": 0,
+        }
+
+    async def start(self) -> None:
+        """Start all workers ahead of the first run"""
+        self._bind_loop()
+        self._closed = False
+        missing = self.size - self._workers
+        results = await asyncio.gather(
+            *(self._spawn() for _ in range(missing)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, _Worker):
+                self._idle.append(result)
+            else:
+                logger.warning(f"Python worker failed to start: {result}")
+
+    async def execute(
+        self,
+        code: str,
+        timeout: float = 30,
+        memory_limit_mb: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run code in a warm worker, yielding output as it arrives.
+
+        Args:
+            code: Python source to run as __main__
+            timeout: Maximum run time in seconds
+            memory_limit_mb: Override of the pool's per-run memory limit
+
+        Yields:
+            {"type": "output", "stream": "stdout" | "stderr", "data": str} events,
+            then {"type": "result", "returncode": int, "timed_out": bool}
+
+        Raises:
+            PythonWorkerError: If no worker could run the code
+        """
+        self._bind_loop()
+        await self._slots.acquire()
+        self._busy += 1
+        worker = None
+        healthy = False
+        try:
+            worker = self._idle.pop() if self._idle else await self._spawn()
+            request = {
+                "code": code,
+                "timeout": timeout,
+                "memory_mb": self.memory_limit_mb if memory_limit_mb is None else memory_limit_mb,
+            }
+            worker.process.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+            await worker.process.stdin.drain()
+
+            while True:
+                line = await asyncio.wait_for(
+                    worker.process.stdout.readline(), timeout + WORKER_GRACE_SECONDS
+                )
+                if not line:
+                    raise PythonWorkerError(f"worker exited with code {worker.process.returncode}")
+                message = json.loads(line)
+                if message["type"] == "result":
+                    worker.executions += 1
+                    self.stats["executions"] += 1
+                    if message.get("timed_out"):
+                        self.stats["timeouts"] += 1
+                    healthy = True
+                    yield message
+                    return
+                yield message
+
+        except (asyncio.TimeoutError, ConnectionError, OSError, ValueError) as e:
+            self.stats["crashes"] += 1
+            raise PythonWorkerError(str(e) or type(e).__name__) from e
+        except PythonWorkerError:
+            self.stats["crashes"] += 1
+            raise
+
+        finally:
+            self._busy -= 1
+            if worker is not None:
+                self._release(worker, healthy)
+            self._slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dict with size, worker counts, utilization and counters
+        """
+        return {
+            "size": self.size,
+            "workers": self._workers,
+            "busy": self._busy,
+            "idle": len(self._idle),
+            "utilization": round(self._busy / self.size, 3) if self.size else 0.0,
+            "max_executions": self.max_executions,
+            "memory_limit_mb": self.memory_limit_mb,
+            "preload_modules": self.preload_modules,
+            **self.stats,
+        }
+
+    async def close(self) -> None:
+        """Stop all idle workers (busy ones stop when their run ends)"""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        self._workers -= len(idle)
+        await asyncio.gather(*(worker.stop() for worker in idle), *self._stopping)
+
+    def _bind_loop(self) -> None:
+        """Tie the pool to the running loop; workers from another loop are dropped"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        for worker in self._idle:
+            # Transports belong to the old loop; signal the process directly
+            try:
+                os.kill(worker.process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        self._idle.clear()
+        self._stopping = set()
+        self._workers = 0
+        self._busy = 0
+        self._slots = asyncio.Semaphore(max(self.size, 1))
+        self._loop = loop
+
+    async def _spawn(self) -> _Worker:
+        """Start a worker and wait until its preload modules are imported"""
+        self._workers += 1
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.python, WORKER_SCRIPT, *self.preload_modules,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=PROTOCOL_LINE_LIMIT
+            )
+            line = await asyncio.wait_for(process.stdout.readline(), WORKER_STARTUP_TIMEOUT)
+            ready = json.loads(line) if line else {}
+        except BaseException as e:
+            self._workers -= 1
+            if process is not None and process.returncode is None:
+                process.kill()  # timed out or cancelled while starting
+            if isinstance(e, Exception):
+                raise PythonWorkerError(f"worker failed to start: {e}") from e
+            raise
+
+        if ready.get("type") != "ready":
+            self._workers -= 1
+            process.kill()
+            raise PythonWorkerError(f"worker failed to start (exit code {process.returncode})")
+
+        if ready.get("failed"):
+            logger.warning(f"Python worker could not preload: {', '.join(ready['failed'])}")
+        self.stats["started"] += 1
+        return _Worker(process, ready.get("preloaded", []))
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        """Return a worker to the pool, or replace it"""
+        if healthy and worker.alive and worker.executions < self.max_executions and not self._closed:
+            self._idle.append(worker)
+            return
+        self._workers -= 1
+        self.stats["recycles"] += 1
+        task = asyncio.ensure_future(worker.stop())
+        self._stopping.add(task)
+        task.add_done_callback(self._stopping.discard)
+
+
+# Global pool instance
+_python_worker_pool: Optional[PythonWorkerPool] = None
+_pool_configured = False
+
+
+def get_python_worker_pool() -> Optional[PythonWorkerPool]:
+    """
+    Get the global Python worker pool (configured from settings).
+
+    Returns:
+        PythonWorkerPool, or None if disabled or not supported on this platform
+    """
+    global _python_worker_pool, _pool_configured
+    if not _pool_configured:
+        _pool_configured = True
+        from app.core.config import settings
+
+        if settings.python_worker_pool_size > 0 and hasattr(os, "fork") and sys.platform != "win32":
+            _python_worker_pool = PythonWorkerPool(
+                size=settings.python_worker_pool_size,
+                max_executions=settings.python_worker_max_executions,
+                memory_limit_mb=settings.python_worker_memory_mb,
+                preload_modules=settings.python_worker_preload_list
+            )
+    return _python_worker_pool
+
+
+async def close_python_worker_pool() -> None:
+    """Stop the global pool's workers (application shutdown)"""
+    if _python_worker_pool is not None:
+        await _python_worker_pool.close()
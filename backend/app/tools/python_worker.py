@@ -0,0 +1,218 @@
+"""
+Warm Python worker for ExecutePythonTool (run as a standalone script)
+
+Imports the preload modules once, then forks a child for every snippet, so
+runs start from a warm interpreter but never share state. Each child gets
+its own process group, resource limits and stdout/stderr pipes; the worker
+relays output as it arrives and enforces the timeout.
+
+Usage:
+    python3 python_worker.py [preload_module ...]
+
+Protocol (JSON lines; requests on stdin, messages on stdout):
+    <- {"type": "ready", "preloaded": [...], "failed": [...]}
+    -> {"code": str, "timeout": float, "memory_mb": int}
+    <- {"type": "output", "stream": "stdout" | "stderr", "data": str}  (repeated)
+    <- {"type": "result", "returncode": int, "timed_out": bool}
+
+Only the standard library is used here.
+"""
+
+import codecs
+import importlib
+import json
+import linecache
+import os
+import select
+import signal
+import sys
+import tempfile
+import time
+import traceback
+
+READ_CHUNK_SIZE = 8192
+SNIPPET_FILENAME = "<execute_python>"
+
+# Process group of the running snippet (killed if the worker is terminated)
+_current_pgid = None
+
+
+def _send(proto, message: dict) -> None:
+    proto.write(json.dumps(message) + "\n")
+    proto.flush()
+
+
+def _kill_group(pgid: int) -> None:
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _on_terminate(signum, frame):
+    if _current_pgid is not None:
+        _kill_group(_current_pgid)
+    os._exit(0)
+
+
+def _apply_limits(memory_mb: int, timeout: float) -> None:
+    """Resource limits for the snippet process"""
+    import resource
+
+    limits = [(resource.RLIMIT_CPU, int(timeout) + 1)]
+    if memory_mb:
+        limits.append((resource.RLIMIT_AS, memory_mb * 1024 * 1024))
+    for kind, value in limits:
+        try:
+            _, hard = resource.getrlimit(kind)
+            if hard != resource.RLIM_INFINITY:
+                value = min(value, hard)
+            resource.setrlimit(kind, (value, hard if kind == resource.RLIMIT_CPU else value))
+        except (ValueError, OSError):
+            pass
+
+
+def _run_snippet(code: str) -> int:
+    """Execute the snippet like `python3 file.py` and return the exit status"""
+    linecache.cache[SNIPPET_FILENAME] = (len(code), None, code.splitlines(True), SNIPPET_FILENAME)
+    sys.argv = [SNIPPET_FILENAME]
+    # Like `python3 /tmp/file.py`: the script directory, not this one, is
+    # first on the path, so snippets can't import the backend's modules
+    sys.path[0] = tempfile.gettempdir()
+    namespace = {"__name__": "__main__", "__file__": SNIPPET_FILENAME, "__builtins__": __builtins__}
+    try:
+        exec(compile(code, SNIPPET_FILENAME, "exec"), namespace)
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException as e:
+        # Skip this frame so the traceback starts in the snippet
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        return 1
+
+
+def _execute(request: dict, proto, proto_fd: int) -> None:
+    global _current_pgid
+
+    timeout = float(request.get("timeout") or 30)
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.setpgid(0, 0)
+            for fd in (out_r, err_r, proto_fd):
+                os.close(fd)
+            null = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(null, 0)
+            os.dup2(out_w, 1)
+            os.dup2(err_w, 2)
+            sys.stdin = open(os.devnull)
+            # The pipes are not terminals: without this, output would only
+            # arrive when the buffer fills or the snippet exits
+            sys.stdout.reconfigure(line_buffering=True)
+            sys.stderr.reconfigure(line_buffering=True)
+            _apply_limits(int(request.get("memory_mb") or 0), timeout)
+            status = _run_snippet(request.get("code", ""))
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except Exception:
+                    pass
+            os._exit(status if isinstance(status, int) and 0 <= status < 256 else 1)
+
+    _current_pgid = pid
+    try:
+        os.setpgid(pid, pid)
+    except OSError:
+        pass  # child already did it (or exited)
+    os.close(out_w)
+    os.close(err_w)
+
+    streams = {
+        out_r: ("stdout", codecs.getincrementaldecoder("utf-8")(errors="replace")),
+        err_r: ("stderr", codecs.getincrementaldecoder("utf-8")(errors="replace")),
+    }
+    open_fds = [out_r, err_r]
+    deadline = time.monotonic() + timeout
+    timed_out = False
+
+    while open_fds:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            timed_out = True
+            break
+        ready, _, _ = select.select(open_fds, [], [], remaining)
+        for fd in ready:
+            data = os.read(fd, READ_CHUNK_SIZE)
+            name, decoder = streams[fd]
+            if data:
+                text = decoder.decode(data)
+            else:
+                text = decoder.decode(b"", final=True)
+                open_fds.remove(fd)
+            if text:
+                _send(proto, {"type": "output", "stream": name, "data": text})
+
+    # Output closed; give the process until the deadline to exit
+    while not timed_out:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            break
+        if time.monotonic() >= deadline:
+            timed_out = True
+            break
+        time.sleep(0.005)
+
+    if timed_out:
+        _kill_group(pid)
+        _, status = os.waitpid(pid, 0)
+    else:
+        _kill_group(pid)  # background processes the snippet left behind
+
+    _current_pgid = None
+    for fd in (out_r, err_r):
+        os.close(fd)
+
+    _send(proto, {
+        "type": "result",
+        "returncode": -9 if timed_out else os.waitstatus_to_exitcode(status),
+        "timed_out": timed_out
+    })
+
+
+def main() -> None:
+    # Messages go to the original stdout; anything else printed by the
+    # worker (or a preloaded module) is discarded.
+    proto_fd = os.dup(1)
+    proto = os.fdopen(proto_fd, "w", encoding="utf-8")
+    null = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(null, 1)
+    os.close(null)
+
+    signal.signal(signal.SIGTERM, _on_terminate)
+
+    preloaded, failed = [], []
+    for name in sys.argv[1:]:
+        try:
+            importlib.import_module(name)
+            preloaded.append(name)
+        except Exception:
+            failed.append(name)
+    # Don't let forked snippets inherit buffered preload output
+    sys.stdout.flush()
+    _send(proto, {"type": "ready", "preloaded": preloaded, "failed": failed})
+
+    for line in sys.stdin:
+        if line.strip():
+            _execute(json.loads(line), proto, proto_fd)
+
+
+if __name__ == "__main__":
+    main()
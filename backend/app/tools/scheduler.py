@@ -0,0 +1,161 @@
+"""
+Tool Scheduler - dependency-aware parallel execution of tool calls
+
+A model turn (or an API batch) often contains several independent calls,
+e.g. reading three files. The scheduler runs those concurrently while keeping
+the effects of the original order:
+
+- Read-only calls run in parallel with each other
+- A call that may change files (BaseTool.invalidates_cache) waits for every
+  earlier call touching an overlapping path, and later calls on those paths
+  wait for it
+- Calls without known paths (shell commands, git, unknown or meta tools)
+  conflict with everything on the mutating side
+
+At most max_concurrency calls run at once. Events are yielded as they are
+produced, tagged with the call's index, so callers can stream per-call
+completion and still put results back in the original order.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from .base import BaseTool
+from .performance import paths_overlap
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of one call's events on the shared queue
+_CALL_DONE = object()
+
+
+@dataclass
+class ScheduledCall:
+    """A tool call classified for scheduling"""
+    tool_name: str
+    mutating: bool
+    paths: Optional[List[str]] = None  # None: may touch anything
+
+    def conflicts_with(self, other: "ScheduledCall") -> bool:
+        """Whether the two calls must keep their relative order"""
+        if not (self.mutating or other.mutating):
+            return False
+        if self.paths is None or other.paths is None:
+            return True
+        return any(paths_overlap(a, b) for a in self.paths for b in other.paths)
+
+
+def classify_call(tool: Optional[BaseTool], tool_name: str, params: Dict[str, Any]) -> ScheduledCall:
+    """
+    Classify a tool call as read-only or mutating and find its paths.
+
+    Args:
+        tool: Registered tool, or None for meta/unknown tools (run exclusively)
+        tool_name: Name of the tool
+        params: Parameters the tool will run with
+
+    Returns:
+        ScheduledCall
+    """
+    if tool is None:
+        return ScheduledCall(tool_name, mutating=True)
+
+    try:
+        paths = tool.access_paths(**params)
+    except Exception as e:
+        logger.debug(f"Could not determine paths of {tool_name}: {e}")
+        paths = None
+    return ScheduledCall(tool_name, mutating=tool.invalidates_cache, paths=paths)
+
+
+class ToolScheduler:
+    """
+    Runs classified tool calls concurrently, respecting their conflicts.
+
+    Usage:
+        scheduler = ToolScheduler(max_concurrency=4)
+        calls = [classify_call(tool, name, params) for ...]
+
+        async for index, event in scheduler.run(calls, run_call):
+            ...  # events of call `index`, in the order run_call(index) yields them
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of calls running at once (min 1)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+
+    def plan(self, calls: List[ScheduledCall]) -> List[Set[int]]:
+        """
+        Compute which earlier calls each call has to wait for.
+
+        Args:
+            calls: Calls in their original order
+
+        Returns:
+            List[Set[int]]: Indices of the conflicting earlier calls, per call
+        """
+        return [
+            {j for j in range(i) if call.conflicts_with(calls[j])}
+            for i, call in enumerate(calls)
+        ]
+
+    async def run(
+        self,
+        calls: List[ScheduledCall],
+        run_call: Callable[[int], AsyncIterator[Dict[str, Any]]]
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Run calls, yielding their events as they are produced.
+
+        Args:
+            calls: Calls in their original order
+            run_call: Returns the event stream of call i; the call is complete
+                when the stream ends
+
+        Yields:
+            (call index, event) tuples
+
+        Raises:
+            Exception: The first exception raised by a call's stream
+                (the remaining calls are cancelled)
+        """
+        dependencies = self.plan(calls)
+        done = [asyncio.Event() for _ in calls]
+        slots = asyncio.Semaphore(self.max_concurrency)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def worker(index: int) -> None:
+            try:
+                for dependency in dependencies[index]:
+                    await done[dependency].wait()
+                async with slots:
+                    async for event in run_call(index):
+                        await queue.put((index, event))
+            except Exception as e:
+                await queue.put((index, e))
+            finally:
+                done[index].set()
+                await queue.put((index, _CALL_DONE))
+
+        tasks = [asyncio.ensure_future(worker(i)) for i in range(len(calls))]
+        remaining = len(calls)
+        try:
+            while remaining:
+                index, event = await queue.get()
+                if event is _CALL_DONE:
+                    remaining -= 1
+                elif isinstance(event, Exception):
+                    raise event
+                else:
+                    yield index, event
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -28,6 +28,9 @@ class CodeSearchTool(BaseTool):
         self.requires_network = False
         self.network_type = NetworkType.LOCAL
 
+        # Read-only: ToolExecutor caches results until the index is rewritten
+        self.cacheable = True
+
         self.description = "Semantic search across codebase using RAG (ChromaDB vector database) - works offline"
         self.parameters = {
             "query": {
@@ -90,6 +93,10 @@ class CodeSearchTool(BaseTool):
 
         return self._embedder
 
+    def cache_dependencies(self, **kwargs) -> List[str]:
+        # ChromaDB persists collections in this SQLite file
+        return [os.path.join(self.chroma_path, "chroma.sqlite3")]
+
     def validate_params(self, **kwargs) -> bool:
         """Validate search parameters"""
         if "query" not in kwargs or not kwargs["query"]:
@@ -0,0 +1,201 @@
+"""
+Streaming subprocess output - incremental stdout/stderr with bounded retention
+
+Used by ShellCommandTool, ExecutePythonTool, RunTestsTool and /api/shell/execute:
+- stream_process_output(): yields output chunks as the process produces them
+- OutputBuffer: keeps the head and a ring-buffer tail of a stream, so the
+  final result (what is fed back to the LLM) stays bounded however chatty
+  the command is
+"""
+
+import asyncio
+import codecs
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, Tuple, Any
+
+from .base import ToolResult
+
+# Bytes read from a pipe at a time
+READ_CHUNK_SIZE = 8192
+
+# Characters of a stream retained for the final result (head + tail)
+OUTPUT_HEAD_CHARS = 8000
+OUTPUT_TAIL_CHARS = 24000
+
+
+class OutputBuffer:
+    """
+    Bounded text buffer for one output stream.
+
+    Keeps the first head_chars characters and a ring buffer of the last
+    tail_chars characters; anything in between is counted and dropped.
+    """
+
+    def __init__(self, head_chars: int = OUTPUT_HEAD_CHARS, tail_chars: int = OUTPUT_TAIL_CHARS):
+        self.head_chars = head_chars
+        self.tail_chars = tail_chars
+        self.total_chars = 0
+        self.dropped_chars = 0
+        self._head: List[str] = []
+        self._head_size = 0
+        self._tail: Deque[str] = deque()
+        self._tail_size = 0
+
+    @property
+    def truncated(self) -> bool:
+        """Whether part of the output was dropped"""
+        return self.dropped_chars > 0
+
+    def append(self, text: str) -> None:
+        """Add output text"""
+        self.total_chars += len(text)
+
+        if self._head_size < self.head_chars:
+            taken = text[:self.head_chars - self._head_size]
+            self._head.append(taken)
+            self._head_size += len(taken)
+            text = text[len(taken):]
+            if not text:
+                return
+
+        self._tail.append(text)
+        self._tail_size += len(text)
+        while self._tail_size > self.tail_chars:
+            excess = self._tail_size - self.tail_chars
+            first = self._tail[0]
+            if len(first) <= excess:
+                self._tail.popleft()
+                dropped = len(first)
+            else:
+                self._tail[0] = first[excess:]
+                dropped = excess
+            self._tail_size -= dropped
+            self.dropped_chars += dropped
+
+    def getvalue(self) -> str:
+        """Retained output, with a marker where the middle was dropped"""
+        head = "".join(self._head)
+        tail = "".join(self._tail)
+        if not self.dropped_chars:
+            return head + tail
+        return f"{head}\n... [{self.dropped_chars} characters omitted] ...\n{tail}"
+
+
+async def stream_process_output(
+    process: asyncio.subprocess.Process,
+    timeout: float,
+    chunk_size: int = READ_CHUNK_SIZE
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Yield (stream, text) chunks from a subprocess as they arrive.
+
+    stdout and stderr are read concurrently; chunks end at a line boundary
+    unless a single line is longer than chunk_size. The process is killed if
+    it is still running when the timeout expires or the consumer stops early.
+
+    Args:
+        process: Process started with stdout/stderr=PIPE
+        timeout: Maximum run time in seconds
+        chunk_size: Bytes to read from a pipe at a time
+
+    Yields:
+        ("stdout" | "stderr", decoded text)
+
+    Raises:
+        asyncio.TimeoutError: If the process runs longer than timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    # Bounded so a slow consumer applies back-pressure to the pipes
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+    async def pump(name: str, reader: asyncio.StreamReader) -> None:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        try:
+            while True:
+                data = await reader.read(chunk_size)
+                if not data:
+                    pending += decoder.decode(b"", final=True)
+                    break
+                pending += decoder.decode(data)
+                cut = pending.rfind("\n") + 1
+                if cut:
+                    await queue.put((name, pending[:cut]))
+                    pending = pending[cut:]
+                elif len(pending) >= chunk_size:
+                    await queue.put((name, pending))
+                    pending = ""
+            if pending:
+                await queue.put((name, pending))
+        except (OSError, ValueError):
+            # Broken pipe: treat as end of stream
+            pass
+        await queue.put((name, None))
+
+    pumps = [
+        asyncio.create_task(pump(name, reader))
+        for name, reader in (("stdout", process.stdout), ("stderr", process.stderr))
+        if reader is not None
+    ]
+    open_streams = len(pumps)
+
+    try:
+        while open_streams:
+            name, text = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+            if text is None:
+                open_streams -= 1
+            else:
+                yield name, text
+
+        await asyncio.wait_for(process.wait(), max(deadline - loop.time(), 0))
+
+    finally:
+        for task in pumps:
+            task.cancel()
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+
+async def collect_stream_result(events: AsyncIterator[Dict[str, Any]]) -> ToolResult:
+    """
+    Run a streaming tool execution to completion and return its result.
+
+    Args:
+        events: Events from BaseTool.execute_stream()
+
+    Returns:
+        ToolResult: The final result event's result
+    """
+    result = None
+    async for event in events:
+        if event["type"] == "result":
+            result = event["result"]
+    return result if result is not None else ToolResult(False, None, "Tool produced no result")
+
+
+async def stream_output_events(
+    process: asyncio.subprocess.Process,
+    timeout: float,
+    stdout: OutputBuffer,
+    stderr: OutputBuffer
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    stream_process_output() as tool output events, retaining output in buffers.
+
+    Args:
+        process: Process started with stdout/stderr=PIPE
+        timeout: Maximum run time in seconds
+        stdout: Buffer for retained stdout
+        stderr: Buffer for retained stderr
+
+    Yields:
+        {"type": "output", "stream": "stdout" | "stderr", "data": str}
+
+    Raises:
+        asyncio.TimeoutError: If the process runs longer than timeout
+    """
+    async for stream, text in stream_process_output(process, timeout):
+        (stdout if stream == "stdout" else stderr).append(text)
+        yield {"type": "output", "stream": stream, "data": text}
@@ -249,7 +249,11 @@ class TestShellCommandToolExecute:
         async def mock_subprocess(cmd, **kwargs):
             mock_proc = AsyncMock()
             mock_proc.returncode = 0
-            mock_proc.communicate = AsyncMock(return_value=(b"file.txt\n", b""))
+            mock_proc.stdout = asyncio.StreamReader()
+            mock_proc.stdout.feed_data(b"file.txt\n")
+            mock_proc.stdout.feed_eof()
+            mock_proc.stderr = asyncio.StreamReader()
+            mock_proc.stderr.feed_eof()
             return mock_proc
 
         with patch("asyncio.create_subprocess_shell", side_effect=mock_subprocess):
@@ -270,7 +274,9 @@ class TestShellCommandToolExecute:
 
         async def timeout_subprocess(cmd, **kwargs):
             mock_proc = AsyncMock()
-            mock_proc.communicate = AsyncMock(side_effect=asyncio.TimeoutError())
+            mock_proc.returncode = None
+            mock_proc.stdout = asyncio.StreamReader()  # never reaches EOF
+            mock_proc.stderr = asyncio.StreamReader()
             mock_proc.kill = MagicMock()
             mock_proc.wait = AsyncMock()
             return mock_proc
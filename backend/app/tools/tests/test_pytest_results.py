@@ -0,0 +1,122 @@
+"""
+Tests for structured pytest results (app.tools.pytest_results) and the
+affected-test / fail-fast options of RunTestsTool
+"""
+
+import os
+import sys
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from app.tools.code_tools import RunTestsTool
+from app.tools.pytest_results import build_pytest_command, failed_tests, parse_junit_xml
+
+JUNIT_REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="1" failures="1" skipped="1" tests="5" time="0.5">
+<testcase classname="tests.test_api.TestGet" name="test_ok" file="tests/test_api.py" line="3" time="0.010"/>
+<testcase classname="tests.test_api.TestGet" name="test_bad[1]" file="tests/test_api.py" line="6" time="0.020">
+<failure message="assert 1 == 2">tests/test_api.py:7: in test_bad
+    assert 1 == 2</failure></testcase>
+<testcase classname="tests.test_api" name="test_skip" file="tests/test_api.py" line="9" time="0.000">
+<skipped type="pytest.skip" message="not ready">skipped</skipped></testcase>
+<testcase classname="tests.test_db" name="test_conn" file="tests/test_db.py" line="1" time="0.100">
+<error message="failed on setup with &quot;KeyError&quot;">fixture error</error></testcase>
+<testcase classname="tests.test_db" name="test_query" time="0.001"/>
+</testsuite></testsuites>
+"""
+
+
+class TestParseJunitXml:
+    """Test JUnit report parsing"""
+
+    def test_outcomes_and_node_ids(self, tmp_path):
+        report = tmp_path / "report.xml"
+        report.write_text(JUNIT_REPORT)
+
+        parsed = parse_junit_xml(str(report))
+
+        assert [(t["test_name"], t["outcome"], t["passed"]) for t in parsed["tests"]] == [
+            ("tests/test_api.py::TestGet::test_ok", "passed", True),
+            ("tests/test_api.py::TestGet::test_bad[1]", "failed", False),
+            ("tests/test_api.py::test_skip", "skipped", True),
+            ("tests/test_db.py::test_conn", "error", False),
+            ("tests.test_db::test_query", "passed", True),
+        ]
+        assert parsed["summary"] == {
+            "total": 5, "passed": 2, "failed": 1, "errors": 1, "skipped": 1, "duration_ms": 131.0
+        }
+        assert parsed["tests"][1]["error_message"].startswith("assert 1 == 2\ntests/test_api.py:7")
+        assert failed_tests(parsed["tests"]) == [
+            "tests/test_api.py::TestGet::test_bad[1]", "tests/test_db.py::test_conn"
+        ]
+
+    def test_build_command(self):
+        cmd = build_pytest_command(["tests"], "/tmp/r.xml", verbose=False, fail_fast=True, workers=1)
+
+        assert cmd[:4] == ["python3", "-m", "pytest", "tests"]
+        assert "-x" in cmd and "-v" not in cmd and "-n" not in cmd
+        assert "--junitxml=/tmp/r.xml" in cmd
+
+
+class TestRunTestsStructured:
+    """Test RunTestsTool with real pytest runs"""
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        files = {
+            "pkg/__init__.py": "",
+            "pkg/calc.py": "def add(a, b):\n    return a + b\n",
+            "pkg/other.py": "def other():\n    return 1\n",
+            "tests/test_calc.py": (
+                "from pkg.calc import add\n\n"
+                "def test_fails_first():\n    assert add(1, 1) == 3\n\n"
+                "def test_add():\n    assert add(1, 2) == 3\n"
+            ),
+            "tests/test_other.py": "from pkg.other import other\n\ndef test_other():\n    assert other() == 1\n",
+        }
+        for name, content in files.items():
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_per_test_results_decide_pass_fail(self, workspace):
+        result = await RunTestsTool().execute(test_path="tests", _workspace=str(workspace))
+
+        assert result.success is False
+        assert result.output["passed"] is False
+        assert result.output["summary"]["total"] == 3
+        assert result.output["failed_tests"] == ["tests/test_calc.py::test_fails_first"]
+
+    @pytest.mark.asyncio
+    async def test_changed_files_select_affected_tests(self, workspace):
+        result = await RunTestsTool().execute(
+            test_path="tests", changed_files=["pkg/other.py"], _workspace=str(workspace)
+        )
+
+        assert result.success is True
+        assert result.output["passed"] is True
+        assert [t["test_name"] for t in result.output["tests"]] == ["tests/test_other.py::test_other"]
+        assert result.metadata["selected_tests"] == [str(workspace / "tests/test_other.py")]
+
+    @pytest.mark.asyncio
+    async def test_no_affected_tests_skips_run(self, workspace):
+        result = await RunTestsTool().execute(
+            test_path="tests", changed_files=["README.md"], _workspace=str(workspace)
+        )
+
+        assert result.success is True
+        assert result.output["tests"] == []
+        assert result.output["returncode"] is None
+
+    @pytest.mark.asyncio
+    async def test_fail_fast(self, workspace):
+        result = await RunTestsTool().execute(
+            test_path="tests/test_calc.py", fail_fast=True, _workspace=str(workspace)
+        )
+
+        assert result.output["summary"]["total"] == 1
+        assert result.output["failed_tests"] == ["tests/test_calc.py::test_fails_first"]
@@ -0,0 +1,174 @@
+"""
+Tests for the warm Python worker pool (app.tools.python_pool) and its use
+by ExecutePythonTool
+"""
+
+import asyncio
+import os
+import sys
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from app.tools import code_tools
+from app.tools.code_tools import ExecutePythonTool
+from app.tools.python_pool import PythonWorkerError, PythonWorkerPool
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="worker pool requires fork")
+
+
+async def run(pool, code, timeout=10):
+    """Collect stdout/stderr and the result message of one run"""
+    out = {"stdout": "", "stderr": ""}
+    result = None
+    async for message in pool.execute(code, timeout):
+        if message["type"] == "output":
+            out[message["stream"]] += message["data"]
+        else:
+            result = message
+    return out, result
+
+
+class TestPythonWorkerPool:
+    """Test warm execution, isolation and worker lifecycle"""
+
+    @pytest.mark.asyncio
+    async def test_runs_reuse_worker_without_sharing_state(self):
+        pool = PythonWorkerPool(size=1, preload_modules=["json"])
+        await pool.start()
+
+        out, result = await run(pool, "import sys\nleaked = 1\nprint('json' in sys.modules)")
+        assert out["stdout"] == "True\n"
+        assert result == {"type": "result", "returncode": 0, "timed_out": False}
+
+        out, result = await run(pool, "print('leaked' in globals())")
+        assert out["stdout"] == "False\n"
+
+        stats = pool.get_stats()
+        assert stats["started"] == 1
+        assert stats["executions"] == 2
+        assert stats["idle"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_run_and_keeps_worker(self, monkeypatch):
+        monkeypatch.delenv("PYTHONUNBUFFERED", raising=False)
+        pool = PythonWorkerPool(size=1)
+
+        # Printed output arrives without an explicit flush
+        out, result = await run(pool, "import time\nprint('start')\ntime.sleep(30)", timeout=0.5)
+        assert out["stdout"] == "start\n"
+        assert result["timed_out"] is True
+
+        out, result = await run(pool, "print('next')")
+        assert out["stdout"] == "next\n"
+        assert pool.get_stats()["started"] == 1
+        assert pool.get_stats()["timeouts"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_snippet_cannot_import_backend_modules(self):
+        pool = PythonWorkerPool(size=1)
+
+        out, result = await run(pool, (
+            "import sys, tempfile\n"
+            "print(sys.path[0] == tempfile.gettempdir(), __file__)\n"
+            "import python_pool"
+        ))
+
+        assert out["stdout"] == "True <execute_python>\n"
+        assert "ModuleNotFoundError" in out["stderr"]
+        assert result["returncode"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_start_stops_workers(self):
+        pool = PythonWorkerPool(size=2)
+        start = asyncio.ensure_future(pool.start())
+        await asyncio.sleep(0.01)
+
+        start.cancel()
+        await asyncio.gather(start, return_exceptions=True)
+        await pool.close()
+
+        assert pool.get_stats()["workers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_worker_recycled_after_max_executions(self):
+        pool = PythonWorkerPool(size=1, max_executions=2)
+        for _ in range(3):
+            await run(pool, "pass")
+
+        stats = pool.get_stats()
+        assert stats["started"] == 2
+        assert stats["recycles"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_exit_codes_and_tracebacks(self):
+        pool = PythonWorkerPool(size=1)
+
+        _, result = await run(pool, "import os\nos._exit(3)")
+        assert result["returncode"] == 3
+
+        out, result = await run(pool, "def f():\n    raise ValueError('boom')\nf()")
+        assert result["returncode"] == 1
+        assert 'File "<execute_python>", line 3' in out["stderr"]
+        assert "ValueError: boom" in out["stderr"]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_limit(self):
+        pool = PythonWorkerPool(size=1, memory_limit_mb=256)
+
+        out, result = await run(pool, "x = bytearray(1024 * 1024 * 1024)")
+        assert result["returncode"] == 1
+        assert "MemoryError" in out["stderr"]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_startup_failure(self):
+        pool = PythonWorkerPool(size=1, python=sys.executable + "-missing")
+
+        with pytest.raises(PythonWorkerError):
+            await run(pool, "print(1)")
+        assert pool.get_stats()["workers"] == 0
+
+
+class TestExecutePythonToolPool:
+    """Test ExecutePythonTool running through the pool"""
+
+    @pytest.mark.asyncio
+    async def test_uses_pool(self, monkeypatch):
+        pool = PythonWorkerPool(size=1)
+        monkeypatch.setattr(code_tools, "get_python_worker_pool", lambda: pool)
+
+        result = await ExecutePythonTool().execute(code="print(2 + 2)")
+
+        assert result.success is True
+        assert result.output["stdout"] == "4\n"
+        assert result.metadata["worker"] == "pool"
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_result(self, monkeypatch):
+        pool = PythonWorkerPool(size=1)
+        monkeypatch.setattr(code_tools, "get_python_worker_pool", lambda: pool)
+
+        result = await ExecutePythonTool().execute(code="while True: pass", timeout=0.5)
+
+        assert result.success is False
+        assert "timeout" in result.error.lower()
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_subprocess_when_pool_fails(self, monkeypatch):
+        pool = PythonWorkerPool(size=1, python=sys.executable + "-missing")
+        monkeypatch.setattr(code_tools, "get_python_worker_pool", lambda: pool)
+
+        result = await ExecutePythonTool().execute(code="print('fallback')")
+
+        assert result.success is True
+        assert result.output["stdout"] == "fallback\n"
+        assert result.metadata["worker"] == "subprocess"
@@ -0,0 +1,162 @@
+"""
+Tests for tool result caching: ResultCache invalidation and its use by
+ToolExecutor for read-only tools
+"""
+
+import os
+import sys
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from app.tools.executor import ToolExecutor
+from app.tools.performance import ResultCache, file_fingerprint
+
+
+@pytest.fixture
+def executor():
+    return ToolExecutor(cache=ResultCache(max_size=50, ttl_seconds=300))
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "a.txt").write_text("first")
+    return str(tmp_path)
+
+
+class TestResultCacheInvalidation:
+    """Test tool, scope and file based invalidation"""
+
+    def test_invalidate_all_entries_of_tool(self):
+        cache = ResultCache()
+        cache.set("read_file", {"path": "a"}, "A")
+        cache.set("read_file", {"path": "b"}, "B")
+        cache.set("list_directory", {"path": "."}, "L")
+
+        assert cache.invalidate("read_file") == 2
+        assert cache.get("read_file", {"path": "a"}) is None
+        assert cache.get("list_directory", {"path": "."}) == "L"
+        assert cache.get_stats()["invalidations"] == 2
+
+    def test_invalidate_scope_matches_nested_paths(self):
+        cache = ResultCache()
+        cache.set("t", {"n": 1}, 1, scope="/ws")
+        cache.set("t", {"n": 2}, 2, scope="/ws/sub")
+        cache.set("t", {"n": 3}, 3, scope="/ws2")
+
+        assert cache.invalidate_scope("/ws/sub") == 2
+        assert cache.get("t", {"n": 3}) == 3
+
+    def test_stale_when_dependency_changes(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("one")
+        cache = ResultCache()
+        cache.set("read_file", {"path": str(path)}, "one", dependencies=file_fingerprint([str(path)]))
+        assert cache.get("read_file", {"path": str(path)}) == "one"
+
+        path.write_text("changed")
+        assert cache.get("read_file", {"path": str(path)}) is None
+
+    def test_fingerprint_of_missing_file(self, tmp_path):
+        missing = str(tmp_path / "missing")
+        assert file_fingerprint([missing]) == {missing: None}
+
+
+class TestToolExecutorCache:
+    """Test caching in ToolExecutor.execute"""
+
+    @pytest.mark.asyncio
+    async def test_read_file_served_from_cache(self, executor, workspace):
+        params = {"path": "a.txt", "_workspace": workspace}
+
+        first = await executor.execute("read_file", params, "s")
+        second = await executor.execute("read_file", params, "s")
+
+        assert first.output == second.output == "first"
+        assert "cached" not in first.metadata
+        assert second.metadata["cached"] is True
+        assert executor.cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_external_change_detected_by_mtime(self, executor, workspace):
+        params = {"path": "a.txt", "_workspace": workspace}
+        await executor.execute("read_file", params, "s")
+
+        path = os.path.join(workspace, "a.txt")
+        with open(path, "w") as f:
+            f.write("second!")
+        os.utime(path, ns=(0, 0))
+
+        result = await executor.execute("read_file", params, "s")
+        assert result.output == "second!"
+        assert "cached" not in result.metadata
+
+    @pytest.mark.asyncio
+    async def test_write_file_invalidates_workspace(self, executor, workspace):
+        await executor.execute("list_directory", {"path": ".", "_workspace": workspace}, "s")
+        await executor.execute("read_file", {"path": "a.txt", "_workspace": workspace}, "s")
+        assert executor.cache.get_stats()["size"] == 2
+
+        await executor.execute(
+            "write_file", {"path": "b.txt", "content": "x", "_workspace": workspace}, "s"
+        )
+        assert executor.cache.get_stats()["size"] == 0
+
+        listing = await executor.execute("list_directory", {"path": ".", "_workspace": workspace}, "s")
+        assert {entry["name"] for entry in listing.output} == {"a.txt", "b.txt"}
+
+    @pytest.mark.asyncio
+    async def test_mutating_tool_invalidates_caller_scope(self, executor, workspace):
+        os.mkdir(os.path.join(workspace, "sub"))
+        search = {"pattern": "*.py", "path": ".", "_workspace": workspace}
+        tool = executor.registry.get_tool("search_files")
+        first = await executor.execute("search_files", search, "s")
+        assert first.output == []
+
+        # execute_python names no workspace; the caller's scope is used
+        python = executor.registry.get_tool("execute_python")
+        with open(os.path.join(workspace, "sub", "c.py"), "w") as f:
+            f.write("")
+        executor.update_cache(python, {"code": "..."}, scope=workspace)
+
+        cached, _ = executor.get_cached(tool, search)
+        assert cached is None
+
+    @pytest.mark.asyncio
+    async def test_mutating_tool_without_scope_invalidates_everything(self, executor, workspace):
+        await executor.execute("read_file", {"path": "a.txt", "_workspace": workspace}, "s")
+
+        await executor.execute("execute_python", {"code": "pass"}, "s")
+
+        assert executor.cache.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_key_includes_workspace(self, executor, tmp_path):
+        for name in ("one", "two"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "a.txt").write_text(name)
+
+        one = await executor.execute("read_file", {"path": "a.txt", "_workspace": str(tmp_path / "one")}, "s")
+        two = await executor.execute("read_file", {"path": "a.txt", "_workspace": str(tmp_path / "two")}, "s")
+
+        assert (one.output, two.output) == ("one", "two")
+        assert "cached" not in two.metadata
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self, executor, workspace):
+        params = {"path": "missing.txt", "_workspace": workspace}
+        await executor.execute("read_file", params, "s")
+
+        assert executor.cache.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, workspace):
+        executor = ToolExecutor(use_cache=False)
+        params = {"path": "a.txt", "_workspace": workspace}
+
+        await executor.execute("read_file", params, "s")
+        result = await executor.execute("read_file", params, "s")
+
+        assert executor.cache is None
+        assert "cached" not in result.metadata
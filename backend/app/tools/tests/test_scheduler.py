@@ -0,0 +1,141 @@
+"""
+Tests for dependency-aware parallel tool execution (app.tools.scheduler)
+and ToolExecutor.execute_batch
+"""
+
+import asyncio
+import os
+import sys
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from app.tools.executor import ToolExecutor
+from app.tools.registry import get_registry
+from app.tools.performance import ResultCache
+from app.tools.scheduler import ScheduledCall, ToolScheduler, classify_call
+
+
+def read(path):
+    return ScheduledCall("read_file", mutating=False, paths=[path])
+
+
+def write(path):
+    return ScheduledCall("write_file", mutating=True, paths=[path])
+
+
+async def collect(scheduler, calls, run_call):
+    return [item async for item in scheduler.run(calls, run_call)]
+
+
+class TestClassification:
+    """Test read-only / mutating classification and conflicts"""
+
+    def test_classify_registered_tools(self, tmp_path):
+        registry = get_registry()
+
+        read_call = classify_call(registry.get_tool("read_file"), "read_file",
+                                  {"path": "a.py", "_workspace": str(tmp_path)})
+        assert read_call.mutating is False
+        assert read_call.paths == [str(tmp_path / "a.py")]
+
+        shell_call = classify_call(registry.get_tool("shell_command"), "shell_command", {"command": "ls"})
+        assert shell_call.mutating is True
+        assert shell_call.paths is None
+
+    def test_meta_tools_run_exclusively(self):
+        call = classify_call(None, "ask_human", {"question": "?"})
+        assert call.conflicts_with(read("/ws/a"))
+
+    def test_plan(self):
+        calls = [
+            read("/ws/a.py"),
+            read("/ws/b.py"),
+            write("/ws/a.py"),
+            read("/ws"),
+            ScheduledCall("git_status", mutating=False),
+            ScheduledCall("shell_command", mutating=True),
+        ]
+
+        assert ToolScheduler().plan(calls) == [
+            set(),
+            set(),
+            {0},       # write after the read of the same file
+            {2},       # directory read after a write inside it
+            {2},       # whole-workspace read after any write
+            {0, 1, 2, 3, 4},
+        ]
+
+
+class TestToolScheduler:
+    """Test concurrent execution, ordering and the concurrency cap"""
+
+    @pytest.mark.asyncio
+    async def test_independent_calls_run_concurrently(self):
+        running, peak = 0, 0
+
+        async def run_call(index):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            yield {"type": "result", "result": index}
+
+        calls = [read(f"/ws/{i}") for i in range(4)]
+        events = await collect(ToolScheduler(max_concurrency=2), calls, run_call)
+
+        assert peak == 2
+        assert sorted(index for index, _ in events) == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_conflicting_calls_keep_order_and_events_stream(self):
+        order = []
+
+        async def run_call(index):
+            order.append(("start", index))
+            await asyncio.sleep(0.05 if index == 0 else 0.01)
+            yield {"type": "output", "data": index}
+            order.append(("end", index))
+            yield {"type": "result", "result": index}
+
+        calls = [read("/ws/a"), read("/ws/b"), write("/ws/a")]
+        events = await collect(ToolScheduler(), calls, run_call)
+
+        # The fast read of b completes first, the write waits for the read of a
+        assert [index for index, event in events if event["type"] == "result"] == [1, 0, 2]
+        assert order.index(("start", 2)) > order.index(("end", 0))
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_remaining_calls(self):
+        async def run_call(index):
+            if index == 0:
+                raise RuntimeError("boom")
+            await asyncio.sleep(10)
+            yield {"type": "result"}
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await collect(ToolScheduler(), [read("/a"), read("/b")], run_call)
+
+
+class TestExecuteBatch:
+    """Test ToolExecutor.execute_batch with the scheduler"""
+
+    @pytest.mark.asyncio
+    async def test_results_in_call_order(self, tmp_path):
+        (tmp_path / "a.txt").write_text("old")
+        executor = ToolExecutor(cache=ResultCache(), max_parallel=4)
+        workspace = str(tmp_path)
+
+        results = await executor.execute_batch([
+            {"tool_name": "write_file", "params": {"path": "a.txt", "content": "new", "_workspace": workspace}},
+            {"tool_name": "read_file", "params": {"path": "a.txt", "_workspace": workspace}},
+            {"tool_name": "missing_tool", "params": {}},
+            {"tool_name": "list_directory", "params": {"path": ".", "_workspace": workspace}},
+        ], "s")
+
+        assert results[0].success is True
+        assert results[1].output == "new"
+        assert results[2].success is False
+        assert [entry["name"] for entry in results[3].output] == ["a.txt"]
@@ -0,0 +1,120 @@
+"""
+Tests for streaming subprocess output (app.tools.streaming) and the
+streaming execution mode of ShellCommandTool / ExecutePythonTool / RunTestsTool
+"""
+
+import os
+import sys
+import time
+import asyncio
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+
+from app.tools.code_tools import ExecutePythonTool, RunTestsTool, ShellCommandTool
+from app.tools.streaming import OutputBuffer, stream_process_output
+
+
+class TestOutputBuffer:
+    """Test head/tail retention"""
+
+    def test_small_output_kept_verbatim(self):
+        buffer = OutputBuffer(head_chars=10, tail_chars=10)
+        buffer.append("hello\n")
+        buffer.append("world\n")
+
+        assert buffer.getvalue() == "hello\nworld\n"
+        assert buffer.truncated is False
+
+    def test_middle_dropped_from_large_output(self):
+        buffer = OutputBuffer(head_chars=5, tail_chars=8)
+        for i in range(100):
+            buffer.append(f"line{i:03d}\n")
+
+        value = buffer.getvalue()
+        assert value.startswith("line0")
+        assert value.endswith("line099\n")
+        assert buffer.total_chars == 800
+        assert buffer.dropped_chars == 800 - 5 - 8
+        assert "[787 characters omitted]" in value
+
+
+class TestStreamProcessOutput:
+    """Test incremental reading of real subprocesses"""
+
+    @pytest.mark.asyncio
+    async def test_output_arrives_before_process_exits(self):
+        code = "import sys, time\nprint('first', flush=True)\ntime.sleep(0.5)\nprint('oops', file=sys.stderr)"
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", code,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        start = time.monotonic()
+        chunks = []
+        async for stream, text in stream_process_output(process, timeout=10):
+            chunks.append((stream, text, time.monotonic() - start))
+
+        assert [(s, t) for s, t, _ in chunks] == [("stdout", "first\n"), ("stderr", "oops\n")]
+        assert chunks[0][2] < 0.4
+        assert process.returncode == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self):
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", "import time; print('start', flush=True); time.sleep(30)",
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        received = []
+        with pytest.raises(asyncio.TimeoutError):
+            async for _, text in stream_process_output(process, timeout=0.5):
+                received.append(text)
+
+        assert received == ["start\n"]
+        assert process.returncode is not None
+
+
+class TestStreamingTools:
+    """Test execute_stream() of the subprocess tools"""
+
+    @pytest.mark.asyncio
+    async def test_execute_python_streams_then_returns_result(self):
+        events = [e async for e in ExecutePythonTool().execute_stream(code="for i in range(3): print(i)")]
+
+        output = "".join(e["data"] for e in events if e["type"] == "output")
+        result = events[-1]["result"]
+        assert output == "0\n1\n2\n"
+        assert result.success is True
+        assert result.output["stdout"] == "0\n1\n2\n"
+        assert result.metadata["output_truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_execute_python_subprocess_output_not_buffered(self, monkeypatch):
+        monkeypatch.setattr("app.tools.code_tools.get_python_worker_pool", lambda: None)
+        monkeypatch.delenv("PYTHONUNBUFFERED", raising=False)
+        code = "import time\nprint('start')\ntime.sleep(30)"
+
+        events = [e async for e in ExecutePythonTool().execute_stream(code=code, timeout=1)]
+
+        assert [e["data"] for e in events if e["type"] == "output"] == ["start\n"]
+        assert events[-1]["result"].success is False
+
+    @pytest.mark.asyncio
+    async def test_chatty_output_is_truncated_for_result(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.tools.code_tools.OutputBuffer", lambda: OutputBuffer(head_chars=50, tail_chars=100)
+        )
+
+        result = await ShellCommandTool().execute(command="python -c \"print('x' * 100000)\"")
+
+        assert result.success is True
+        assert len(result.output["stdout"]) < 300
+        assert "characters omitted" in result.output["stdout"]
+        assert result.metadata["output_truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_early_failure_yields_only_result(self, tmp_path):
+        events = [e async for e in RunTestsTool().execute_stream(test_path=str(tmp_path / "missing"))]
+
+        assert [e["type"] for e in events] == ["result"]
+        assert events[0]["result"].success is False
@@ -88,6 +88,10 @@ class WebSearchTool(BaseTool):
                 )
         return self._client
 
+    def access_paths(self, **kwargs) -> List[str]:
+        # Network only, no local files
+        return []
+
     def validate_params(self, **kwargs) -> bool:
         """Validate search parameters"""
         if "query" not in kwargs or not kwargs["query"]:
@@ -268,6 +272,10 @@ class HttpRequestTool(BaseTool):
         # Phase 3: Performance settings
         self._use_cache = use_cache
 
+    def access_paths(self, **kwargs) -> List[str]:
+        # Network only, no local files
+        return []
+
     def validate_params(self, **kwargs) -> bool:
         """Validate HTTP request parameters"""
         if "url" not in kwargs or not kwargs["url"]:
@@ -459,6 +467,9 @@ class DownloadFileTool(BaseTool):
         self.requires_network = True
         self.network_type = NetworkType.EXTERNAL_DOWNLOAD
 
+        # Downloads write files; drop cached results of the workspace
+        self.invalidates_cache = True
+
         self.description = "Download files from URLs with progress tracking (allowed in offline mode)"
         self.parameters = {
             "url": {
@@ -494,6 +505,9 @@ class DownloadFileTool(BaseTool):
         # Phase 3: Progress callback
         self._progress_callback = progress_callback
 
+    def access_paths(self, output_path: str = "", **kwargs) -> List[str]:
+        return [str(pathlib.Path(output_path).resolve())]
+
     def validate_params(self, **kwargs) -> bool:
         """Validate download parameters"""
         if "url" not in kwargs or not kwargs["url"]:
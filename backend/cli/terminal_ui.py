@@ -248,6 +248,13 @@ class TerminalUI:
                         current_status = f"{tool_desc}{detail}"
                         live.update(create_status_display())
 
+                    elif update_type == "tool_output":
+                        # Live stdout/stderr from shell_command, execute_python, run_tests
+                        data = update.get("data", "").rstrip("\n")
+                        if data:
+                            style = "red" if update.get("stream") == "stderr" else "dim"
+                            live.console.print(Text(data, style=style))
+
                     elif update_type == "tool_call_result":
                         # Tool execution completed
                         tool_name = update.get("tool")
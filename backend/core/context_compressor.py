@@ -7,6 +7,7 @@ information like code, errors, and decision points.
 
 import re
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
@@ -108,6 +109,229 @@ class CompressionConfig:
     model: str = "default"                  # Model for token counting
 
 
+# Max cached per-message extraction results per compressor
+EXTRACTION_CACHE_SIZE = 2048
+
+_FILE_EXTENSIONS = r'(?:py|js|ts|tsx|jsx|json|yaml|yml|md|txt|html|css|go|rs|java|c|cpp|h)'
+
+# Extraction patterns, grouped by category in reporting order
+_CODE_BLOCK_PATTERNS = [
+    re.compile(r'```(\w*)\n?([\s\S]*?)```', re.MULTILINE),
+]
+
+_FILE_PATH_PATTERNS = [
+    re.compile(r'(?:^|\s)([A-Za-z]:[\\\/][\w\\\/\-\.]+)'),  # Windows paths
+    re.compile(r'(?:^|\s)((?:/[\w\-\.]+)+)'),               # Unix paths
+    re.compile(r'(?:^|\s)([\w\-]+\.' + _FILE_EXTENSIONS + ')'),  # File extensions
+]
+
+_ERROR_PATTERNS = [
+    re.compile(r'(?i)(error|exception|failed|failure|traceback|warning)[:.\s]+([^\n]+)'),
+    re.compile(r'(?i)(TypeError|ValueError|KeyError|AttributeError|ImportError|SyntaxError)[:.\s]*([^\n]*)'),
+    re.compile(r'(?i)(?:^|\n)(FAILED|ERROR)[:\s]+([^\n]+)'),
+]
+
+_COMMAND_PATTERNS = [
+    re.compile(r'(?:^|\n)\$\s*([^\n]+)'),  # $ command
+    re.compile(r'(?:^|\n)>\s*([^\n]+)'),   # > command
+    re.compile(r'`([^`]+)`'),              # Inline code
+]
+
+_DECISION_PATTERNS = [
+    re.compile(r'(?i)(?:^|\n)(?:let\'s|we should|i will|decided to|choosing|using|implementing)([^\n.]+)'),
+    re.compile(r'(?i)(?:^|\n)(?:approach|solution|plan|strategy)[:.\s]+([^\n]+)'),
+]
+
+_KEY_POINT_PATTERNS = [
+    re.compile(r'(?i)(?:^|\n)(?:important|note|remember|key|summary)[:.\s]+([^\n]+)'),
+    re.compile(r'(?i)(?:^|\n)(?:created|modified|deleted|updated)(?:\s+file)?[:.\s]+([^\n]+)'),
+]
+
+_PATTERNS = (
+    _CODE_BLOCK_PATTERNS + _FILE_PATH_PATTERNS + _ERROR_PATTERNS
+    + _COMMAND_PATTERNS + _DECISION_PATTERNS + _KEY_POINT_PATTERNS
+)
+_CODE_BLOCK, _WINDOWS_PATH, _UNIX_PATH, _EXTENSION_PATH = 0, 1, 2, 3
+_ERROR, _NAMED_ERROR, _LINE_ERROR = 4, 5, 6
+_DOLLAR_COMMAND, _PROMPT_COMMAND, _INLINE_CODE = 7, 8, 9
+_CHOICE_DECISION, _PLAN_DECISION = 10, 11
+_NOTE_POINT, _CHANGE_POINT = 12, 13
+
+# Line-start patterns and the (case-folded) text they can begin with
+_LINE_STARTS = (
+    (_LINE_ERROR, ('failed', 'error')),
+    (_DOLLAR_COMMAND, ('$',)),
+    (_PROMPT_COMMAND, ('>',)),
+    (_CHOICE_DECISION, ("let's", 'we should', 'i will', 'decided to', 'choosing', 'using', 'implementing')),
+    (_PLAN_DECISION, ('approach', 'solution', 'plan', 'strategy')),
+    (_NOTE_POINT, ('important', 'note', 'remember', 'key', 'summary')),
+    (_CHANGE_POINT, ('created', 'modified', 'deleted', 'updated')),
+)
+
+# Every position where some pattern can start, found in one scan of the
+# case-folded text. Each alternative consumes a single character, so no
+# position is skipped; the patterns themselves only run at these positions.
+_CANDIDATE_PATTERN = re.compile(
+    r'\n(?=' + '|'.join(re.escape(word) for _, words in _LINE_STARTS for word in words) + ')'
+    r'|\s(?=[a-z]:[\\/]|/|[\w\-]+\.' + _FILE_EXTENSIONS + ')'
+    r'|`'
+    r'|e(?=rror|xception)|f(?=ail)|t(?=raceback)|w(?=arning)'
+)
+
+# Patterns to try at a candidate, by the candidate's first character (and,
+# after a newline, the next one)
+_AT_SPACE = (_WINDOWS_PATH, _UNIX_PATH, _EXTENSION_PATH)
+_AT_BACKTICK = (_CODE_BLOCK, _INLINE_CODE)
+_AT_KEYWORD = (_ERROR,)
+_AT_LINE_START: Dict[str, Tuple[int, ...]] = {}
+for _index, _words in _LINE_STARTS:
+    for _first in {word[0] for word in _words}:
+        _AT_LINE_START[_first] = _AT_LINE_START.get(_first, _AT_SPACE) + (_index,)
+del _index, _words, _first
+
+# Named errors are found through their "error" suffix
+_NAMED_ERROR_PREFIXES = ('type', 'value', 'key', 'attribute', 'import', 'syntax')
+
+# Characters that (?i) matches against ASCII letters but str.lower() keeps
+# (or, for U+0130, lengthens)
+_CASE_FOLD = str.maketrans({
+    **{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)},
+    'K': 'k', 'ſ': 's', 'ı': 'i', 'İ': 'i',
+})
+
+
+def _fold_case(content: str) -> str:
+    """Lowercase content for candidate search, keeping every offset."""
+    folded = content.lower()
+    if content.isascii():
+        return folded
+    if len(folded) != len(content):
+        return content.translate(_CASE_FOLD)
+    return folded.replace('ſ', 's').replace('ı', 'i')
+
+
+def _find_matches(content: str) -> List[List[Tuple[Optional[str], ...]]]:
+    """Return the groups of every pattern's matches, from one candidate scan.
+
+    The result equals ``[[m.groups() for m in p.finditer(content)] for p in
+    _PATTERNS]``: each pattern is tried only at candidate positions, in order,
+    and resumes after its previous match just as finditer would.
+    """
+    found: List[List[Tuple[Optional[str], ...]]] = [[] for _ in _PATTERNS]
+    # Position each pattern's next match may start at
+    resume = [1] * len(_PATTERNS)
+    for index, pattern in enumerate(_PATTERNS):
+        match = pattern.match(content)
+        if match:
+            found[index].append(match.groups())
+            resume[index] = match.end()
+
+    folded = _fold_case(content)
+    for candidate in _CANDIDATE_PATTERN.finditer(folded):
+        position = candidate.start()
+        char = folded[position]
+        if char == '\n':
+            indexes = _AT_LINE_START.get(folded[position + 1], _AT_SPACE)
+        elif char == '`':
+            indexes = _AT_BACKTICK
+        elif char in 'eftw':
+            indexes = _AT_KEYWORD
+            if folded.startswith('error', position):
+                for prefix in _NAMED_ERROR_PREFIXES:
+                    start = position - len(prefix)
+                    if start >= resume[_NAMED_ERROR] and folded.startswith(prefix, start):
+                        match = _PATTERNS[_NAMED_ERROR].match(content, start)
+                        if match:
+                            found[_NAMED_ERROR].append(match.groups())
+                            resume[_NAMED_ERROR] = match.end()
+                        break
+        else:
+            indexes = _AT_SPACE
+        for index in indexes:
+            if position >= resume[index]:
+                match = _PATTERNS[index].match(content, position)
+                if match:
+                    found[index].append(match.groups())
+                    resume[index] = match.end()
+    return found
+
+
+def _scan_content(content: str) -> Tuple[ExtractedContent, ContentPriority]:
+    """Extract important content from message text.
+
+    Produces the same result as running every extraction pattern over the
+    text in order, from a single candidate scan of the message, and
+    de-duplicates with sets instead of list scans.
+    """
+    extracted = ExtractedContent()
+    priority = ContentPriority.LOW
+    found = _find_matches(content)
+
+    # 1. Code blocks (```...```)
+    for language, code in found[_CODE_BLOCK]:
+        code = code.strip()
+        if code:
+            extracted.code_blocks.append({
+                'language': language or 'text',
+                'content': code
+            })
+            priority = ContentPriority.HIGH
+
+    # 2. File paths
+    seen = set()
+    for index in (_WINDOWS_PATH, _UNIX_PATH, _EXTENSION_PATH):
+        for (path,) in found[index]:
+            path = path.strip()
+            if path and path not in seen:
+                seen.add(path)
+                extracted.file_paths.append(path)
+    if extracted.file_paths and priority.value > ContentPriority.HIGH.value:
+        priority = ContentPriority.HIGH
+
+    # 3. Error messages
+    seen = set()
+    for index in (_ERROR, _NAMED_ERROR, _LINE_ERROR):
+        for error_type, error_msg in found[index]:
+            error_msg = error_msg.strip()
+            full_error = f"{error_type}: {error_msg}" if error_msg else error_type
+            if full_error not in seen:
+                seen.add(full_error)
+                extracted.error_messages.append(full_error)
+    if extracted.error_messages:
+        priority = ContentPriority.CRITICAL
+
+    # 4. Commands
+    seen = set()
+    for index in (_DOLLAR_COMMAND, _PROMPT_COMMAND, _INLINE_CODE):
+        for (cmd,) in found[index]:
+            cmd = cmd.strip()
+            if cmd and len(cmd) < 200 and cmd not in seen:
+                seen.add(cmd)
+                extracted.commands.append(cmd)
+
+    # 5. Decision statements (stored truncated; dedup against stored values)
+    seen = set()
+    for index in (_CHOICE_DECISION, _PLAN_DECISION):
+        for (decision,) in found[index]:
+            decision = decision.strip()
+            if len(decision) > 10 and decision not in seen:
+                seen.add(decision[:200])
+                extracted.decisions.append(decision[:200])
+    if (extracted.commands or extracted.decisions) and priority.value > ContentPriority.MEDIUM.value:
+        priority = ContentPriority.MEDIUM
+
+    # 6. Key points (sentences with important keywords)
+    seen = set()
+    for index in (_NOTE_POINT, _CHANGE_POINT):
+        for (point,) in found[index]:
+            point = point.strip()
+            if point and point not in seen:
+                seen.add(point[:200])
+                extracted.key_points.append(point[:200])
+
+    return extracted, priority
+
+
 class ContextCompressor:
     """Smart context compression engine.
 
@@ -122,6 +346,8 @@ class ContextCompressor:
             config: Compression configuration
         """
         self.config = config or CompressionConfig()
+        # (content hash, length) -> extraction result, LRU bounded
+        self._extraction_cache: "OrderedDict[Tuple[int, int], Tuple[ExtractedContent, ContentPriority]]" = OrderedDict()
         logger.info("ContextCompressor initialized")
 
     def compress(
@@ -177,89 +403,26 @@ class ContextCompressor:
         if not content:
             return ExtractedContent(), ContentPriority.LOW
 
-        extracted = ExtractedContent()
-        priority = ContentPriority.LOW
-
-        # 1. Extract code blocks (```...```)
-        code_pattern = re.compile(r'```(\w*)\n?([\s\S]*?)```', re.MULTILINE)
-        for match in code_pattern.finditer(content):
-            language = match.group(1) or 'text'
-            code = match.group(2).strip()
-            if code:
-                extracted.code_blocks.append({
-                    'language': language,
-                    'content': code
-                })
-                priority = ContentPriority.HIGH
-
-        # 2. Extract file paths
-        file_patterns = [
-            r'(?:^|\s)([A-Za-z]:[\\\/][\w\\\/\-\.]+)',  # Windows paths
-            r'(?:^|\s)((?:/[\w\-\.]+)+)',               # Unix paths
-            r'(?:^|\s)([\w\-]+\.(?:py|js|ts|tsx|jsx|json|yaml|yml|md|txt|html|css|go|rs|java|c|cpp|h))',  # File extensions
-        ]
-        for pattern in file_patterns:
-            for match in re.finditer(pattern, content):
-                path = match.group(1).strip()
-                if path and path not in extracted.file_paths:
-                    extracted.file_paths.append(path)
-                    if priority.value > ContentPriority.HIGH.value:
-                        priority = ContentPriority.HIGH
-
-        # 3. Extract error messages
-        error_patterns = [
-            r'(?i)(error|exception|failed|failure|traceback|warning)[:.\s]+([^\n]+)',
-            r'(?i)(TypeError|ValueError|KeyError|AttributeError|ImportError|SyntaxError)[:.\s]*([^\n]*)',
-            r'(?i)(?:^|\n)(FAILED|ERROR)[:\s]+([^\n]+)',
-        ]
-        for pattern in error_patterns:
-            for match in re.finditer(pattern, content):
-                error_type = match.group(1)
-                error_msg = match.group(2).strip() if len(match.groups()) > 1 else ""
-                full_error = f"{error_type}: {error_msg}" if error_msg else error_type
-                if full_error not in extracted.error_messages:
-                    extracted.error_messages.append(full_error)
-                    priority = ContentPriority.CRITICAL
-
-        # 4. Extract commands
-        command_patterns = [
-            r'(?:^|\n)\$\s*([^\n]+)',           # $ command
-            r'(?:^|\n)>\s*([^\n]+)',            # > command
-            r'`([^`]+)`',                        # Inline code
-        ]
-        for pattern in command_patterns:
-            for match in re.finditer(pattern, content):
-                cmd = match.group(1).strip()
-                if cmd and len(cmd) < 200 and cmd not in extracted.commands:
-                    extracted.commands.append(cmd)
-                    if priority.value > ContentPriority.MEDIUM.value:
-                        priority = ContentPriority.MEDIUM
-
-        # 5. Extract decision statements
-        decision_patterns = [
-            r'(?i)(?:^|\n)(?:let\'s|we should|i will|decided to|choosing|using|implementing)([^\n.]+)',
-            r'(?i)(?:^|\n)(?:approach|solution|plan|strategy)[:.\s]+([^\n]+)',
-        ]
-        for pattern in decision_patterns:
-            for match in re.finditer(pattern, content):
-                decision = match.group(1).strip() if match.groups() else match.group(0).strip()
-                if decision and len(decision) > 10 and decision not in extracted.decisions:
-                    extracted.decisions.append(decision[:200])
-                    if priority.value > ContentPriority.MEDIUM.value:
-                        priority = ContentPriority.MEDIUM
-
-        # 6. Extract key points (sentences with important keywords)
-        key_patterns = [
-            r'(?i)(?:^|\n)(?:important|note|remember|key|summary)[:.\s]+([^\n]+)',
-            r'(?i)(?:^|\n)(?:created|modified|deleted|updated)(?:\s+file)?[:.\s]+([^\n]+)',
-        ]
-        for pattern in key_patterns:
-            for match in re.finditer(pattern, content):
-                point = match.group(1).strip() if match.groups() else match.group(0).strip()
-                if point and point not in extracted.key_points:
-                    extracted.key_points.append(point[:200])
-
-        return extracted, priority
+        key = (hash(content), len(content))
+        cached = self._extraction_cache.get(key)
+        if cached is None:
+            cached = _scan_content(content)
+            self._extraction_cache[key] = cached
+            if len(self._extraction_cache) > EXTRACTION_CACHE_SIZE:
+                self._extraction_cache.popitem(last=False)
+        else:
+            self._extraction_cache.move_to_end(key)
+
+        extracted, priority = cached
+        # Callers may modify the result; keep the cached copy intact
+        return ExtractedContent(
+            code_blocks=[dict(block) for block in extracted.code_blocks],
+            file_paths=list(extracted.file_paths),
+            error_messages=list(extracted.error_messages),
+            decisions=list(extracted.decisions),
+            commands=list(extracted.commands),
+            key_points=list(extracted.key_points),
+        ), priority
 
     def summarize_messages(
         self,
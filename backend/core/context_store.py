@@ -11,11 +11,15 @@ Phase 6 Enhancement:
 - 스마트 컨텍스트 압축 지원
 - 토큰 버짓 관리
 """
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from sqlalchemy import func
 
 # SQLAlchemy imports
 from app.db.database import SessionLocal, get_db_context
@@ -24,6 +28,8 @@ from app.db.models import Conversation, Message, Artifact
 # RAG imports
 from app.services.conversation_indexer import get_conversation_indexer
 
+from shared.utils.token_utils import TokenCounter
+
 # Phase 6: Context Compressor (lazy import to avoid circular dependency)
 _compressor = None
 
@@ -58,12 +64,30 @@ ENABLE_COMPRESSION = True
 # 압축 시작 임계값 (메시지 수)
 COMPRESSION_THRESHOLD = 50
 
+# ========== DB 쓰기 지연(write-behind) 설정 ==========
+# 저장 요청 후 DB에 모아 쓰기까지 대기 시간 (초) - 그 사이의 저장은 세션별로 합쳐짐
+FLUSH_INTERVAL_SECONDS = 0.5
+
+# ========== 세션 컨텍스트 캐시 설정 ==========
+# 메모리에 유지할 최대 세션 수 (LRU)
+MAX_CACHED_SESSIONS = 200
+# 마지막 접근 후 캐시에서 내보내기까지 시간 (초)
+CONTEXT_CACHE_TTL_SECONDS = 3600
+# 캐시 전체 메모리 예산 (메시지/아티팩트 내용 기준 추정 바이트)
+CONTEXT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# 메시지/아티팩트 하나당 내용 외 추정 오버헤드 (바이트)
+CONTEXT_ITEM_OVERHEAD_BYTES = 200
+
 
 @dataclass
 class ConversationContext:
     """대화 컨텍스트
 
     세션별 대화 기록, 아티팩트, 분석 결과를 관리합니다.
+
+    DB에서 로드한 컨텍스트는 최근 메시지와 아티팩트 메타데이터(내용 제외)만
+    가지고 있습니다. 이전 메시지와 아티팩트 내용은 ContextStore의
+    load_older_messages / get_artifact로 필요할 때 가져옵니다.
     """
     session_id: str
     messages: List[Dict[str, str]] = field(default_factory=list)
@@ -72,6 +96,51 @@ class ConversationContext:
     last_analysis: Optional[Dict[str, Any]] = None
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # 전체 메시지 수 (메모리에 없는 이전 메시지 포함)
+    message_count: int = 0
+    user_message_count: int = 0
+    # 메모리에 있는 메시지의 누적 토큰 수 (token_count 첫 접근 시 생성)
+    _tokens: Optional[TokenCounter] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.message_count = max(self.message_count, len(self.messages))
+        if not self.user_message_count:
+            self.user_message_count = sum(1 for m in self.messages if m.get("role") == "user")
+
+    @property
+    def older_message_count(self) -> int:
+        """메모리에 로드되지 않은 이전 메시지 수"""
+        return max(0, self.message_count - len(self.messages))
+
+    @property
+    def token_count(self) -> int:
+        """메모리에 있는 메시지의 토큰 수 (메시지 추가 시 증분 갱신)"""
+        if self._tokens is None:
+            self._tokens = TokenCounter(self.messages)
+        return self._tokens.total
+
+    def prepend_messages(self, messages: List[Dict[str, Any]]):
+        """DB에서 가져온 이전 메시지를 앞에 추가
+
+        Args:
+            messages: 이전 메시지 (오래된 순)
+        """
+        self.messages[:0] = messages
+        if self._tokens is not None:
+            self._tokens.extend(messages)
+
+    def estimate_size(self) -> int:
+        """메모리 사용량 추정 (메시지/아티팩트 내용 기준 바이트)
+
+        Returns:
+            int: 추정 바이트
+        """
+        size = 0
+        for msg in self.messages:
+            size += len(msg.get("content") or "") + CONTEXT_ITEM_OVERHEAD_BYTES
+        for artifact in self.artifacts:
+            size += len(artifact.get("content") or "") + CONTEXT_ITEM_OVERHEAD_BYTES
+        return size
 
     def add_message(self, role: str, content: str):
         """메시지 추가
@@ -80,15 +149,25 @@ class ConversationContext:
             role: 역할 (user, assistant, system)
             content: 메시지 내용
         """
-        self.messages.append({
+        message = {
             "role": role,
             "content": content,
             "timestamp": datetime.now().isoformat()
-        })
+        }
+        self.messages.append(message)
+        self.message_count += 1
+        if role == "user":
+            self.user_message_count += 1
+        if self._tokens is not None:
+            self._tokens.add(message)
 
         # 최대 메시지 수 제한
         if len(self.messages) > MAX_MESSAGES:
+            dropped = self.messages[:-MAX_MESSAGES]
             self.messages = self.messages[-MAX_MESSAGES:]
+            if self._tokens is not None:
+                for msg in dropped:
+                    self._tokens.remove(msg)
 
         self.updated_at = datetime.now()
 
@@ -182,8 +261,8 @@ class ConversationContext:
         summary_parts = []
 
         # 대화 통계 추가
-        total_msgs = len(self.messages)
-        user_msgs = sum(1 for m in self.messages if m.get("role") == "user")
+        total_msgs = self.message_count
+        user_msgs = self.user_message_count
         summary_parts.append(f"[대화 통계: 총 {total_msgs}개 메시지, 사용자 {user_msgs}개]")
         summary_parts.append("")
 
@@ -215,16 +294,71 @@ class ConversationContext:
         return "\n".join(summaries)
 
 
+@dataclass
+class PendingWrite:
+    """DB에 아직 반영되지 않은 세션 변경분
+
+    같은 세션의 저장 요청은 하나로 합쳐지고(메시지는 이어붙이고 아티팩트는
+    파일명별 최신 내용만 유지), 대화 정보는 기록 직전에 컨텍스트에서 복사합니다.
+    """
+    context: ConversationContext
+    messages: List[Dict[str, Any]] = field(default_factory=list)
+    artifacts: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # 기록 직전 스냅샷 (이벤트 루프에서 채움)
+    title: str = ""
+    workspace: Optional[str] = None
+    last_analysis: Optional[Dict[str, Any]] = None
+
+    def merge(self, newer: "PendingWrite"):
+        """이후에 쌓인 변경분을 이 변경분 뒤에 합치기"""
+        self.messages.extend(newer.messages)
+        self.artifacts.update(newer.artifacts)
+
+
 class ContextStore:
     """컨텍스트 저장소
 
     세션별 컨텍스트의 로드/저장을 관리합니다.
     메모리 캐시와 DB 영속성을 모두 지원합니다.
+
+    DB 쓰기는 지연(write-behind) 방식입니다. save는 메모리 캐시만 갱신하고
+    변경분을 세션별로 모아 두며, FLUSH_INTERVAL_SECONDS 뒤 백그라운드 작업이
+    모인 변경분을 한 트랜잭션으로 (스레드에서) 기록합니다. 따라서 대화 턴의
+    지연 시간에는 DB 왕복이 포함되지 않습니다. 종료 시에는 close로 남은
+    변경분을 기록합니다.
+
+    메모리 캐시는 세션 수, 유휴 시간(TTL), 추정 메모리 예산으로 제한되는
+    LRU입니다. 내보낸 세션은 다음 접근 때 DB에서 최근 메시지와 아티팩트
+    메타데이터만 다시 로드합니다 (DB 기록 대기 중이면 그 컨텍스트를 재사용).
     """
 
-    def __init__(self):
-        """ContextStore 초기화"""
-        self.cache: Dict[str, ConversationContext] = {}
+    def __init__(
+        self,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_sessions: int = MAX_CACHED_SESSIONS,
+        ttl_seconds: float = CONTEXT_CACHE_TTL_SECONDS,
+        max_bytes: int = CONTEXT_CACHE_MAX_BYTES
+    ):
+        """ContextStore 초기화
+
+        Args:
+            flush_interval: 저장 요청 후 DB에 기록하기까지 대기 시간 (초)
+            max_sessions: 캐시에 유지할 최대 세션 수
+            ttl_seconds: 마지막 접근 후 캐시에서 내보내기까지 시간 (초)
+            max_bytes: 캐시 전체 메모리 예산 (추정 바이트)
+        """
+        self.cache: "OrderedDict[str, ConversationContext]" = OrderedDict()
+        self.max_sessions = max(1, max_sessions)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._access_times: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._cache_bytes = 0
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, PendingWrite] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # 이 저장소의 DB 작업 직렬화 (단일 SQLite 연결을 스레드 간에 공유하지 않도록)
+        self._db_lock = asyncio.Lock()
         logger.info("ContextStore initialized")
 
     async def load(self, session_id: str) -> ConversationContext:
@@ -236,23 +370,89 @@ class ContextStore:
         Returns:
             ConversationContext: 컨텍스트 객체
         """
-        # 1. 캐시 확인
+        # 1. 캐시 확인 (DB 기록 대기 중인 컨텍스트 포함)
+        self._evict_expired()
         if session_id in self.cache:
             logger.debug(f"Context loaded from cache: {session_id}")
-            return self.cache[session_id]
+            return self._cache_put(session_id, self.cache[session_id])
+        if session_id in self._pending:
+            return self._cache_put(session_id, self._pending[session_id].context)
 
-        # 2. DB 조회 (향후 구현)
+        # 2. DB 조회 (최근 메시지 + 아티팩트 메타데이터)
         db_context = await self._load_from_db(session_id)
+        if session_id in self.cache:
+            # DB 조회 중 다른 요청이 먼저 로드/생성함
+            return self._cache_put(session_id, self.cache[session_id])
         if db_context:
-            self.cache[session_id] = db_context
             logger.debug(f"Context loaded from DB: {session_id}")
-            return db_context
+            return self._cache_put(session_id, db_context)
 
         # 3. 신규 생성
         new_context = ConversationContext(session_id=session_id)
-        self.cache[session_id] = new_context
         logger.info(f"New context created: {session_id}")
-        return new_context
+        return self._cache_put(session_id, new_context)
+
+    async def load_older_messages(
+        self,
+        session_id: str,
+        limit: int = RECENT_MESSAGES_FOR_LLM
+    ) -> List[Dict[str, Any]]:
+        """메모리에 없는 이전 메시지를 DB에서 가져와 컨텍스트 앞에 추가
+
+        Args:
+            session_id: 세션 ID
+            limit: 가져올 최대 메시지 수 (로드된 메시지 바로 앞부터)
+
+        Returns:
+            List[Dict[str, Any]]: 가져온 메시지 (오래된 순)
+        """
+        context = await self.load(session_id)
+        older = context.older_message_count
+        if older <= 0 or limit <= 0:
+            return []
+
+        # 아직 기록되지 않은 메시지가 있으면 먼저 기록 (DB 순서 = 메모리 순서)
+        await self.flush()
+        start = max(0, older - limit)
+        try:
+            async with self._db_lock:
+                messages = await asyncio.to_thread(
+                    self._read_messages, session_id, start, older - start
+                )
+        except Exception as e:
+            logger.error(f"Failed to load older messages from DB: {e}")
+            return []
+
+        context.prepend_messages(messages)
+        self._cache_put(session_id, context)
+        return messages
+
+    async def get_artifact(self, session_id: str, filename: str) -> Optional[Dict[str, Any]]:
+        """아티팩트를 내용과 함께 반환 (내용이 메모리에 없으면 DB에서 로드)
+
+        Args:
+            session_id: 세션 ID
+            filename: 파일명
+
+        Returns:
+            Optional[Dict[str, Any]]: 아티팩트 또는 None
+        """
+        context = await self.load(session_id)
+        artifact = next((a for a in reversed(context.artifacts) if a.get("filename") == filename), None)
+        if artifact is None or "content" in artifact:
+            return artifact
+
+        try:
+            async with self._db_lock:
+                content = await asyncio.to_thread(self._read_artifact_content, session_id, filename)
+        except Exception as e:
+            logger.error(f"Failed to load artifact content from DB: {e}")
+            return artifact
+
+        if content is not None:
+            artifact["content"] = content
+            self._cache_put(session_id, context)
+        return artifact
 
     async def save(
         self,
@@ -264,6 +464,8 @@ class ContextStore:
     ):
         """컨텍스트 저장
 
+        메모리 캐시를 갱신하고 DB 기록은 예약만 합니다 (write-behind).
+
         Args:
             session_id: 세션 ID
             user_message: 사용자 메시지
@@ -272,10 +474,14 @@ class ContextStore:
             artifacts: 생성된 아티팩트 목록
         """
         context = await self.load(session_id)
+        pending = self._pending.get(session_id)
+        if pending is None:
+            pending = self._pending[session_id] = PendingWrite(context=context)
 
         # 메시지 추가
         context.add_message("user", user_message)
         context.add_message("assistant", assistant_response)
+        pending.messages.extend(context.messages[-2:])
 
         # 분석 결과 저장
         if analysis:
@@ -285,20 +491,123 @@ class ContextStore:
         if artifacts:
             for artifact in artifacts:
                 context.add_artifact(artifact)
+                if artifact.get("filename"):
+                    pending.artifacts[artifact["filename"]] = artifact
 
         context.updated_at = datetime.now()
 
         # 캐시 업데이트
-        self.cache[session_id] = context
+        self._cache_put(session_id, context)
 
-        # DB 저장 (비동기, 향후 구현)
-        await self._save_to_db(context)
+        # DB 저장 예약 (세션별로 합쳐서 나중에 한 번에 기록)
+        self._schedule_flush()
 
         # RAG: 대화 내용 벡터 색인
         await self._index_conversation(session_id, user_message, assistant_response)
 
         logger.debug(f"Context saved: {session_id}, messages={len(context.messages)}")
 
+    async def flush(self) -> int:
+        """대기 중인 변경분을 DB에 한 트랜잭션으로 기록
+
+        실패하면 변경분을 대기열에 되돌려 다음 기록 때 다시 시도합니다.
+
+        Returns:
+            int: 기록한 세션 수
+        """
+        async with self._db_lock:
+            batch = self._take_pending()
+            if not batch:
+                return 0
+
+            try:
+                await asyncio.to_thread(self._write_pending, batch)
+            except Exception as e:
+                logger.error(f"Failed to save {len(batch)} contexts to DB: {e}")
+                self._requeue(batch)
+                return 0
+
+        logger.debug(f"Flushed {len(batch)} contexts to DB")
+        return len(batch)
+
+    async def close(self):
+        """예약된 기록을 취소하고 남은 변경분을 모두 기록 (종료 시 호출)"""
+        task = self._flush_task
+        self._flush_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
+
+    def _schedule_flush(self):
+        """백그라운드 기록 작업이 없으면 시작"""
+        loop = asyncio.get_running_loop()
+        task = self._flush_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        """flush_interval마다 대기 중인 변경분이 없어질 때까지 기록"""
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            if not await self.flush() and self._pending:
+                # 기록 실패 - 다음 save나 close 때 다시 시도
+                break
+
+    def _take_pending(self) -> List[PendingWrite]:
+        """대기 중인 변경분을 꺼내고 대화 정보를 스냅샷 (이벤트 루프에서 실행)"""
+        batch = list(self._pending.values())
+        self._pending.clear()
+
+        for pending in batch:
+            context = pending.context
+            pending.title = self._generate_title(context)
+            pending.workspace = context.workspace
+            pending.last_analysis = context.last_analysis
+        return batch
+
+    def _requeue(self, batch: List[PendingWrite]):
+        """기록에 실패한 변경분을 그 사이 쌓인 변경분 앞에 되돌리기"""
+        for pending in batch:
+            session_id = pending.context.session_id
+            newer = self._pending.get(session_id)
+            if newer is not None:
+                pending.merge(newer)
+            self._pending[session_id] = pending
+
+    def _cache_put(self, session_id: str, context: ConversationContext) -> ConversationContext:
+        """캐시에 넣거나 최근 사용으로 갱신하고, 한도를 넘으면 오래된 세션 내보내기"""
+        self.cache[session_id] = context
+        self.cache.move_to_end(session_id)
+        self._access_times[session_id] = time.monotonic()
+
+        size = context.estimate_size()
+        self._cache_bytes += size - self._sizes.get(session_id, 0)
+        self._sizes[session_id] = size
+
+        # 방금 사용한 세션은 내보내지 않음
+        while len(self.cache) > 1 and (
+            len(self.cache) > self.max_sessions or self._cache_bytes > self.max_bytes
+        ):
+            self._cache_remove(next(iter(self.cache)))
+        return context
+
+    def _cache_remove(self, session_id: str):
+        """캐시에서 세션 제거 (DB 기록 대기 중인 변경분은 유지)"""
+        self.cache.pop(session_id, None)
+        self._access_times.pop(session_id, None)
+        self._cache_bytes -= self._sizes.pop(session_id, 0)
+
+    def _evict_expired(self):
+        """TTL 동안 접근하지 않은 세션을 캐시에서 제거"""
+        deadline = time.monotonic() - self.ttl_seconds
+        while self.cache:
+            session_id = next(iter(self.cache))
+            if self._access_times.get(session_id, 0) > deadline:
+                break
+            self._cache_remove(session_id)
+            logger.debug(f"Context expired from cache: {session_id}")
+
     async def _index_conversation(
         self,
         session_id: str,
@@ -336,7 +645,6 @@ class ContextStore:
         context = await self.load(session_id)
         context.workspace = workspace
         context.updated_at = datetime.now()
-        self.cache[session_id] = context
         logger.debug(f"Workspace updated: {session_id} -> {workspace}")
 
     async def clear(self, session_id: str):
@@ -345,16 +653,16 @@ class ContextStore:
         Args:
             session_id: 세션 ID
         """
-        if session_id in self.cache:
-            del self.cache[session_id]
+        self._cache_remove(session_id)
+        # 기록 대기 중인 변경분도 버림 (삭제 후 다시 생성되지 않도록)
+        self._pending.pop(session_id, None)
 
-        # DB에서도 삭제 (향후 구현)
         await self._delete_from_db(session_id)
 
         logger.info(f"Context cleared: {session_id}")
 
     async def _load_from_db(self, session_id: str) -> Optional[ConversationContext]:
-        """DB에서 컨텍스트 로드
+        """DB에서 컨텍스트 로드 (스레드에서 실행)
 
         Args:
             session_id: 세션 ID
@@ -363,172 +671,252 @@ class ContextStore:
             Optional[ConversationContext]: 컨텍스트 또는 None
         """
         try:
-            with get_db_context() as db:
-                # 세션 조회
-                conversation = db.query(Conversation).filter(
-                    Conversation.session_id == session_id
-                ).first()
-
-                if not conversation:
-                    return None
-
-                # ConversationContext 생성
-                context = ConversationContext(
-                    session_id=session_id,
-                    workspace=conversation.workspace_path,
-                    created_at=conversation.created_at or datetime.now(),
-                    updated_at=conversation.updated_at or datetime.now()
-                )
-
-                # 메시지 로드
-                messages = db.query(Message).filter(
-                    Message.conversation_id == conversation.id
-                ).order_by(Message.created_at).all()
-
-                for msg in messages:
-                    context.messages.append({
-                        "role": msg.role,
-                        "content": msg.content,
-                        "timestamp": msg.created_at.isoformat() if msg.created_at else None,
-                        "agent_name": msg.agent_name,
-                        "message_type": msg.message_type
-                    })
-
-                # 아티팩트 로드
-                artifacts = db.query(Artifact).filter(
-                    Artifact.conversation_id == conversation.id
-                ).order_by(Artifact.created_at).all()
-
-                for art in artifacts:
-                    context.artifacts.append({
-                        "filename": art.filename,
-                        "language": art.language,
-                        "content": art.content,
-                        "task_num": art.task_num,
-                        "version": art.version,
-                        "added_at": art.created_at.isoformat() if art.created_at else None
-                    })
-
-                # workflow_state에서 last_analysis 복원
-                if conversation.workflow_state:
-                    context.last_analysis = conversation.workflow_state.get("last_analysis")
-
-                logger.debug(f"Context loaded from DB: {session_id}, messages={len(context.messages)}")
-                return context
-
+            async with self._db_lock:
+                return await asyncio.to_thread(self._read_context, session_id)
         except Exception as e:
             logger.error(f"Failed to load context from DB: {e}")
             return None
 
-    async def _save_to_db(self, context: ConversationContext):
-        """DB에 컨텍스트 저장
+    def _read_context(self, session_id: str) -> Optional[ConversationContext]:
+        """DB에서 대화와 최근 메시지, 아티팩트 메타데이터를 읽어 컨텍스트 생성
+
+        메시지는 최근 RECENT_MESSAGES_FOR_LLM개만, 아티팩트는 내용 없이
+        최근 MAX_ARTIFACTS개의 메타데이터만 읽습니다.
 
         Args:
-            context: 저장할 컨텍스트
+            session_id: 세션 ID
+
+        Returns:
+            Optional[ConversationContext]: 컨텍스트 또는 None
         """
-        try:
-            with get_db_context() as db:
-                # 기존 대화 조회 또는 생성
-                conversation = db.query(Conversation).filter(
-                    Conversation.session_id == context.session_id
-                ).first()
-
-                if not conversation:
-                    # 새 대화 생성
+        with get_db_context() as db:
+            # 세션 조회
+            conversation = db.query(Conversation).filter(
+                Conversation.session_id == session_id
+            ).first()
+
+            if not conversation:
+                return None
+
+            # 역할별 메시지 수 (메모리에 없는 이전 메시지 포함)
+            role_counts = dict(
+                db.query(Message.role, func.count(Message.id)).filter(
+                    Message.conversation_id == conversation.id
+                ).group_by(Message.role).all()
+            )
+
+            # ConversationContext 생성
+            context = ConversationContext(
+                session_id=session_id,
+                workspace=conversation.workspace_path,
+                created_at=conversation.created_at or datetime.now(),
+                updated_at=conversation.updated_at or datetime.now(),
+                message_count=sum(role_counts.values()),
+                user_message_count=role_counts.get("user", 0)
+            )
+
+            # 최근 메시지 로드
+            messages = db.query(Message).filter(
+                Message.conversation_id == conversation.id
+            ).order_by(Message.created_at.desc(), Message.id.desc()).limit(RECENT_MESSAGES_FOR_LLM).all()
+            context.messages = [self._message_to_dict(msg) for msg in reversed(messages)]
+
+            # 아티팩트 메타데이터 로드 (내용은 get_artifact에서 필요할 때)
+            artifacts = db.query(
+                Artifact.filename, Artifact.language, Artifact.task_num,
+                Artifact.version, Artifact.created_at
+            ).filter(
+                Artifact.conversation_id == conversation.id
+            ).order_by(Artifact.created_at.desc(), Artifact.id.desc()).limit(MAX_ARTIFACTS).all()
+
+            for art in reversed(artifacts):
+                context.artifacts.append({
+                    "filename": art.filename,
+                    "language": art.language,
+                    "task_num": art.task_num,
+                    "version": art.version,
+                    "added_at": art.created_at.isoformat() if art.created_at else None
+                })
+
+            # workflow_state에서 last_analysis 복원
+            if conversation.workflow_state:
+                context.last_analysis = conversation.workflow_state.get("last_analysis")
+
+            logger.debug(
+                f"Context loaded from DB: {session_id}, "
+                f"messages={len(context.messages)}/{context.message_count}"
+            )
+            return context
+
+    def _read_messages(self, session_id: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """DB에서 메시지 한 페이지 읽기 (오래된 순)
+
+        Args:
+            session_id: 세션 ID
+            offset: 건너뛸 메시지 수 (가장 오래된 메시지부터)
+            limit: 읽을 메시지 수
+
+        Returns:
+            List[Dict[str, Any]]: 메시지 목록
+        """
+        with get_db_context() as db:
+            messages = db.query(Message).join(Conversation).filter(
+                Conversation.session_id == session_id
+            ).order_by(Message.created_at, Message.id).offset(offset).limit(limit).all()
+            return [self._message_to_dict(msg) for msg in messages]
+
+    def _read_artifact_content(self, session_id: str, filename: str) -> Optional[str]:
+        """DB에서 아티팩트 내용 읽기
+
+        Args:
+            session_id: 세션 ID
+            filename: 파일명
+
+        Returns:
+            Optional[str]: 최신 아티팩트 내용 또는 None
+        """
+        with get_db_context() as db:
+            row = db.query(Artifact.content).join(Conversation).filter(
+                Conversation.session_id == session_id,
+                Artifact.filename == filename
+            ).order_by(Artifact.id.desc()).first()
+            return row.content if row else None
+
+    @staticmethod
+    def _message_to_dict(msg: Message) -> Dict[str, Any]:
+        """Message 행을 컨텍스트 메시지 dict로 변환"""
+        return {
+            "role": msg.role,
+            "content": msg.content,
+            "timestamp": msg.created_at.isoformat() if msg.created_at else None,
+            "agent_name": msg.agent_name,
+            "message_type": msg.message_type
+        }
+
+    def _write_pending(self, batch: List[PendingWrite]):
+        """모인 변경분을 DB에 한 트랜잭션으로 기록 (스레드에서 실행)
+
+        대화와 기존 아티팩트는 세션 전체에 대해 한 번씩만 조회하고,
+        새 메시지와 아티팩트는 한 번에 추가합니다.
+
+        Args:
+            batch: 기록할 변경분 목록
+        """
+        with get_db_context() as db:
+            # 기존 대화 일괄 조회 후 없으면 생성
+            session_ids = [pending.context.session_id for pending in batch]
+            conversations = {
+                conversation.session_id: conversation
+                for conversation in db.query(Conversation).filter(
+                    Conversation.session_id.in_(session_ids)
+                )
+            }
+
+            for pending in batch:
+                context = pending.context
+                conversation = conversations.get(context.session_id)
+                if conversation is None:
                     conversation = Conversation(
                         session_id=context.session_id,
-                        title=self._generate_title(context),
+                        title=pending.title,
                         mode="unified",
-                        workspace_path=context.workspace,
+                        workspace_path=pending.workspace,
                         created_at=context.created_at
                     )
                     db.add(conversation)
-                    db.flush()  # ID 할당
+                    conversations[context.session_id] = conversation
                 else:
-                    # 기존 대화 업데이트
-                    conversation.workspace_path = context.workspace
+                    conversation.workspace_path = pending.workspace
                     conversation.updated_at = datetime.now()
 
-                # workflow_state 업데이트 (last_analysis 저장)
-                workflow_state = conversation.workflow_state or {}
-                if context.last_analysis:
-                    workflow_state["last_analysis"] = context.last_analysis
-                conversation.workflow_state = workflow_state
-
-                # 새 메시지만 저장 (마지막 2개: user, assistant)
-                existing_msg_count = db.query(Message).filter(
-                    Message.conversation_id == conversation.id
-                ).count()
-
-                new_messages = context.messages[existing_msg_count:]
-                for msg in new_messages:
-                    db_msg = Message(
-                        conversation_id=conversation.id,
-                        role=msg.get("role", "user"),
-                        content=msg.get("content", ""),
-                        agent_name=msg.get("agent_name"),
-                        message_type=msg.get("message_type"),
-                        created_at=datetime.fromisoformat(msg["timestamp"]) if msg.get("timestamp") else datetime.now()
+                # workflow_state 업데이트 (새 dict로 바꿔야 JSON 컬럼 변경이 감지됨)
+                if pending.last_analysis:
+                    conversation.workflow_state = {
+                        **(conversation.workflow_state or {}),
+                        "last_analysis": pending.last_analysis
+                    }
+
+            db.flush()  # 새 대화 ID 할당
+
+            # 새 메시지 일괄 추가
+            db.add_all([
+                Message(
+                    conversation_id=conversations[pending.context.session_id].id,
+                    role=msg.get("role", "user"),
+                    content=msg.get("content", ""),
+                    agent_name=msg.get("agent_name"),
+                    message_type=msg.get("message_type"),
+                    created_at=datetime.fromisoformat(msg["timestamp"]) if msg.get("timestamp") else datetime.now()
+                )
+                for pending in batch
+                for msg in pending.messages
+            ])
+
+            # 아티팩트 upsert (기존 아티팩트는 한 번에 조회)
+            artifact_keys = {
+                (conversations[pending.context.session_id].id, filename): artifact
+                for pending in batch
+                for filename, artifact in pending.artifacts.items()
+            }
+            existing_artifacts = {}
+            if artifact_keys:
+                existing_artifacts = {
+                    (art.conversation_id, art.filename): art
+                    for art in db.query(Artifact).filter(
+                        Artifact.conversation_id.in_({key[0] for key in artifact_keys}),
+                        Artifact.filename.in_({key[1] for key in artifact_keys})
                     )
-                    db.add(db_msg)
-
-                # 새 아티팩트 저장
-                for artifact in context.artifacts:
-                    filename = artifact.get("filename")
-                    if not filename:
-                        continue
-
-                    # 기존 아티팩트 확인 (같은 파일명이면 업데이트)
-                    existing_art = db.query(Artifact).filter(
-                        Artifact.conversation_id == conversation.id,
-                        Artifact.filename == filename
-                    ).first()
-
-                    if existing_art:
-                        # 버전 업데이트
-                        # Note: artifact.get("content") or "" handles both missing key AND None value
-                        existing_art.content = artifact.get("content") or ""
-                        existing_art.version = (existing_art.version or 1) + 1
-                    else:
-                        # 새 아티팩트 생성
-                        # Ensure content is never None (SQLite NOT NULL constraint)
-                        content = artifact.get("content") or ""
-                        db_art = Artifact(
-                            conversation_id=conversation.id,
-                            filename=filename,
-                            language=artifact.get("language") or "text",
-                            content=content,
-                            task_num=artifact.get("task_num")
-                        )
-                        db.add(db_art)
+                }
 
-                db.commit()
-                logger.debug(f"Context saved to DB: {context.session_id}")
+            for (conversation_id, filename), artifact in artifact_keys.items():
+                # Ensure content is never None (SQLite NOT NULL constraint)
+                content = artifact.get("content") or ""
+                existing_art = existing_artifacts.get((conversation_id, filename))
+                if existing_art:
+                    # 버전 업데이트
+                    existing_art.content = content
+                    existing_art.version = (existing_art.version or 1) + 1
+                else:
+                    db.add(Artifact(
+                        conversation_id=conversation_id,
+                        filename=filename,
+                        language=artifact.get("language") or "text",
+                        content=content,
+                        task_num=artifact.get("task_num")
+                    ))
 
-        except Exception as e:
-            logger.error(f"Failed to save context to DB: {e}")
+            db.commit()
+            logger.debug(f"Contexts saved to DB: {', '.join(session_ids)}")
 
     async def _delete_from_db(self, session_id: str):
-        """DB에서 컨텍스트 삭제
+        """DB에서 컨텍스트 삭제 (스레드에서 실행)
 
         Args:
             session_id: 세션 ID
         """
         try:
-            with get_db_context() as db:
-                conversation = db.query(Conversation).filter(
-                    Conversation.session_id == session_id
-                ).first()
-
-                if conversation:
-                    # cascade delete로 관련 메시지, 아티팩트도 삭제됨
-                    db.delete(conversation)
-                    db.commit()
-                    logger.info(f"Context deleted from DB: {session_id}")
-
+            async with self._db_lock:
+                await asyncio.to_thread(self._delete_conversation, session_id)
         except Exception as e:
             logger.error(f"Failed to delete context from DB: {e}")
 
+    def _delete_conversation(self, session_id: str):
+        """대화와 관련 메시지, 아티팩트 삭제
+
+        Args:
+            session_id: 세션 ID
+        """
+        with get_db_context() as db:
+            conversation = db.query(Conversation).filter(
+                Conversation.session_id == session_id
+            ).first()
+
+            if conversation:
+                # cascade delete로 관련 메시지, 아티팩트도 삭제됨
+                db.delete(conversation)
+                db.commit()
+                logger.info(f"Context deleted from DB: {session_id}")
+
     def _generate_title(self, context: ConversationContext) -> str:
         """대화 제목 자동 생성
 
@@ -556,10 +944,13 @@ class ContextStore:
         """
         return {
             "cached_sessions": len(self.cache),
+            "cached_bytes": self._cache_bytes,
+            "pending_writes": len(self._pending),
             "sessions": [
                 {
                     "session_id": sid,
-                    "message_count": len(ctx.messages),
+                    "message_count": ctx.message_count,
+                    "token_count": ctx.token_count,
                     "artifact_count": len(ctx.artifacts),
                     "updated_at": ctx.updated_at.isoformat()
                 }
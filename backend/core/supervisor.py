@@ -324,7 +324,7 @@ class SupervisorAgent:
         if self.use_api:
             try:
                 # Get reasoning client
-                client = vllm_router.get_client("reasoning")
+                client = vllm_router.get_client("reasoning", affinity_key=self.system_prompt)
 
                 # Build prompt using model-appropriate template with Harmony format
                 # Format conversation history in structured way
@@ -927,7 +927,7 @@ Strategy: {self._build_workflow_strategy(request)} approach with {len(agents)} a
             return f"Rule-based RCA: {failure_reason}"
 
         try:
-            client = vllm_router.get_client("reasoning")
+            client = vllm_router.get_client("reasoning", affinity_key=self.system_prompt)
 
             from shared.prompts.deepseek_r1 import DEEPSEEK_R1_RCA_PROMPT
 
@@ -1017,7 +1017,7 @@ Strategy: {self._build_workflow_strategy(request)} approach with {len(agents)} a
 
             try:
                 # Call LLM with tools
-                client = vllm_router.get_client("reasoning")
+                client = vllm_router.get_client("reasoning", affinity_key=self.system_prompt)
 
                 response = await client.chat_completion_with_tools(
                     messages=messages,
@@ -1054,7 +1054,10 @@ Strategy: {self._build_workflow_strategy(request)} approach with {len(agents)} a
                             "iteration": iteration
                         }
 
-                    # Execute each tool call
+                    # Parse each tool call; results are added to messages in
+                    # this order once all calls have finished
+                    scheduled = []
+                    tool_messages = {}
                     for tool_call in message.tool_calls:
                         tool_name = tool_call.function.name
 
@@ -1137,66 +1140,106 @@ Strategy: {self._build_workflow_strategy(request)} approach with {len(agents)} a
                                 }
 
                                 # Add error message to conversation
-                                messages.append({
+                                tool_messages[tool_call.id] = {
                                     "role": "tool",
                                     "tool_call_id": tool_call.id,
                                     "content": json.dumps({
                                         "error": "Failed to parse arguments - malformed JSON",
                                         "suggestion": "Please try again with valid JSON"
                                     })
-                                })
+                                }
 
                                 # Continue to next tool call
                                 continue
 
-                        logger.info(f"   → Calling: {tool_name}({list(tool_args.keys())})")
-
-                        # Yield tool call start
-                        yield {
-                            "type": "tool_call_start",
-                            "tool": tool_name,
-                            "arguments": tool_args,
-                            "tool_call_id": tool_call.id
-                        }
+                        scheduled.append((tool_call, tool_name, tool_args))
 
-                        # Execute tool
-                        tool_result = await self._execute_tool(
+                        # Calls after complete_task are never run
+                        if tool_name == "complete_task":
+                            break
+
+                    # Execute tool calls: independent ones concurrently, calls
+                    # that change files after earlier calls on the same paths
+                    from app.tools.registry import get_registry
+                    from app.tools.scheduler import ToolScheduler, classify_call
+
+                    registry = get_registry()
+                    calls = []
+                    for _, tool_name, tool_args in scheduled:
+                        tool = registry.get_tool(tool_name, check_availability=True)
+                        calls.append(classify_call(tool, tool_name, self._with_workspace(tool, tool_args, context)))
+
+                    async def run_call(index: int):
+                        _, tool_name, tool_args = scheduled[index]
+                        yield {"type": "start"}
+                        async for event in self._execute_tool_stream(
                             tool_name=tool_name,
                             arguments=tool_args,
                             context=context
-                        )
+                        ):
+                            yield event
 
-                        # Yield tool result
-                        yield {
-                            "type": "tool_call_result",
-                            "tool": tool_name,
-                            "result": tool_result,
-                            "tool_call_id": tool_call.id
-                        }
+                    completed_task = None
+                    scheduler = ToolScheduler(settings.tool_max_parallel)
+                    async for index, event in scheduler.run(calls, run_call):
+                        tool_call, tool_name, tool_args = scheduled[index]
 
-                        # Add tool result to messages
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "content": json.dumps(tool_result)
-                        })
+                        if event["type"] == "start":
+                            logger.info(f"   → Calling: {tool_name}({list(tool_args.keys())})")
 
-                        # Check if complete_task was called
-                        if tool_name == "complete_task":
-                            logger.info("✅ Task completed by LLM")
+                            # Yield tool call start
+                            yield {
+                                "type": "tool_call_start",
+                                "tool": tool_name,
+                                "arguments": tool_args,
+                                "tool_call_id": tool_call.id
+                            }
+
+                        elif event["type"] == "result":
+                            # Yield tool result as soon as this call completes
+                            tool_result = event["result"]
+                            if tool_name == "complete_task":
+                                completed_task = tool_result
+                            yield {
+                                "type": "tool_call_result",
+                                "tool": tool_name,
+                                "result": tool_result,
+                                "tool_call_id": tool_call.id
+                            }
+
+                            tool_messages[tool_call.id] = {
+                                "role": "tool",
+                                "tool_call_id": tool_call.id,
+                                "content": json.dumps(tool_result)
+                            }
+
+                        else:
+                            # Output of long-running tools while they run
                             yield {
-                                "type": "final_response",
-                                "content": tool_result.get("response", ""),
-                                "summary": tool_result.get("summary", ""),
-                                "files_created": tool_result.get("files_created", [])
+                                "type": "tool_output",
+                                "tool": tool_name,
+                                "stream": event["stream"],
+                                "data": event["data"],
+                                "tool_call_id": tool_call.id
                             }
-                            return
 
-                        # Check if ask_human was called
-                        if tool_name == "ask_human":
-                            # This will be handled by HITL system
-                            # The human response will be added to messages
-                            pass
+                    # Add tool results to messages in the order of the calls
+                    messages.extend(
+                        tool_messages[tool_call.id]
+                        for tool_call in message.tool_calls
+                        if tool_call.id in tool_messages
+                    )
+
+                    # Check if complete_task was called
+                    if completed_task is not None:
+                        logger.info("✅ Task completed by LLM")
+                        yield {
+                            "type": "final_response",
+                            "content": completed_task.get("response", ""),
+                            "summary": completed_task.get("summary", ""),
+                            "files_created": completed_task.get("files_created", [])
+                        }
+                        return
 
                     # Continue loop - LLM will see tool results and decide next step
 
@@ -1343,24 +1386,51 @@ For each task, select the right tools and use them effectively."""
         Returns:
             Tool execution result
         """
+        result = None
+        async for event in self._execute_tool_stream(tool_name, arguments, context):
+            if event["type"] == "result":
+                result = event["result"]
+        return result
+
+    async def _execute_tool_stream(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        context: Optional[Dict] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Execute a concrete action tool, yielding its output while it runs
+
+        Args:
+            tool_name: Name of the tool to call (e.g., 'read_file', 'execute_python')
+            arguments: Tool arguments
+            context: Optional context (workspace path, etc.)
+
+        Yields:
+            {"type": "output", "stream", "data"} events from streaming tools
+            (shell_command, execute_python, run_tests), then
+            {"type": "result", "result": <tool execution result dict>}
+        """
         logger.info(f"🔧 Executing tool: {tool_name}({list(arguments.keys())})")
 
         # Special case: ask_human (strategic decision HITL)
         if tool_name == "ask_human":
-            return await self._handle_ask_human(arguments, context)
+            yield {"type": "result", "result": await self._handle_ask_human(arguments, context)}
+            return
 
         # Special case: complete_task (workflow termination)
         if tool_name == "complete_task":
-            return {
+            yield {"type": "result", "result": {
                 "success": True,
                 "summary": arguments.get("summary", ""),
                 "response": arguments.get("response", ""),
                 "files_modified": arguments.get("files_modified", []),
                 "next_steps": arguments.get("next_steps", [])
-            }
+            }}
+            return
 
         # Execute concrete action tool from ToolRegistry
         try:
+            from app.tools.executor import ToolExecutor
             from app.tools.registry import get_registry
 
             registry = get_registry()
@@ -1369,35 +1439,48 @@ For each task, select the right tools and use them effectively."""
             if not tool:
                 error_msg = f"Tool '{tool_name}' not found or unavailable in current network mode"
                 logger.error(f"❌ {error_msg}")
-                return {
+                yield {"type": "result", "result": {
                     "success": False,
                     "error": error_msg,
                     "tool": tool_name
-                }
+                }}
+                return
 
             # Validate parameters
             if not tool.validate_params(**arguments):
                 error_msg = f"Invalid parameters for tool '{tool_name}'"
                 logger.error(f"❌ {error_msg}")
-                return {
+                yield {"type": "result", "result": {
                     "success": False,
                     "error": error_msg,
                     "tool": tool_name,
                     "arguments": arguments
-                }
+                }}
+                return
 
             # Execute tool with context support
             logger.info(f"   → Executing {tool_name} from category: {tool.category.value}")
 
             # For file tools, inject workspace path into arguments if context provided
-            if context and tool.category.value == "file":
-                workspace = context.get("workspace")
-                if workspace and "path" in arguments:
-                    # Inject workspace for path resolution
-                    arguments["_workspace"] = workspace
-                    logger.info(f"   📁 Workspace context: {workspace}")
-
-            result = await tool.execute(**arguments)
+            arguments = self._with_workspace(tool, arguments, context)
+            if "_workspace" in arguments:
+                logger.info(f"   📁 Workspace context: {arguments['_workspace']}")
+
+            # Read-only tools are served from the shared result cache; the
+            # session workspace scopes invalidation by tools without paths
+            executor = ToolExecutor()
+            cache_scope = (context or {}).get("workspace")
+            result, fingerprint = executor.get_cached(tool, arguments, scope=cache_scope)
+
+            if result is None:
+                try:
+                    async for event in tool.execute_stream(**arguments):
+                        if event["type"] == "result":
+                            result = event["result"]
+                        else:
+                            yield event
+                finally:
+                    executor.update_cache(tool, arguments, result, fingerprint, scope=cache_scope)
 
             # Convert ToolResult to dict
             result_dict = result.to_dict()
@@ -1410,17 +1493,38 @@ For each task, select the right tools and use them effectively."""
             else:
                 logger.warning(f"   ⚠️ {tool_name} failed: {result.error}")
 
-            return result_dict
+            yield {"type": "result", "result": result_dict}
 
         except Exception as e:
             error_msg = f"Tool execution error: {str(e)}"
             logger.error(f"❌ {error_msg}", exc_info=True)
-            return {
+            yield {"type": "result", "result": {
                 "success": False,
                 "error": error_msg,
                 "tool": tool_name,
                 "arguments": arguments
-            }
+            }}
+
+    def _with_workspace(
+        self,
+        tool: Optional[Any],
+        arguments: Dict[str, Any],
+        context: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """File tool arguments with the workspace injected for path resolution
+
+        Args:
+            tool: Tool from the ToolRegistry (None for meta/unknown tools)
+            arguments: Tool arguments (not modified)
+            context: Optional context with the workspace path
+
+        Returns:
+            Arguments including _workspace for file tools with a path argument
+        """
+        workspace = (context or {}).get("workspace")
+        if not workspace or "path" not in arguments or tool is None or tool.category.value != "file":
+            return arguments
+        return {**arguments, "_workspace": workspace}
 
     async def _handle_ask_human(
         self,
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Benchmark ContextCompressor extraction on a long, log-heavy history.
+
+Builds a synthetic conversation (chat turns, code blocks, pytest/traceback
+logs) and compares ContextCompressor.extract_important_content against the
+previous implementation, which ran every regex on every message and
+de-duplicated with list scans. Outputs are checked for equivalence first.
+
+Usage:
+    python scripts/benchmark_context_compressor.py [--messages 200] [--log-lines 400]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.context_compressor import ContextCompressor, ContentPriority, ExtractedContent
+
+
+def legacy_extract(message: dict):
+    """extract_important_content before the single scan and per-message caching"""
+    content = message.get('content', '')
+    if not content:
+        return ExtractedContent(), ContentPriority.LOW
+
+    extracted = ExtractedContent()
+    priority = ContentPriority.LOW
+
+    for match in re.compile(r'```(\w*)\n?([\s\S]*?)```', re.MULTILINE).finditer(content):
+        code = match.group(2).strip()
+        if code:
+            extracted.code_blocks.append({'language': match.group(1) or 'text', 'content': code})
+            priority = ContentPriority.HIGH
+
+    for pattern in [
+        r'(?:^|\s)([A-Za-z]:[\\\/][\w\\\/\-\.]+)',
+        r'(?:^|\s)((?:/[\w\-\.]+)+)',
+        r'(?:^|\s)([\w\-]+\.(?:py|js|ts|tsx|jsx|json|yaml|yml|md|txt|html|css|go|rs|java|c|cpp|h))',
+    ]:
+        for match in re.finditer(pattern, content):
+            path = match.group(1).strip()
+            if path and path not in extracted.file_paths:
+                extracted.file_paths.append(path)
+                if priority.value > ContentPriority.HIGH.value:
+                    priority = ContentPriority.HIGH
+
+    for pattern in [
+        r'(?i)(error|exception|failed|failure|traceback|warning)[:.\s]+([^\n]+)',
+        r'(?i)(TypeError|ValueError|KeyError|AttributeError|ImportError|SyntaxError)[:.\s]*([^\n]*)',
+        r'(?i)(?:^|\n)(FAILED|ERROR)[:\s]+([^\n]+)',
+    ]:
+        for match in re.finditer(pattern, content):
+            error_msg = match.group(2).strip()
+            full_error = f"{match.group(1)}: {error_msg}" if error_msg else match.group(1)
+            if full_error not in extracted.error_messages:
+                extracted.error_messages.append(full_error)
+                priority = ContentPriority.CRITICAL
+
+    for pattern in [r'(?:^|\n)\$\s*([^\n]+)', r'(?:^|\n)>\s*([^\n]+)', r'`([^`]+)`']:
+        for match in re.finditer(pattern, content):
+            cmd = match.group(1).strip()
+            if cmd and len(cmd) < 200 and cmd not in extracted.commands:
+                extracted.commands.append(cmd)
+                if priority.value > ContentPriority.MEDIUM.value:
+                    priority = ContentPriority.MEDIUM
+
+    for pattern in [
+        r'(?i)(?:^|\n)(?:let\'s|we should|i will|decided to|choosing|using|implementing)([^\n.]+)',
+        r'(?i)(?:^|\n)(?:approach|solution|plan|strategy)[:.\s]+([^\n]+)',
+    ]:
+        for match in re.finditer(pattern, content):
+            decision = match.group(1).strip()
+            if decision and len(decision) > 10 and decision not in extracted.decisions:
+                extracted.decisions.append(decision[:200])
+                if priority.value > ContentPriority.MEDIUM.value:
+                    priority = ContentPriority.MEDIUM
+
+    for pattern in [
+        r'(?i)(?:^|\n)(?:important|note|remember|key|summary)[:.\s]+([^\n]+)',
+        r'(?i)(?:^|\n)(?:created|modified|deleted|updated)(?:\s+file)?[:.\s]+([^\n]+)',
+    ]:
+        for match in re.finditer(pattern, content):
+            point = match.group(1).strip()
+            if point and point not in extracted.key_points:
+                extracted.key_points.append(point[:200])
+
+    return extracted, priority
+
+
+def build_history(messages: int, log_lines: int) -> list:
+    """Build a synthetic conversation with large tool outputs"""
+    rng = random.Random(0)
+    history = []
+    for i in range(messages):
+        kind = i % 4
+        if kind == 0:
+            content = f"Can you fix the failing test in app/services/module{i}.py? Note: keep the API stable."
+        elif kind == 1:
+            content = (
+                f"Let's update the parser first.\nApproach: split tokens before matching.\n"
+                f"```python\ndef parse_{i}(text):\n    return text.split()\n```\n"
+                f"$ pytest tests/test_module{i}.py -q\nCreated file: tests/test_module{i}.py"
+            )
+        elif kind == 2:
+            lines = []
+            for j in range(log_lines):
+                n = rng.randrange(50)
+                lines.append(rng.choice([
+                    f"tests/test_module{n}.py::test_case_{j} PASSED",
+                    f"FAILED tests/test_module{n}.py::test_case_{j} - AssertionError: expected {n}",
+                    f"  File \"/srv/app/services/module{n}.py\", line {j}, in handler",
+                    f"ValueError: invalid literal for int() with base 10: '{n}'",
+                    f"WARNING: deprecated call in C:\\work\\module{n}.py",
+                    "Traceback (most recent call last):",
+                ]))
+            content = "\n".join(lines)
+        else:
+            content = f"Done. Updated `module{i}.py` and ran the tests; using the new parser everywhere."
+        history.append({"role": "user" if kind == 0 else "assistant", "content": content})
+    return history
+
+
+# Fragments around pattern boundaries: line starts, case folding (the Kelvin
+# sign, long s, dotless and dotted I), unterminated backticks, paths
+EDGE_FRAGMENTS = [
+    "\n", "\n\n", " ", "\t", "`", "```", "````", "``````", "```py\n", "$", "$ ", ">", "> ",
+    "error", "ERROR", "Error:", "error\n\nfoo", "exception. ", "failed", "FAILED ", "failure:",
+    "traceback", "warning ", "TypeError", "typeerror:", "ValueError", "KeyError", "KEYERROR",
+    "AttributeError", "ImportError", "SyntaxError", "valueerrorerror", "TypeTypeError",
+    "\u212aeyError", "\u212aey: ", "\u017fummary: ", "\u0131mportant: ", "\u0130mportant: ",
+    "let's go somewhere nice", "we should", "I will", "decided to", "choosing", "using", "implementing",
+    "approach:", "solution.", "plan ", "strategy", "important", "note:", "remember", "key",
+    "summary", "created file ", "modified", "deleted:", "updated file:", "C:\\work\\a.py",
+    "c:/x/y", "/usr/bin/env", "/a/b.c", "main.py", "x-y.tsx", ".py", "a.pyc", "run tests",
+    "value", "type", "x", "42", ".", ":", "\u00e9", "\ud55c\uae00",
+]
+
+
+def build_edge_cases(count: int) -> list:
+    """Build random messages from EDGE_FRAGMENTS"""
+    rng = random.Random(1)
+    return [
+        {"role": "assistant", "content": "".join(rng.choices(EDGE_FRAGMENTS, k=rng.randrange(1, 40)))}
+        for _ in range(count)
+    ]
+
+
+def timed(label: str, fn, repeat: int) -> float:
+    """Run fn repeat times and print the mean latency"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<48} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--messages", type=int, default=200, help="messages in the history")
+    parser.add_argument("--log-lines", type=int, default=400, help="lines per tool-output message")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per measurement")
+    args = parser.parse_args()
+
+    history = build_history(args.messages, args.log_lines)
+    size = sum(len(m["content"]) for m in history)
+    print(f"History: {len(history)} messages, {size / 1024:.0f} KiB")
+
+    compressor = ContextCompressor()
+    for message in history + build_edge_cases(5000):
+        old_content, old_priority = legacy_extract(message)
+        new_content, new_priority = compressor.extract_important_content(message)
+        assert (old_content, old_priority) == (new_content, new_priority), message["content"][:80]
+    print("Outputs identical to previous implementation")
+
+    print("Extraction over the whole history (mean per pass):")
+    legacy = timed("previous implementation",
+                   lambda: [legacy_extract(m) for m in history], args.repeat)
+    cold = timed("single scan, cold cache",
+                 lambda: [ContextCompressor().extract_important_content(m) for m in history], args.repeat)
+    warm = timed("single scan, warm cache",
+                 lambda: [compressor.extract_important_content(m) for m in history], args.repeat)
+    timed("compress() (sliding window), warm cache",
+          lambda: ContextCompressor.compress(compressor, history), args.repeat)
+
+    print(f"Speedup: {legacy / cold:,.1f}x cold, {legacy / warm:,.0f}x warm")
+
+
+if __name__ == "__main__":
+    main()
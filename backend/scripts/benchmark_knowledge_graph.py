@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark KnowledgeGraph lookups on a large synthetic code graph.
+
+Builds a graph shaped like CodeGraphBuilder output for a large repository
+(file -> contains -> class/function, file -> imports -> dependency) and times
+the lookups HybridRAGBuilder._traverse_graph performs, next to the full-graph
+scan that search_concepts used before secondary indexes were added.
+
+Usage:
+    python scripts/benchmark_knowledge_graph.py [--files 110000] [--defs 8]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.memory.knowledge_graph import KnowledgeGraph, Concept, Relationship
+
+
+def build_graph(files: int, defs_per_file: int, dependencies: int, imports_per_file: int) -> KnowledgeGraph:
+    """Build a synthetic repository graph"""
+    rng = random.Random(0)
+    graph = KnowledgeGraph("benchmark")
+
+    for i in range(dependencies):
+        graph.add_concept(Concept(f"dep:pkg{i}", "dependency", f"pkg{i}", {"source": "synthetic"}))
+
+    for i in range(files):
+        path = f"src/module{i // 100}/file{i}.py"
+        file_id = f"file:{path}"
+        graph.add_concept(Concept(file_id, "file", f"file{i}.py", {
+            "path": path, "extension": ".py", "directory": f"src/module{i // 100}"
+        }))
+
+        for j in range(defs_per_file):
+            kind = "class" if j % 4 == 0 else "function"
+            def_id = f"{kind}:{path}::def{j}"
+            graph.add_concept(Concept(def_id, kind, f"def{j}_{i % 1000}", {"file": path}))
+            graph.add_relationship(Relationship(file_id, def_id, "contains", {}))
+
+        for dep in rng.sample(range(dependencies), imports_per_file):
+            graph.add_relationship(Relationship(file_id, f"dep:pkg{dep}", "imports", {}))
+
+    return graph
+
+
+def scan_search(graph: KnowledgeGraph, concept_type: str, properties: dict) -> list:
+    """search_concepts before indexing: one pass over every node"""
+    return [
+        node_id
+        for node_id, data in graph.graph.nodes(data=True)
+        if data.get("type") == concept_type and all(data.get(k) == v for k, v in properties.items())
+    ]
+
+
+def timed(label: str, fn, repeat: int) -> float:
+    """Run fn repeat times and print the mean latency"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<48} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--files", type=int, default=110000, help="number of file nodes")
+    parser.add_argument("--defs", type=int, default=8, help="class/function nodes per file")
+    parser.add_argument("--dependencies", type=int, default=5000, help="number of dependency nodes")
+    parser.add_argument("--imports", type=int, default=6, help="imports per file")
+    parser.add_argument("--repeat", type=int, default=200, help="repetitions per indexed lookup")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = build_graph(args.files, args.defs, args.dependencies, args.imports)
+    stats = graph.get_statistics()
+    print(f"Built graph: {stats['nodes']:,} nodes, {stats['edges']:,} edges "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    rng = random.Random(1)
+    targets = [rng.randrange(args.files) for _ in range(args.repeat)]
+    names = iter(targets * 3)
+    paths = iter([f"src/module{i // 100}/file{i}.py" for i in targets] * 3)
+
+    print("Lookups (mean per call):")
+    indexed = timed("search_concepts(file, name) - indexed",
+                    lambda: graph.search_concepts("file", {"name": f"file{next(names)}.py"}), args.repeat)
+    scanned = timed("search_concepts(file, name) - full scan",
+                    lambda: scan_search(graph, "file", {"name": f"file{targets[0]}.py"}), 3)
+    timed("search_concepts(function, file) - indexed",
+          lambda: graph.search_concepts("function", {"file": next(paths)}),
+          args.repeat)
+    timed("get_concept(file id)",
+          lambda: graph.get_concept(f"file:{next(paths)}"), args.repeat)
+
+    start_ids = iter([f"file:src/module{i // 100}/file{i}.py" for i in targets] * 3)
+    timed("get_related_concepts(file, depth=2)",
+          lambda: graph.get_related_concepts(next(start_ids), depth=2), args.repeat)
+    timed("get_related_concepts(file, depth=2, max_results=5)",
+          lambda: graph.get_related_concepts(next(start_ids), depth=2, max_results=5), args.repeat)
+    timed("get_related_concepts(file, imports)",
+          lambda: graph.get_related_concepts(next(start_ids), relationship_type="imports"), args.repeat)
+
+    print(f"Indexed name lookup speedup: {scanned / indexed:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
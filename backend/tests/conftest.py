@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+import pytest
+
+from app.memory import graph_store
+from app.memory.graph_store import KnowledgeGraphStore
+
+
+@pytest.fixture(autouse=True)
+def isolated_graph_store(tmp_path, monkeypatch):
+    """Keep knowledge graph snapshots written by tests out of the data directory."""
+    store = KnowledgeGraphStore(directory=str(tmp_path / "knowledge_graphs"))
+    monkeypatch.setattr(graph_store, "_graph_store", store)
+    return store
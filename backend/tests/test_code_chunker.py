@@ -0,0 +1,168 @@
+"""Tests for StructuralChunker - AST/structure-aware code chunking."""
+import pytest
+
+from app.services.code_chunker import StructuralChunker
+
+
+def _method(name: str, body_lines: int) -> str:
+    body = "\n".join(f"        value_{i} = self.compute_{name}({i})" for i in range(body_lines))
+    return f'    def {name}(self):\n        """Docstring for {name}."""\n{body}\n        return value_0\n'
+
+
+def _lines_of(content: str, chunk: dict) -> str:
+    return "\n".join(content.split("\n")[chunk["start_line"] - 1:chunk["end_line"]])
+
+
+class TestPythonChunking:
+    """Test ast-based Python chunking."""
+
+    @pytest.fixture
+    def chunker(self):
+        return StructuralChunker(max_chunk_size=600)
+
+    def test_large_class_split_into_header_and_methods(self, chunker):
+        content = (
+            'import os\n\n\n'
+            'class UserService(BaseService):\n'
+            '    """Handle users."""\n\n'
+            '    table = "users"\n\n'
+            + _method("create", 8) + '\n'
+            + _method("delete", 8) + '\n'
+            + _method("update", 8)
+        )
+
+        chunks = chunker.chunk_python(content, "svc.py", "python")
+
+        assert all(len(chunk["code"]) <= 600 for chunk in chunks)
+        names = [chunk["filename"] for chunk in chunks]
+        assert "svc.py::UserService.delete" in names
+        method_chunk = chunks[names.index("svc.py::UserService.delete")]
+        assert method_chunk["code"].startswith("# class UserService(BaseService):\n    def delete")
+        assert "Docstring for delete" in method_chunk["description"]
+
+    def test_line_ranges_match_source(self, chunker):
+        content = 'class A:\n' + _method("first", 10) + '\n' + _method("second", 10)
+
+        chunks = chunker.chunk_python(content, "a.py", "python")
+
+        for chunk in chunks:
+            code = chunk["code"]
+            if code.startswith("# "):
+                code = code.split("\n", 1)[1]
+            assert code == _lines_of(content, chunk)
+        assert [c["start_line"] for c in chunks] == sorted(c["start_line"] for c in chunks)
+
+    def test_small_definitions_are_merged_not_dropped(self, chunker):
+        content = "\n\n".join(f"def f{i}():\n    return {i}\n" for i in range(30))
+
+        chunks = chunker.chunk_python(content, "small.py", "python")
+
+        joined = "\n".join(chunk["code"] for chunk in chunks)
+        assert all(f"def f{i}():" in joined for i in range(30))
+        assert len(chunks) < 30
+
+    def test_decorators_and_comments_stay_with_definition(self, chunker):
+        content = (
+            '"""Module."""\n' + "X = 1\n" * 40 + '\n'
+            '# Routes the request\n'
+            '@router.get("/items")\n'
+            'def list_items():\n'
+            + "    items = load()\n" * 30 + "    return items\n"
+        )
+
+        chunks = chunker.chunk_python(content, "routes.py", "python")
+
+        func = next(c for c in chunks if c["filename"] == "routes.py::list_items")
+        assert func["code"].startswith("# Routes the request\n@router.get")
+
+    def test_oversized_function_split_with_context(self, chunker):
+        content = "def huge():\n" + "".join(f"    step_{i} = run({i})\n" for i in range(80))
+
+        chunks = chunker.chunk_python(content, "huge.py", "python")
+
+        assert len(chunks) > 1
+        assert all(len(chunk["code"]) <= 600 for chunk in chunks)
+        assert chunks[1]["filename"] == "huge.py::huge::part2"
+        assert chunks[1]["code"].startswith("# def huge():\n")
+
+    def test_oversized_module_code_and_class_attributes_split(self, chunker):
+        rows = "".join(f"    ROW_{i} = compute_row({i})\n" for i in range(40))
+        content = (
+            "".join(f"SETTING_{i} = load_setting({i})\n" for i in range(40))
+            + "\n\nclass Table:\n" + _method("render", 2) + rows + "\n" + _method("flush", 2)
+        )
+
+        chunks = chunker.chunk_python(content, "big.py", "python")
+
+        assert all(len(chunk["code"]) <= 600 for chunk in chunks)
+        names = [chunk["filename"] for chunk in chunks]
+        assert "big.py::module::part2" in names
+        attributes = chunks[names.index("big.py::Table.attributes::part2")]
+        assert attributes["code"].startswith("# class Table:\n    ROW_")
+        covered = set()
+        for chunk in chunks:
+            covered.update(range(chunk["start_line"], chunk["end_line"] + 1))
+        assert covered >= {i + 1 for i, line in enumerate(content.split("\n")) if line.strip()}
+
+    def test_syntax_error_returns_none(self, chunker):
+        assert chunker.chunk_python("def broken(:\n    pass\n", "bad.py", "python") is None
+
+
+class TestJavaScriptChunking:
+    """Test brace-depth based JS/TS chunking."""
+
+    @pytest.fixture
+    def chunker(self):
+        return StructuralChunker(max_chunk_size=500)
+
+    def test_top_level_declarations_with_leading_comments(self, chunker):
+        content = (
+            'import { api } from "./api";\n\n'
+            '/** Fetch all users. */\n'
+            'export async function fetchUsers() {\n'
+            + '  const a = await api.get("/users/{id}");\n' * 6 +
+            '  return a;\n}\n\n'
+            '// Render the list\n'
+            'export const UserList = ({ users }: Props) => {\n'
+            + '  const rows = users.map((u) => `${u.name}}`);\n' * 6 +
+            '  return rows;\n};\n'
+        )
+
+        chunks = chunker.chunk_javascript(content, "users.ts", "typescript")
+
+        # The short import is packed together with the next declaration
+        assert len(chunks) == 2
+        assert "/** Fetch all users. */\nexport async function fetchUsers() {" in chunks[0]["code"]
+        user_list = chunks[1]
+        assert user_list["filename"] == "users.ts::UserList"
+        assert user_list["code"].startswith("// Render the list\nexport const UserList")
+        assert user_list["code"].rstrip().endswith("};")
+
+    def test_large_class_split_into_members(self, chunker):
+        body = "".join(
+            f"  {name}(value: string): void {{\n" + f"    this.items.push(value + '{name}');\n" * 8 + "  }\n\n"
+            for name in ("add", "remove", "update")
+        )
+        content = f"export class Store extends Base {{\n  items: string[] = [];\n\n{body}}}\n"
+
+        chunks = chunker.chunk_javascript(content, "store.ts", "typescript")
+
+        assert all(len(chunk["code"]) <= 500 for chunk in chunks)
+        remove = next(c for c in chunks if c["filename"] == "store.ts::Store.remove")
+        assert remove["code"].startswith("// export class Store extends Base {\n  remove(value: string)")
+        assert remove["code"].split("\n", 1)[1] == _lines_of(content, remove)
+
+    def test_braces_in_strings_and_comments_ignored(self, chunker):
+        scan = chunker._scan_js([
+            'const a = "{";',
+            "// }",
+            "/* {",
+            "} */",
+            "const b = `${x}{`;",
+            "function f() {",
+            "  return 1;",
+            "}",
+        ])
+
+        assert [depth for depth, _ in scan] == [0, 0, 0, 0, 0, 0, 1, 1]
+        assert scan[3] == (0, True)
@@ -299,7 +299,7 @@ function fetchData() {}
     async def test_index_project_with_mock_vector_db(self, temp_workspace):
         """Test project indexing with mocked vector DB."""
         with patch('app.services.code_indexer.vector_db') as mock_vector_db:
-            mock_vector_db.add_code_snippet = MagicMock(return_value="doc_123")
+            mock_vector_db.upsert_code_snippets = MagicMock(return_value=["doc_123"])
             mock_vector_db.search_code = MagicMock(return_value=[])
 
             indexer = CodeIndexer(temp_workspace, "test_session")
@@ -311,14 +311,14 @@ function fetchData() {}
             assert stats.total_chunks > 0
             assert len(stats.files_processed) >= 2
 
-            # Verify add_code_snippet was called
-            assert mock_vector_db.add_code_snippet.called
+            # Verify chunks were bulk upserted
+            assert mock_vector_db.upsert_code_snippets.called
 
     @pytest.mark.asyncio
     async def test_index_single_file(self, temp_workspace):
         """Test indexing a single file."""
         with patch('app.services.code_indexer.vector_db') as mock_vector_db:
-            mock_vector_db.add_code_snippet = MagicMock(return_value="doc_123")
+            mock_vector_db.upsert_code_snippets = MagicMock(return_value=["doc_123"])
 
             indexer = CodeIndexer(temp_workspace, "test_session")
             py_file = Path(temp_workspace) / "test_module.py"
@@ -346,6 +346,285 @@ function fetchData() {}
         assert indexer1 is indexer2
 
 
+class TestIndexingPipeline:
+    """Test batched, pipelined indexing."""
+
+    @pytest.fixture
+    def many_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(40):
+                (Path(tmpdir) / f"module_{i}.py").write_text(
+                    f'"""Module {i}."""\n\n\ndef function_{i}():\n    return {i}\n'
+                )
+            yield tmpdir
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_upserted_in_batches(self, many_files):
+        with patch('app.services.code_indexer.vector_db') as mock_vector_db:
+            mock_vector_db.upsert_code_snippets = MagicMock(return_value=[])
+
+            indexer = CodeIndexer(many_files, "test_session")
+            indexer.EMBED_BATCH_SIZE = 16
+            stats = await indexer.index_project(incremental=False)
+
+        batch_sizes = [len(call.args[0]) for call in mock_vector_db.upsert_code_snippets.call_args_list]
+        assert stats.indexed == 40
+        assert stats.total_chunks == 40
+        assert batch_sizes == [16, 16, 8]
+        assert stats.batches == 3
+
+    @pytest.mark.asyncio
+    async def test_reports_throughput_and_progress(self, many_files):
+        progress = []
+        with patch('app.services.code_indexer.vector_db') as mock_vector_db:
+            mock_vector_db.upsert_code_snippets = MagicMock(return_value=[])
+
+            indexer = CodeIndexer(many_files, "test_session")
+            indexer.EMBED_BATCH_SIZE = 10
+            stats = await indexer.index_project(
+                incremental=False, progress_callback=lambda done, total: progress.append((done, total))
+            )
+
+        assert stats.duration_seconds > 0
+        assert stats.files_per_second > 0
+        assert stats.chunks_per_second > 0
+        assert progress[-1] == (40, 40)
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_marks_its_files_as_errors(self, many_files):
+        with patch('app.services.code_indexer.vector_db') as mock_vector_db:
+            mock_vector_db.upsert_code_snippets = MagicMock(side_effect=[[], RuntimeError("db down"), [], []])
+
+            indexer = CodeIndexer(many_files, "test_session")
+            indexer.EMBED_BATCH_SIZE = 10
+            stats = await indexer.index_project(incremental=False)
+
+        assert stats.indexed == 30
+        assert stats.errors == 10
+        assert len(stats.error_files) == 10
+
+    @pytest.mark.asyncio
+    async def test_unreadable_file_does_not_stop_pipeline(self, many_files):
+        indexer = CodeIndexer(many_files, "test_session")
+        original = indexer._prepare_file
+
+        def flaky(file_path, content=None):
+            if file_path.name == "module_3.py":
+                raise OSError("permission denied")
+            return original(file_path, content)
+
+        with patch('app.services.code_indexer.vector_db') as mock_vector_db, \
+                patch.object(indexer, "_prepare_file", side_effect=flaky):
+            mock_vector_db.upsert_code_snippets = MagicMock(return_value=[])
+            stats = await indexer.index_project(incremental=False)
+
+        assert stats.indexed == 39
+        assert stats.error_files == [str(Path(many_files) / "module_3.py")]
+
+
+def _fake_upsert(snippets, session_id):
+    """Return the IDs the real vector DB would assign."""
+    from app.services.vector_db import VectorDBService
+
+    return [
+        VectorDBService._code_snippet_record(s["code"], s["filename"], s["language"], session_id)[0]
+        for s in snippets
+    ]
+
+
+class TestIncrementalIndexing:
+    """Test manifest-based incremental re-indexing."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        root = tmp_path / "ws"
+        root.mkdir()
+        for name in ("a", "b", "c"):
+            (root / f"{name}.py").write_text(f'"""Module {name}."""\n\n\ndef func_{name}():\n    return 1\n')
+        return root
+
+    @pytest.fixture
+    def mock_vector_db(self):
+        with patch('app.services.code_indexer.vector_db') as mock_vector_db:
+            mock_vector_db.upsert_code_snippets = MagicMock(side_effect=_fake_upsert)
+            mock_vector_db.delete_documents = MagicMock()
+            yield mock_vector_db
+
+    def _indexer(self, workspace, tmp_path, session_id="incr_session"):
+        return CodeIndexer(str(workspace), session_id, manifest_path=str(tmp_path / "manifest.json"))
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_skipped(self, workspace, tmp_path, mock_vector_db):
+        await self._indexer(workspace, tmp_path).index_project()
+        mock_vector_db.upsert_code_snippets.reset_mock()
+
+        # New indexer instance reloads the persisted manifest
+        stats = await self._indexer(workspace, tmp_path).index_project()
+
+        assert stats.indexed == 0
+        assert stats.skipped == 3
+        mock_vector_db.upsert_code_snippets.assert_not_called()
+        mock_vector_db.delete_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_modified_file_replaces_its_chunks(self, workspace, tmp_path, mock_vector_db):
+        indexer = self._indexer(workspace, tmp_path)
+        await indexer.index_project()
+        old_ids = indexer.manifest.entries["b.py"].chunk_ids
+
+        (workspace / "b.py").write_text('"""Module b, changed."""\n\n\ndef func_b2():\n    return 2\n')
+        stats = await indexer.index_project()
+
+        assert stats.indexed == 1
+        assert stats.skipped == 2
+        assert stats.files_processed == [str(workspace / "b.py")]
+        assert mock_vector_db.delete_documents.call_args.args[0] == old_ids
+        assert indexer.manifest.entries["b.py"].chunk_ids != old_ids
+
+    @pytest.mark.asyncio
+    async def test_touched_file_with_same_content_is_skipped(self, workspace, tmp_path, mock_vector_db):
+        indexer = self._indexer(workspace, tmp_path)
+        await indexer.index_project()
+        mock_vector_db.upsert_code_snippets.reset_mock()
+
+        stat = (workspace / "a.py").stat()
+        os.utime(workspace / "a.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        stats = await indexer.index_project()
+
+        assert stats.indexed == 0
+        assert stats.skipped == 3
+        mock_vector_db.upsert_code_snippets.assert_not_called()
+        assert indexer.manifest.entries["a.py"].mtime_ns == stat.st_mtime_ns + 10**9
+
+    @pytest.mark.asyncio
+    async def test_removed_file_chunks_are_deleted(self, workspace, tmp_path, mock_vector_db):
+        indexer = self._indexer(workspace, tmp_path)
+        await indexer.index_project()
+        old_ids = indexer.manifest.entries["c.py"].chunk_ids
+
+        (workspace / "c.py").unlink()
+        stats = await indexer.index_project()
+
+        assert stats.removed == 1
+        assert stats.deleted_chunks == len(old_ids)
+        mock_vector_db.delete_documents.assert_called_once_with(old_ids, "incr_session")
+        assert "c.py" not in indexer.manifest.entries
+
+    @pytest.mark.asyncio
+    async def test_knowledge_graph_updated_from_diff(self, workspace, tmp_path, mock_vector_db):
+        from app.memory.knowledge_graph import get_knowledge_graph
+
+        indexer = self._indexer(workspace, tmp_path, session_id="incr_graph_session")
+        graph = get_knowledge_graph("incr_graph_session", str(workspace))
+        graph.clear()
+        await indexer.index_project()
+
+        (workspace / "b.py").write_text('def func_b2():\n    return 2\n')
+        (workspace / "c.py").unlink()
+        await indexer.index_project()
+
+        b_path = str(workspace / "b.py")
+        assert graph.get_concept("file:a.py") is not None
+        assert graph.get_concept("file:c.py") is None
+        assert graph.get_concept(f"function:{str(workspace / 'c.py')}::func_c") is None
+        assert graph.get_concept(f"function:{b_path}::func_b") is None
+        assert graph.get_concept(f"function:{b_path}::func_b2") is not None
+
+    @pytest.mark.asyncio
+    async def test_chunker_upgrade_rechunks_unchanged_files_once(self, workspace, tmp_path, mock_vector_db):
+        indexer = self._indexer(workspace, tmp_path)
+        await indexer.index_project()
+        indexer.manifest.chunker_version = CodeIndexer.CHUNKER_VERSION - 1
+        indexer.manifest.save()
+
+        stats = await self._indexer(workspace, tmp_path).index_project()
+        assert stats.indexed == 3
+        assert stats.skipped == 0
+
+        stats = await self._indexer(workspace, tmp_path).index_project()
+        assert stats.indexed == 0
+        assert stats.skipped == 3
+
+    @pytest.mark.asyncio
+    async def test_index_paths_reindexes_only_given_changes(self, workspace, tmp_path, mock_vector_db):
+        indexer = self._indexer(workspace, tmp_path)
+        await indexer.index_project()
+        old_c_ids = indexer.manifest.entries["c.py"].chunk_ids
+        mock_vector_db.upsert_code_snippets.reset_mock()
+
+        (workspace / "a.py").write_text('def func_a2():\n    return 2\n')
+        (workspace / "b.py").write_text('def func_b2():\n    return 2\n')
+        (workspace / "c.py").unlink()
+        stats = await indexer.index_paths([
+            str(workspace / "a.py"),
+            str(workspace / "c.py"),
+            str(workspace / ".git" / "index"),
+            str(tmp_path / "outside.py"),
+        ])
+
+        assert stats.files_processed == [str(workspace / "a.py")]
+        assert stats.removed == 1
+        mock_vector_db.delete_documents.assert_any_call(old_c_ids, "incr_session")
+        assert set(indexer.manifest.entries) == {"a.py", "b.py"}
+
+    @pytest.mark.asyncio
+    async def test_index_paths_removed_directory(self, workspace, tmp_path, mock_vector_db):
+        pkg = workspace / "pkg"
+        pkg.mkdir()
+        (pkg / "mod.py").write_text('def mod():\n    return 1\n')
+        indexer = self._indexer(workspace, tmp_path)
+        await indexer.index_project()
+
+        (pkg / "mod.py").unlink()
+        pkg.rmdir()
+        stats = await indexer.index_paths([str(pkg)])
+
+        assert stats.removed == 1
+        assert os.path.join("pkg", "mod.py") not in indexer.manifest.entries
+
+    def test_is_watched_path(self, workspace, tmp_path):
+        indexer = self._indexer(workspace, tmp_path)
+
+        assert indexer.is_watched_path(workspace / "src" / "a.py")
+        assert not indexer.is_watched_path(workspace / "node_modules" / "x.js")
+        assert not indexer.is_watched_path(workspace / ".git" / "HEAD")
+        assert not indexer.is_watched_path(tmp_path / "elsewhere.py")
+
+
+class TestBulkUpsert:
+    """Test VectorDBService.upsert_code_snippets."""
+
+    def test_single_collection_call_with_unique_ids(self):
+        from app.services.vector_db import VectorDBService
+
+        service = VectorDBService("test_bulk")
+        service._collection = MagicMock()
+        service._initialized = True
+        snippet = {"code": "x = 1", "filename": "a.py", "language": "python"}
+
+        doc_ids = service.upsert_code_snippets(
+            [snippet, dict(snippet), {**snippet, "filename": "b.py", "description": "B"}], "s1"
+        )
+
+        assert len(doc_ids) == 3
+        assert doc_ids[0] == doc_ids[1]
+        service._collection.upsert.assert_called_once()
+        kwargs = service._collection.upsert.call_args.kwargs
+        assert len(kwargs["ids"]) == len(set(kwargs["ids"])) == 2
+        assert kwargs["metadatas"][1]["description"] == "B"
+
+    def test_empty_batch_skips_collection(self):
+        from app.services.vector_db import VectorDBService
+
+        service = VectorDBService("test_bulk")
+        service._collection = MagicMock()
+        service._initialized = True
+
+        assert service.upsert_code_snippets([], "s1") == []
+        service._collection.upsert.assert_not_called()
+
+
 class TestIndexingStats:
     """Test IndexingStats dataclass."""
 
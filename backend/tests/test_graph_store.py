@@ -0,0 +1,113 @@
+"""Tests for KnowledgeGraphStore - persisted, memory-bounded knowledge graphs."""
+import threading
+
+import pytest
+
+from app.memory.graph_store import KnowledgeGraphStore
+from app.memory.knowledge_graph import Concept, Relationship
+
+
+def _populate(graph, count=1, prefix="file"):
+    for i in range(count):
+        graph.add_concept(Concept(f"{prefix}:{i}.py", "file", f"{i}.py", {"path": f"{i}.py"}))
+    if count > 1:
+        graph.add_relationship(Relationship(f"{prefix}:0.py", f"{prefix}:1.py", "imports", {}))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return KnowledgeGraphStore(directory=str(tmp_path), max_loaded=2)
+
+
+class TestKnowledgeGraphStore:
+    """Test snapshot persistence, sharing and eviction."""
+
+    def test_graph_loaded_lazily_from_snapshot(self, store, tmp_path):
+        _populate(store.get("s1", "/ws/project"), count=3)
+        assert store.save("s1", "/ws/project") is True
+
+        restored = KnowledgeGraphStore(directory=str(tmp_path)).get("other", "/ws/project")
+
+        assert restored.graph.number_of_nodes() == 3
+        assert [c.id for c in restored.get_related_concepts("file:0.py")] == ["file:1.py"]
+        assert [c.id for c in restored.search_concepts("file", {"path": "2.py"})] == ["file:2.py"]
+        assert restored.dirty is False
+
+    def test_clean_graph_is_not_rewritten(self, store):
+        graph = store.get("s1")
+        assert store.save("s1") is False
+
+        _populate(graph)
+        assert store.save("s1") is True
+        assert store.save("s1") is False
+        assert store.stats["saves"] == 1
+
+    def test_sessions_share_workspace_graph(self, store):
+        graph = store.get("s1", "/ws/project")
+
+        assert store.get("s2", "/ws/project/") is graph
+        assert store.get("s1") is graph
+        assert store.get("s3") is not graph
+
+    def test_lru_eviction_by_count_saves_graph(self, store):
+        _populate(store.get("s1"))
+        store.get("s2")
+        store.get("s3")
+
+        assert store.get_statistics()["loaded_graphs"] == 2
+        assert store.stats["evictions"] == 1
+        assert store.get("s1").graph.number_of_nodes() == 1
+        assert store.stats["loads"] == 1
+
+    def test_lru_eviction_by_node_budget(self, tmp_path):
+        store = KnowledgeGraphStore(directory=str(tmp_path), max_loaded=8, max_nodes=5)
+        _populate(store.get("s1"), count=4)
+        _populate(store.get("s2"), count=4)
+        store.get("s3")
+
+        assert store.get_statistics()["loaded_graphs"] == 2
+        assert store.stats["evictions"] == 1
+
+    def test_evicted_graph_still_referenced_is_reused(self, store):
+        graph = store.get("s1")
+        _populate(graph)
+        store.get("s2")
+        store.get("s3")
+
+        assert store.get("s1") is graph
+
+    def test_persistence_disabled(self):
+        store = KnowledgeGraphStore(directory=None, max_loaded=1)
+        _populate(store.get("s1"))
+        store.get("s2")
+
+        assert store.save_all() == 0
+        assert store.get("s1").graph.number_of_nodes() == 0
+
+    def test_concurrent_gets_load_once_outside_lock(self, store, monkeypatch):
+        loading = threading.Event()
+        release = threading.Event()
+        load = store._load
+        calls = []
+
+        def slow_load(key, session_id):
+            calls.append(key)
+            loading.set()
+            release.wait(5)
+            return load(key, session_id)
+
+        monkeypatch.setattr(store, "_load", slow_load)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(store.get("s1"))) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        assert loading.wait(5)
+
+        other = store.get_statistics()  # the store lock is free during the load
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert other["loaded_graphs"] == 0
+        assert len(calls) == 1
+        assert len(results) == 3 and all(graph is results[0] for graph in results)
@@ -1,6 +1,7 @@
 """Tests for HybridRAG - Phase 3-E verification."""
+import time
 import pytest
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 from pathlib import Path
 
 from app.services.hybrid_rag import (
@@ -10,6 +11,7 @@ from app.services.hybrid_rag import (
     HybridRAGContext,
     get_hybrid_rag_builder
 )
+from app.services.lexical_index import LexicalHit
 from app.memory.knowledge_graph import Concept
 
 
@@ -86,7 +88,7 @@ class TestCodeGraphBuilder:
 
             assert builder.session_id == "test_session"
             assert builder.workspace == Path("/workspace")
-            mock_get_kg.assert_called_once_with("test_session")
+            mock_get_kg.assert_called_once_with("test_session", "/workspace")
 
     def test_detect_language(self):
         """Test language detection from file extension."""
@@ -224,8 +226,68 @@ def test_function():
 
             # Should add: file node + import + class + function
             assert nodes_added >= 4
-            assert mock_graph.add_concept.called
-            assert mock_graph.add_relationship.called
+            assert mock_graph.add_concepts.called
+            assert mock_graph.add_relationships.called
+
+
+class TestCodeGraphBuilderImports:
+    """Test import resolution and incremental updates on a real graph."""
+
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        files = {
+            "main.py": "import os\nfrom pkg.util import helper\n\ndef main():\n    pass\n",
+            "pkg/__init__.py": "",
+            "pkg/util.py": "def helper():\n    pass\n",
+            "pkg/mod.py": "from .util import helper\nimport logging\n",
+            "web/app.ts": "import { render } from './lib';\nimport React from 'react';\n",
+            "web/lib/index.ts": "export function render() {}\n",
+        }
+        for name, content in files.items():
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        return tmp_path
+
+    def _build(self, workspace, session_id="graph_imports"):
+        builder = CodeGraphBuilder(session_id, str(workspace))
+        builder.graph.clear()
+        paths = sorted(str(p) for p in workspace.rglob("*") if p.is_file())
+        builder.build_from_files(paths)
+        return builder
+
+    @staticmethod
+    def _imports(builder, file_id):
+        return sorted(c.id for c in builder.graph.get_related_concepts(file_id, relationship_type="imports"))
+
+    def test_imports_resolved_to_workspace_files(self, workspace):
+        builder = self._build(workspace)
+
+        assert self._imports(builder, "file:main.py") == ["dep:os", "file:pkg/util.py"]
+        assert self._imports(builder, "file:pkg/mod.py") == ["dep:logging", "file:pkg/util.py"]
+        assert self._imports(builder, "file:web/app.ts") == ["dep:react", "file:web/lib/index.ts"]
+        assert builder.graph.get_concept(f"function:{workspace / 'pkg/util.py'}::helper") is not None
+
+    def test_update_keeps_imports_into_changed_file(self, workspace):
+        builder = self._build(workspace)
+        util = workspace / "pkg/util.py"
+        util.write_text("def helper2():\n    pass\n")
+
+        builder.update_files([str(util)], [str(workspace / "pkg/mod.py")])
+
+        assert self._imports(builder, "file:main.py") == ["dep:os", "file:pkg/util.py"]
+        assert builder.graph.get_concept("dep:logging") is None
+        assert builder.graph.get_concept(f"function:{util}::helper") is None
+        assert builder.graph.get_concept(f"function:{util}::helper2") is not None
+
+    def test_process_pool_extraction_matches_serial(self, workspace):
+        serial = self._build(workspace, "graph_serial").graph.export_to_dict()
+
+        with patch.object(CodeGraphBuilder, "PROCESS_POOL_MIN_FILES", 1):
+            pooled = self._build(workspace, "graph_pooled").graph.export_to_dict()
+
+        assert sorted(n["id"] for n in pooled["nodes"]) == sorted(n["id"] for n in serial["nodes"])
+        assert len(pooled["edges"]) == len(serial["edges"])
 
 
 class TestHybridRAGBuilder:
@@ -263,15 +325,71 @@ class TestHybridRAGBuilder:
                 mock_context.conversation_results = 0
                 mock_context.avg_relevance = 0.7
 
-                mock_rag_instance.enrich_query.return_value = ("enriched", mock_context)
+                mock_rag_instance.build_context_from_results.return_value = mock_context
+                mock_rag_instance.search_conversation.return_value = ("", [])
 
-                builder = HybridRAGBuilder("test_session")
-                context = builder.build_context("test query")
+                with patch('app.services.hybrid_rag.vector_db'), \
+                        patch('app.services.hybrid_rag.get_lexical_index'):
+                    builder = HybridRAGBuilder("test_session")
+                    context = builder.build_context("test query")
 
                 assert isinstance(context, HybridRAGContext)
                 assert context.vector_results_count == 3
                 assert context.search_query == "test query"
 
+    @pytest.mark.asyncio
+    async def test_build_context_async_partial_on_slow_graph(self):
+        """Test async hybrid context keeps vector results when graph traversal is slow."""
+        from app.services.rag_context import RAGContext
+
+        with patch('app.services.hybrid_rag.get_knowledge_graph'):
+            with patch('app.services.hybrid_rag.RAGContextBuilder') as mock_rag:
+                mock_rag_instance = MagicMock()
+                mock_rag.return_value = mock_rag_instance
+                mock_rag_instance.build_context_from_results.return_value = RAGContext(
+                    formatted_context="## Code\n...",
+                    results_count=2,
+                    files_referenced=["file1.py"],
+                    avg_relevance=0.8,
+                    search_query="q"
+                )
+                mock_rag_instance.search_conversation_async = AsyncMock(return_value=("## Conv", [1]))
+
+                with patch('app.services.hybrid_rag.vector_db'), \
+                        patch('app.services.hybrid_rag.get_lexical_index'):
+                    builder = HybridRAGBuilder("test_session")
+                    with patch.object(builder, '_traverse_graph', side_effect=lambda *a: time.sleep(1.0) or []):
+                        enriched, context = await builder.enrich_query_async("q", timeout=0.2)
+
+                assert context.timed_out_sources == ["graph"]
+                assert context.vector_results_count == 2
+                assert context.conversation_results == 1
+                assert enriched == "q\n\n## Code\n...\n\n## Conv"
+
+    def test_search_code_fuses_vector_and_lexical_results(self):
+        """Test RRF fusion adds lexical-only hits and drops irrelevant vector hits."""
+        from app.services.vector_db import SearchResult
+
+        def result(doc_id, distance):
+            return SearchResult(id=doc_id, content="code", metadata={"filename": f"{doc_id}.py"}, distance=distance)
+
+        with patch('app.services.hybrid_rag.get_knowledge_graph'), \
+                patch('app.services.hybrid_rag.vector_db') as mock_db, \
+                patch('app.services.hybrid_rag.get_lexical_index') as mock_get_index:
+            mock_db.search_code.return_value = [result("v1", 0.2), result("both", 0.3), result("far", 0.9)]
+            mock_db.get_documents.side_effect = lambda ids: [result(doc_id, 0.0) for doc_id in ids]
+            mock_get_index.return_value.search.return_value = [
+                LexicalHit("both", 9.0, "python"), LexicalHit("lex", 5.0, "python")
+            ]
+
+            builder = HybridRAGBuilder("test_session")
+            context = builder._search_code("parse_manifest", n_results=3, min_relevance=0.5)
+
+        mock_db.search_code.assert_called_once_with(query="parse_manifest", session_id="test_session", n_results=3)
+        mock_db.get_documents.assert_called_once_with(["lex"])
+        assert context.files_referenced == ["both.py", "v1.py", "lex.py"]
+        assert context.avg_relevance == pytest.approx(1 - (0.3 + 0.2 + 0.5) / 3)
+
     def test_traverse_graph(self):
         """Test graph traversal from starting files."""
         with patch('app.services.hybrid_rag.get_knowledge_graph') as mock_get_kg:
@@ -286,26 +404,46 @@ class TestHybridRAGBuilder:
                     name="test.py",
                     properties={}
                 )
+                mock_graph.get_concept.return_value = None
                 mock_graph.search_concepts.return_value = [mock_file_node]
 
-                # Mock get_related_concepts
+                # Mock traversal (concept, relationship type, depth)
                 mock_related = Concept(
                     id="class:TestClass",
                     type="class",
                     name="TestClass",
                     properties={"file": "test.py"}
                 )
-                mock_graph.get_related_concepts.return_value = [mock_related]
-
-                # Mock edge data
-                mock_graph.graph.get_edge_data.return_value = {"type": "contains"}
+                mock_graph.traverse.return_value = [(mock_related, "contains", 1)]
 
                 builder = HybridRAGBuilder("test_session")
                 results = builder._traverse_graph(["test.py"], depth=2, max_results=5)
 
+                mock_graph.search_concepts.assert_called_once_with("file", {"name": "test.py"})
                 assert len(results) >= 1
                 assert results[0].concept_type == "class"
                 assert results[0].name == "TestClass"
+                assert results[0].relationship == "contains"
+
+    def test_traverse_graph_from_chunk_path(self):
+        """Test traversal starts from the file node of a chunk reference."""
+        from app.memory.knowledge_graph import KnowledgeGraph, Relationship
+
+        graph = KnowledgeGraph("traverse_session")
+        graph.add_concept(Concept("file:app/svc.py", "file", "svc.py", {"path": "app/svc.py"}))
+        graph.add_concept(Concept("file:other/svc.py", "file", "svc.py", {"path": "other/svc.py"}))
+        graph.add_concept(Concept("class:Svc", "class", "Svc", {}))
+        graph.add_concept(Concept("function:helper", "function", "helper", {}))
+        graph.add_relationship(Relationship("file:app/svc.py", "class:Svc", "contains", {}))
+        graph.add_relationship(Relationship("class:Svc", "function:helper", "calls", {}))
+
+        with patch('app.services.hybrid_rag.get_knowledge_graph', return_value=graph):
+            builder = HybridRAGBuilder("test_session")
+            results = builder._traverse_graph(["app/svc.py::Svc.run"], depth=2, max_results=5)
+
+        assert [(r.name, r.relationship, r.depth) for r in results] == [
+            ("Svc", "contains", 1), ("helper", "calls", 2)
+        ]
 
     def test_format_graph_results_empty(self):
         """Test formatting empty results."""
@@ -373,10 +511,13 @@ class TestHybridRAGBuilder:
                 mock_context.conversation_results = 0
                 mock_context.avg_relevance = 0.8
 
-                mock_rag_instance.enrich_query.return_value = ("enriched", mock_context)
+                mock_rag_instance.build_context_from_results.return_value = mock_context
+                mock_rag_instance.search_conversation.return_value = ("", [])
 
-                builder = HybridRAGBuilder("test_session")
-                enriched, context = builder.enrich_query("How do I use this?")
+                with patch('app.services.hybrid_rag.vector_db'), \
+                        patch('app.services.hybrid_rag.get_lexical_index'):
+                    builder = HybridRAGBuilder("test_session")
+                    enriched, context = builder.enrich_query("How do I use this?")
 
                 assert "How do I use this?" in enriched
                 assert isinstance(context, HybridRAGContext)
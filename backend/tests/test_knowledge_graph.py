@@ -0,0 +1,85 @@
+"""Tests for KnowledgeGraph secondary indexes and traversal."""
+import pytest
+
+from app.memory.knowledge_graph import KnowledgeGraph, Concept, Relationship
+
+
+@pytest.fixture
+def graph():
+    graph = KnowledgeGraph("kg_test")
+    graph.add_concept(Concept("file:a/main.py", "file", "main.py", {"path": "a/main.py"}))
+    graph.add_concept(Concept("file:b/main.py", "file", "main.py", {"path": "b/main.py"}))
+    graph.add_concept(Concept("class:a/main.py::App", "class", "App", {"file": "a/main.py"}))
+    graph.add_concept(Concept("function:a/main.py::run", "function", "run", {"file": "a/main.py"}))
+    graph.add_concept(Concept("dep:os", "dependency", "os", {"source": "a/main.py"}))
+    graph.add_relationship(Relationship("file:a/main.py", "class:a/main.py::App", "contains", {}))
+    graph.add_relationship(Relationship("file:a/main.py", "function:a/main.py::run", "contains", {}))
+    graph.add_relationship(Relationship("file:a/main.py", "dep:os", "imports", {}))
+    graph.add_relationship(Relationship("class:a/main.py::App", "function:a/main.py::run", "calls", {}))
+    return graph
+
+
+class TestSearchConcepts:
+    """Test index-backed concept search."""
+
+    def test_search_by_type_name_and_indexed_property(self, graph):
+        assert [c.id for c in graph.search_concepts("file", {"name": "main.py"})] == [
+            "file:a/main.py", "file:b/main.py"
+        ]
+        assert [c.id for c in graph.search_concepts("file", {"path": "b/main.py"})] == ["file:b/main.py"]
+        assert [c.name for c in graph.search_concepts("function", {"file": "a/main.py"})] == ["run"]
+        assert graph.search_concepts("class", {"name": "main.py"}) == []
+
+    def test_non_indexed_property_is_still_filtered(self, graph):
+        assert [c.id for c in graph.search_concepts("dependency", {"source": "a/main.py"})] == ["dep:os"]
+        assert graph.search_concepts("dependency", {"source": "b/main.py"}) == []
+
+        graph.add_index("source")
+        assert [c.id for c in graph.search_concepts("dependency", {"source": "a/main.py"})] == ["dep:os"]
+
+    def test_indexes_follow_updates_and_removal(self, graph):
+        graph.add_concept(Concept("file:b/main.py", "file", "app.py", {"path": "b/main.py"}))
+        graph.remove_concept("file:a/main.py")
+
+        assert graph.search_concepts("file", {"name": "main.py"}) == []
+        assert [c.id for c in graph.search_concepts("file", {"name": "app.py"})] == ["file:b/main.py"]
+        assert graph.get_statistics()["by_type"] == {"file": 1, "class": 1, "function": 1, "dependency": 1}
+
+    def test_indexes_rebuilt_on_import(self, graph):
+        data = graph.export_to_dict()
+        restored = KnowledgeGraph("kg_restored")
+        restored.import_from_dict(data)
+
+        assert [c.id for c in restored.search_concepts("file", {"path": "a/main.py"})] == ["file:a/main.py"]
+
+
+class TestTraversal:
+    """Test bounded BFS traversal."""
+
+    def test_each_concept_reported_once_at_shallowest_depth(self, graph):
+        results = graph.traverse("file:a/main.py", depth=2)
+
+        assert [(c.id, rel, depth) for c, rel, depth in results] == [
+            ("class:a/main.py::App", "contains", 1),
+            ("function:a/main.py::run", "contains", 1),
+            ("dep:os", "imports", 1),
+        ]
+
+    def test_relationship_filter_is_not_followed_through_other_edges(self, graph):
+        related = graph.get_related_concepts("file:a/main.py", relationship_type="imports", depth=3)
+        assert [c.id for c in related] == ["dep:os"]
+
+        related = graph.get_related_concepts("class:a/main.py::App", relationship_type="contains")
+        assert related == []
+
+    def test_max_results_stops_early(self, graph):
+        assert len(graph.get_related_concepts("file:a/main.py", depth=2, max_results=2)) == 2
+
+    def test_reverse_follows_incoming_relationships(self, graph):
+        graph.add_concept(Concept("file:b/app.py", "file", "app.py", {"path": "b/app.py"}))
+        graph.add_relationship(Relationship("file:b/main.py", "file:a/main.py", "imports", {}))
+        graph.add_relationship(Relationship("file:b/app.py", "file:b/main.py", "imports", {}))
+
+        related = graph.get_related_concepts("file:a/main.py", relationship_type="imports", depth=5, reverse=True)
+        assert [c.id for c in related] == ["file:b/main.py", "file:b/app.py"]
+        assert [c.id for c in graph.get_related_concepts("dep:os", reverse=True)] == ["file:a/main.py"]
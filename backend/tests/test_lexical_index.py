@@ -0,0 +1,90 @@
+"""Tests for LexicalIndex - identifier-aware BM25 retrieval."""
+import pytest
+from unittest.mock import patch
+
+from app.services.lexical_index import LexicalIndex, reciprocal_rank_fusion, tokenize
+
+
+def _chunk(code, filename="a.py", language="python"):
+    return {"code": code, "filename": filename, "language": language, "description": ""}
+
+
+@pytest.fixture
+def index():
+    with patch("app.services.lexical_index.vector_db") as mock_db:
+        mock_db.get_code_documents.return_value = []
+        index = LexicalIndex("lex_session")
+        index.ensure_loaded()
+        yield index
+
+
+class TestTokenize:
+    """Test identifier-aware tokenization."""
+
+    def test_splits_camel_and_snake_case(self):
+        assert tokenize("getUserById") == ["getuserbyid", "get", "user", "id"]
+        assert tokenize("MAX_CHUNK_SIZE") == ["maxchunksize", "max", "chunk", "size"]
+        assert tokenize("HTTPServer") == ["httpserver", "http", "server"]
+
+    def test_snake_and_camel_identifiers_share_full_token(self):
+        assert tokenize("get_user_by_id")[0] == tokenize("getUserById")[0]
+
+    def test_drops_stopwords_and_single_characters(self):
+        assert tokenize("def the x(self): return a") == []
+
+
+class TestLexicalIndex:
+    """Test BM25 index maintenance and ranking."""
+
+    def test_exact_identifier_ranks_first(self, index):
+        index.add_chunks(["d1", "d2", "d3"], [
+            _chunk("def create_user(name):\n    return save(name)"),
+            _chunk("def validate_token(token):\n    raise TokenExpiredError('expired')"),
+            _chunk("user = create(user_name)"),
+        ])
+
+        assert index.search("TokenExpiredError")[0].doc_id == "d2"
+        assert index.search("create_user")[0].doc_id == "d1"
+
+    def test_remove_and_replace(self, index):
+        index.add_chunks(["d1", "d2"], [_chunk("alpha_handler()"), _chunk("beta_handler()")])
+        index.remove(["d1", "missing"])
+        index.add_chunks(["d2"], [_chunk("gamma_handler()")])
+
+        assert len(index) == 1
+        assert index.search("alpha") == []
+        assert index.search("beta") == []
+        assert index.search("gamma_handler")[0].doc_id == "d2"
+
+    def test_language_filter(self, index):
+        index.add_chunks(["py", "ts"], [
+            _chunk("load_config()"),
+            _chunk("loadConfig()", "a.ts", "typescript"),
+        ])
+
+        hits = index.search("loadConfig", language="typescript")
+
+        assert [hit.doc_id for hit in hits] == ["ts"]
+
+    def test_adds_before_load_are_read_from_vector_db(self):
+        with patch("app.services.lexical_index.vector_db") as mock_db:
+            mock_db.get_code_documents.return_value = [
+                ("d1", "desc\n\nFilename: a.py\nLanguage: python\n\nparse_manifest()", {"language": "python"})
+            ]
+            index = LexicalIndex("lazy_session")
+            index.add_chunks(["ignored"], [_chunk("other()")])
+
+            hits = index.search("parse_manifest")
+
+        assert [hit.doc_id for hit in hits] == ["d1"]
+        assert len(index) == 1
+
+
+class TestReciprocalRankFusion:
+    """Test rank fusion."""
+
+    def test_documents_in_both_lists_rank_first(self):
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]])
+
+        assert fused[0] == "c"
+        assert set(fused) == {"a", "b", "c", "d"}
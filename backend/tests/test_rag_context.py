@@ -1,4 +1,5 @@
 """Tests for RAGContextBuilder - Phase 3-C verification."""
+import time
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -259,5 +260,73 @@ class TestRAGIntegration:
             assert context is not None
 
 
+class TestAsyncEnrichment:
+    """Test concurrent retrieval with a latency budget."""
+
+    @pytest.fixture
+    def code_result(self):
+        return SearchResult(
+            id="doc1",
+            content="desc\n\nFilename: a.py\nLanguage: python\n\ndef a():\n    pass",
+            metadata={"filename": "a.py", "language": "python"},
+            distance=0.2
+        )
+
+    def _slow(self, delay, value):
+        def search(*args, **kwargs):
+            time.sleep(delay)
+            return value
+        return search
+
+    @pytest.mark.asyncio
+    async def test_code_and_conversation_searches_run_concurrently(self, code_result):
+        builder = RAGContextBuilder("async_session")
+
+        with patch('app.services.rag_context.vector_db') as mock_db:
+            mock_db.search_code.side_effect = self._slow(0.3, [code_result])
+            with patch.object(builder, 'search_conversation',
+                              side_effect=self._slow(0.3, ("## Previous Conversation", [MagicMock()]))):
+                start = time.monotonic()
+                enriched, context = await builder.enrich_query_async("question", timeout=5)
+                elapsed = time.monotonic() - start
+
+        assert elapsed < 0.55
+        assert context.results_count == 1
+        assert context.conversation_results == 1
+        assert "Relevant Code from Project" in enriched
+        assert "## Previous Conversation" in enriched
+        assert context.timed_out_sources == []
+
+    @pytest.mark.asyncio
+    async def test_slow_source_is_dropped_after_budget(self, code_result):
+        builder = RAGContextBuilder("async_session")
+
+        with patch('app.services.rag_context.vector_db') as mock_db:
+            mock_db.search_code.side_effect = self._slow(0.0, [code_result])
+            with patch.object(builder, 'search_conversation',
+                              side_effect=self._slow(1.0, ("## Previous Conversation", [MagicMock()]))):
+                start = time.monotonic()
+                enriched, context = await builder.enrich_query_async("question", timeout=0.2)
+                elapsed = time.monotonic() - start
+
+        assert elapsed < 0.6
+        assert context.timed_out_sources == ["conversation"]
+        assert context.results_count == 1
+        assert context.conversation_results == 0
+        assert "Relevant Code from Project" in enriched
+
+    @pytest.mark.asyncio
+    async def test_failed_source_returns_remaining_results(self):
+        builder = RAGContextBuilder("async_session")
+
+        with patch.object(builder, 'build_context', side_effect=RuntimeError("db down")):
+            with patch.object(builder, 'search_conversation', return_value=("## Previous Conversation", [1, 2])):
+                enriched, context = await builder.enrich_query_async("question")
+
+        assert context.results_count == 0
+        assert context.conversation_results == 2
+        assert enriched == "question\n\n## Previous Conversation"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+"""Tests for affected test selection from the knowledge graph import relationships."""
+import os
+
+import pytest
+
+from app.services.hybrid_rag import CodeGraphBuilder
+from app.services.test_selection import SELECTION_SESSION_ID, is_test_file, select_affected_tests
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    files = {
+        "pkg/__init__.py": "",
+        "pkg/calc.py": "def add(a, b):\n    return a + b\n",
+        "pkg/util.py": "from pkg.calc import add\n\ndef double(x):\n    return add(x, x)\n",
+        "pkg/other.py": "def other():\n    return 1\n",
+        "tests/test_util.py": "from pkg.util import double\n\ndef test_double():\n    assert double(2) == 4\n",
+        "tests/test_other.py": "from pkg.other import other\n\ndef test_other():\n    assert other() == 1\n",
+        "tests/helpers.py": "from pkg.calc import add\n",
+        "build/test_generated.py": "from pkg.calc import add\n",
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def _relative(workspace, paths):
+    return [os.path.relpath(path, workspace) for path in paths]
+
+
+class TestSelectAffectedTests:
+    """Test selection of tests that import changed files."""
+
+    def test_transitive_importers_selected(self, workspace):
+        selected = select_affected_tests(str(workspace), ["pkg/calc.py"])
+
+        assert _relative(workspace, selected) == ["tests/test_util.py"]
+
+    def test_changed_test_file_and_absolute_paths(self, workspace):
+        selected = select_affected_tests(
+            str(workspace), [str(workspace / "tests/test_other.py"), str(workspace / "pkg/util.py")]
+        )
+
+        assert _relative(workspace, selected) == ["tests/test_other.py", "tests/test_util.py"]
+
+    def test_unrelated_and_non_python_changes_select_nothing(self, workspace):
+        assert select_affected_tests(str(workspace), ["README.md", "pkg/__init__.py"]) == []
+
+    def test_conftest_change_selects_everything(self, workspace):
+        assert select_affected_tests(str(workspace), ["tests/conftest.py"]) is None
+
+    def test_conftest_importing_changed_file_selects_its_directory(self, workspace):
+        (workspace / "pkg/fixtures.py").write_text("def make():\n    return 1\n")
+        (workspace / "tests/unit").mkdir()
+        (workspace / "tests/unit/conftest.py").write_text("from pkg.fixtures import make\n")
+        (workspace / "tests/unit/test_plain.py").write_text("def test_plain(make):\n    pass\n")
+
+        selected = select_affected_tests(str(workspace), ["pkg/fixtures.py"])
+
+        assert _relative(workspace, selected) == ["tests/unit/test_plain.py"]
+
+    def test_untraceable_non_python_change_selects_everything(self, workspace):
+        assert select_affected_tests(str(workspace), ["pkg/data.json", "docs/logo.png"]) is None
+
+    def test_new_imports_are_picked_up(self, workspace):
+        select_affected_tests(str(workspace), ["pkg/calc.py"])
+        (workspace / "pkg/other.py").write_text("from pkg.calc import add\n")
+
+        selected = select_affected_tests(str(workspace), ["pkg/other.py", "pkg/calc.py"])
+
+        assert _relative(workspace, selected) == ["tests/test_other.py", "tests/test_util.py"]
+
+    def test_deleted_file_selects_its_importers(self, workspace):
+        select_affected_tests(str(workspace), [])
+        (workspace / "pkg/other.py").unlink()
+
+        selected = select_affected_tests(str(workspace), ["pkg/other.py"])
+
+        assert _relative(workspace, selected) == ["tests/test_other.py"]
+        assert not CodeGraphBuilder(SELECTION_SESSION_ID, str(workspace)).has_file(str(workspace / "pkg/other.py"))
+
+    def test_test_root_limits_selection(self, workspace):
+        assert select_affected_tests(str(workspace), ["pkg/calc.py"], str(workspace / "pkg")) == []
+
+    def test_is_test_file(self):
+        assert is_test_file("tests/test_api.py")
+        assert is_test_file("api_test.py")
+        assert not is_test_file("tests/helpers.py")
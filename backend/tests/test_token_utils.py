@@ -0,0 +1,109 @@
+"""Tests for shared.utils.token_utils - cached and incremental token counting"""
+import pytest
+
+from shared.utils import token_utils
+from shared.utils.token_utils import (
+    TokenCounter,
+    configure_tokenizer,
+    count_messages_tokens,
+    count_tokens_accurate,
+    find_local_tokenizer,
+    set_tokenizer,
+)
+
+
+class FakeTokenizer:
+    """One token per character, counts encode() calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text, add_special_tokens=True):
+        self.calls += 1
+        return list(text)
+
+
+@pytest.fixture(autouse=True)
+def reset_tokenizer():
+    set_tokenizer(None)
+    yield
+    set_tokenizer(None)
+
+
+class TestTokenCache:
+    """Test per-content caching"""
+
+    def test_repeat_counts_hit_cache(self, monkeypatch):
+        text = "def foo():\n    return `bar`  # 안녕하세요"
+        first = count_tokens_accurate(text)
+
+        monkeypatch.setattr(token_utils, "_CJK_PATTERN", None)  # a rescan would fail
+        assert count_tokens_accurate(text) == first
+
+    def test_cache_is_per_model_and_bounded(self, monkeypatch):
+        monkeypatch.setattr(token_utils, "TOKEN_CACHE_SIZE", 3)
+        text = " ".join(["word"] * 40)
+
+        assert count_tokens_accurate(text, "claude-3-opus") > count_tokens_accurate(text)
+        for i in range(10):
+            count_tokens_accurate(f"text {i}")
+        assert len(token_utils._token_cache) == 3
+
+    def test_role_costs_fixed_overhead(self):
+        messages = [{"role": "user", "content": "hello"}, {"role": "", "content": "hello"}]
+
+        assert count_messages_tokens(messages) == 2 * (4 + count_tokens_accurate("hello")) + 1 + 3
+
+
+class TestTokenCounter:
+    """Test the running total API"""
+
+    def test_running_total_matches_full_count(self):
+        messages = [{"role": "user", "content": f"question {i}?"} for i in range(5)]
+        counter = TokenCounter()
+        assert counter.total == 0
+
+        for message in messages:
+            counter.add(message)
+            assert counter.total == count_messages_tokens(messages[:counter.message_count])
+
+        counter.remove(messages[0])
+        assert counter.total == count_messages_tokens(messages[1:])
+
+    def test_add_counts_only_new_message(self):
+        tokenizer = FakeTokenizer()
+        set_tokenizer(tokenizer)
+        counter = TokenCounter([{"role": "user", "content": f"m{i}"} for i in range(10)])
+        tokenizer.calls = 0
+
+        counter.add({"role": "assistant", "content": "reply"})
+
+        assert tokenizer.calls == 1
+        assert counter.total == 10 * (4 + 2 + 1) + (4 + 5 + 1) + 3
+
+
+class TestTokenizerBackend:
+    """Test the optional tokenizer backend"""
+
+    def test_tokenizer_used_for_default_and_its_model(self):
+        set_tokenizer(FakeTokenizer(), "org/model")
+
+        assert count_tokens_accurate("abcdef") == 6
+        assert count_tokens_accurate("abcdef", "org/model") == 6
+        assert count_tokens_accurate("abcdef", "gpt-4") == 1
+
+    def test_find_local_tokenizer_in_hf_cache(self, tmp_path, monkeypatch):
+        snapshot = tmp_path / "models--org--model" / "snapshots" / "abc123"
+        snapshot.mkdir(parents=True)
+        (snapshot / "tokenizer.json").write_text("{}")
+        monkeypatch.setenv("HF_HUB_CACHE", str(tmp_path))
+
+        assert find_local_tokenizer("org/model") == str(snapshot / "tokenizer.json")
+        assert find_local_tokenizer("org/other") is None
+
+    def test_configure_falls_back_without_tokenizer(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HF_HUB_CACHE", str(tmp_path))
+
+        assert configure_tokenizer("org/missing") is False
+        assert configure_tokenizer(tokenizer_file=str(tmp_path / "broken.json")) is False
+        assert token_utils._tokenizer is None
@@ -0,0 +1,102 @@
+"""Tests for VectorDBService query caching."""
+import pytest
+from unittest.mock import MagicMock
+
+from app.services.vector_db import VectorDBService
+
+
+def _query_response(doc_id="doc1"):
+    return {
+        "ids": [[doc_id]],
+        "documents": [["content"]],
+        "metadatas": [[{"filename": "a.py"}]],
+        "distances": [[0.1]],
+    }
+
+
+@pytest.fixture
+def service():
+    embedding_fn = MagicMock(side_effect=lambda texts: [[float(len(text)), 1.0] for text in texts])
+    service = VectorDBService("test_cache", embedding_fn=embedding_fn)
+    service._collection = MagicMock()
+    service._collection.query.return_value = _query_response()
+    service._initialized = True
+    return service
+
+
+class TestQueryCache:
+    """Test search result and query embedding caching."""
+
+    def test_repeated_search_hits_cache(self, service):
+        first = service.search_code("create user", session_id="s1")
+        second = service.search_code("create user", session_id="s1")
+
+        assert first == second
+        service._collection.query.assert_called_once()
+        assert service._collection.query.call_args.kwargs["query_embeddings"] == [[11.0, 1.0]]
+        stats = service.get_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_key_includes_filter_and_result_count(self, service):
+        service.search_code("create user", session_id="s1")
+        service.search_code("create user", session_id="s2")
+        service.search_code("create user", session_id="s1", n_results=10)
+        service.search_code("create user", session_id="s1", language="python")
+
+        assert service._collection.query.call_count == 4
+        # The query embedding is computed once and reused
+        service._embedding_fn.assert_called_once()
+        assert service.get_cache_stats()["embedding_hits"] == 3
+
+    def test_write_invalidates_only_that_session(self, service):
+        service.search_code("create user", session_id="s1")
+        service.search_code("create user", session_id="s2")
+
+        service.upsert_code_snippets([{"code": "x = 1", "filename": "a.py", "language": "python"}], "s1")
+        service.search_code("create user", session_id="s1")
+        service.search_code("create user", session_id="s2")
+
+        assert service._collection.query.call_count == 3
+
+    def test_delete_without_session_invalidates_everything(self, service):
+        service.search_code("create user", session_id="s1")
+        service.search("create user")
+
+        service.delete_documents(["doc1"])
+        service.search_code("create user", session_id="s1")
+        service.search("create user")
+
+        assert service._collection.query.call_count == 4
+
+    def test_unscoped_search_invalidated_by_any_write(self, service):
+        service.search("create user")
+        service.add_documents(["doc"], ["id1"], [{"session_id": "s9"}])
+        service.search("create user")
+
+        assert service._collection.query.call_count == 2
+
+    def test_failed_search_is_not_cached(self, service):
+        service._collection.query.side_effect = [RuntimeError("down"), _query_response()]
+
+        assert service.search("create user") == []
+        assert len(service.search("create user")) == 1
+
+    def test_lru_eviction(self, service):
+        service.QUERY_CACHE_SIZE = 2
+        for query in ("a", "b", "c"):
+            service.search(query)
+        service.search("a")
+
+        assert service._collection.query.call_count == 4
+        assert service.get_cache_stats()["size"] == 2
+
+    def test_stats_expose_cache_counters(self, service):
+        service._collection.count.return_value = 5
+        service.search("q")
+        service.search("q")
+
+        stats = service.get_stats()
+
+        assert stats["document_count"] == 5
+        assert stats["query_cache"]["hits"] == 1
+        assert stats["query_cache"]["hit_rate"] == 0.5
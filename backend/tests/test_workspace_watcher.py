@@ -0,0 +1,162 @@
+"""Tests for WorkspaceWatcher - debounced live re-indexing."""
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock, AsyncMock, patch
+
+import pytest
+
+from app.services.code_indexer import CodeIndexer, IndexingStats
+from app.services import workspace_watcher
+from app.services.workspace_watcher import WorkspaceWatcher
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "ws"
+    root.mkdir()
+    (root / "a.py").write_text("def a():\n    return 1\n")
+    return root
+
+
+@pytest.fixture
+def indexer(workspace, tmp_path):
+    indexer = CodeIndexer(str(workspace), "watch_session", manifest_path=str(tmp_path / "manifest.json"))
+    indexer.index_paths = AsyncMock(return_value=IndexingStats())
+    indexer.index_project = AsyncMock(return_value=IndexingStats())
+    return indexer
+
+
+def _watcher(indexer, **kwargs):
+    options = dict(debounce_seconds=0.05, max_delay_seconds=1.0, poll_interval=0.05, use_watchdog=False)
+    options.update(kwargs)
+    return WorkspaceWatcher(indexer, **options)
+
+
+async def _wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestDebounce:
+    """Test event coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced_into_one_batch(self, workspace, indexer):
+        watcher = _watcher(indexer)
+        await watcher.start()
+        try:
+            for i in range(20):
+                watcher.notify([str(workspace / f"f{i}.py")])
+            watcher.notify([str(workspace / "f0.py")])
+
+            await _wait_for(lambda: watcher.batches == 1)
+            indexer.index_paths.assert_awaited_once()
+            assert len(indexer.index_paths.call_args.args[0]) == 20
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_ignored_paths_do_not_trigger_reindex(self, workspace, tmp_path, indexer):
+        watcher = _watcher(indexer)
+        await watcher.start()
+        try:
+            watcher.notify([str(workspace / ".git" / "index"), str(tmp_path / "outside.py")])
+            await asyncio.sleep(0.2)
+
+            indexer.index_paths.assert_not_called()
+        finally:
+            await watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_changes_during_reindex_go_to_next_batch(self, workspace, indexer):
+        release = asyncio.Event()
+
+        async def slow_index(paths):
+            await release.wait()
+            return IndexingStats()
+
+        indexer.index_paths = AsyncMock(side_effect=slow_index)
+        watcher = _watcher(indexer)
+        await watcher.start()
+        try:
+            watcher.notify([str(workspace / "a.py")])
+            await _wait_for(lambda: indexer.index_paths.await_count == 1)
+
+            watcher.notify([str(workspace / "b.py")])
+            watcher.notify([str(workspace / "c.py")])
+            release.set()
+
+            await _wait_for(lambda: watcher.batches == 2)
+            assert sorted(indexer.index_paths.call_args.args[0]) == [
+                str(workspace / "b.py"), str(workspace / "c.py")
+            ]
+        finally:
+            await watcher.stop()
+
+
+class TestBackpressure:
+    """Test overflow to a single incremental full re-index."""
+
+    @pytest.mark.asyncio
+    async def test_overflow_runs_one_full_reindex(self, workspace, indexer):
+        watcher = _watcher(indexer, max_pending=10)
+        await watcher.start()
+        try:
+            watcher.notify([str(workspace / f"f{i}.py") for i in range(500)])
+
+            await _wait_for(lambda: watcher.batches == 1)
+            indexer.index_project.assert_awaited_once_with(incremental=True)
+            indexer.index_paths.assert_not_called()
+            assert watcher.full_reindexes == 1
+        finally:
+            await watcher.stop()
+
+
+class TestPolling:
+    """Test the polling fallback."""
+
+    @pytest.mark.asyncio
+    async def test_poll_detects_added_modified_and_removed_files(self, workspace, indexer):
+        watcher = _watcher(indexer)
+        await watcher.start()
+        try:
+            (workspace / "a.py").write_text("def a():\n    return 2  # changed\n")
+            (workspace / "b.py").write_text("def b():\n    return 1\n")
+            (workspace / "notes.bin").write_bytes(b"\x00")
+
+            await _wait_for(lambda: watcher.batches >= 1)
+            paths = {p for call in indexer.index_paths.call_args_list for p in call.args[0]}
+            assert paths == {str(workspace / "a.py"), str(workspace / "b.py")}
+
+            (workspace / "b.py").unlink()
+            await _wait_for(lambda: str(workspace / "b.py") in indexer.index_paths.call_args.args[0]
+                            and watcher.batches >= 2)
+        finally:
+            await watcher.stop()
+
+
+class TestRegistry:
+    """Test per-session watcher lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_start_replaces_watcher_when_workspace_changes(self, tmp_path):
+        first, second = tmp_path / "one", tmp_path / "two"
+        first.mkdir()
+        second.mkdir()
+
+        with patch.object(workspace_watcher, "get_code_indexer",
+                          side_effect=lambda ws, sid: MagicMock(workspace=Path(ws), session_id=sid,
+                                                                _get_code_files=MagicMock(return_value=[]))):
+            watcher = await workspace_watcher.start_workspace_watcher(str(first), "registry_session", use_watchdog=False)
+            same = await workspace_watcher.start_workspace_watcher(str(first), "registry_session", use_watchdog=False)
+            assert same is watcher
+
+            replaced = await workspace_watcher.start_workspace_watcher(str(second), "registry_session", use_watchdog=False)
+            assert replaced is not watcher
+            assert not watcher.running
+            assert replaced.running
+
+            assert await workspace_watcher.stop_workspace_watcher("registry_session")
+            assert not await workspace_watcher.stop_workspace_watcher("registry_session")
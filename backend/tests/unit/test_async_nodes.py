@@ -0,0 +1,175 @@
+"""Unit tests for the async (non-blocking) coder/reviewer/refiner nodes"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.agent.langgraph.nodes import coder, refiner, reviewer
+from app.agent.langgraph.schemas.state import create_initial_state
+from app.services.http_client import AsyncLLMHttpClient
+
+
+ENDPOINT = "http://llm.test/v1"
+
+
+def _chat_response(content: str) -> dict:
+    return {
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+    }
+
+
+@pytest.fixture
+def llm_settings():
+    with patch.object(coder.settings, "vllm_coding_endpoint", ENDPOINT), \
+            patch.object(coder.settings, "coding_model", "test-model"):
+        yield
+
+
+class TestAsyncLLMHttpClient:
+    """Test pooled, non-blocking HTTP client"""
+
+    @pytest.mark.asyncio
+    async def test_reuses_pooled_client_across_requests(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("shared.llm.http_pool.LLMClientPool.get_async_client", return_value=pooled) as get_client:
+            client = AsyncLLMHttpClient(max_retries=1)
+            assert await client.post(f"{ENDPOINT}/completions", json={}) == ({"ok": True}, None)
+            assert await client.post(f"{ENDPOINT}/completions", json={}) == ({"ok": True}, None)
+
+        assert len(requests) == 2
+        assert get_client.call_args.args == ("http://llm.test",)
+        assert not pooled.is_closed
+        await pooled.aclose()
+
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_block_event_loop(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(1)
+            if len(attempts) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+
+        pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.02)
+
+        with patch("shared.llm.http_pool.LLMClientPool.get_async_client", return_value=pooled):
+            client = AsyncLLMHttpClient(max_retries=2, base_delay=0.2)
+            result, _ = await asyncio.gather(client.post(f"{ENDPOINT}/completions", json={}), ticker())
+
+        assert result == ({"ok": True}, None)
+        assert len(ticks) == 5
+        await pooled.aclose()
+
+
+class TestCoderNodeAsync:
+    """Test async coder node"""
+
+    @pytest.mark.asyncio
+    async def test_writes_generated_files(self, tmp_path, llm_settings):
+        content = json.dumps({"files": [{"filename": "app.py", "content": "print('hi')\n", "language": "python"}]})
+        state = create_initial_state(user_request="hello app", workspace_root=str(tmp_path), task_type="implementation")
+
+        with patch.object(AsyncLLMHttpClient, "post", AsyncMock(return_value=(_chat_response(content), None))) as post:
+            result = await coder.coder_node_async(state)
+
+        assert post.await_args.kwargs["cache_task_type"] == "coding"
+        assert post.await_args.kwargs["url"] == f"{ENDPOINT}/chat/completions"
+        assert result["coder_output"]["files_generated"] == 1
+        assert result["token_usage"]["total_tokens"] == 30
+        assert (tmp_path / "app.py").read_text() == "print('hi')\n"
+
+    @pytest.mark.asyncio
+    async def test_error_falls_back_to_template(self, tmp_path, llm_settings):
+        state = create_initial_state(user_request="Create a calculator", workspace_root=str(tmp_path), task_type="implementation")
+
+        with patch.object(AsyncLLMHttpClient, "post", AsyncMock(return_value=(None, "Connection error"))):
+            result = await coder.coder_node_async(state)
+
+        assert result["coder_output"]["files_generated"] > 0
+        assert result["token_usage"]["total_tokens"] == 0
+
+
+class TestReviewerNodeAsync:
+    """Test async reviewer node"""
+
+    @pytest.mark.asyncio
+    async def test_review_via_direct_call(self, llm_settings):
+        review = {"approved": True, "issues": [], "suggestions": [], "quality_score": 0.9, "critique": "ok"}
+        state = create_initial_state(user_request="x", workspace_root="/tmp", task_type="implementation")
+        state["coder_output"] = {"artifacts": [{"filename": "a.py", "content": "x = 1"}]}
+
+        with patch.object(reviewer, "LLM_PROVIDER_AVAILABLE", False), \
+                patch.object(AsyncLLMHttpClient, "post", AsyncMock(return_value=({"choices": [{"text": json.dumps(review)}]}, None))) as post:
+            result = await reviewer.reviewer_node_async(state)
+
+        assert post.await_args.kwargs["cache_task_type"] == "review"
+        assert result["review_approved"] is True
+        assert result["review_feedback"]["quality_score"] == 0.9
+
+    @pytest.mark.asyncio
+    async def test_no_artifacts(self):
+        state = create_initial_state(user_request="x", workspace_root="/tmp", task_type="implementation")
+
+        result = await reviewer.reviewer_node_async(state)
+
+        assert result["review_approved"] is False
+
+
+class TestRefinerNodeAsync:
+    """Test async refiner node"""
+
+    @pytest.mark.asyncio
+    async def test_fixes_requested_concurrently(self, tmp_path):
+        artifacts = [
+            {"filename": f"f{i}.py", "file_path": str(tmp_path / f"f{i}.py"), "content": f"x = {i}\n"}
+            for i in range(3)
+        ]
+        state = create_initial_state(user_request="x", workspace_root=str(tmp_path), task_type="implementation")
+        state["coder_output"] = {"artifacts": artifacts}
+        state["review_feedback"] = {
+            "approved": False,
+            "issues": ["issue 0", "issue 1", "issue 2"],
+            "suggestions": [],
+            "quality_score": 0.3,
+        }
+
+        async def fake_fix(original_content, issue, suggestion=""):
+            await asyncio.sleep(0.2)
+            return original_content + "# fixed\n"
+
+        start = time.perf_counter()
+        with patch.object(refiner, "_apply_fix_with_llm_async", side_effect=fake_fix):
+            result = await refiner.refiner_node_async(state)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert result["refiner_output"]["diffs_applied"] == 3
+        assert result["is_fixed"] is True
+        assert (tmp_path / "f1.py").read_text() == "x = 1\n# fixed\n"
+
+    @pytest.mark.asyncio
+    async def test_approved_review_skips_refinement(self):
+        state = create_initial_state(user_request="x", workspace_root="/tmp", task_type="implementation")
+        state["review_feedback"] = {"approved": True}
+
+        result = await refiner.refiner_node_async(state)
+
+        assert result["refiner_output"]["status"] == "approved"
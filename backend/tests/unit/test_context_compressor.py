@@ -0,0 +1,79 @@
+"""Unit tests for ContextCompressor content extraction"""
+
+from core import context_compressor
+from core.context_compressor import ContentPriority, ContextCompressor
+
+
+def _extract(content):
+    return ContextCompressor().extract_important_content({"role": "assistant", "content": content})
+
+
+class TestExtractImportantContent:
+    """Test suite for single-scan, cached extraction"""
+
+    def test_extracts_each_category_in_pattern_order(self):
+        extracted, priority = _extract(
+            "Note: keep the API stable\n"
+            "$ pytest tests/test_api.py -q\n"
+            "FAILED tests/test_api.py::test_get - KeyError: 'id'\n"
+            "Let's retry with a fixed fixture here\n"
+            "```python\nx = 1\n```"
+        )
+
+        assert priority is ContentPriority.CRITICAL
+        assert extracted.code_blocks == [{"language": "python", "content": "x = 1"}]
+        assert extracted.commands == ["pytest tests/test_api.py -q", "python\nx = 1"]
+        assert extracted.key_points == ["keep the API stable"]
+        assert extracted.decisions == ["retry with a fixed fixture here"]
+        assert extracted.error_messages == [
+            "FAILED: tests/test_api.py::test_get - KeyError: 'id'",
+            "KeyError: 'id'",
+        ]
+
+    def test_repeated_log_lines_are_deduplicated(self):
+        log = "\n".join(["ValueError: bad value", "  in /srv/app/main.py"] * 500)
+
+        extracted, priority = _extract(log)
+
+        assert extracted.error_messages == ["Error: bad value", "ValueError: bad value"]
+        assert extracted.file_paths == ["/srv/app/main.py"]
+        assert priority is ContentPriority.CRITICAL
+
+    def test_scan_matches_each_pattern_finditer(self):
+        texts = [
+            "error\n\nfoo",
+            "ERROR: boom\nValueErrorError: x\nTypeTypeError",
+            "\u212aeyError: \u212aelvin\n\u017fummary: long s\n\u0131mportant: dotless\n\u0130mportant: dotted",
+            "$\n x\n> \n`a\nb` ``````` ````",
+            "see C:\\work\\a.py or c:/x/y, /usr/bin/env and x-y.tsx",
+            "Traceback (most recent call last):\nwarning failure. failed\nused\nusing it",
+        ]
+        for text in texts:
+            expected = [[m.groups() for m in p.finditer(text)] for p in context_compressor._PATTERNS]
+            assert context_compressor._find_matches(text) == expected, text
+
+    def test_plain_chat_skips_extraction(self):
+        extracted, priority = _extract("Thanks, that works now")
+
+        assert priority is ContentPriority.LOW
+        assert extracted == context_compressor.ExtractedContent()
+
+    def test_results_cached_per_content(self, monkeypatch):
+        compressor = ContextCompressor()
+        message = {"role": "assistant", "content": "Created file: main.py"}
+        first, _ = compressor.extract_important_content(message)
+        first.key_points.append("mutated by caller")
+
+        monkeypatch.setattr(context_compressor, "_scan_content", None)  # a rescan would fail
+        second, priority = compressor.extract_important_content(dict(message))
+
+        assert second.key_points == ["main.py"]
+        assert priority is ContentPriority.HIGH
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(context_compressor, "EXTRACTION_CACHE_SIZE", 2)
+        compressor = ContextCompressor()
+        for i in range(5):
+            compressor.extract_important_content({"role": "user", "content": f"message {i}"})
+
+        assert len(compressor._extraction_cache) == 2
@@ -0,0 +1,216 @@
+"""Unit tests for ContextStore write-behind persistence"""
+
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.database import Base
+from app.db import models
+from core.context_store import ContextStore
+from shared.utils.token_utils import count_messages_tokens
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Point ContextStore at a fresh SQLite database and count statements"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'conversations.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    @contextmanager
+    def db_context():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    with patch("core.context_store.get_db_context", db_context), \
+            patch("core.context_store.get_conversation_indexer"):
+        db_context.statements = statements
+        yield db_context
+
+
+def _rows(db, model):
+    with db() as session:
+        return session.query(model).order_by(model.id).all()
+
+
+class TestContextStoreWriteBehind:
+    """Test suite for deferred, batched DB writes"""
+
+    @pytest.mark.asyncio
+    async def test_save_does_not_touch_db_until_flush(self, db):
+        store = ContextStore(flush_interval=60)
+        await store.save("s1", "hi", "hello")
+        db.statements.clear()
+
+        await store.save("s1", "again", "sure", artifacts=[{"filename": "a.py", "content": "x = 1"}])
+
+        assert db.statements == []
+        assert store.get_stats()["pending_writes"] == 1
+        assert await store.flush() == 1
+        assert [m.content for m in _rows(db, models.Message)] == ["hi", "hello", "again", "sure"]
+        assert [a.filename for a in _rows(db, models.Artifact)] == ["a.py"]
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_batches_sessions_without_per_artifact_queries(self, db):
+        store = ContextStore(flush_interval=60)
+        for session_id in ("s1", "s2", "s3"):
+            await store.save(session_id, "q", "a", artifacts=[
+                {"filename": f"f{i}.py", "content": "pass"} for i in range(10)
+            ])
+        db.statements.clear()
+
+        assert await store.flush() == 3
+
+        selects = [s for s in db.statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 2  # conversations + existing artifacts
+        assert len(_rows(db, models.Artifact)) == 30
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_artifact_version_bumped_only_when_saved_again(self, db):
+        store = ContextStore(flush_interval=60)
+        await store.save("s1", "q", "a", artifacts=[
+            {"filename": "a.py", "content": "v1"}, {"filename": "b.py", "content": "b"}
+        ])
+        await store.flush()
+
+        await store.save("s1", "q2", "a2", artifacts=[{"filename": "a.py", "content": "v2"}])
+        await store.save("s1", "q3", "a3")
+        await store.flush()
+
+        artifacts = {a.filename: (a.content, a.version) for a in _rows(db, models.Artifact)}
+        assert artifacts == {"a.py": ("v2", 2), "b.py": ("b", 1)}
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_background_flush_and_reload(self, db):
+        store = ContextStore(flush_interval=0.01)
+        await store.save("s1", "hi", "hello", analysis={"response_type": "quick_qa"})
+        await asyncio.sleep(0.2)
+
+        assert store.get_stats()["pending_writes"] == 0
+        restored = await ContextStore().load("s1")
+        assert [m["content"] for m in restored.messages] == ["hi", "hello"]
+        assert restored.last_analysis == {"response_type": "quick_qa"}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, db):
+        store = ContextStore(flush_interval=60)
+        await store.save("s1", "first", "reply")
+
+        with patch.object(store, "_write_pending", side_effect=RuntimeError("db locked")):
+            assert await store.flush() == 0
+        await store.save("s1", "second", "reply")
+        await store.close()
+
+        assert [m.content for m in _rows(db, models.Message)] == ["first", "reply", "second", "reply"]
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_pending_writes(self, db):
+        store = ContextStore(flush_interval=60)
+        await store.save("s1", "hi", "hello")
+        await store.flush()
+        await store.save("s1", "more", "text")
+
+        await store.clear("s1")
+        await store.close()
+
+        assert _rows(db, models.Conversation) == []
+        assert _rows(db, models.Message) == []
+
+
+class TestContextStoreCache:
+    """Test suite for the bounded session cache and lazy loading"""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_session_count(self, db):
+        store = ContextStore(flush_interval=60, max_sessions=2)
+        for session_id in ("s1", "s2", "s3"):
+            await store.load(session_id)
+
+        assert list(store.cache) == ["s2", "s3"]
+        await store.load("s2")
+        await store.load("s4")
+        assert list(store.cache) == ["s2", "s4"]
+
+    @pytest.mark.asyncio
+    async def test_memory_budget_and_ttl(self, db):
+        store = ContextStore(flush_interval=60, max_bytes=4000)
+        await store.save("s1", "x" * 2000, "y")
+        await store.save("s2", "x" * 2000, "y")
+        assert list(store.cache) == ["s2"]
+
+        store.ttl_seconds = 0
+        await store.load("s3")
+        assert list(store.cache) == ["s3"]
+
+    @pytest.mark.asyncio
+    async def test_evicted_pending_context_is_reused(self, db):
+        store = ContextStore(flush_interval=60, max_sessions=1)
+        await store.save("s1", "hi", "hello")
+        context = store.cache["s1"]
+        await store.load("s2")
+
+        assert "s1" not in store.cache
+        assert await store.load("s1") is context
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_reload_pages_messages_and_artifact_content(self, db):
+        store = ContextStore(flush_interval=60)
+        for i in range(20):
+            await store.save("s1", f"q{i}", f"a{i}")
+        await store.save("s1", "last", "done", artifacts=[{"filename": "big.py", "content": "x = 1"}])
+        await store.close()
+
+        fresh = ContextStore(flush_interval=60)
+        context = await fresh.load("s1")
+        assert len(context.messages) == 30
+        assert context.messages[-1]["content"] == "done"
+        assert context.message_count == 42
+        assert context.user_message_count == 21
+        assert "content" not in context.artifacts[0]
+
+        older = await fresh.load_older_messages("s1", limit=10)
+        assert [m["content"] for m in older] == [f"{p}{i}" for i in range(1, 6) for p in "qa"]
+        assert context.older_message_count == 2
+
+        artifact = await fresh.get_artifact("s1", "big.py")
+        assert artifact["content"] == "x = 1"
+        assert await fresh.get_artifact("s1", "missing.py") is None
+
+    @pytest.mark.asyncio
+    async def test_token_count_tracks_appended_and_older_messages(self, db):
+        store = ContextStore(flush_interval=60)
+        for i in range(20):
+            await store.save("s1", f"q{i}", f"a{i}")
+        await store.close()
+
+        fresh = ContextStore(flush_interval=60)
+        context = await fresh.load("s1")
+        assert context.token_count == count_messages_tokens(context.messages)
+
+        context.add_message("user", "one more question")
+        assert context.token_count == count_messages_tokens(context.messages)
+
+        await fresh.load_older_messages("s1")
+        assert len(context.messages) == 41
+        assert context.token_count == count_messages_tokens(context.messages)
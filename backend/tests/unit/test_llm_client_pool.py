@@ -0,0 +1,85 @@
+"""Unit tests for the shared LLM HTTP client pool"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.llm.http_pool import LLMClientPool
+from shared.llm.adapters.generic_adapter import GenericAdapter
+from shared.llm.base import TaskType
+
+
+class TestLLMClientPool:
+    """Test client reuse and lifecycle"""
+
+    @pytest.mark.asyncio
+    async def test_async_client_reused_per_endpoint(self):
+        pool = LLMClientPool()
+        first = pool.get_async_client("http://a/v1")
+
+        assert pool.get_async_client("http://a/v1") is first
+        assert pool.get_async_client("http://b/v1") is not first
+
+        await pool.aclose()
+        assert first.is_closed
+
+    def test_async_clients_are_per_event_loop(self):
+        pool = LLMClientPool()
+
+        async def get():
+            return pool.get_async_client("http://a/v1")
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+
+        assert first is not second
+        # Client of the closed loop was pruned when the second was created
+        assert pool.get_stats()["async_clients"] == 1
+        assert pool.get_stats()["leaked_clients"] == 0
+
+    def test_pruned_client_with_open_connections_counted(self):
+        pool = LLMClientPool()
+
+        async def get():
+            return pool.get_async_client("http://a/v1")
+
+        asyncio.run(get())
+        with patch.object(LLMClientPool, "_open_connections", return_value=1):
+            asyncio.run(get())
+
+        assert pool.get_stats()["leaked_clients"] == 1
+
+    def test_sync_client_reused_and_limits_applied(self):
+        pool = LLMClientPool(max_connections=7, max_keepalive_connections=3)
+        client = pool.get_sync_client("http://a/v1")
+
+        assert pool.get_sync_client("http://a/v1") is client
+        assert pool.get_stats()["max_connections"] == 7
+        client.close()
+        assert pool.get_sync_client("http://a/v1") is not client
+
+    @pytest.mark.asyncio
+    async def test_adapter_reuses_pooled_client_across_requests(self):
+        pool = LLMClientPool()
+        adapter = GenericAdapter("http://a/v1", "test-model")
+
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"choices": [{"message": {"content": "hello"}}]}
+
+        posted = []
+
+        async def fake_post(url, **kwargs):
+            posted.append(kwargs["timeout"])
+            return response
+
+        client = pool.get_async_client("http://a/v1")
+        with patch("shared.llm.http_pool.get_llm_client_pool", return_value=pool), \
+                patch.object(client, "post", side_effect=fake_post):
+            await adapter.generate("hi", TaskType.GENERAL)
+            await adapter.generate("hi again", TaskType.GENERAL)
+
+        assert posted == [120.0, 120.0]
+        assert pool.get_stats()["async_clients"] == 1
+        await pool.aclose()
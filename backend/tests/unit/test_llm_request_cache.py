@@ -0,0 +1,209 @@
+"""Unit tests for the shared LLM request cache and request coalescing"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.services.lm_cache import LMCacheService
+from app.services.llm_request_cache import LLMRequestCache
+from app.services.http_client import LLMHttpClient
+from shared.llm.adapters.generic_adapter import GenericAdapter
+from shared.llm.base import LLMResponse, TaskType
+
+
+REQUEST = {"model": "test-model", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.1}
+
+
+@pytest.fixture
+def request_cache(tmp_path):
+    cache = LMCacheService(use_redis=False, cache_dir=str(tmp_path))
+    return LLMRequestCache(cache=cache, task_types=["review", "coding"], max_temperature=0.2)
+
+
+class TestLLMRequestCache:
+    """Test caching rules and single-flight coalescing"""
+
+    def test_is_cacheable(self, request_cache):
+        assert request_cache.is_cacheable("review", REQUEST)
+        assert not request_cache.is_cacheable("reasoning", REQUEST)
+        assert not request_cache.is_cacheable(None, REQUEST)
+        assert not request_cache.is_cacheable("review", {**REQUEST, "temperature": 0.7})
+        assert not request_cache.is_cacheable("review", {**REQUEST, "stream": True})
+
+    def test_sync_second_call_served_from_cache(self, request_cache):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return {"choices": [{"text": "ok"}]}
+
+        assert request_cache.call_sync("review", REQUEST, fetch) == {"choices": [{"text": "ok"}]}
+        assert request_cache.call_sync("review", REQUEST, fetch) == {"choices": [{"text": "ok"}]}
+        assert len(calls) == 1
+        assert request_cache.get_stats()["hits"] == 1
+
+    def test_not_cacheable_always_fetches(self, request_cache):
+        calls = []
+        request = {**REQUEST, "temperature": 0.9}
+
+        for _ in range(3):
+            request_cache.call_sync("review", request, lambda: calls.append(1) or {"ok": True})
+
+        assert len(calls) == 3
+
+    def test_encode_none_skips_caching(self, request_cache):
+        calls = []
+
+        for _ in range(2):
+            request_cache.call_sync(
+                "review", REQUEST, lambda: calls.append(1) or {"error": True}, encode=lambda v: None
+            )
+
+        assert len(calls) == 2
+
+    def test_sync_concurrent_requests_coalesced(self, request_cache):
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"value": 42}
+
+        threads = [
+            threading.Thread(target=lambda: results.append(request_cache.call_sync("coding", REQUEST, fetch)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [{"value": 42}] * 8
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_requests_coalesced(self, request_cache):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return {"value": 7}
+
+        results = await asyncio.gather(*[
+            request_cache.call("review", REQUEST, fetch) for _ in range(10)
+        ])
+
+        assert len(calls) == 1
+        assert results == [{"value": 7}] * 10
+        stats = request_cache.get_stats()
+        assert stats["upstream_calls"] == 1
+        assert stats["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_async_error_shared_and_not_cached(self, request_cache):
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            *[request_cache.call("review", REQUEST, failing) for _ in range(3)],
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(calls) == 1
+
+        async def ok():
+            return {"value": 1}
+
+        assert await request_cache.call("review", REQUEST, ok) == {"value": 1}
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_over_to_follower(self, request_cache):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return {"value": len(calls)}
+
+        leader = asyncio.create_task(request_cache.call("review", REQUEST, fetch))
+        await asyncio.sleep(0.01)
+        followers = [asyncio.create_task(request_cache.call("review", REQUEST, fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        results = await asyncio.gather(*followers)
+        assert leader.cancelled()
+        assert results == [{"value": 2}] * 3
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_semantic_tier_not_used_for_requests(self, tmp_path):
+        cache = LMCacheService(
+            use_redis=False,
+            cache_dir=str(tmp_path),
+            semantic_cache=True,
+            semantic_threshold=0.5,
+            embedding_fn=lambda texts: [[1.0, 0.0] for _ in texts],
+        )
+        request_cache = LLMRequestCache(cache=cache, task_types=["review"], max_temperature=0.2)
+        other = {**REQUEST, "messages": [{"role": "user", "content": "something else"}]}
+
+        async def fetch_first():
+            return {"value": "first"}
+
+        async def fetch_other():
+            return {"value": "other"}
+
+        assert await request_cache.call("review", REQUEST, fetch_first) == {"value": "first"}
+        assert await request_cache.call("review", other, fetch_other) == {"value": "other"}
+
+
+class TestCallPathIntegration:
+    """Test that LLM call paths go through the request cache"""
+
+    def test_http_client_caches_successful_posts_only(self, request_cache):
+        client = LLMHttpClient(max_retries=1)
+        responses = [(None, "Server error 500"), ({"choices": [{"text": "ok"}]}, None)]
+
+        with patch("app.services.llm_request_cache.get_llm_request_cache", return_value=request_cache), \
+                patch.object(client, "_post", side_effect=responses) as mock_post:
+            assert client.post("http://x/completions", json=REQUEST, cache_task_type="review") == (None, "Server error 500")
+            assert client.post("http://x/completions", json=REQUEST, cache_task_type="review")[0] == {"choices": [{"text": "ok"}]}
+            assert client.post("http://x/completions", json=REQUEST, cache_task_type="review")[0] == {"choices": [{"text": "ok"}]}
+
+        assert mock_post.call_count == 2
+
+    def test_adapter_generate_sync_uses_cache(self, request_cache):
+        adapter = GenericAdapter("http://x/v1", "test-model")
+        response = LLMResponse(content="looks good", model="test-model", raw_response={"id": "1"})
+
+        with patch("app.services.llm_request_cache.get_llm_request_cache", return_value=request_cache), \
+                patch.object(adapter, "_generate_sync_uncached", return_value=response) as mock_generate:
+            first = adapter.generate_sync("review this", TaskType.REVIEW)
+            second = adapter.generate_sync("review this", TaskType.REVIEW)
+
+        assert mock_generate.call_count == 1
+        assert first.content == second.content == "looks good"
+        assert isinstance(second, LLMResponse)
+
+    @pytest.mark.asyncio
+    async def test_adapter_generate_reasoning_not_cached(self, request_cache):
+        adapter = GenericAdapter("http://x/v1", "test-model")
+        response = LLMResponse(content="plan", model="test-model", raw_response={"id": "1"})
+
+        with patch("app.services.llm_request_cache.get_llm_request_cache", return_value=request_cache), \
+                patch.object(adapter, "_generate_uncached", return_value=response) as mock_generate:
+            await adapter.generate("plan this", TaskType.REASONING)
+            await adapter.generate("plan this", TaskType.REASONING)
+
+        assert mock_generate.call_count == 2
@@ -0,0 +1,263 @@
+"""Unit tests for LMCacheService segment-log file backend"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.lm_cache import LMCacheService, SegmentLogStore, SemanticCacheIndex
+
+
+def _entry(key: str, response: str = "resp", ttl_hours: float = 1.0) -> dict:
+    now = datetime.utcnow()
+    return {
+        "key": key,
+        "response": response,
+        "model": "test-model",
+        "prompt_hash": key,
+        "created_at": now.isoformat(),
+        "expires_at": (now + timedelta(hours=ttl_hours)).isoformat(),
+        "hit_count": 0,
+        "metadata": None,
+    }
+
+
+def _bag_of_words(texts):
+    """Deterministic toy embedding: hashed word counts."""
+    vectors = []
+    for text in texts:
+        vector = [0.0] * 64
+        for word in text.lower().split():
+            vector[sum(map(ord, word)) % 64] += 1.0
+        vectors.append(vector)
+    return vectors
+
+
+class TestSegmentLogStore:
+    """Test suite for SegmentLogStore"""
+
+    @pytest.fixture
+    def store_dir(self, tmp_path):
+        return str(tmp_path / "segments")
+
+    def test_set_get_delete(self, store_dir):
+        store = SegmentLogStore(store_dir)
+        store.set("a", _entry("a", "first"))
+        store.set("b", _entry("b", "second"))
+
+        assert store.get("a")["response"] == "first"
+        assert store.get("b")["response"] == "second"
+        assert store.get("missing") is None
+
+        assert store.delete("a") is True
+        assert store.delete("a") is False
+        assert store.get("a") is None
+        assert len(store) == 1
+
+    def test_entries_share_segment_files(self, store_dir):
+        store = SegmentLogStore(store_dir)
+        for i in range(50):
+            store.set(f"k{i}", _entry(f"k{i}"))
+
+        assert len(os.listdir(store_dir)) == 1
+        assert store.get_stats()["entry_count"] == 50
+
+    def test_index_rebuilt_on_restart(self, store_dir):
+        store = SegmentLogStore(store_dir)
+        store.set("a", _entry("a", "old"))
+        store.set("a", _entry("a", "new"))
+        store.set("b", _entry("b"))
+        store.delete("b")
+        store.get("a")
+        store.get("a")
+        store.close()
+
+        reopened = SegmentLogStore(store_dir)
+        assert len(reopened) == 1
+        entry = reopened.get("a")
+        assert entry["response"] == "new"
+        # Two hits flushed on close plus this one
+        assert entry["hit_count"] == 3
+
+    def test_hit_counts_are_batched(self, store_dir):
+        store = SegmentLogStore(store_dir, hit_flush_threshold=3, hit_flush_interval=3600)
+        store.set("a", _entry("a"))
+        size_after_set = store.get_stats()["total_size_bytes"]
+
+        store.get("a")
+        assert store.get_stats()["total_size_bytes"] == size_after_set
+        assert store.get_stats()["pending_hit_updates"] == 1
+
+        store.flush_hits()
+        assert store.get_stats()["total_size_bytes"] > size_after_set
+        assert store.get_stats()["pending_hit_updates"] == 0
+
+    def test_cleanup_expired_only_touches_expired(self, store_dir):
+        store = SegmentLogStore(store_dir)
+        store.set("live", _entry("live", ttl_hours=1))
+        store.set("dead1", _entry("dead1", ttl_hours=-1))
+        store.set("dead2", _entry("dead2", ttl_hours=-1))
+
+        assert store.cleanup_expired() == 2
+        assert len(store) == 1
+        assert store.get("live") is not None
+
+    def test_overwritten_key_not_expired_by_stale_heap_item(self, store_dir):
+        store = SegmentLogStore(store_dir)
+        store.set("a", _entry("a", ttl_hours=-1))
+        store.set("a", _entry("a", ttl_hours=1))
+
+        assert store.cleanup_expired() == 0
+        assert store.get("a") is not None
+
+    def test_compact_reclaims_dead_bytes(self, store_dir):
+        store = SegmentLogStore(store_dir)
+        for i in range(10):
+            store.set("a", _entry("a", f"v{i}"))
+
+        store.compact()
+        stats = store.get_stats()
+        assert stats["dead_bytes"] == 0
+        assert stats["entry_count"] == 1
+        assert store.get("a")["response"] == "v9"
+
+    def test_segment_rotation(self, store_dir):
+        store = SegmentLogStore(store_dir, max_segment_bytes=512)
+        for i in range(20):
+            store.set(f"k{i}", _entry(f"k{i}"))
+
+        assert store.get_stats()["segment_count"] > 1
+        assert SegmentLogStore(store_dir).get("k0") is not None
+
+    def test_stores_sharing_directory_record_correct_offsets(self, store_dir):
+        # Two worker processes appending to the same segment
+        first = SegmentLogStore(store_dir)
+        second = SegmentLogStore(store_dir)
+        for i in range(5):
+            first.set(f"a{i}", _entry(f"a{i}", f"first-{i}"))
+            second.set(f"b{i}", _entry(f"b{i}", f"second-{i}"))
+
+        assert [first.get(f"a{i}")["response"] for i in range(5)] == [f"first-{i}" for i in range(5)]
+        assert [second.get(f"b{i}")["response"] for i in range(5)] == [f"second-{i}" for i in range(5)]
+        assert SegmentLogStore(store_dir).get("b4")["response"] == "second-4"
+
+    def test_torn_tail_is_ignored(self, store_dir):
+        store = SegmentLogStore(store_dir)
+        store.set("a", _entry("a"))
+        store.close()
+        segment = os.path.join(store_dir, os.listdir(store_dir)[0])
+        with open(segment, "ab") as f:
+            f.write(b'{"op":"set","entry":{"key"')
+
+        reopened = SegmentLogStore(store_dir)
+        assert reopened.get("a") is not None
+
+
+class TestLMCacheServiceFileBackends:
+    """Test LMCacheService API on top of file backends"""
+
+    @pytest.mark.parametrize("file_backend", ["segment", "json"])
+    def test_api_roundtrip(self, tmp_path, file_backend):
+        cache = LMCacheService(use_redis=False, file_backend=file_backend, cache_dir=str(tmp_path))
+
+        cache.set("prompt", "response", "model", temperature=0.0)
+        assert cache.get("prompt", "model", temperature=0.0) == "response"
+        json_files = [f for f in os.listdir(tmp_path) if f.endswith(".json")]
+        assert len(json_files) == (1 if file_backend == "json" else 0)
+        assert cache.get("prompt", "model", temperature=0.5) is None
+
+        stats = cache.get_stats()
+        assert stats["backend"] == "file"
+        assert stats["file_backend"] == file_backend
+        assert stats["entry_count"] == 1
+
+        assert cache.delete("prompt", "model", temperature=0.0) is True
+        cache.set("p1", "r1", "model")
+        cache.set("p2", "r2", "model")
+        assert cache.clear() == 2
+        assert cache.get_stats()["entry_count"] == 0
+
+    def test_invalid_file_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            LMCacheService(use_redis=False, file_backend="lmdb", cache_dir=str(tmp_path))
+
+    def test_legacy_json_entries_are_migrated(self, tmp_path):
+        legacy = LMCacheService(use_redis=False, file_backend="json", cache_dir=str(tmp_path))
+        legacy.set("prompt", "legacy response", "model")
+
+        cache = LMCacheService(use_redis=False, file_backend="segment", cache_dir=str(tmp_path))
+        assert cache.get("prompt", "model") == "legacy response"
+        assert not [f for f in os.listdir(tmp_path) if f.endswith(".json")]
+
+
+class TestSemanticCache:
+    """Test the embedding-similarity cache tier"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return LMCacheService(
+            use_redis=False,
+            cache_dir=str(tmp_path),
+            semantic_cache=True,
+            semantic_threshold=0.9,
+            embedding_fn=_bag_of_words,
+        )
+
+    def test_whitespace_variant_is_semantic_hit(self, cache):
+        cache.set("explain   this file\n", "explanation", "model", temperature=0.0)
+
+        assert cache.get("explain this file", "model", temperature=0.0) == "explanation"
+        stats = cache.get_stats()
+        assert stats["semantic_hits"] == 1
+        assert stats["exact_hits"] == 0
+
+    def test_exact_hit_counted_separately(self, cache):
+        cache.set("classify request", "code_generation", "model", temperature=0.0)
+
+        assert cache.get("classify request", "model", temperature=0.0) == "code_generation"
+        assert cache.get("completely unrelated words", "model", temperature=0.0) is None
+        stats = cache.get_hit_stats()
+        assert stats["exact_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["exact_hit_rate"] == 0.5
+
+    def test_scoped_by_model_and_temperature(self, cache):
+        cache.set("explain this file", "explanation", "model-a", temperature=0.0)
+
+        assert cache.get("explain  this file", "model-b", temperature=0.0) is None
+        assert cache.get("explain  this file", "model-a", temperature=0.7) is None
+
+    def test_scoped_by_max_tokens(self, cache):
+        cache.set("explain this file", "explanation", "model", temperature=0.0, max_tokens=100)
+
+        assert cache.get("explain  this file", "model", temperature=0.0, max_tokens=2000) is None
+        assert cache.get("explain  this file", "model", temperature=0.0, max_tokens=100) == "explanation"
+
+    def test_prompts_longer_than_embedding_window_skipped(self, cache):
+        system_prompt = "you are a careful reviewer " * 100
+        cache.set(system_prompt + "review a.py", "review of a", "model", temperature=0.0)
+
+        assert cache.get(system_prompt + "review b.py", "model", temperature=0.0) is None
+        assert len(cache._semantic) == 0
+
+    def test_semantic_flag_skips_tier(self, cache):
+        cache.set("explain this file", "explanation", "model", temperature=0.0)
+
+        assert cache.get("explain  this file", "model", semantic=False, temperature=0.0) is None
+
+    def test_deleted_entry_not_served(self, cache):
+        cache.set("explain this file", "explanation", "model", temperature=0.0)
+        cache.delete("explain this file", "model", temperature=0.0)
+
+        assert cache.get("explain  this  file", "model", temperature=0.0) is None
+
+    def test_index_eviction_and_swap_remove(self):
+        index = SemanticCacheIndex(threshold=0.99, max_entries_per_scope=2, embedding_fn=_bag_of_words)
+        index.add("k1", "alpha", "m", 0.0)
+        index.add("k2", "beta", "m", 0.0)
+        index.add("k3", "gamma", "m", 0.0)
+
+        assert len(index) == 2
+        assert index.lookup("alpha", "m", 0.0)[0] is None
+        index.remove("k2")
+        assert index.lookup("gamma", "m", 0.0)[0] == "k3"
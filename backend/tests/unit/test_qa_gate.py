@@ -0,0 +1,95 @@
+"""Unit tests for the QA gate test run (structured per-test results)"""
+
+import pytest
+
+from app.agent.langgraph.nodes import qa_gate
+from app.agent.langgraph.nodes.qa_gate import qa_gate_node
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    files = {
+        "pkg/__init__.py": "",
+        "pkg/calc.py": "def add(a, b):\n    return a + b\n",
+        "pkg/other.py": "def other():\n    return 1\n",
+        "tests/test_calc.py": (
+            "from pkg.calc import add\n\n"
+            "def test_add():\n    assert add(1, 2) == 3\n\n"
+            "def test_add_wrong():\n    assert add(1, 1) == 3\n"
+        ),
+        "tests/test_other.py": "from pkg.other import other\n\ndef test_other():\n    assert other() == 1\n",
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    monkeypatch.setattr(qa_gate.settings, "qa_run_tests", True)
+    return tmp_path
+
+
+def _artifact(workspace, filename):
+    content = (workspace / filename).read_text()
+    return {
+        "filename": filename, "file_path": str(workspace / filename),
+        "language": "python", "content": f'"""doc"""\n{content}', "saved": True,
+    }
+
+
+class TestQAGateTests:
+    """Test suite for running affected tests in the QA gate"""
+
+    def test_failing_affected_test_fails_gate(self, workspace):
+        result = qa_gate_node({
+            "workspace_root": str(workspace),
+            "coder_output": {"artifacts": [_artifact(workspace, "pkg/calc.py")]},
+        })
+
+        assert result["qa_passed"] is False
+        assert result["tests_passed"] is False
+        assert result["qa_results"]["tests"]["failed_tests"] == ["tests/test_calc.py::test_add_wrong"]
+        assert {t["test_name"]: t["passed"] for t in result["qa_test_results"]} == {
+            "tests/test_calc.py::test_add": True,
+            "tests/test_calc.py::test_add_wrong": False,
+        }
+
+    def test_refinement_reruns_previous_failures(self, workspace):
+        first = qa_gate_node({
+            "workspace_root": str(workspace),
+            "coder_output": {"artifacts": [_artifact(workspace, "pkg/calc.py")]},
+        })
+        (workspace / "tests/test_calc.py").write_text(
+            "from pkg.calc import add\n\ndef test_add_wrong():\n    assert add(1, 2) == 3\n"
+        )
+
+        result = qa_gate_node({
+            "workspace_root": str(workspace),
+            "coder_output": {"artifacts": [_artifact(workspace, "pkg/calc.py")]},
+            "qa_results": first["qa_results"],
+            "refiner_output": {"changed_files": [str(workspace / "pkg/other.py")]},
+        })
+
+        assert result["qa_passed"] is True
+        assert sorted(t["test_name"] for t in result["qa_test_results"]) == [
+            "tests/test_calc.py::test_add_wrong", "tests/test_other.py::test_other",
+        ]
+
+    def test_no_affected_tests(self, workspace):
+        (workspace / "README.md").write_text("# readme\n")
+        artifact = {"filename": "README.md", "file_path": str(workspace / "README.md"),
+                    "language": "markdown", "content": "# readme\n", "saved": True}
+
+        result = qa_gate_node({"workspace_root": str(workspace), "coder_output": {"artifacts": [artifact]}})
+
+        assert result["qa_results"]["checks"]["tests"]["passed"] is True
+        assert result["qa_test_results"] == []
+
+    def test_disabled(self, workspace, monkeypatch):
+        monkeypatch.setattr(qa_gate.settings, "qa_run_tests", False)
+
+        result = qa_gate_node({
+            "workspace_root": str(workspace),
+            "coder_output": {"artifacts": [_artifact(workspace, "pkg/calc.py")]},
+        })
+
+        assert "tests" not in result["qa_results"]["checks"]
+        assert result["qa_passed"] is True
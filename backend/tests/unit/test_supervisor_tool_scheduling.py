@@ -0,0 +1,136 @@
+"""
+Unit tests for parallel tool execution and result caching in SupervisorAgent
+"""
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+
+def tool_call(call_id, name, arguments):
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments))
+    )
+
+
+def llm_response(tool_calls):
+    message = SimpleNamespace(content="", tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def supervisor():
+    from core.supervisor import SupervisorAgent
+    return SupervisorAgent(use_api=False)
+
+
+async def run(supervisor, responses, delays):
+    """Run execute_with_tools with fake LLM turns and tools that take `delays` seconds"""
+    client = Mock()
+    client.chat_completion_with_tools = AsyncMock(side_effect=responses)
+
+    async def fake_tool_stream(tool_name, arguments, context=None):
+        await asyncio.sleep(delays.get(arguments.get("path"), 0))
+        yield {"type": "output", "stream": "stdout", "data": tool_name}
+        yield {"type": "result", "result": {"success": True, "tool": tool_name, **arguments}}
+
+    with patch("core.supervisor.vllm_router.get_client", return_value=client), \
+         patch.object(supervisor, "_execute_tool_stream", side_effect=fake_tool_stream):
+        events = [event async for event in supervisor.execute_with_tools("read files")]
+
+    messages = client.chat_completion_with_tools.call_args.kwargs["messages"]
+    return events, messages
+
+
+class TestToolScheduling:
+    """Test concurrent tool calls, result ordering and completion events"""
+
+    @pytest.mark.asyncio
+    async def test_read_only_calls_run_concurrently(self, supervisor):
+        responses = [
+            llm_response([
+                tool_call("c1", "read_file", {"path": "slow.py"}),
+                tool_call("c2", "read_file", {"path": "fast.py"}),
+            ]),
+            llm_response([tool_call("c3", "complete_task", {"response": "done"})]),
+        ]
+
+        events, messages = await run(supervisor, responses, {"slow.py": 0.2})
+
+        # Completion events stream as calls finish
+        results = [e["tool_call_id"] for e in events if e["type"] == "tool_call_result"]
+        assert results[:2] == ["c2", "c1"]
+        starts = [e["tool_call_id"] for e in events if e["type"] == "tool_call_start"]
+        assert starts[:2] == ["c1", "c2"]
+        outputs = [e["tool_call_id"] for e in events if e["type"] == "tool_output"]
+        assert outputs[:2] == ["c2", "c1"]
+
+        # Messages for the model keep the order of the calls
+        tool_messages = [m["tool_call_id"] for m in messages if m["role"] == "tool"]
+        assert tool_messages == ["c1", "c2", "c3"]
+        assert events[-1] == {
+            "type": "final_response",
+            "content": "done",
+            "summary": "",
+            "files_created": []
+        }
+
+    @pytest.mark.asyncio
+    async def test_write_waits_for_read_of_same_path(self, supervisor):
+        responses = [
+            llm_response([
+                tool_call("c1", "read_file", {"path": "a.py"}),
+                tool_call("c2", "write_file", {"path": "a.py", "content": "x"}),
+                tool_call("c3", "complete_task", {"response": "done"}),
+                tool_call("c4", "read_file", {"path": "never.py"}),
+            ]),
+        ]
+
+        events, messages = await run(supervisor, responses, {"a.py": 0.1})
+
+        results = [e["tool_call_id"] for e in events if e["type"] == "tool_call_result"]
+        assert results == ["c1", "c2", "c3"]
+        assert [m["tool_call_id"] for m in messages if m["role"] == "tool"] == ["c1", "c2", "c3"]
+        assert events[-1]["type"] == "final_response"
+
+    @pytest.mark.asyncio
+    async def test_malformed_arguments_keep_message_position(self, supervisor):
+        bad_call = SimpleNamespace(id="c2", function=SimpleNamespace(name="read_file", arguments='{"path": "'))
+        responses = [
+            llm_response([
+                tool_call("c1", "read_file", {"path": "a.py"}),
+                bad_call,
+                tool_call("c3", "read_file", {"path": "b.py"}),
+            ]),
+            llm_response([tool_call("c4", "complete_task", {"response": "done"})]),
+        ]
+
+        events, messages = await run(supervisor, responses, {})
+
+        assert [m["tool_call_id"] for m in messages if m["role"] == "tool"] == ["c1", "c2", "c3", "c4"]
+
+
+class TestToolResultCache:
+    """Test the shared tool result cache as used by the supervisor"""
+
+    @pytest.mark.asyncio
+    async def test_mutating_tool_invalidates_session_workspace(self, supervisor, tmp_path):
+        (tmp_path / "sub").mkdir()
+        context = {"workspace": str(tmp_path)}
+
+        async def call(tool_name, arguments):
+            events = [e async for e in supervisor._execute_tool_stream(tool_name, arguments, context)]
+            return events[-1]["result"]
+
+        search = {"pattern": "*.py", "path": "."}
+        assert (await call("search_files", search))["output"] == []
+
+        code = f"open({str(tmp_path / 'sub' / 'c.py')!r}, 'w').close()"
+        assert (await call("execute_python", {"code": code}))["success"] is True
+
+        found = (await call("search_files", search))["output"]
+        assert [os.path.basename(match) for match in found] == ["c.py"]
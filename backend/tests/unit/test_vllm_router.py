@@ -0,0 +1,280 @@
+"""Unit tests for VLLMRouter load balancing strategies and passive health checks
+
+Uses local stub OpenAI-compatible servers.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.vllm_client import EndpointStats, VLLMClient, VLLMRouter
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        server = self.server
+        server.requests += 1
+        time.sleep(server.delay)
+
+        if server.status != 200:
+            body = json.dumps({"error": {"message": "stub failure"}}).encode()
+        else:
+            body = json.dumps({
+                "id": "cmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "stub",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": server.name},
+                    "finish_reason": "stop",
+                }],
+            }).encode()
+
+        self.send_response(server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    """Minimal OpenAI-compatible /v1/chat/completions server"""
+
+    def __init__(self, name: str, delay: float = 0.0, status: int = 200):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.httpd.name = name
+        self.httpd.delay = delay
+        self.httpd.status = status
+        self.httpd.requests = 0
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    @property
+    def requests(self) -> int:
+        return self.httpd.requests
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(*specs):
+        for name, delay, status in specs:
+            started.append(StubServer(name, delay, status))
+        return started
+
+    yield start
+    for server in started:
+        server.close()
+
+
+def _router(servers, strategy: str) -> VLLMRouter:
+    router = VLLMRouter(endpoints=[s.url for s in servers], strategy=strategy)
+    for client in router.clients:
+        client.client = client.client.with_options(max_retries=0)
+    return router
+
+
+async def _ask(router: VLLMRouter, affinity_key: str = None) -> str:
+    client = router.get_client(affinity_key=affinity_key)
+    response = await client.chat_completion(messages=[{"role": "user", "content": "hi"}], temperature=0.0)
+    return response.choices[0].message.content
+
+
+class TestStrategies:
+    """Test endpoint selection"""
+
+    def test_unknown_strategy_rejected(self):
+        with pytest.raises(ValueError):
+            VLLMRouter(endpoints=["http://a/v1", "http://b/v1"], strategy="random")
+
+    def test_round_robin(self):
+        router = VLLMRouter(endpoints=["http://a/v1", "http://b/v1"], strategy="round_robin")
+
+        picked = [router.get_client().base_url for _ in range(4)]
+
+        assert picked == ["http://a/v1", "http://b/v1", "http://a/v1", "http://b/v1"]
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_avoids_busy_endpoint(self, servers):
+        slow, fast = servers(("slow", 0.5, 200), ("fast", 0.0, 200))
+        router = _router([slow, fast], "least_outstanding")
+
+        # Pin one long request on the slow server, then send more
+        pinned = asyncio.create_task(router.clients[0].chat_completion(messages=[{"role": "user", "content": "x"}]))
+        await asyncio.sleep(0.1)
+        results = [await _ask(router) for _ in range(4)]
+        await pinned
+
+        assert results == ["fast"] * 4
+        assert slow.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_latency_ewma_prefers_fast_endpoint(self, servers):
+        slow, fast = servers(("slow", 0.2, 200), ("fast", 0.0, 200))
+        router = _router([slow, fast], "latency_ewma")
+
+        results = [await _ask(router) for _ in range(8)]
+
+        # Both are sampled once, afterwards the fast endpoint wins
+        assert results.count("fast") >= 7
+        assert slow.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_prefix_affinity_is_sticky(self, servers):
+        started = servers(("a", 0.0, 200), ("b", 0.0, 200), ("c", 0.0, 200))
+        router = _router(started, "prefix_affinity")
+
+        for key in ("session-1", "session-2", "session-3"):
+            assert len({await _ask(router, affinity_key=key) for _ in range(3)}) == 1
+
+    def test_prefix_affinity_bounded_load(self):
+        router = VLLMRouter(endpoints=["http://a/v1", "http://b/v1"], strategy="prefix_affinity")
+        preferred = router.get_client(affinity_key="session-1")
+
+        preferred.stats.in_flight = router.affinity_max_extra_in_flight + 1
+
+        assert router.get_client(affinity_key="session-1") is not preferred
+
+
+class TestHealthTracking:
+    """Test passive health checks and stats"""
+
+    @pytest.mark.asyncio
+    async def test_failing_endpoint_is_ejected(self, servers):
+        bad, good = servers(("bad", 0.0, 500), ("good", 0.0, 200))
+        router = _router([bad, good], "round_robin")
+        router.clients[0].stats.eject_after_failures = 2
+
+        results = []
+        for _ in range(8):
+            try:
+                results.append(await _ask(router))
+            except Exception:
+                results.append("error")
+
+        assert results.count("error") == 2
+        assert bad.requests == 2
+        stats = router.get_load_balancing_stats()
+        bad_stats = stats["endpoint_stats"][0]
+        assert bad_stats["healthy"] is False
+        assert bad_stats["error_rate"] == 1.0
+        assert stats["healthy_endpoints"] == 1
+
+    @pytest.mark.asyncio
+    async def test_endpoint_readmitted_after_cooldown(self, servers):
+        bad, good = servers(("bad", 0.0, 500), ("good", 0.0, 200))
+        router = _router([bad, good], "round_robin")
+        router.clients[0].stats.eject_after_failures = 1
+        router.clients[0].stats.eject_cooldown = 0.2
+
+        with pytest.raises(Exception):
+            await router.clients[0].chat_completion(messages=[{"role": "user", "content": "x"}])
+        assert not router.clients[0].stats.is_available()
+
+        bad.httpd.status = 200
+        await asyncio.sleep(0.25)
+        results = {await _ask(router) for _ in range(4)}
+
+        assert results == {"bad", "good"}
+        assert router.clients[0].stats.consecutive_failures == 0
+
+    def test_all_ejected_fails_open(self):
+        router = VLLMRouter(endpoints=["http://a/v1", "http://b/v1"], strategy="least_outstanding")
+        now = time.monotonic()
+        router.clients[0].stats.ejected_until = now + 60
+        router.clients[1].stats.ejected_until = now + 10
+
+        assert router.get_client() is router.clients[1]
+
+    def test_client_errors_do_not_eject(self):
+        import httpx
+        from openai import BadRequestError
+
+        stats = EndpointStats("http://a/v1", eject_after_failures=1)
+        error = BadRequestError(
+            "bad", response=httpx.Response(400, request=httpx.Request("POST", "http://a")), body=None
+        )
+
+        with pytest.raises(BadRequestError):
+            with stats.track():
+                raise error
+
+        assert stats.is_available()
+        assert stats.errors == 0
+
+    def test_early_stream_close_does_not_eject(self):
+        stats = EndpointStats("http://a/v1", eject_after_failures=1)
+
+        with pytest.raises(GeneratorExit):
+            with stats.track():
+                raise GeneratorExit()
+
+        assert stats.is_available()
+        assert stats.errors == 0
+        assert stats.in_flight == 0
+
+    def test_chat_completion_rejects_stream(self):
+        client = VLLMClient("http://a/v1", "stub")
+
+        with pytest.raises(ValueError, match="stream_chat_completion"):
+            asyncio.run(client.chat_completion([{"role": "user", "content": "hi"}], stream=True))
+
+        assert client.stats.requests == 0
+
+    def test_single_probe_after_cooldown(self):
+        stats = EndpointStats("http://a/v1", eject_after_failures=1, eject_cooldown=10)
+        with pytest.raises(RuntimeError):
+            with stats.track():
+                raise RuntimeError("down")
+        now = stats.ejected_until + 1
+
+        assert stats.is_available(now)
+        stats.claim(now)
+        # Only the probe goes through until it finishes
+        assert not stats.is_available(now)
+
+        with pytest.raises(RuntimeError):
+            with stats.track():
+                raise RuntimeError("still down")
+        assert not stats.is_available()
+        assert stats.ejections == 2
+
+        now = stats.ejected_until + 1
+        stats.claim(now)
+        with stats.track():
+            pass
+        assert stats.is_available(now)
+        stats.claim(now)
+        assert stats.is_available(now)
+
+    def test_latency_percentiles(self):
+        stats = EndpointStats("http://a/v1")
+        for ms in range(1, 101):
+            stats.in_flight += 1
+            stats._finish(ms / 1000)
+
+        snapshot = stats.get_stats()
+
+        assert snapshot["latency_p50_ms"] == pytest.approx(50)
+        assert snapshot["latency_p95_ms"] == pytest.approx(95)
+        assert snapshot["requests"] == 100
+        assert snapshot["in_flight"] == 0
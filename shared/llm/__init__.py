@@ -27,6 +27,13 @@ from .base import (
     LLMProviderFactory,
 )
 
+from .http_pool import (
+    LLMClientPool,
+    get_llm_client_pool,
+    configure_llm_client_pool,
+    close_llm_client_pool,
+)
+
 # Import adapters to register them
 from .adapters import (
     GenericAdapter,
@@ -41,6 +48,11 @@ __all__ = [
     "LLMResponse",
     "TaskType",
     "LLMProviderFactory",
+    # HTTP connection pool
+    "LLMClientPool",
+    "get_llm_client_pool",
+    "configure_llm_client_pool",
+    "close_llm_client_pool",
     # Adapters
     "GenericAdapter",
     "DeepSeekAdapter",
@@ -257,6 +257,20 @@ Provide review in JSON format:
         task_type: TaskType = TaskType.GENERAL,
         config_override: Optional[LLMConfig] = None,
         max_retries: int = 3
+    ) -> LLMResponse:
+        """Generate response, served from the shared request cache when eligible"""
+        config = config_override or self.get_config_for_task(task_type)
+        return await self._generate_with_cache(
+            prompt, task_type, config,
+            lambda: self._generate_uncached(prompt, task_type, config_override, max_retries),
+        )
+
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        config_override: Optional[LLMConfig] = None,
+        max_retries: int = 3
     ) -> LLMResponse:
         """Generate response from DeepSeek-R1 with retry and exponential backoff"""
         config = config_override or self.get_config_for_task(task_type)
@@ -271,7 +285,7 @@ Provide review in JSON format:
 
         for attempt in range(max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=180.0) as client:  # Longer timeout for reasoning
+                async with self._http_client(timeout=180.0) as client:  # Longer timeout for reasoning
                     # Use chat completions format for instruction-tuned models
                     messages = [
                         {"role": "system", "content": system_prompt},
@@ -353,6 +367,20 @@ Provide review in JSON format:
         task_type: TaskType = TaskType.GENERAL,
         config_override: Optional[LLMConfig] = None,
         max_retries: int = 3
+    ) -> LLMResponse:
+        """Synchronous generate, served from the shared request cache when eligible"""
+        config = config_override or self.get_config_for_task(task_type)
+        return self._generate_sync_with_cache(
+            prompt, task_type, config,
+            lambda: self._generate_sync_uncached(prompt, task_type, config_override, max_retries),
+        )
+
+    def _generate_sync_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        config_override: Optional[LLMConfig] = None,
+        max_retries: int = 3
     ) -> LLMResponse:
         """Synchronous generation for DeepSeek-R1 with retry and exponential backoff"""
         config = config_override or self.get_config_for_task(task_type)
@@ -367,7 +395,7 @@ Provide review in JSON format:
 
         for attempt in range(max_retries + 1):
             try:
-                with httpx.Client(timeout=180.0) as client:
+                with self._sync_http_client(timeout=180.0) as client:
                     # Use chat completions format for instruction-tuned models
                     messages = [
                         {"role": "system", "content": system_prompt},
@@ -460,7 +488,7 @@ Provide review in JSON format:
             {"role": "user", "content": formatted_prompt}
         ]
 
-        async with httpx.AsyncClient(timeout=180.0) as client:
+        async with self._http_client(timeout=180.0) as client:
             async with client.stream(
                 "POST",
                 f"{self.endpoint}/chat/completions",
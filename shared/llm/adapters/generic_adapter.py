@@ -153,6 +153,20 @@ Provide your review in JSON format:
         task_type: TaskType = TaskType.GENERAL,
         config_override: Optional[LLMConfig] = None,
         max_retries: int = 3
+    ) -> LLMResponse:
+        """Generate response, served from the shared request cache when eligible"""
+        config = config_override or self.get_config_for_task(task_type)
+        return await self._generate_with_cache(
+            prompt, task_type, config,
+            lambda: self._generate_uncached(prompt, task_type, config_override, max_retries),
+        )
+
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        config_override: Optional[LLMConfig] = None,
+        max_retries: int = 3
     ) -> LLMResponse:
         """Generate response using the LLM API with chat completions format"""
         config = config_override or self.get_config_for_task(task_type)
@@ -161,7 +175,7 @@ Provide your review in JSON format:
 
         for attempt in range(max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=120.0) as client:
+                async with self._http_client(timeout=120.0) as client:
                     # Use chat completions format
                     messages = [
                         {"role": "system", "content": system_prompt},
@@ -230,6 +244,20 @@ Provide your review in JSON format:
         task_type: TaskType = TaskType.GENERAL,
         config_override: Optional[LLMConfig] = None,
         max_retries: int = 3
+    ) -> LLMResponse:
+        """Synchronous generate, served from the shared request cache when eligible"""
+        config = config_override or self.get_config_for_task(task_type)
+        return self._generate_sync_with_cache(
+            prompt, task_type, config,
+            lambda: self._generate_sync_uncached(prompt, task_type, config_override, max_retries),
+        )
+
+    def _generate_sync_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        config_override: Optional[LLMConfig] = None,
+        max_retries: int = 3
     ) -> LLMResponse:
         """Synchronous version of generate with chat completions format"""
         config = config_override or self.get_config_for_task(task_type)
@@ -238,7 +266,7 @@ Provide your review in JSON format:
 
         for attempt in range(max_retries + 1):
             try:
-                with httpx.Client(timeout=120.0) as client:
+                with self._sync_http_client(timeout=120.0) as client:
                     # Use chat completions format
                     messages = [
                         {"role": "system", "content": system_prompt},
@@ -316,7 +344,7 @@ Provide your review in JSON format:
             {"role": "user", "content": formatted_prompt}
         ]
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._http_client(timeout=120.0) as client:
             async with client.stream(
                 "POST",
                 f"{self.endpoint}/chat/completions",
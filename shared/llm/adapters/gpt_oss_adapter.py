@@ -425,6 +425,33 @@ class GptOssAdapter(BaseLLMProvider):
         max_retries: int = 3,
         reasoning_effort: Optional[str] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> LLMResponse:
+        """Generate response, served from the shared request cache when eligible
+
+        Requests with tools are never cached (tool calls depend on live state).
+        """
+        def fetch():
+            return self._generate_uncached(
+                prompt, task_type, config_override, max_retries, reasoning_effort, tools
+            )
+
+        if tools or self.tools:
+            return await fetch()
+
+        config = config_override or self.get_config_for_task(task_type)
+        return await self._generate_with_cache(
+            prompt, task_type, config, fetch,
+            reasoning_effort=reasoning_effort or self.reasoning_effort,
+        )
+
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        config_override: Optional[LLMConfig] = None,
+        max_retries: int = 3,
+        reasoning_effort: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
     ) -> LLMResponse:
         """Generate response from GPT-OSS with retry and backoff
 
@@ -456,7 +483,7 @@ class GptOssAdapter(BaseLLMProvider):
 
         for attempt in range(max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=180.0) as client:
+                async with self._http_client(timeout=180.0) as client:
                     messages = [
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": formatted_prompt}
@@ -556,6 +583,33 @@ class GptOssAdapter(BaseLLMProvider):
         max_retries: int = 3,
         reasoning_effort: Optional[str] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> LLMResponse:
+        """Synchronous generate, served from the shared request cache when eligible
+
+        Requests with tools are never cached (tool calls depend on live state).
+        """
+        def fetch():
+            return self._generate_sync_uncached(
+                prompt, task_type, config_override, max_retries, reasoning_effort, tools
+            )
+
+        if tools or self.tools:
+            return fetch()
+
+        config = config_override or self.get_config_for_task(task_type)
+        return self._generate_sync_with_cache(
+            prompt, task_type, config, fetch,
+            reasoning_effort=reasoning_effort or self.reasoning_effort,
+        )
+
+    def _generate_sync_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        config_override: Optional[LLMConfig] = None,
+        max_retries: int = 3,
+        reasoning_effort: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
     ) -> LLMResponse:
         """Synchronous generation for GPT-OSS with function calling support
 
@@ -583,7 +637,7 @@ class GptOssAdapter(BaseLLMProvider):
 
         for attempt in range(max_retries + 1):
             try:
-                with httpx.Client(timeout=180.0) as client:
+                with self._sync_http_client(timeout=180.0) as client:
                     messages = [
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": formatted_prompt}
@@ -689,7 +743,7 @@ class GptOssAdapter(BaseLLMProvider):
             {"role": "user", "content": formatted_prompt}
         ]
 
-        async with httpx.AsyncClient(timeout=180.0) as client:
+        async with self._http_client(timeout=180.0) as client:
             async with client.stream(
                 "POST",
                 f"{self.endpoint}/chat/completions",
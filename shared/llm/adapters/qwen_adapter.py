@@ -200,6 +200,20 @@ Fixed code:"""
         task_type: TaskType = TaskType.GENERAL,
         config_override: Optional[LLMConfig] = None,
         max_retries: int = 3
+    ) -> LLMResponse:
+        """Generate response, served from the shared request cache when eligible"""
+        config = config_override or self.get_config_for_task(task_type)
+        return await self._generate_with_cache(
+            prompt, task_type, config,
+            lambda: self._generate_uncached(prompt, task_type, config_override, max_retries),
+        )
+
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        config_override: Optional[LLMConfig] = None,
+        max_retries: int = 3
     ) -> LLMResponse:
         """Generate response from Qwen-Coder with retry and exponential backoff"""
         config = config_override or self.get_config_for_task(task_type)
@@ -212,7 +226,7 @@ Fixed code:"""
 
         for attempt in range(max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=120.0) as client:
+                async with self._http_client(timeout=120.0) as client:
                     # Use chat completions format for instruction-tuned models
                     messages = [
                         {"role": "system", "content": system_prompt},
@@ -292,6 +306,20 @@ Fixed code:"""
         task_type: TaskType = TaskType.GENERAL,
         config_override: Optional[LLMConfig] = None,
         max_retries: int = 3
+    ) -> LLMResponse:
+        """Synchronous generate, served from the shared request cache when eligible"""
+        config = config_override or self.get_config_for_task(task_type)
+        return self._generate_sync_with_cache(
+            prompt, task_type, config,
+            lambda: self._generate_sync_uncached(prompt, task_type, config_override, max_retries),
+        )
+
+    def _generate_sync_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType = TaskType.GENERAL,
+        config_override: Optional[LLMConfig] = None,
+        max_retries: int = 3
     ) -> LLMResponse:
         """Synchronous generation for Qwen-Coder with retry and exponential backoff"""
         config = config_override or self.get_config_for_task(task_type)
@@ -304,7 +332,7 @@ Fixed code:"""
 
         for attempt in range(max_retries + 1):
             try:
-                with httpx.Client(timeout=120.0) as client:
+                with self._sync_http_client(timeout=120.0) as client:
                     # Use chat completions format for instruction-tuned models
                     messages = [
                         {"role": "system", "content": system_prompt},
@@ -396,7 +424,7 @@ Fixed code:"""
             {"role": "user", "content": formatted_prompt}
         ]
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with self._http_client(timeout=120.0) as client:
             async with client.stream(
                 "POST",
                 f"{self.endpoint}/chat/completions",
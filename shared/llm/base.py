@@ -5,11 +5,13 @@ enabling seamless switching between different models (DeepSeek, Qwen, GPT, etc.)
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, AsyncGenerator, Any
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, AsyncGenerator, Any, Awaitable, Callable
 from enum import Enum
 import logging
 
+from .http_pool import pooled_async_client, pooled_sync_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,6 +57,17 @@ class LLMResponse:
     thinking_blocks: Optional[List[str]] = None
 
 
+def _encode_llm_response(response: LLMResponse) -> Optional[Dict[str, Any]]:
+    """Serialize a response for caching; placeholders without raw_response are skipped"""
+    if response.raw_response is None:
+        return None
+    return asdict(response)
+
+
+def _decode_llm_response(data: Dict[str, Any]) -> LLMResponse:
+    return LLMResponse(**data)
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers
 
@@ -150,6 +163,91 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    def _http_client(self, timeout: float):
+        """Borrow the pooled async HTTP client for this provider's endpoint
+
+        Usage: ``async with self._http_client(timeout=120.0) as client``.
+        Connections are kept alive across requests and retries.
+        """
+        return pooled_async_client(self.endpoint, timeout)
+
+    def _sync_http_client(self, timeout: float):
+        """Borrow the pooled sync HTTP client for this provider's endpoint"""
+        return pooled_sync_client(self.endpoint, timeout)
+
+    @staticmethod
+    def _get_request_cache():
+        """Get the backend's shared LLM request cache (None outside the backend app)"""
+        try:
+            from app.services.llm_request_cache import get_llm_request_cache
+        except ImportError:
+            return None
+        return get_llm_request_cache()
+
+    def _cache_request(
+        self,
+        prompt: str,
+        task_type: TaskType,
+        config: LLMConfig,
+        **extra: Any
+    ) -> Dict[str, Any]:
+        """Build the request fingerprint used as the response cache key"""
+        return {
+            "provider": self.model_type,
+            "model": self.model,
+            "task_type": task_type.value,
+            "prompt": prompt,
+            "temperature": config.temperature,
+            "max_tokens": config.max_tokens,
+            "top_p": config.top_p,
+            "stop": config.stop_sequences,
+            **extra,
+        }
+
+    async def _generate_with_cache(
+        self,
+        prompt: str,
+        task_type: TaskType,
+        config: LLMConfig,
+        fetch: Callable[[], Awaitable[LLMResponse]],
+        **extra: Any
+    ) -> LLMResponse:
+        """Run ``fetch`` through the shared request cache (caching + coalescing)
+
+        Only task types opted in via LLM_CACHE_TASK_TYPES with a low
+        temperature are cached; everything else calls ``fetch`` directly.
+        """
+        cache = self._get_request_cache()
+        if cache is None:
+            return await fetch()
+        return await cache.call(
+            task_type.value,
+            self._cache_request(prompt, task_type, config, **extra),
+            fetch,
+            encode=_encode_llm_response,
+            decode=_decode_llm_response,
+        )
+
+    def _generate_sync_with_cache(
+        self,
+        prompt: str,
+        task_type: TaskType,
+        config: LLMConfig,
+        fetch: Callable[[], LLMResponse],
+        **extra: Any
+    ) -> LLMResponse:
+        """Synchronous variant of ``_generate_with_cache``"""
+        cache = self._get_request_cache()
+        if cache is None:
+            return fetch()
+        return cache.call_sync(
+            task_type.value,
+            self._cache_request(prompt, task_type, config, **extra),
+            fetch,
+            encode=_encode_llm_response,
+            decode=_decode_llm_response,
+        )
+
     def get_config_for_task(self, task_type: TaskType) -> LLMConfig:
         """Get optimal configuration for a specific task type
 
@@ -0,0 +1,200 @@
+"""Shared HTTP connection pools for LLM providers
+
+Adapters used to open a new httpx client (and TCP/TLS connection) for every
+request and retry. This module keeps one long-lived client per endpoint with
+keep-alive connections, reused by all adapters talking to that endpoint.
+
+- Async clients are tracked per event loop (httpx connections are loop-bound)
+- HTTP/2 is enabled when the optional ``h2`` package is installed
+- Call ``close_llm_client_pool()`` on application shutdown
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+class _TimeoutBoundClient:
+    """Thin view over a pooled client that applies a per-request timeout"""
+
+    def __init__(self, client, timeout: float):
+        self._client = client
+        self._timeout = timeout
+
+    def post(self, url: str, **kwargs: Any):
+        kwargs.setdefault("timeout", self._timeout)
+        return self._client.post(url, **kwargs)
+
+    def stream(self, method: str, url: str, **kwargs: Any):
+        kwargs.setdefault("timeout", self._timeout)
+        return self._client.stream(method, url, **kwargs)
+
+
+class LLMClientPool:
+    """Lifecycle-managed httpx clients keyed by endpoint"""
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = True,
+    ):
+        """Initialize pool
+
+        Args:
+            max_connections: Max concurrent connections per endpoint client
+            max_keepalive_connections: Idle connections kept open per client
+            keepalive_expiry: Seconds an idle connection is kept alive
+            http2: Use HTTP/2 when the ``h2`` package is available
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._lock = threading.Lock()
+        self._async_clients: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._sync_clients: Dict[str, httpx.Client] = {}
+        self.leaked_clients = 0
+
+    def get_async_client(self, endpoint: str) -> httpx.AsyncClient:
+        """Get the pooled async client for an endpoint on the running loop"""
+        loop = asyncio.get_running_loop()
+        key = (endpoint, id(loop))
+        with self._lock:
+            entry = self._async_clients.get(key)
+            if entry is None or entry[0] is not loop or entry[1].is_closed:
+                self._prune_closed_loops()
+                client = httpx.AsyncClient(limits=self.limits, http2=self.http2)
+                self._async_clients[key] = (loop, client)
+                logger.debug(f"Created pooled async LLM client for {endpoint}")
+                return client
+            return entry[1]
+
+    def get_sync_client(self, endpoint: str) -> httpx.Client:
+        """Get the pooled sync client for an endpoint"""
+        with self._lock:
+            client = self._sync_clients.get(endpoint)
+            if client is None or client.is_closed:
+                client = httpx.Client(limits=self.limits, http2=self.http2)
+                self._sync_clients[endpoint] = client
+                logger.debug(f"Created pooled sync LLM client for {endpoint}")
+            return client
+
+    def _prune_closed_loops(self) -> None:
+        """Forget clients whose event loop is gone (called with lock held)
+
+        Their connections can no longer be closed: transports of a closed
+        loop cannot be shut down from another loop. Clients that still held
+        open connections are logged and counted in ``leaked_clients``; call
+        ``aclose()`` on the owning loop before closing it to avoid this.
+        """
+        for key, (loop, client) in list(self._async_clients.items()):
+            if not loop.is_closed():
+                continue
+            del self._async_clients[key]
+            if not client.is_closed and self._open_connections(client):
+                self.leaked_clients += 1
+                logger.warning(
+                    f"Dropped pooled async LLM client for {key[0]} with open connections: "
+                    f"its event loop was closed without close_llm_client_pool()"
+                )
+
+    @staticmethod
+    def _open_connections(client: httpx.AsyncClient) -> int:
+        """Connections held by a client's pool (0 if unknown)"""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        return len(getattr(pool, "connections", ()))
+
+    async def aclose(self) -> None:
+        """Close all clients; async clients of other live loops are dropped"""
+        current = asyncio.get_running_loop()
+        with self._lock:
+            async_entries = list(self._async_clients.values())
+            sync_clients = list(self._sync_clients.values())
+            self._async_clients.clear()
+            self._sync_clients.clear()
+
+        for loop, client in async_entries:
+            if loop is current:
+                await client.aclose()
+        for client in sync_clients:
+            client.close()
+        logger.info(f"Closed {len(async_entries) + len(sync_clients)} pooled LLM HTTP clients")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        with self._lock:
+            return {
+                "http2": self.http2,
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "async_clients": len(self._async_clients),
+                "sync_clients": len(self._sync_clients),
+                "leaked_clients": self.leaked_clients,
+                "endpoints": sorted(
+                    {key[0] for key in self._async_clients} | set(self._sync_clients)
+                ),
+            }
+
+
+_pool: Optional[LLMClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """Get or create the process-wide client pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = LLMClientPool()
+        return _pool
+
+
+def configure_llm_client_pool(**kwargs: Any) -> LLMClientPool:
+    """Replace the process-wide pool with one using the given settings
+
+    Call at startup before any requests are made (see LLMClientPool for args).
+    """
+    global _pool
+    with _pool_lock:
+        _pool = LLMClientPool(**kwargs)
+        return _pool
+
+
+async def close_llm_client_pool() -> None:
+    """Close all pooled clients (application shutdown)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        await pool.aclose()
+
+
+@asynccontextmanager
+async def pooled_async_client(endpoint: str, timeout: float) -> AsyncIterator[_TimeoutBoundClient]:
+    """Borrow the pooled async client for an endpoint
+
+    Drop-in for ``async with httpx.AsyncClient(timeout=...) as client`` that
+    leaves the connection pool open on exit.
+    """
+    yield _TimeoutBoundClient(get_llm_client_pool().get_async_client(endpoint), timeout)
+
+
+@contextmanager
+def pooled_sync_client(endpoint: str, timeout: float) -> Iterator[_TimeoutBoundClient]:
+    """Borrow the pooled sync client for an endpoint"""
+    yield _TimeoutBoundClient(get_llm_client_pool().get_sync_client(endpoint), timeout)
@@ -4,9 +4,13 @@ Provides functions to estimate token counts for LLM API calls,
 with improved accuracy and context budget management.
 """
 
+import os
 import re
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -56,6 +60,30 @@ MODEL_RESPONSE_RESERVE: Dict[str, int] = {
 }
 
 
+# Per-message formatting overhead used by count_messages_tokens
+MESSAGE_OVERHEAD_TOKENS = 4
+ROLE_TOKENS = 1
+CONVERSATION_OVERHEAD_TOKENS = 3
+
+# Max cached (content, model) -> token count entries
+TOKEN_CACHE_SIZE = 16384
+
+# Patterns for count_tokens_accurate
+_CJK_PATTERN = re.compile(r'[\u4e00-\u9fff\uac00-\ud7af\u3040-\u30ff]+')
+_CODE_PATTERN = re.compile(r'```[\s\S]*?```|`[^`]+`')
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+_SPECIAL_PATTERN = re.compile(r'[^\w\s]')
+
+# Keyed by (hash(text), len(text), model); str hashes are cached by Python,
+# so repeat lookups for the same message don't rescan its content.
+_token_cache: "OrderedDict[Tuple[int, int, str], int]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+# Optional real tokenizer (see configure_tokenizer)
+_tokenizer: Any = None
+_tokenizer_model: Optional[str] = None
+
+
 @dataclass
 class TokenBudget:
     """Token budget information for context management."""
@@ -107,6 +135,10 @@ def count_tokens_accurate(text: str, model: str = "default") -> int:
     - Code-specific tokenization patterns
     - Special characters and whitespace
 
+    When a tokenizer is configured (see configure_tokenizer), it is used
+    instead of the estimate. Results are cached per (content, model), so
+    recounting the same conversation history on every turn is cheap.
+
     Args:
         text: Input text to count tokens for
         model: Model name for model-specific adjustments
@@ -117,37 +149,54 @@ def count_tokens_accurate(text: str, model: str = "default") -> int:
     if not text:
         return 0
 
+    key = (hash(text), len(text), model)
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            _token_cache.move_to_end(key)
+            return cached
+
+    tokenizer = _tokenizer if model in ("default", _tokenizer_model) else None
+    if tokenizer is not None:
+        count = _count_with_tokenizer(tokenizer, text)
+    else:
+        count = _estimate_tokens_heuristic(text, model)
+
+    with _token_cache_lock:
+        _token_cache[key] = count
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return count
+
+
+def _estimate_tokens_heuristic(text: str, model: str) -> int:
+    """Word/CJK/code based token estimate used when no tokenizer is configured."""
     total_tokens = 0
 
     # Split into segments for different handling
     # 1. Count CJK characters (each CJK char is typically 1-2 tokens)
-    cjk_pattern = re.compile(r'[\u4e00-\u9fff\uac00-\ud7af\u3040-\u30ff]+')
-    cjk_matches = cjk_pattern.findall(text)
+    cjk_matches = _CJK_PATTERN.findall(text)
     for match in cjk_matches:
         # CJK characters: approximately 1.2 tokens per character
         total_tokens += int(len(match) * 1.2)
 
     # Remove CJK for ASCII processing
-    ascii_text = cjk_pattern.sub(' ', text)
+    ascii_text = _CJK_PATTERN.sub(' ', text) if cjk_matches else text
 
     # 2. Handle code blocks specially (code is tokenized differently)
-    code_pattern = re.compile(r'```[\s\S]*?```|`[^`]+`')
-    code_matches = code_pattern.findall(ascii_text)
+    code_matches = _CODE_PATTERN.findall(ascii_text) if '`' in ascii_text else []
     for match in code_matches:
         # Code: approximately 1 token per 3.5 characters
         total_tokens += int(len(match) / 3.5)
 
     # Remove code for word processing
-    text_without_code = code_pattern.sub(' ', ascii_text)
+    text_without_code = _CODE_PATTERN.sub(' ', ascii_text) if code_matches else ascii_text
 
     # 3. Count words and punctuation
-    # Split on whitespace and punctuation
-    word_pattern = re.compile(r'\b\w+\b')
-    words = word_pattern.findall(text_without_code)
+    words = _WORD_PATTERN.findall(text_without_code)
 
     # Count special tokens (punctuation, operators)
-    special_pattern = re.compile(r'[^\w\s]')
-    specials = special_pattern.findall(text_without_code)
+    specials = _SPECIAL_PATTERN.findall(text_without_code)
 
     # Words: ~1.3 tokens per word (subword tokenization)
     total_tokens += int(len(words) * 1.3)
@@ -170,6 +219,134 @@ def count_tokens_accurate(text: str, model: str = "default") -> int:
     return max(1, total_tokens)
 
 
+def _count_with_tokenizer(tokenizer: Any, text: str) -> int:
+    """Count tokens with a real tokenizer (HF tokenizers or compatible)."""
+    try:
+        encoding = tokenizer.encode(text, add_special_tokens=False)
+    except TypeError:
+        encoding = tokenizer.encode(text)
+    ids = getattr(encoding, 'ids', encoding)
+    return max(1, len(ids))
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token counts."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def find_local_tokenizer(model_name: str) -> Optional[str]:
+    """Locate a tokenizer.json for a model without downloading anything.
+
+    Looks at the model name as a local path first (a file or a model
+    directory), then in the Hugging Face hub cache
+    (HF_HUB_CACHE, HF_HOME/hub or ~/.cache/huggingface/hub).
+
+    Args:
+        model_name: Model name (e.g. "deepseek-ai/DeepSeek-R1") or local path
+
+    Returns:
+        Path to tokenizer.json, or None if no local copy exists
+    """
+    if not model_name:
+        return None
+
+    local = Path(model_name).expanduser()
+    if local.is_file():
+        return str(local)
+    if (local / "tokenizer.json").is_file():
+        return str(local / "tokenizer.json")
+
+    hub_cache = os.environ.get("HF_HUB_CACHE") or os.path.join(
+        os.environ.get("HF_HOME", os.path.join("~", ".cache", "huggingface")), "hub"
+    )
+    snapshots = Path(hub_cache).expanduser() / f"models--{model_name.replace('/', '--')}" / "snapshots"
+    candidates = sorted(
+        snapshots.glob("*/tokenizer.json"),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True
+    )
+    return str(candidates[0]) if candidates else None
+
+
+def set_tokenizer(tokenizer: Any, model: Optional[str] = None) -> None:
+    """Install (or remove, with None) the tokenizer used for token counting.
+
+    The tokenizer is used for model="default" and for the given model name;
+    other models keep the heuristic estimate.
+
+    Args:
+        tokenizer: Object with encode(text) (e.g. tokenizers.Tokenizer), or None
+        model: Model name the tokenizer belongs to
+    """
+    global _tokenizer, _tokenizer_model
+    _tokenizer = tokenizer
+    _tokenizer_model = model if tokenizer is not None else None
+    clear_token_cache()
+
+
+def configure_tokenizer(model_name: Optional[str] = None, tokenizer_file: Optional[str] = None) -> bool:
+    """Load a local Hugging Face tokenizer for accurate token counting.
+
+    Requires the optional `tokenizers` package. Falls back to the heuristic
+    estimate (and returns False) if the package or the file is unavailable.
+
+    Args:
+        model_name: Configured model name, used to find a cached tokenizer.json
+        tokenizer_file: Explicit tokenizer.json path (takes precedence)
+
+    Returns:
+        True if a tokenizer was loaded
+    """
+    path = tokenizer_file or find_local_tokenizer(model_name or "")
+    if not path:
+        logger.debug(f"No local tokenizer for {model_name}, using estimated token counts")
+        return False
+
+    try:
+        from tokenizers import Tokenizer
+    except ImportError:
+        logger.info("tokenizers package not installed, using estimated token counts")
+        return False
+
+    try:
+        tokenizer = Tokenizer.from_file(path)
+    except Exception as e:
+        logger.warning(f"Failed to load tokenizer from {path}: {e}")
+        return False
+
+    set_tokenizer(tokenizer, model_name)
+    logger.info(f"Token counting uses tokenizer: {path}")
+    return True
+
+
+def count_message_tokens(message: Dict[str, Any], model: str = "default") -> int:
+    """Count tokens for a single chat message, including its overhead.
+
+    Args:
+        message: Message dict with 'role' and 'content'
+        model: Model name for token counting
+
+    Returns:
+        Token count of the message (without conversation overhead)
+    """
+    total = MESSAGE_OVERHEAD_TOKENS
+    content = message.get('content', '')
+    if isinstance(content, str):
+        total += count_tokens_accurate(content, model)
+    elif isinstance(content, list):
+        # Handle multi-part content (images, etc.)
+        for part in content:
+            if isinstance(part, dict) and 'text' in part:
+                total += count_tokens_accurate(part['text'], model)
+
+    # Role token (role names are single words)
+    if message.get('role'):
+        total += ROLE_TOKENS
+
+    return total
+
+
 def count_messages_tokens(messages: List[Dict[str, Any]], model: str = "default") -> int:
     """Count tokens for a list of chat messages.
 
@@ -183,29 +360,59 @@ def count_messages_tokens(messages: List[Dict[str, Any]], model: str = "default"
     if not messages:
         return 0
 
-    total = 0
-    # Each message has overhead for role and formatting
-    message_overhead = 4  # Approximate tokens per message structure
-
-    for msg in messages:
-        total += message_overhead
-        content = msg.get('content', '')
-        if isinstance(content, str):
-            total += count_tokens_accurate(content, model)
-        elif isinstance(content, list):
-            # Handle multi-part content (images, etc.)
-            for part in content:
-                if isinstance(part, dict) and 'text' in part:
-                    total += count_tokens_accurate(part['text'], model)
-
-        # Role token
-        role = msg.get('role', '')
-        total += count_tokens_accurate(role, model)
+    total = sum(count_message_tokens(msg, model) for msg in messages)
 
     # Conversation overhead
-    total += 3  # Every conversation has some fixed overhead
+    return total + CONVERSATION_OVERHEAD_TOKENS
 
-    return total
+
+class TokenCounter:
+    """Running token total of a conversation.
+
+    Adding a message costs one count of that message instead of recounting
+    the whole history. total matches count_messages_tokens for the same
+    messages.
+    """
+
+    def __init__(self, messages: Optional[List[Dict[str, Any]]] = None, model: str = "default"):
+        self.model = model
+        self.message_count = 0
+        self._message_tokens = 0
+        if messages:
+            self.extend(messages)
+
+    @property
+    def total(self) -> int:
+        """Total tokens including conversation overhead."""
+        if not self.message_count:
+            return 0
+        return self._message_tokens + CONVERSATION_OVERHEAD_TOKENS
+
+    def add(self, message: Dict[str, Any]) -> int:
+        """Add a message and return its token count."""
+        tokens = count_message_tokens(message, self.model)
+        self._message_tokens += tokens
+        self.message_count += 1
+        return tokens
+
+    def extend(self, messages: List[Dict[str, Any]]) -> None:
+        """Add several messages."""
+        for message in messages:
+            self.add(message)
+
+    def remove(self, message: Dict[str, Any]) -> int:
+        """Remove a previously added message and return its token count."""
+        tokens = count_message_tokens(message, self.model)
+        self._message_tokens -= tokens
+        self.message_count -= 1
+        return tokens
+
+    def reset(self, messages: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Start over from the given messages."""
+        self.message_count = 0
+        self._message_tokens = 0
+        if messages:
+            self.extend(messages)
 
 
 def check_context_budget(